@@ -0,0 +1,60 @@
+"""
+Micro-benchmark of recoverable secp256k1 signing in `hiero_sdk_python.contract.ethereum_transaction_data`.
+
+Times `sign_recoverable` with the signer selected at import, the `cryptography`
+fallback on its own, coincurve and eth_keys when they are installed, and a plain
+`cryptography` signature without a recovery id as the floor, and prints the time
+per signature.
+
+Usage:
+    python scripts/benchmarks/ethereum_signing.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import timeit
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
+
+from hiero_sdk_python.contract import ethereum_transaction_data
+from hiero_sdk_python.crypto.private_key import PrivateKey
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=500, help="signatures per measurement")
+    args = parser.parse_args()
+
+    private_key = PrivateKey.generate_ecdsa()
+    message_hash = os.urandom(32)
+    signers = {
+        f"sign_recoverable ({ethereum_transaction_data.SIGNING_BACKEND})": ethereum_transaction_data.sign_recoverable,
+        "cryptography fallback": ethereum_transaction_data._sign_with_cryptography,
+    }
+    try:
+        signers["coincurve"] = ethereum_transaction_data._coincurve_signer()
+    except ImportError as e:
+        print(f"coincurve: unavailable ({e})")
+    try:
+        from eth_keys import keys
+
+        eth_key = keys.PrivateKey(private_key.to_bytes_ecdsa_raw())
+        signers[f"eth_keys ({eth_key.backend.__class__.__name__})"] = lambda _key, h: eth_key.sign_msg_hash(h)
+    except ImportError as e:
+        print(f"eth_keys: unavailable ({e})")
+
+    raw_key = private_key._private_key
+    algorithm = ec.ECDSA(Prehashed(hashes.SHA256()), deterministic_signing=True)
+    signers["cryptography sign, no recovery id"] = lambda _key, h: raw_key.sign(h, algorithm)
+
+    for label, sign in signers.items():
+        seconds = min(timeit.repeat(lambda f=sign: f(private_key, message_hash), number=args.number, repeat=3))
+        print(f"{label:<44}{seconds / args.number * 1e3:>8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Micro-benchmark of the Keccak-256 backends in `hiero_sdk_python.utils.crypto_utils`.
+
+Hashes inputs of typical sizes (a public key, an ABI call, a transaction body,
+contract bytecode) with every installed backend, one call at a time and through
+`keccak256_many`, and prints the time per hash.
+
+Usage:
+    python scripts/benchmarks/keccak_backends.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import timeit
+
+from hiero_sdk_python.utils import crypto_utils
+
+
+SIZES = {
+    "public key (64 B)": 64,
+    "ABI call (196 B)": 196,
+    "transaction body (1 KiB)": 1024,
+    "bytecode (24 KiB)": 24 * 1024,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20_000, help="hashes per measurement")
+    args = parser.parse_args()
+
+    backends = {}
+    for name in (*crypto_utils.KECCAK_BACKENDS, *crypto_utils.OPT_IN_KECCAK_BACKENDS):
+        try:
+            backends[name] = crypto_utils.load_keccak_backend(name)
+        except ImportError as e:  # noqa: PERF203
+            print(f"{name}: unavailable ({e})")
+    print(f"selected at import: {crypto_utils.KECCAK_BACKEND}\n")
+
+    print(f"{'input':<26}" + "".join(f"{name:>18}" for name in backends))
+    for label, size in SIZES.items():
+        data = os.urandom(size)
+        number = max(args.number * 64 // max(size, 64), 100)
+        row = f"{label:<26}"
+        for hash_function in backends.values():
+            seconds = min(timeit.repeat(lambda f=hash_function, d=data: f(d), number=number, repeat=3))
+            row += f"{seconds / number * 1e6:>15.2f} us"
+        print(row)
+
+    items = [os.urandom(196) for _ in range(args.number)]
+    seconds = min(timeit.repeat(lambda: crypto_utils.keccak256_many(items), number=1, repeat=3))
+    print(f"\nkeccak256_many, {len(items)} x 196 B: {seconds / len(items) * 1e6:.2f} us per hash")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Micro-benchmark of entity ID string parsing in `hiero_sdk_python.utils.entity_id_helper`.
+
+Parses a batch of '0.0.<num>' strings with the regex and `int()`, with
+`parse_entity_id`, with `AccountId.from_string` one string at a time, and with
+`parse_many` into instances and into a flat array, and prints the time per batch.
+
+Usage:
+    python scripts/benchmarks/parse_many.py [--count N] [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.utils.entity_id_helper import ID_REGEX, parse_entity_id, parse_many
+
+
+def _parse_with_regex(strings: list[str]) -> list[tuple[int, int, int]]:
+    result = []
+    for address in strings:
+        match = ID_REGEX.match(address)
+        result.append((int(match.group(1)), int(match.group(2)), int(match.group(3))))
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20_000, help="strings per batch")
+    parser.add_argument("--number", type=int, default=10, help="batches per measurement")
+    args = parser.parse_args()
+
+    strings = [f"0.0.{num}" for num in range(1000, 1000 + args.count)]
+    cases = {
+        "regex + int()": lambda: _parse_with_regex(strings),
+        "parse_entity_id": lambda: [parse_entity_id(address) for address in strings],
+        "AccountId.from_string": lambda: [AccountId.from_string(address) for address in strings],
+        "parse_many(AccountId)": lambda: parse_many(strings, AccountId),
+        "parse_many (array)": lambda: parse_many(strings),
+    }
+
+    print(f"{len(strings)} strings per batch")
+    for label, function in cases.items():
+        seconds = min(timeit.repeat(function, number=args.number, repeat=3))
+        print(f"{label:<26}{seconds / args.number * 1e3:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,9 +23,16 @@ from .address_book.rpc_relay_service_endpoint import RpcRelayServiceEndpoint
 
 # Client and Network
 from .client.client import Client
+from .client.mirror_channel_pool import MirrorChannelPool
 from .client.network import Network
 
 # Consensus
+from .consensus.topic_checkpoint_store import (
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+    TopicCheckpoint,
+    TopicCheckpointStore,
+)
 from .consensus.topic_create_transaction import TopicCreateTransaction
 from .consensus.topic_delete_transaction import TopicDeleteTransaction
 from .consensus.topic_id import TopicId
@@ -33,18 +40,36 @@ from .consensus.topic_message_submit_transaction import TopicMessageSubmitTransa
 from .consensus.topic_update_transaction import TopicUpdateTransaction
 
 # Contract
+from .contract.bulk_decoder import EventLogIndex
+from .contract.contract import Contract
 from .contract.contract_bytecode_query import ContractBytecodeQuery
+from .contract.contract_call_batch import ContractCallBatch, ContractCallBatchResult
 from .contract.contract_call_query import ContractCallQuery
+from .contract.contract_create_flow import BytecodeFileCache, ContractCreateFlow
 from .contract.contract_create_transaction import ContractCreateTransaction
 from .contract.contract_delete_transaction import ContractDeleteTransaction
+from .contract.contract_event_indexer import (
+    ContractEventIndexer,
+    EventCheckpoint,
+    MirrorContractLogSource,
+    RecordLogSource,
+)
 from .contract.contract_execute_transaction import ContractExecuteTransaction
+from .contract.contract_function import ContractFunction
 from .contract.contract_function_parameters import ContractFunctionParameters
 from .contract.contract_function_result import ContractFunctionResult
+from .contract.contract_gas_estimator import ContractGasEstimator, GasEstimate
 from .contract.contract_id import ContractId
 from .contract.contract_info import ContractInfo
 from .contract.contract_info_query import ContractInfoQuery
 from .contract.contract_update_transaction import ContractUpdateTransaction
+from .contract.ethereum_flow import EthereumFlow
 from .contract.ethereum_transaction import EthereumTransaction
+from .contract.ethereum_transaction_data import (
+    EthereumTransactionData,
+    EthereumTransactionDataEip1559,
+    EthereumTransactionDataLegacy,
+)
 
 # Crypto
 from .crypto.evm_address import EvmAddress
@@ -66,6 +91,7 @@ from .fees.network_fee import NetworkFee
 
 # File
 from .file.file_append_transaction import FileAppendTransaction
+from .file.file_contents_cache import FileContentsCache
 from .file.file_contents_query import FileContentsQuery
 from .file.file_create_transaction import FileCreateTransaction
 from .file.file_delete_transaction import FileDeleteTransaction
@@ -181,6 +207,7 @@ __all__ = [
     # Client
     "Client",
     "Network",
+    "MirrorChannelPool",
     # Account
     "AccountId",
     "AccountCreateTransaction",
@@ -246,6 +273,10 @@ __all__ = [
     "TopicUpdateTransaction",
     "TopicDeleteTransaction",
     "TopicId",
+    "TopicCheckpoint",
+    "TopicCheckpointStore",
+    "FileCheckpointStore",
+    "SQLiteCheckpointStore",
     # Queries
     "FeeEstimateQuery",
     "TopicInfoQuery",
@@ -284,6 +315,7 @@ __all__ = [
     "FileId",
     "FileInfoQuery",
     "FileInfo",
+    "FileContentsCache",
     "FileContentsQuery",
     "FileUpdateTransaction",
     "FileDeleteTransaction",
@@ -294,18 +326,35 @@ __all__ = [
     "FeeExtra",
     "NetworkFee",
     # Contract
+    "BytecodeFileCache",
+    "ContractCreateFlow",
     "ContractCreateTransaction",
+    "ContractCallBatch",
+    "ContractCallBatchResult",
     "ContractCallQuery",
     "ContractId",
     "ContractInfoQuery",
     "ContractBytecodeQuery",
     "ContractExecuteTransaction",
     "ContractDeleteTransaction",
+    "ContractEventIndexer",
+    "EventCheckpoint",
+    "MirrorContractLogSource",
+    "RecordLogSource",
+    "Contract",
+    "ContractFunction",
     "ContractFunctionParameters",
     "ContractFunctionResult",
+    "ContractGasEstimator",
     "ContractInfo",
     "ContractUpdateTransaction",
+    "EthereumFlow",
     "EthereumTransaction",
+    "EthereumTransactionData",
+    "EthereumTransactionDataEip1559",
+    "EthereumTransactionDataLegacy",
+    "EventLogIndex",
+    "GasEstimate",
     # Schedule
     "ScheduleCreateTransaction",
     "ScheduleId",
@@ -9,8 +9,9 @@ from hiero_sdk_python.crypto.evm_address import EvmAddress
 from hiero_sdk_python.crypto.public_key import PublicKey
 from hiero_sdk_python.hapi.services import basic_types_pb2
 from hiero_sdk_python.utils.entity_id_helper import (
+    copy_proto,
     format_to_string_with_checksum,
-    parse_from_string,
+    parse_entity_id,
     perform_query_to_mirror_node,
     to_solidity_address,
     validate_checksum,
@@ -22,6 +23,9 @@ if TYPE_CHECKING:
 
 ALIAS_REGEX = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.((?:[0-9a-fA-F][0-9a-fA-F])+)$")
 
+# Attributes that identify an account; changing any of them invalidates the cached hash and proto.
+_IDENTITY_FIELDS = frozenset(("shard", "realm", "num", "alias_key", "evm_address"))
+
 
 class AccountId:
     """
@@ -35,8 +39,13 @@ class AccountId:
     In addition to the account number, the account component can also be an alias:
     - An alias can be either a public key (ED25519 or ECDSA) or an EVM address (20 bytes)
     - The alias format is `<shardNum>.<realmNum>.<alias>`, where `alias` is the public key or evm address
+
+    Instances use ``__slots__`` and cache their hash and protobuf form, since account IDs
+    are created in large numbers and used as dictionary keys in transfer lists.
     """
 
+    __slots__ = ("shard", "realm", "num", "alias_key", "evm_address", "__checksum", "_hash", "_proto")
+
     def __init__(
         self,
         shard: int = 0,
@@ -55,12 +64,37 @@ class AccountId:
             alias_key (PublicKey): The public key of the account.
             evm_address (EvmAddress): The public evm_address of the account.
         """
-        self.shard = shard
-        self.realm = realm
-        self.num = num
-        self.alias_key = alias_key
-        self.evm_address = evm_address
-        self.__checksum: str | None = None
+        # Bypass __setattr__, the hash is computed once all fields are set.
+        set_attr = object.__setattr__
+        set_attr(self, "shard", shard)
+        set_attr(self, "realm", realm)
+        set_attr(self, "num", num)
+        set_attr(self, "alias_key", alias_key)
+        set_attr(self, "evm_address", evm_address)
+        set_attr(self, "_AccountId__checksum", None)
+        set_attr(self, "_hash", hash((shard, realm, num)))
+        set_attr(self, "_proto", None)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Sets an attribute, invalidating the cached hash and proto when an identity field changes."""
+        object.__setattr__(self, name, value)
+        if name in _IDENTITY_FIELDS:
+            object.__setattr__(self, "_hash", hash((self.shard, self.realm, self.num)))
+            object.__setattr__(self, "_proto", None)
+
+    def __getstate__(self) -> dict[str, object]:
+        """Returns the identity fields and checksum for copy and pickle; cached values are rebuilt."""
+        state = {name: getattr(self, name) for name in _IDENTITY_FIELDS}
+        state["_AccountId__checksum"] = self.__checksum
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restores all fields at once, bypassing __setattr__ so the hash is computed from a complete state."""
+        set_attr = object.__setattr__
+        for name, value in state.items():
+            set_attr(self, name, value)
+        set_attr(self, "_hash", hash((self.shard, self.realm, self.num)))
+        set_attr(self, "_proto", None)
 
     @classmethod
     def from_string(cls, account_id_str: str) -> AccountId:
@@ -84,21 +118,21 @@ class AccountId:
         if account_id_str is None or not isinstance(account_id_str, str):
             raise TypeError(f"account_id_str must be a string, got {type(account_id_str).__name__}.")
 
-        if cls._is_evm_address(account_id_str):
-            # Detect EVM address input (raw 20-byte hex or 0x-prefixed).
-            # EVM addresses do not encode shard or realm information, so both
-            # values default to 0. The numeric account ID can later be resolved
-            # via the mirror node using populate_account_num().
-            return cls.from_evm_address(account_id_str, 0, 0)
-
         try:
-            shard, realm, num, checksum = parse_from_string(account_id_str)
+            shard, realm, num, checksum = parse_entity_id(account_id_str)
 
-            account_id: AccountId = cls(shard=int(shard), realm=int(realm), num=int(num))
+            account_id: AccountId = cls(shard=shard, realm=realm, num=num)
             account_id.__checksum = checksum
 
             return account_id
         except Exception as e:
+            if cls._is_evm_address(account_id_str):
+                # Detect EVM address input (raw 20-byte hex or 0x-prefixed).
+                # EVM addresses do not encode shard or realm information, so both
+                # values default to 0. The numeric account ID can later be resolved
+                # via the mirror node using populate_account_num().
+                return cls.from_evm_address(account_id_str, 0, 0)
+
             alias_match = ALIAS_REGEX.match(account_id_str)
 
             if alias_match:
@@ -189,13 +223,14 @@ class AccountId:
             realm=account_id_proto.realmNum,
             num=account_id_proto.accountNum,
         )
-        if account_id_proto.alias:
-            alias = account_id_proto.alias
-            if len(alias) == 20:
-                result.evm_address = EvmAddress.from_bytes(alias)
-            else:
-                alias = alias[2:]  # remove 2 bytes, i.e prefix
-                result.alias_key = PublicKey.from_bytes(alias)
+        alias = account_id_proto.alias
+        if not alias:
+            return result
+        if len(alias) == 20:
+            result.evm_address = EvmAddress.from_bytes(alias)
+        else:
+            alias = alias[2:]  # remove 2 bytes, i.e prefix
+            result.alias_key = PublicKey.from_bytes(alias)
 
         return result
 
@@ -206,6 +241,10 @@ class AccountId:
         Returns:
             AccountID: The protobuf AccountID object.
         """
+        account_id_proto = self._proto
+        if account_id_proto is not None:
+            return copy_proto(account_id_proto)
+
         account_id_proto = basic_types_pb2.AccountID(
             shardNum=self.shard,
             realmNum=self.realm,
@@ -218,7 +257,8 @@ class AccountId:
         elif self.evm_address:
             account_id_proto.alias = self.evm_address.address_bytes
 
-        return account_id_proto
+        object.__setattr__(self, "_proto", account_id_proto)
+        return copy_proto(account_id_proto)
 
     @property
     def checksum(self) -> str | None:
@@ -389,4 +429,4 @@ class AccountId:
 
     def __hash__(self) -> int:
         """Returns a hash value for the AccountId instance."""
-        return hash((self.shard, self.realm, self.num))
+        return self._hash
@@ -33,6 +33,7 @@ class AccountRecordsQuery(Query):
         """
         super().__init__()
         self.account_id: AccountId | None = account_id
+        self.lazy_decoding: bool = False
 
     def set_account_id(self, account_id: AccountId | None) -> AccountRecordsQuery:
         """
@@ -47,6 +48,26 @@ class AccountRecordsQuery(Query):
         self.account_id = account_id
         return self
 
+    def set_lazy_decoding(self, lazy_decoding: bool) -> AccountRecordsQuery:
+        """
+        Sets whether the returned records decode their fields lazily.
+
+        Lazy records keep the protobuf response and decode each field only on
+        first access, which avoids allocating transfer maps and other nested
+        objects for records where only a few fields are read.
+
+        Args:
+            lazy_decoding (bool): Whether to decode record fields lazily.
+
+        Returns:
+            AccountRecordsQuery: Returns self for method chaining.
+        """
+        if not isinstance(lazy_decoding, bool):
+            raise TypeError(f"lazy_decoding must be a boolean, got {type(lazy_decoding).__name__}")
+
+        self.lazy_decoding = lazy_decoding
+        return self
+
     def _make_request(self) -> query_pb2.Query:
         """
         Constructs the protobuf request for the query.
@@ -120,7 +141,10 @@ class AccountRecordsQuery(Query):
         self._before_execute(client)
         response = self._execute(client, timeout)
 
-        return [TransactionRecord._from_proto(record) for record in response.cryptoGetAccountRecords.records]
+        return [
+            TransactionRecord._from_proto(record, lazy=self.lazy_decoding)
+            for record in response.cryptoGetAccountRecords.records
+        ]
 
     def _get_query_response(self, response: response_pb2.Response) -> CryptoGetAccountRecordsResponse:
         """
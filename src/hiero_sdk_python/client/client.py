@@ -5,8 +5,9 @@ from __future__ import annotations
 import math
 import os
 import warnings
+from collections.abc import Callable, Iterator
 from decimal import Decimal
-from typing import Literal, NamedTuple
+from typing import TYPE_CHECKING, BinaryIO, Literal, NamedTuple
 
 import grpc
 from dotenv import load_dotenv
@@ -24,6 +25,14 @@ from hiero_sdk_python.transaction.transaction_id import TransactionId
 from .network import Network
 
 
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.mirror_channel_pool import MirrorChannelPool
+    from hiero_sdk_python.file.file_id import FileId
+    from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
+    from hiero_sdk_python.transaction.transaction_response import TransactionResponse
+    from hiero_sdk_python.transaction.transaction_stream import TransactionSource
+
+
 DEFAULT_MAX_QUERY_PAYMENT = Hbar(1)
 
 DEFAULT_GRPC_DEADLINE = 10  # seconds
@@ -72,6 +81,29 @@ class Client:
     def mirror_stub(self) -> mirror_consensus_grpc.ConsensusServiceStub:
         return self.network.get_mirror_stub()
 
+    @property
+    def mirror_channel_pool(self) -> MirrorChannelPool | None:
+        """The pool topic subscriptions take their mirror channel from, or None for the single channel."""
+        return self.network.get_mirror_channel_pool()
+
+    def set_mirror_channel_pool(self, pool: MirrorChannelPool | None) -> Client:
+        """
+        Spreads topic subscriptions over a pool of mirror channels.
+
+        Args:
+            pool (MirrorChannelPool | None): The pool to use, or None for the single mirror channel.
+
+        Returns:
+            Client: This client instance for fluent chaining.
+        """
+        self.network.set_mirror_channel_pool(pool)
+        return self
+
+    @property
+    def mirror_aio_stub(self) -> mirror_consensus_grpc.ConsensusServiceStub:
+        """The mirror stub for asyncio subscriptions; must be accessed from a running event loop."""
+        return self.network.get_mirror_aio_stub()
+
     @property
     def mirror_channel(self) -> grpc.Channel:
         self.network.get_mirror_stub()
@@ -424,6 +456,96 @@ class Client:
         self.network._set_network_nodes()
         return self
 
+    def iter_submit_transactions(
+        self,
+        source: TransactionSource,
+        wait_for_receipt: bool = True,
+        use_mmap: bool = False,
+    ) -> Iterator[TransactionReceipt | TransactionResponse]:
+        """
+        Lazily submits the transactions of a length-delimited stream, one at a time.
+
+        This is a generator: each transaction is read and submitted only when the
+        next result is requested, so nothing is submitted unless the result is
+        iterated. Use `submit_transactions()` to submit the whole stream at once.
+
+        Args:
+            source (TransactionSource): A readable binary file object or an in-memory buffer.
+            wait_for_receipt (bool, optional): Whether to wait for the receipt of each transaction.
+            use_mmap (bool, optional): Memory-map `source` when it is a regular file.
+
+        Yields:
+            TransactionReceipt | TransactionResponse: The result of each submission, in stream order.
+        """
+        from hiero_sdk_python.transaction.transaction_stream import read_transactions
+
+        for transaction in read_transactions(source, use_mmap=use_mmap):
+            yield transaction.execute(self, wait_for_receipt=wait_for_receipt)
+
+    def submit_transactions(
+        self,
+        source: TransactionSource,
+        wait_for_receipt: bool = True,
+        use_mmap: bool = False,
+    ) -> list[TransactionReceipt | TransactionResponse]:
+        """
+        Submits every transaction of a length-delimited stream, one at a time.
+
+        The stream is read lazily with `read_transactions()`, so files written by
+        `write_transactions()` can be submitted without loading them into memory.
+
+        Args:
+            source (TransactionSource): A readable binary file object or an in-memory buffer.
+            wait_for_receipt (bool, optional): Whether to wait for the receipt of each transaction.
+            use_mmap (bool, optional): Memory-map `source` when it is a regular file.
+
+        Returns:
+            list[TransactionReceipt | TransactionResponse]: The result of each submission, in stream order.
+        """
+        return list(self.iter_submit_transactions(source, wait_for_receipt=wait_for_receipt, use_mmap=use_mmap))
+
+    def upload_file(
+        self,
+        source: BinaryIO | str | os.PathLike,
+        keys: list[PrivateKey] | None = None,
+        file_memo: str | None = None,
+        chunk_size: int = 4096,
+        pipeline_window: int = 1,
+        progress: Callable[[int, int], None] | None = None,
+        checkpoint_path: str | os.PathLike | None = None,
+    ) -> FileId:
+        """
+        Uploads a local file to a new file on the network, streaming it from disk.
+
+        See `hiero_sdk_python.file.file_upload.upload_file()` for details.
+
+        Args:
+            source (BinaryIO | str | os.PathLike): A path, or a seekable binary file object.
+            keys (list[PrivateKey], optional): Keys controlling the file. Defaults to the operator key.
+            file_memo (str, optional): The memo of the new file.
+            chunk_size (int, optional): The size of each chunk in bytes.
+            pipeline_window (int, optional): The number of append chunks allowed in flight.
+                Defaults to 1, appending each chunk after the previous one reached consensus,
+                so uploads are only pipelined when a larger window is passed.
+            progress (Callable[[int, int], None], optional): Called with (uploaded_bytes, total_bytes).
+            checkpoint_path (str | os.PathLike, optional): Persist progress here to make the upload resumable.
+
+        Returns:
+            FileId: The ID of the created file.
+        """
+        from hiero_sdk_python.file.file_upload import upload_file
+
+        return upload_file(
+            self,
+            source,
+            keys=keys,
+            file_memo=file_memo,
+            chunk_size=chunk_size,
+            pipeline_window=pipeline_window,
+            progress=progress,
+            checkpoint_path=checkpoint_path,
+        )
+
     def __enter__(self) -> Client:
         """
         Allows the Client to be used in a 'with' statement for automatic resource management.
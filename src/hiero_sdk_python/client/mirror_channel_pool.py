@@ -0,0 +1,277 @@
+"""
+Pool of mirror node gRPC channels for many concurrent topic subscriptions.
+
+A single HTTP/2 connection caps the number of concurrent streams, so a
+`MirrorChannelPool` opens several channels per mirror endpoint, each on its own
+connection, and places every new subscription on the least-loaded channel. An
+endpoint whose streams fail is skipped for a while, so subscriptions fail over
+to the remaining endpoints. Threaded subscriptions use blocking channels;
+asyncio subscriptions get `grpc.aio` channels opened on their event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import grpc
+
+from hiero_sdk_python.hapi.mirror import consensus_service_pb2_grpc as mirror_consensus_grpc
+
+
+DEFAULT_CHANNELS_PER_ENDPOINT = 2
+DEFAULT_KEEPALIVE_TIME = 30.0  # seconds
+DEFAULT_KEEPALIVE_TIMEOUT = 10.0  # seconds
+DEFAULT_FAILOVER_BACKOFF = 30.0  # seconds
+
+TLS_PORTS = (443, 50212)
+
+
+class MirrorChannel:
+    """
+    One pooled channel to a mirror endpoint.
+
+    Attributes:
+        endpoint (str): The mirror address (host:port) the channel connects to.
+        stub (ConsensusServiceStub): The consensus service stub bound to the channel.
+        active_streams (int): The number of subscriptions currently placed on the channel.
+    """
+
+    def __init__(self, endpoint: str, channel: grpc.Channel | grpc.aio.Channel) -> None:
+        self.endpoint: str = endpoint
+        self.channel: grpc.Channel | grpc.aio.Channel = channel
+        self.stub: mirror_consensus_grpc.ConsensusServiceStub = mirror_consensus_grpc.ConsensusServiceStub(channel)
+        self.active_streams: int = 0
+
+
+class MirrorChannelPool:
+    """Thread-safe pool of mirror channels across one or more endpoints."""
+
+    def __init__(
+        self,
+        endpoints: str | Sequence[str],
+        channels_per_endpoint: int = DEFAULT_CHANNELS_PER_ENDPOINT,
+        keepalive_time: float | None = DEFAULT_KEEPALIVE_TIME,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        initial_window_size: int | None = None,
+        max_receive_message_length: int | None = None,
+        transport_security: bool | None = None,
+        root_certificates: bytes | None = None,
+        failover_backoff: float = DEFAULT_FAILOVER_BACKOFF,
+        channel_options: Sequence[tuple[str, Any]] = (),
+    ) -> None:
+        """
+        Creates a pool. Channels are opened lazily, the first time an endpoint is used.
+
+        Args:
+            endpoints (str | Sequence[str]): Mirror addresses (host:port), in order of preference.
+            channels_per_endpoint (int, optional): Channels (and so connections) per endpoint.
+            keepalive_time (float, optional): Seconds between keepalive pings. None disables them.
+            keepalive_timeout (float, optional): Seconds to wait for a ping acknowledgement.
+            initial_window_size (int, optional): HTTP/2 per-stream flow-control window in bytes.
+                Setting it disables gRPC's automatic window sizing (BDP probing).
+            max_receive_message_length (int, optional): The largest message the channel accepts.
+            transport_security (bool, optional): Whether to use TLS. By default TLS is used
+                for ports 443 and 50212.
+            root_certificates (bytes, optional): PEM root certificates for TLS.
+            failover_backoff (float, optional): Seconds an endpoint is skipped after a failure.
+            channel_options (Sequence[tuple[str, Any]], optional): Extra gRPC channel arguments.
+
+        Raises:
+            ValueError: If no endpoint is given, an endpoint has no valid port, or a
+                numeric option is out of range.
+        """
+        if isinstance(endpoints, str):
+            endpoints = [endpoints]
+        if not endpoints:
+            raise ValueError("At least one mirror endpoint is required")
+        if channels_per_endpoint <= 0:
+            raise ValueError("channels_per_endpoint must be greater than 0")
+        if keepalive_time is not None and keepalive_time <= 0:
+            raise ValueError("keepalive_time must be greater than 0")
+        if keepalive_timeout <= 0:
+            raise ValueError("keepalive_timeout must be greater than 0")
+        if initial_window_size is not None and initial_window_size <= 0:
+            raise ValueError("initial_window_size must be greater than 0")
+        if failover_backoff < 0:
+            raise ValueError("failover_backoff must be non-negative")
+
+        self._endpoints: list[tuple[str, bool]] = [
+            (endpoint, self._uses_tls(endpoint, transport_security)) for endpoint in endpoints
+        ]
+        self._channels_per_endpoint = channels_per_endpoint
+        self._root_certificates = root_certificates
+        self._failover_backoff = failover_backoff
+        self._options = self._build_options(
+            keepalive_time, keepalive_timeout, initial_window_size, max_receive_message_length, channel_options
+        )
+
+        self._channels: dict[str, list[MirrorChannel]] = {}
+        # grpc.aio channels only work on the event loop they were created on.
+        self._aio_channels: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, list[MirrorChannel]]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._unhealthy_until: dict[str, float] = {}
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _uses_tls(endpoint: str, transport_security: bool | None) -> bool:
+        host, sep, port = endpoint.rpartition(":")
+        if not sep or not host or not port.isdigit():
+            raise ValueError(f"Invalid mirror endpoint {endpoint!r}; expected host:port")
+        if transport_security is not None:
+            return transport_security
+        return int(port) in TLS_PORTS
+
+    @staticmethod
+    def _build_options(
+        keepalive_time: float | None,
+        keepalive_timeout: float,
+        initial_window_size: int | None,
+        max_receive_message_length: int | None,
+        channel_options: Sequence[tuple[str, Any]],
+    ) -> list[tuple[str, Any]]:
+        # A local subchannel pool gives every channel its own connection; otherwise
+        # channels with identical arguments share one HTTP/2 connection.
+        options: list[tuple[str, Any]] = [("grpc.use_local_subchannel_pool", 1)]
+
+        if keepalive_time is not None:
+            options += [
+                ("grpc.keepalive_time_ms", int(keepalive_time * 1000)),
+                ("grpc.keepalive_timeout_ms", int(keepalive_timeout * 1000)),
+                ("grpc.keepalive_permit_without_calls", 1),
+                ("grpc.http2.max_pings_without_data", 0),
+            ]
+        if initial_window_size is not None:
+            options += [("grpc.http2.lookahead_bytes", initial_window_size), ("grpc.http2.bdp_probe", 0)]
+        if max_receive_message_length is not None:
+            options.append(("grpc.max_receive_message_length", max_receive_message_length))
+
+        return options + list(channel_options)
+
+    @property
+    def options(self) -> list[tuple[str, Any]]:
+        """The gRPC channel arguments every pooled channel is created with."""
+        return list(self._options)
+
+    def _open_channel(self, endpoint: str, tls: bool) -> grpc.Channel:
+        if tls:
+            credentials = grpc.ssl_channel_credentials(root_certificates=self._root_certificates)
+            return grpc.secure_channel(endpoint, credentials, options=self._options)
+        return grpc.insecure_channel(endpoint, options=self._options)
+
+    def _open_aio_channel(self, endpoint: str, tls: bool) -> grpc.aio.Channel:
+        if tls:
+            credentials = grpc.ssl_channel_credentials(root_certificates=self._root_certificates)
+            return grpc.aio.secure_channel(endpoint, credentials, options=self._options)
+        return grpc.aio.insecure_channel(endpoint, options=self._options)
+
+    def _endpoint_channels(
+        self,
+        groups: dict[str, list[MirrorChannel]],
+        endpoint: str,
+        tls: bool,
+        open_channel: Callable[[str, bool], grpc.Channel | grpc.aio.Channel],
+    ) -> list[MirrorChannel]:
+        channels = groups.get(endpoint)
+        if channels is None:
+            channels = [
+                MirrorChannel(endpoint, open_channel(endpoint, tls)) for _ in range(self._channels_per_endpoint)
+            ]
+            groups[endpoint] = channels
+        return channels
+
+    def _acquire(self, groups: dict[str, list[MirrorChannel]], open_channel: Callable) -> MirrorChannel:
+        now = time.monotonic()
+        healthy = [(e, tls) for e, tls in self._endpoints if self._unhealthy_until.get(e, 0.0) <= now]
+        if not healthy:
+            healthy = [min(self._endpoints, key=lambda entry: self._unhealthy_until[entry[0]])]
+
+        best: MirrorChannel | None = None
+        for endpoint, tls in healthy:
+            for channel in self._endpoint_channels(groups, endpoint, tls, open_channel):
+                if best is None or channel.active_streams < best.active_streams:
+                    best = channel
+
+        best.active_streams += 1
+        return best
+
+    def acquire(self) -> MirrorChannel:
+        """
+        Places a new subscription on the least-loaded channel of a healthy endpoint.
+
+        Endpoints in failover backoff are skipped. If every endpoint is in backoff,
+        the one whose backoff ends first is used. Ties go to the earlier endpoint.
+        Call `release()` when the subscription ends.
+
+        Raises:
+            RuntimeError: If the pool is closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MirrorChannelPool is closed")
+            return self._acquire(self._channels, self._open_channel)
+
+    def acquire_aio(self) -> MirrorChannel:
+        """
+        Like `acquire()`, but places the subscription on a `grpc.aio` channel.
+
+        Asyncio channels are opened per event loop, with the same options as the
+        threaded ones, and share their endpoint health. Call `release()` when the
+        subscription ends.
+
+        Raises:
+            RuntimeError: If the pool is closed or no event loop is running.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MirrorChannelPool is closed")
+            groups = self._aio_channels.setdefault(loop, {})
+            return self._acquire(groups, self._open_aio_channel)
+
+    def release(self, channel: MirrorChannel) -> None:
+        """Records that a subscription placed by `acquire()` has ended."""
+        with self._lock:
+            channel.active_streams = max(0, channel.active_streams - 1)
+
+    def mark_failed(self, channel: MirrorChannel) -> None:
+        """Skips the channel's endpoint for the failover backoff period."""
+        with self._lock:
+            self._unhealthy_until[channel.endpoint] = time.monotonic() + self._failover_backoff
+
+    def close(self) -> None:
+        """
+        Closes every channel. Further calls to `acquire()` fail.
+
+        Asyncio channels are closed on their event loop if it is still running.
+        """
+        with self._lock:
+            self._closed = True
+            channels = [channel for group in self._channels.values() for channel in group]
+            self._channels.clear()
+            aio_channels = [
+                (loop, channel)
+                for loop, groups in self._aio_channels.items()
+                for group in groups.values()
+                for channel in group
+            ]
+            self._aio_channels.clear()
+
+        for channel in channels:
+            channel.channel.close()
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for loop, channel in aio_channels:
+            if loop is running:
+                loop.create_task(channel.channel.close())
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(channel.channel.close(), loop)
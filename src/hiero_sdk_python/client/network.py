@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import secrets
 import time
 from typing import Any
@@ -11,6 +12,7 @@ import requests
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.address_book.node_address import NodeAddress
+from hiero_sdk_python.client.mirror_channel_pool import TLS_PORTS, MirrorChannelPool
 from hiero_sdk_python.hapi.mirror import consensus_service_pb2_grpc as mirror_consensus_grpc
 from hiero_sdk_python.node import _Node
 
@@ -102,6 +104,10 @@ class Network:
         self._mirror_address: str = mirror_address or self.MIRROR_ADDRESS_DEFAULT.get(self.network, "localhost:5600")
         self._mirror_channel: grpc.Channel | None = None
         self._mirror_stub: mirror_consensus_grpc.ConsensusServiceStub | None = None
+        self._mirror_aio_channel: grpc.aio.Channel | None = None
+        self._mirror_aio_stub: mirror_consensus_grpc.ConsensusServiceStub | None = None
+        self._mirror_aio_loop: asyncio.AbstractEventLoop | None = None
+        self._mirror_channel_pool: MirrorChannelPool | None = None
 
         self.ledger_id = ledger_id or self.LEDGER_ID.get(self.network, bytes.fromhex("03"))
 
@@ -436,25 +442,93 @@ class Network:
 
         self._mirror_channel = None
         self._mirror_stub = None
+        self._close_mirror_aio_channel()
+
+    def _close_mirror_aio_channel(self):
+        """Closes the asyncio mirror channel on the event loop it was created on, if still running."""
+        channel, loop = self._mirror_aio_channel, self._mirror_aio_loop
+        self._mirror_aio_channel = None
+        self._mirror_aio_stub = None
+        self._mirror_aio_loop = None
+
+        if channel is None or loop is None or loop.is_closed():
+            return
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            loop.create_task(channel.close())
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(channel.close(), loop)
 
     def _close(self):
         """Safely closes the mirror gRPC channel and consensus node."""
         self._close_mirror_node()
 
+        if self._mirror_channel_pool is not None:
+            self._mirror_channel_pool.close()
+            self._mirror_channel_pool = None
+
         if self.nodes:
             for node in self.nodes:
                 node._close()
 
+    def _open_mirror_channel(self, channels: Any) -> grpc.Channel | grpc.aio.Channel:
+        """
+        Opens a channel to the mirror address, using TLS for the TLS ports (443 and 50212).
+
+        Args:
+            channels: The module to open the channel with, `grpc` or `grpc.aio`.
+        """
+        addr = self._mirror_address
+        port = addr.rpartition(":")[2]
+        if port.isdigit() and int(port) in TLS_PORTS:
+            return channels.secure_channel(addr, grpc.ssl_channel_credentials())
+        return channels.insecure_channel(addr)
+
     def get_mirror_stub(self) -> mirror_consensus_grpc.ConsensusServiceStub:
         """Returns the mirror stub."""
         if self._mirror_stub is None:
-            addr = self._mirror_address
-
-            if addr.endswith(":50212") or addr.endswith(":443"):
-                self._mirror_channel = grpc.secure_channel(addr, grpc.ssl_channel_credentials())
-            else:
-                self._mirror_channel = grpc.insecure_channel(addr)
-
+            self._mirror_channel = self._open_mirror_channel(grpc)
             self._mirror_stub = mirror_consensus_grpc.ConsensusServiceStub(self._mirror_channel)
 
         return self._mirror_stub
+
+    def get_mirror_channel_pool(self) -> MirrorChannelPool | None:
+        """Returns the mirror channel pool used for topic subscriptions, if one is configured."""
+        return self._mirror_channel_pool
+
+    def set_mirror_channel_pool(self, pool: MirrorChannelPool | None) -> None:
+        """
+        Sets the pool topic subscriptions take their mirror channel from.
+
+        A previously set pool is closed. None goes back to the single mirror channel.
+        """
+        if pool is not None and not isinstance(pool, MirrorChannelPool):
+            raise TypeError(f"pool must be a MirrorChannelPool, not {type(pool).__name__}")
+
+        if self._mirror_channel_pool is not None and self._mirror_channel_pool is not pool:
+            self._mirror_channel_pool.close()
+        self._mirror_channel_pool = pool
+
+    def get_mirror_aio_stub(self) -> mirror_consensus_grpc.ConsensusServiceStub:
+        """
+        Returns a mirror stub bound to a `grpc.aio` channel on the running event loop.
+
+        One channel is shared by every asyncio subscription on that loop. If called
+        from a different event loop, the previous channel is closed and replaced.
+
+        Raises:
+            RuntimeError: If called outside of a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._mirror_aio_stub is None or self._mirror_aio_loop is not loop:
+            self._close_mirror_aio_channel()
+            self._mirror_aio_channel = self._open_mirror_channel(grpc.aio)
+            self._mirror_aio_stub = mirror_consensus_grpc.ConsensusServiceStub(self._mirror_aio_channel)
+            self._mirror_aio_loop = loop
+
+        return self._mirror_aio_stub
@@ -0,0 +1,198 @@
+"""
+Durable resume points for topic subscriptions.
+
+A `TopicMessageQuery` with a checkpoint store saves how far each topic has been
+consumed, and resumes from there after a restart instead of replaying from its
+start time.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TextIO
+
+from hiero_sdk_python.consensus.topic_id import TopicId
+
+
+@dataclass(frozen=True)
+class TopicCheckpoint:
+    """
+    How far a topic has been consumed.
+
+    Attributes:
+        consensus_timestamp (int): Consensus timestamp, in nanoseconds since the epoch,
+            up to which every message has been handled. A resumed subscription starts
+            right after it.
+        sequence_number (int): The highest sequence number delivered. Messages at or
+            below it are dropped as duplicates.
+    """
+
+    consensus_timestamp: int
+    sequence_number: int
+
+
+class TopicCheckpointStore(ABC):
+    """Persists one `TopicCheckpoint` per topic. Implementations must be thread-safe."""
+
+    @abstractmethod
+    def load(self, topic_id: TopicId) -> TopicCheckpoint | None:
+        """Returns the checkpoint saved for a topic, or None if there is none."""
+
+    @abstractmethod
+    def save(self, topic_id: TopicId, checkpoint: TopicCheckpoint) -> None:
+        """Durably replaces the checkpoint of a topic."""
+
+    def close(self) -> None:  # noqa: B027
+        """Releases any resources held by the store. Does nothing by default."""
+
+
+class FileCheckpointStore(TopicCheckpointStore):
+    """
+    Stores the checkpoints of all topics in one append-only file.
+
+    Each save appends and fsyncs a single JSON line for the changed topic, so the
+    cost of a save does not grow with the number of topics. When loading, the last
+    line of each topic wins, and a line torn by a crash is ignored. Once the file
+    holds `compact_after` superseded lines, it is rewritten atomically (write,
+    fsync, rename) with one line per topic.
+    """
+
+    def __init__(self, path: str | os.PathLike, compact_after: int = 1024) -> None:
+        """
+        Args:
+            path (str | os.PathLike): The checkpoint file. It is created on the first save.
+            compact_after (int, optional): The number of superseded lines that triggers
+                a rewrite of the file.
+
+        Raises:
+            ValueError: If compact_after is not positive.
+        """
+        if compact_after <= 0:
+            raise ValueError("compact_after must be positive")
+
+        self.path = os.fspath(path)
+        self.compact_after = compact_after
+        self._lock = threading.Lock()
+        self._checkpoints: dict[str, TopicCheckpoint] = {}
+        self._file: TextIO | None = None
+        self._lines = 0
+        self._needs_compaction = False
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                contents = f.read()
+        except FileNotFoundError:
+            return
+
+        for line in contents.splitlines():
+            try:
+                entry = json.loads(line)
+                checkpoint = TopicCheckpoint(entry["consensus_timestamp"], entry["sequence_number"])
+                self._checkpoints[entry["topic_id"]] = checkpoint
+            except (ValueError, KeyError, TypeError):  # noqa: PERF203
+                self._needs_compaction = True
+            else:
+                self._lines += 1
+        # Appending after a torn last line would corrupt the next entry.
+        if contents and not contents.endswith("\n"):
+            self._needs_compaction = True
+
+    def load(self, topic_id: TopicId) -> TopicCheckpoint | None:
+        with self._lock:
+            return self._checkpoints.get(str(topic_id))
+
+    def save(self, topic_id: TopicId, checkpoint: TopicCheckpoint) -> None:
+        with self._lock:
+            topic = str(topic_id)
+            self._checkpoints[topic] = checkpoint
+            if self._needs_compaction or self._lines - len(self._checkpoints) >= self.compact_after:
+                self._compact()
+                return
+
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+            self._file.write(_checkpoint_line(topic, checkpoint))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._lines += 1
+
+    def _compact(self) -> None:
+        """Atomically rewrites the file with the current checkpoint of every topic."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(_checkpoint_line(topic, cp) for topic, cp in self._checkpoints.items())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._lines = len(self._checkpoints)
+        self._needs_compaction = False
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _checkpoint_line(topic: str, checkpoint: TopicCheckpoint) -> str:
+    entry = {
+        "topic_id": topic,
+        "consensus_timestamp": checkpoint.consensus_timestamp,
+        "sequence_number": checkpoint.sequence_number,
+    }
+    return json.dumps(entry) + "\n"
+
+
+class SQLiteCheckpointStore(TopicCheckpointStore):
+    """Stores checkpoints in a SQLite database, one row per topic."""
+
+    def __init__(self, path: str | os.PathLike, table: str = "topic_checkpoints") -> None:
+        """
+        Args:
+            path (str | os.PathLike): The database file, or ":memory:".
+            table (str, optional): The table checkpoints are kept in. It is created if missing.
+
+        Raises:
+            ValueError: If the table name is not a valid identifier.
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table!r}")
+
+        self._table = table
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "topic_id TEXT PRIMARY KEY, consensus_timestamp INTEGER NOT NULL, sequence_number INTEGER NOT NULL)"
+            )
+
+    def load(self, topic_id: TopicId) -> TopicCheckpoint | None:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT consensus_timestamp, sequence_number FROM {self._table} WHERE topic_id = ?",
+                (str(topic_id),),
+            ).fetchone()
+        return TopicCheckpoint(*row) if row is not None else None
+
+    def save(self, topic_id: TopicId, checkpoint: TopicCheckpoint) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT INTO {self._table} (topic_id, consensus_timestamp, sequence_number) VALUES (?, ?, ?) "
+                "ON CONFLICT(topic_id) DO UPDATE SET "
+                "consensus_timestamp = excluded.consensus_timestamp, sequence_number = excluded.sequence_number",
+                (str(topic_id), checkpoint.consensus_timestamp, checkpoint.sequence_number),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -13,10 +13,18 @@ from dataclasses import dataclass, field
 
 from hiero_sdk_python.client.client import Client
 from hiero_sdk_python.hapi.services import basic_types_pb2
-from hiero_sdk_python.utils.entity_id_helper import format_to_string_with_checksum, parse_from_string, validate_checksum
-
-
-@dataclass(frozen=True)
+from hiero_sdk_python.utils.entity_id_helper import (
+    copy_proto,
+    entity_id_getstate,
+    entity_id_setstate,
+    format_to_string_with_checksum,
+    intern_entity_id,
+    parse_entity_id,
+    validate_checksum,
+)
+
+
+@dataclass(frozen=True, slots=True)
 class TopicId:
     """
     Represents the unique identifier of a topic in the Hedera Consensus Service (HCS).
@@ -35,6 +43,15 @@ class TopicId:
     realm: int = 0
     num: int = 0
     checksum: str | None = field(default=None, init=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _proto: basic_types_pb2.TopicID | None = field(default=None, init=False, repr=False, compare=False)
+
+    __getstate__ = entity_id_getstate
+    __setstate__ = entity_id_setstate
+
+    def __post_init__(self) -> None:
+        """Precomputes the hash of the TopicId."""
+        object.__setattr__(self, "_hash", hash((self.shard, self.realm, self.num)))
 
     @classmethod
     def _from_proto(cls, topic_id_proto: basic_types_pb2.TopicID) -> TopicId:
@@ -47,7 +64,7 @@ class TopicId:
         Returns:
             TopicId: A new TopicId instance.
         """
-        return cls(shard=topic_id_proto.shardNum, realm=topic_id_proto.realmNum, num=topic_id_proto.topicNum)
+        return intern_entity_id(cls, topic_id_proto.shardNum, topic_id_proto.realmNum, topic_id_proto.topicNum)
 
     def _to_proto(self) -> basic_types_pb2.TopicID:
         """
@@ -56,11 +73,15 @@ class TopicId:
         Returns:
             basic_types_pb2.TopicID: The protobuf TopicID representation.
         """
-        topic_id_proto = basic_types_pb2.TopicID()
-        topic_id_proto.shardNum = self.shard
-        topic_id_proto.realmNum = self.realm
-        topic_id_proto.topicNum = self.num
-        return topic_id_proto
+        topic_id_proto = self._proto
+        if topic_id_proto is None:
+            topic_id_proto = basic_types_pb2.TopicID(shardNum=self.shard, realmNum=self.realm, topicNum=self.num)
+            object.__setattr__(self, "_proto", topic_id_proto)
+        return copy_proto(topic_id_proto)
+
+    def __hash__(self) -> int:
+        """Returns the precomputed hash of the TopicId."""
+        return self._hash
 
     def __str__(self) -> str:
         """
@@ -95,9 +116,9 @@ class TopicId:
             ValueError: If the string format is invalid.
         """
         try:
-            shard, realm, num, checksum = parse_from_string(topic_id_str)
+            shard, realm, num, checksum = parse_entity_id(topic_id_str)
 
-            topic_id: TopicId = cls(shard=int(shard), realm=int(realm), num=int(num))
+            topic_id: TopicId = cls(shard=shard, realm=realm, num=num)
             object.__setattr__(topic_id, "checksum", checksum)
 
             return topic_id
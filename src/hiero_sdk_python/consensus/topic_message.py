@@ -87,32 +87,29 @@ class TopicMessage:
     @classmethod
     def of_many(cls, responses: list[mirror_proto.ConsensusTopicResponse]) -> TopicMessage:  # type: ignore
         """Reassemble multiple chunk responses into a single TopicMessage."""
-        sorted_responses: list[mirror_proto.ConsensusTopicResponse] = sorted(
-            responses, key=lambda r: r.chunkInfo.number
-        )
-
-        chunks: list[TopicMessageChunk] = []
-        total_size: int = 0
-        transaction_id: TransactionId | None = None
+        ordered: list[mirror_proto.ConsensusTopicResponse | None] = [None] * len(responses)
+        for r in responses:
+            index = r.chunkInfo.number - 1
+            if not 0 <= index < len(ordered) or ordered[index] is not None:
+                # Chunk numbers are missing or inconsistent; fall back to a stable sort.
+                ordered = sorted(responses, key=lambda r: r.chunkInfo.number)
+                break
+            ordered[index] = r
 
-        for r in sorted_responses:
-            c = TopicMessageChunk(r)
-            chunks.append(c)
+        return cls._of_ordered(ordered)
 
-            total_size += len(r.message)
+    @classmethod
+    def _of_ordered(cls, responses: list[mirror_proto.ConsensusTopicResponse]) -> TopicMessage:  # type: ignore
+        """Build a TopicMessage from chunk responses already in chunk order."""
+        chunks: list[TopicMessageChunk] = [TopicMessageChunk(r) for r in responses]
 
-            if transaction_id is None and r.HasField("chunkInfo") and r.chunkInfo.HasField("initialTransactionID"):
+        transaction_id: TransactionId | None = None
+        for r in responses:
+            if r.HasField("chunkInfo") and r.chunkInfo.HasField("initialTransactionID"):
                 transaction_id = TransactionId._from_proto(r.chunkInfo.initialTransactionID)
+                break
 
-        contents = bytearray(total_size)
-
-        offset: int = 0
-        for r in sorted_responses:
-            end = offset + len(r.message)
-            contents[offset:end] = r.message
-            offset = end
-
-        last_r: mirror_proto.ConsensusTopicResponse = sorted_responses[-1]
+        last_r: mirror_proto.ConsensusTopicResponse = responses[-1]
         consensus_timestamp: datetime = Timestamp._from_protobuf(last_r.consensusTimestamp).to_date()
         running_hash: bytes = last_r.runningHash
         sequence_number: int = last_r.sequenceNumber
@@ -120,7 +117,7 @@ class TopicMessage:
         return cls(
             consensus_timestamp,
             {
-                "contents": bytes(contents),
+                "contents": b"".join(r.message for r in responses),
                 "running_hash": running_hash,
                 "sequence_number": sequence_number,
             },
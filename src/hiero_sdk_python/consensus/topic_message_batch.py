@@ -0,0 +1,78 @@
+"""
+Columnar batch of topic messages for high-volume subscriptions.
+
+A `TopicMessageBatch` holds the consensus timestamps, sequence numbers and
+payloads of many `ConsensusTopicResponse`s in a few flat arrays, without
+building a `TopicMessage`, `TopicMessageChunk` and `datetime` per message.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Sequence
+
+from hiero_sdk_python.hapi.mirror import consensus_service_pb2 as mirror_proto
+
+
+class TopicMessageBatch:
+    """
+    Consensus timestamps, sequence numbers and payloads of a batch of topic messages.
+
+    Attributes:
+        consensus_timestamps (array): Consensus timestamps in nanoseconds since the epoch.
+        sequence_numbers (array): Topic sequence numbers.
+        payload (bytes): The payloads of every message, concatenated.
+        offsets (array): Start offset of each payload in `payload`, followed by its total length.
+    """
+
+    def __init__(
+        self,
+        consensus_timestamps: array,
+        sequence_numbers: array,
+        payload: bytes,
+        offsets: array,
+    ) -> None:
+        self.consensus_timestamps: array = consensus_timestamps
+        self.sequence_numbers: array = sequence_numbers
+        self.payload: bytes = payload
+        self.offsets: array = offsets
+
+    @classmethod
+    def from_responses(cls, responses: Sequence[mirror_proto.ConsensusTopicResponse]) -> TopicMessageBatch:
+        """Builds a batch from mirror node responses, in the order given."""
+        timestamps = array("q")
+        sequence_numbers = array("Q")
+        offsets = array("Q", [0])
+        payloads: list[bytes] = []
+
+        offset = 0
+        for response in responses:
+            timestamp = response.consensusTimestamp
+            timestamps.append(timestamp.seconds * 1_000_000_000 + timestamp.nanos)
+            sequence_numbers.append(response.sequenceNumber)
+
+            message = response.message
+            payloads.append(message)
+            offset += len(message)
+            offsets.append(offset)
+
+        return cls(timestamps, sequence_numbers, b"".join(payloads), offsets)
+
+    def contents(self, index: int) -> memoryview:
+        """Returns a zero-copy view of the payload of the message at `index`."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TopicMessageBatch index out of range")
+        return memoryview(self.payload)[self.offsets[index] : self.offsets[index + 1]]
+
+    def __len__(self) -> int:
+        return len(self.sequence_numbers)
+
+    def __iter__(self) -> Iterator[tuple[int, int, memoryview]]:
+        """Yields (consensus_timestamp_nanos, sequence_number, contents) for each message."""
+        view = memoryview(self.payload)
+        for i, (timestamp, sequence_number) in enumerate(
+            zip(self.consensus_timestamps, self.sequence_numbers, strict=True)
+        ):
+            yield timestamp, sequence_number, view[self.offsets[i] : self.offsets[i + 1]]
@@ -43,6 +43,8 @@ class TopicMessageSubmitTransaction(ChunkedTransaction):
         super().__init__()
         self.topic_id: TopicId | None = topic_id
         self.message: bytes | str | None = message
+        # (message, encoded bytes) so a str message is encoded only once
+        self._encoded_message: tuple[bytes | str, bytes] | None = None
         self.chunk_size: int = 1024
         self.max_chunks: int = 20
         if chunk_size is not None:
@@ -57,13 +59,21 @@ class TopicMessageSubmitTransaction(ChunkedTransaction):
         """
         Returns the message encoded as bytes for chunking and protobuf serialization.
 
+        A str message is encoded once and the result reused until the message changes.
+
         Returns:
             bytes: The message as bytes.
         """
-        if self.message is None:
+        message = self.message
+        if message is None:
             return b""
+        if not isinstance(message, str):
+            return message
 
-        return self.message.encode("utf-8") if isinstance(self.message, str) else self.message
+        encoded = self._encoded_message
+        if encoded is None or encoded[0] is not message:
+            encoded = self._encoded_message = (message, message.encode("utf-8"))
+        return encoded[1]
 
     def get_required_chunks(self) -> int:
         """
@@ -175,11 +185,7 @@ class TopicMessageSubmitTransaction(ChunkedTransaction):
         if not self.message:
             raise ValueError("Missing required fields: message.")
 
-        content = self._message_as_bytes()
-
-        start_index = self._current_chunk_index * self.chunk_size
-        end_index = min(start_index + self.chunk_size, len(content))
-        chunk_content = content[start_index:end_index]
+        chunk_content = self._current_chunk(self._message_as_bytes())
 
         body = consensus_submit_message_pb2.ConsensusSubmitMessageTransactionBody(
             topicID=self.topic_id._to_proto() if self.topic_id else None, message=chunk_content
@@ -0,0 +1,374 @@
+"""
+Columnar decoding of large contract results and event log scans.
+
+Decoding with eth-abi, or word by word with `ContractFunctionResult` getters,
+creates Python objects one value at a time. The functions here decode arrays of
+fixed-width static values (`uint<N>`, `int<N>`, `bool`, `address`, `bytes<K>`)
+into columns in one pass: NumPy arrays when NumPy is installed, and `array`
+module arrays (or lists, for values that do not fit in 64 bits) otherwise.
+
+Column types by element type:
+
+    =====================  =========================  ================
+    Element type           With NumPy                 Without NumPy
+    =====================  =========================  ================
+    uint8 ... uint64       uint64 ndarray             array("Q")
+    int8 ... int64         int64 ndarray              array("q")
+    uint72 ... uint256     object ndarray of int      list[int]
+    int72 ... int256       object ndarray of int      list[int]
+    bool                   bool ndarray               array("B")
+    address                (n, 20) uint8 ndarray      list[bytes]
+    bytes1 ... bytes32     (n, K) uint8 ndarray       list[bytes]
+    =====================  =========================  ================
+"""
+
+from __future__ import annotations
+
+import re
+import struct
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from hiero_sdk_python.contract.contract import Contract, ContractEvent
+from hiero_sdk_python.contract.contract_function_result import ContractFunctionResult
+from hiero_sdk_python.contract.contract_id import ContractId
+from hiero_sdk_python.contract.contract_log_info import ContractLogInfo
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_WORD = 32
+_INT_TYPE = re.compile(r"(u?)int(\d*)")
+_BYTES_TYPE = re.compile(r"bytes(\d+)")
+_ARRAY_TYPE = re.compile(r"(.+)\[(\d*)\]")
+
+
+@dataclass(frozen=True)
+class _ElementType:
+    kind: str  # "uint", "int", "bool", "address" or "bytes"
+    size: int = 0  # bits for integers, bytes for bytes<K>
+
+
+@lru_cache(maxsize=256)
+def _element_type(type_str: str) -> _ElementType:
+    if type_str in ("bool", "address"):
+        return _ElementType(type_str)
+
+    match = _INT_TYPE.fullmatch(type_str)
+    if match:
+        bits = int(match.group(2) or 256)
+        if bits % 8 == 0 and 8 <= bits <= 256:
+            return _ElementType("uint" if match.group(1) else "int", bits)
+
+    match = _BYTES_TYPE.fullmatch(type_str)
+    if match and 1 <= int(match.group(1)) <= 32:
+        return _ElementType("bytes", int(match.group(1)))
+
+    raise ValueError(f"{type_str} is not a fixed-width static type")
+
+
+def _invalid(element: _ElementType) -> ValueError:
+    name = f"{element.kind}{element.size or ''}"
+    return ValueError(f"Invalid {name} value in encoded data")
+
+
+def _check_int(element: _ElementType, value: int) -> int:
+    if element.kind == "uint":
+        if value >> element.size:
+            raise _invalid(element)
+    elif not -(1 << (element.size - 1)) <= value < 1 << (element.size - 1):
+        raise _invalid(element)
+    return value
+
+
+def _decode_words(buf: bytes, count: int, stride: int, offset: int, element: _ElementType) -> Any:
+    """
+    Decodes one value from each of `count` records of `stride` bytes in `buf`,
+    reading the 32-byte word at `offset` of every record.
+    """
+    if element.kind in ("uint", "int") and element.size > 64:
+        values = _decode_big_ints(buf, stride, offset, element)
+        return np.array(values, dtype=object) if np is not None else values
+    if np is not None:
+        return _decode_numpy(buf, count, stride, offset, element)
+    return _decode_array(buf, stride, offset, element)
+
+
+def _record(stride: int, offset: int, fields: str) -> struct.Struct:
+    return struct.Struct(f">{offset}x{fields}{stride - offset - _WORD}x")
+
+
+def _decode_big_ints(buf: bytes, stride: int, offset: int, element: _ElementType) -> list[int]:
+    values = []
+    for a, b, c, d in _record(stride, offset, "4Q").iter_unpack(buf):
+        value = (a << 192) | (b << 128) | (c << 64) | d
+        if element.kind == "int" and a >> 63:
+            value -= 1 << 256
+        values.append(_check_int(element, value))
+    return values
+
+
+def _decode_array(buf: bytes, stride: int, offset: int, element: _ElementType) -> Any:
+    if element.kind in ("address", "bytes"):
+        size = 20 if element.kind == "address" else element.size
+        padding = bytes(_WORD - size)
+        fields = f"{_WORD - size}s{size}s" if element.kind == "address" else f"{size}s{_WORD - size}s"
+        values = []
+        for first, second in _record(stride, offset, fields).iter_unpack(buf):
+            value, pad = (second, first) if element.kind == "address" else (first, second)
+            if pad != padding:
+                raise _invalid(element)
+            values.append(value)
+        return values
+
+    records = _record(stride, offset, "3Qq" if element.kind == "int" else "4Q").iter_unpack(buf)
+    if element.kind == "int":
+        values = array("q")
+        for a, b, c, d in records:
+            sign = 0xFFFFFFFFFFFFFFFF if d < 0 else 0
+            if a != sign or b != sign or c != sign:
+                raise _invalid(element)
+            values.append(_check_int(element, d))
+        return values
+
+    limit = 1 if element.kind == "bool" else (1 << element.size) - 1
+    values = array("B" if element.kind == "bool" else "Q")
+    for a, b, c, d in records:
+        if a or b or c or d > limit:
+            raise _invalid(element)
+        values.append(d)
+    return values
+
+
+def _decode_numpy(buf: bytes, count: int, stride: int, offset: int, element: _ElementType) -> Any:
+    words = np.frombuffer(buf, dtype=np.uint8, count=count * stride).reshape(count, stride)[:, offset : offset + _WORD]
+    kind = element.kind
+
+    if kind == "address":
+        if words[:, :12].any():
+            raise _invalid(element)
+        return words[:, 12:].copy()
+    if kind == "bytes":
+        if words[:, element.size :].any():
+            raise _invalid(element)
+        return words[:, : element.size].copy()
+    if kind == "bool":
+        if words[:, :31].any() or (words[:, 31] > 1).any():
+            raise _invalid(element)
+        return words[:, 31].astype(bool)
+
+    low = words[:, 24:].copy()
+    if kind == "uint":
+        values = low.view(">u8").ravel().astype(np.uint64)
+        if words[:, :24].any() or (element.size < 64 and (values >> np.uint64(element.size)).any()):
+            raise _invalid(element)
+        return values
+
+    values = low.view(">i8").ravel().astype(np.int64)
+    sign = np.where(values < 0, 0xFF, 0).astype(np.uint8)
+    if (words[:, :24] != sign[:, None]).any():
+        raise _invalid(element)
+    if element.size < 64:
+        limit = 1 << (element.size - 1)
+        if ((values < -limit) | (values >= limit)).any():
+            raise _invalid(element)
+    return values
+
+
+def _read_word(data: bytes, position: int) -> int:
+    if position + _WORD > len(data):
+        raise ValueError("Encoded data is too short")
+    return int.from_bytes(data[position : position + _WORD], "big")
+
+
+def decode_array(data: ContractFunctionResult | bytes, type_str: str, position: int = 0) -> Any:
+    """
+    Decodes an array of fixed-width static values from ABI-encoded return data.
+
+    Args:
+        data (ContractFunctionResult | bytes): The call result, or its raw return data.
+        type_str (str): The array type, e.g. "uint256[]", "address[]" or "bool[10]".
+        position (int, optional): The word of the head at which the array is encoded.
+            This is the output index when every earlier output is a single word,
+            such as a dynamic array or an elementary value.
+
+    Returns:
+        The column of decoded values; see the module documentation for its type.
+
+    Raises:
+        ValueError: If the type is not an array of fixed-width static values,
+            or the data does not hold a valid array of that type.
+    """
+    if isinstance(data, ContractFunctionResult):
+        data = data.contract_call_result or b""
+    data = bytes(data)
+
+    match = _ARRAY_TYPE.fullmatch(type_str)
+    if not match:
+        raise ValueError(f"{type_str} is not an array type")
+    element = _element_type(match.group(1))
+
+    start = position * _WORD
+    if match.group(2):
+        length = int(match.group(2))
+    else:
+        start = _read_word(data, start)
+        length = _read_word(data, start)
+        start += _WORD
+    if start + length * _WORD > len(data):
+        raise ValueError("Encoded data is too short")
+
+    return _decode_words(data[start : start + length * _WORD], length, _WORD, 0, element)
+
+
+def _topic_element(type_str: str) -> _ElementType:
+    try:
+        return _element_type(type_str)
+    except ValueError:
+        # Indexed values of other types are stored as their keccak256 hash
+        return _element_type("bytes32")
+
+
+def decode_event_logs(event: ContractEvent, logs: Sequence[ContractLogInfo]) -> dict[str, Any]:
+    """
+    Decodes the arguments of many logs of one event into one column per argument.
+
+    Every non-indexed argument must be a fixed-width static type. Indexed arguments
+    of other types are returned as a bytes32 column of their topic hashes.
+
+    Args:
+        event (ContractEvent): The event that emitted every log.
+        logs (Sequence[ContractLogInfo]): The logs to decode.
+
+    Returns:
+        dict[str, Any]: The columns, keyed by argument name, in argument order.
+
+    Raises:
+        ValueError: If a log was not emitted by the event, or an argument cannot be decoded.
+    """
+    first_topic = 0 if event.anonymous else 1
+    topic_count = first_topic + sum(event.indexed)
+    data_types = [type_str for type_str, indexed in zip(event.input_types, event.indexed, strict=True) if not indexed]
+    data_elements = [_element_type(type_str) for type_str in data_types]
+    data_size = _WORD * len(data_elements)
+
+    for log in logs:
+        if len(log.topics) != topic_count or (first_topic and bytes(log.topics[0]) != event.topic):
+            raise ValueError(f"Log is not a {event.signature} event")
+        if len(log.data or b"") != data_size:
+            raise ValueError(f"{event.signature} log data must be {data_size} bytes, got {len(log.data or b'')}")
+
+    data = b"".join(bytes(log.data or b"") for log in logs)
+    columns: dict[str, Any] = {}
+    topic = first_topic
+    word = 0
+    for name, type_str, indexed in zip(event.input_names, event.input_types, event.indexed, strict=True):
+        if indexed:
+            topics = b"".join(bytes(log.topics[topic]) for log in logs)
+            columns[name] = _decode_words(topics, len(logs), _WORD, 0, _topic_element(type_str))
+            topic += 1
+        else:
+            columns[name] = _decode_words(data, len(logs), data_size, word * _WORD, data_elements[word])
+            word += 1
+    return columns
+
+
+def _columnar(event: ContractEvent) -> bool:
+    try:
+        for type_str, indexed in zip(event.input_types, event.indexed, strict=True):
+            if not indexed:
+                _element_type(type_str)
+    except ValueError:
+        return False
+    return True
+
+
+@dataclass
+class DecodedLogs:
+    """
+    The logs of one event found in a scan.
+
+    Attributes:
+        event (ContractEvent): The event.
+        positions (list[int]): The index of each log in the scanned sequence.
+        contract_ids (list[ContractId | None]): The contract that emitted each log.
+        columns (dict[str, Any]): The arguments, one column per argument name.
+    """
+
+    event: ContractEvent
+    positions: list[int]
+    contract_ids: list[ContractId | None]
+    columns: dict[str, Any]
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+class EventLogIndex:
+    """Matches logs to events by topic hash and decodes them in bulk, one batch per event."""
+
+    def __init__(self, events: Iterable[ContractEvent]) -> None:
+        """
+        Args:
+            events (Iterable[ContractEvent]): The events to index. Anonymous events
+                have no topic hash and are ignored.
+        """
+        self._events: dict[bytes, ContractEvent] = {event.topic: event for event in events if event.topic is not None}
+        self._columnar: dict[bytes, bool] = {topic: _columnar(event) for topic, event in self._events.items()}
+
+    @classmethod
+    def from_abi(cls, abi: str | Sequence[Mapping[str, Any]]) -> EventLogIndex:
+        """Indexes every event of a contract ABI, given as JSON text or parsed JSON."""
+        return cls(Contract.from_abi(abi).events)
+
+    @property
+    def topics(self) -> list[bytes]:
+        """The topic hashes of the indexed events, e.g. for a mirror node topic filter."""
+        return list(self._events)
+
+    def get(self, topic: bytes) -> ContractEvent | None:
+        """Returns the event with the given topic hash, or None."""
+        return self._events.get(bytes(topic))
+
+    def group(self, logs: Iterable[ContractLogInfo]) -> dict[bytes, list[int]]:
+        """Returns the positions of the logs of each indexed event, by topic hash."""
+        groups: dict[bytes, list[int]] = {}
+        for i, log in enumerate(logs):
+            if log.topics:
+                topic = bytes(log.topics[0])
+                if topic in self._events:
+                    groups.setdefault(topic, []).append(i)
+        return groups
+
+    def decode(self, logs: Sequence[ContractLogInfo]) -> list[DecodedLogs]:
+        """
+        Decodes every log of an indexed event. Logs of other events are skipped.
+
+        Events whose non-indexed arguments are all fixed-width static types are
+        decoded in bulk into columns. Other events are decoded log by log, and
+        their columns are lists.
+
+        Returns:
+            list[DecodedLogs]: One entry per event found, in order of first occurrence.
+
+        Raises:
+            ValueError: If a log carries an indexed event's topic but cannot be decoded.
+        """
+        decoded = []
+        for topic, positions in self.group(logs).items():
+            event = self._events[topic]
+            matched = [logs[i] for i in positions]
+            if self._columnar[topic]:
+                columns = decode_event_logs(event, matched)
+            else:
+                rows = [event.decode_log(log) for log in matched]
+                columns = {name: [row[i] for row in rows] for i, name in enumerate(event.input_names)}
+            decoded.append(DecodedLogs(event, positions, [log.contract_id for log in matched], columns))
+        return decoded
@@ -0,0 +1,377 @@
+"""
+This module provides ABI-driven contract bindings.
+
+`Contract.from_abi()` compiles every function and event of a contract ABI once.
+Each bound function encodes its arguments with a cached `ContractFunction`, runs
+through `ContractCallQuery` or `ContractExecuteTransaction`, and decodes outputs
+into tuples, or named tuples when every output has a name. Events decode
+`ContractLogInfo` entries the same way.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections import namedtuple
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from hiero_sdk_python.contract.contract_call_query import ContractCallQuery
+from hiero_sdk_python.contract.contract_execute_transaction import ContractExecuteTransaction
+from hiero_sdk_python.contract.contract_function import (
+    ContractFunction,
+    _abi_type,
+    _decode,
+    _load_abi,
+    _tuple_decoder,
+)
+from hiero_sdk_python.contract.contract_function_result import ContractFunctionResult
+from hiero_sdk_python.contract.contract_id import ContractId
+from hiero_sdk_python.contract.contract_log_info import ContractLogInfo
+from hiero_sdk_python.utils.crypto_utils import keccak256
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.hbar import Hbar
+    from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
+
+
+DEFAULT_CALL_GAS = 100_000
+DEFAULT_EXECUTE_GAS = 300_000
+
+
+def _result_type(type_name: str, params: Sequence[Mapping[str, Any]]) -> type[tuple] | None:
+    """Returns a named tuple class if every parameter is named, otherwise None."""
+    names = [param.get("name") for param in params]
+    if not names or not all(names):
+        return None
+    return namedtuple(type_name, names, rename=True)
+
+
+def _wrap(result_type: type[tuple] | None, values: tuple[Any, ...]) -> tuple[Any, ...]:
+    return result_type(*values) if result_type is not None else values
+
+
+class ContractMethod:
+    """
+    A contract function bound to a contract.
+
+    Attributes:
+        function (ContractFunction): The compiled codec of the function.
+        contract_id (ContractId, optional): The contract the function is called on.
+    """
+
+    def __init__(
+        self,
+        function: ContractFunction,
+        contract_id: ContractId | None,
+        outputs: Sequence[Mapping[str, Any]] = (),
+        state_mutability: str | None = None,
+    ) -> None:
+        self.function: ContractFunction = function
+        self.contract_id: ContractId | None = contract_id
+        self.state_mutability: str | None = state_mutability
+        self._result_type = _result_type(f"{function.name}_result", outputs)
+
+    @property
+    def name(self) -> str:
+        return self.function.name
+
+    @property
+    def signature(self) -> str:
+        return self.function.signature
+
+    def encode(self, *args: Any) -> bytes:
+        """Returns the call data for a call with the given arguments."""
+        return self.function.encode(*args)
+
+    def decode(self, result: ContractFunctionResult | bytes) -> tuple[Any, ...]:
+        """
+        Decodes the outputs of a call.
+
+        Args:
+            result (ContractFunctionResult | bytes): The call result, or its raw return data.
+
+        Returns:
+            tuple: The outputs, as a named tuple when every output is named.
+
+        Raises:
+            ValueError: If the data cannot be decoded as the function outputs.
+        """
+        data = result.contract_call_result if isinstance(result, ContractFunctionResult) else result
+        return _wrap(self._result_type, self.function.decode_output(data or b""))
+
+    def query(self, *args: Any, gas: int = DEFAULT_CALL_GAS) -> ContractCallQuery:
+        """Returns a `ContractCallQuery` that calls the function with the given arguments."""
+        self._require_contract_id()
+        return (
+            ContractCallQuery()
+            .set_contract_id(self.contract_id)
+            .set_gas(gas)
+            .set_function_parameters(self.function.encode(*args))
+        )
+
+    def call(
+        self,
+        client: Client,
+        *args: Any,
+        gas: int = DEFAULT_CALL_GAS,
+        timeout: int | float | None = None,
+    ) -> tuple[Any, ...]:
+        """
+        Calls the function locally on a node with `ContractCallQuery` and decodes the outputs.
+
+        Returns:
+            tuple: The outputs, as a named tuple when every output is named.
+        """
+        return self.decode(self.query(*args, gas=gas).execute(client, timeout))
+
+    def transaction(
+        self,
+        *args: Any,
+        gas: int = DEFAULT_EXECUTE_GAS,
+        payable_amount: int | Hbar | None = None,
+    ) -> ContractExecuteTransaction:
+        """Returns a `ContractExecuteTransaction` that calls the function with the given arguments."""
+        self._require_contract_id()
+        transaction = (
+            ContractExecuteTransaction()
+            .set_contract_id(self.contract_id)
+            .set_gas(gas)
+            .set_function_parameters(self.function.encode(*args))
+        )
+        if payable_amount is not None:
+            transaction.set_payable_amount(payable_amount)
+        return transaction
+
+    def execute(
+        self,
+        client: Client,
+        *args: Any,
+        gas: int = DEFAULT_EXECUTE_GAS,
+        payable_amount: int | Hbar | None = None,
+        timeout: int | float | None = None,
+    ) -> TransactionReceipt:
+        """Calls the function in a `ContractExecuteTransaction` and returns its receipt."""
+        return self.transaction(*args, gas=gas, payable_amount=payable_amount).execute(client, timeout=timeout)
+
+    def _require_contract_id(self) -> None:
+        if self.contract_id is None:
+            raise ValueError("Contract ID must be set to call a contract function")
+
+    def __repr__(self) -> str:
+        return f"ContractMethod({self.function.signature}, contract_id={self.contract_id})"
+
+
+class ContractEvent:
+    """
+    A compiled decoder for one contract event.
+
+    Attributes:
+        name (str): The event name.
+        input_names (tuple[str, ...]): The argument names; unnamed arguments are called "arg<position>".
+        input_types (tuple[str, ...]): The canonical ABI types of the arguments.
+        indexed (tuple[bool, ...]): Whether each argument is indexed, i.e. stored in a topic.
+        signature (str): The canonical signature, e.g. "Transfer(address,address,uint256)".
+        topic (bytes): The keccak256 hash of the signature (topic 0), or None for anonymous events.
+    """
+
+    def __init__(self, entry: Mapping[str, Any]) -> None:
+        """
+        Args:
+            entry (Mapping[str, Any]): The event's ABI entry.
+        """
+        inputs = entry.get("inputs", [])
+        self.name: str = entry["name"]
+        self.anonymous: bool = bool(entry.get("anonymous", False))
+        self.input_names: tuple[str, ...] = tuple(param.get("name") or f"arg{i}" for i, param in enumerate(inputs))
+        self.input_types: tuple[str, ...] = tuple(_abi_type(param) for param in inputs)
+        self.indexed: tuple[bool, ...] = tuple(bool(param.get("indexed")) for param in inputs)
+        self.signature: str = f"{self.name}({','.join(self.input_types)})"
+        self.topic: bytes | None = None if self.anonymous else keccak256(self.signature.encode())
+
+        self._data_positions = [i for i, indexed in enumerate(self.indexed) if not indexed]
+        self._data_decoder = _tuple_decoder(tuple(self.input_types[i] for i in self._data_positions))
+        self._topic_decoders = [
+            (i, _tuple_decoder((type_str,)) if self._is_value_type(type_str) else None)
+            for i, (type_str, indexed) in enumerate(zip(self.input_types, self.indexed, strict=True))
+            if indexed
+        ]
+        self._arity = len(inputs)
+        self._result_type = _result_type(self.name, inputs)
+
+    @staticmethod
+    def _is_value_type(type_str: str) -> bool:
+        """Indexed values of dynamic or composite types are stored as their keccak256 hash."""
+        return not (type_str in ("string", "bytes") or type_str.endswith("]") or type_str.startswith("("))
+
+    def decode_log(self, log: ContractLogInfo) -> tuple[Any, ...]:
+        """
+        Decodes the arguments of a log entry emitted by this event.
+
+        Indexed arguments of dynamic types (strings, bytes, arrays, tuples) are
+        returned as the 32-byte hash stored in the topic.
+
+        Raises:
+            ValueError: If the log was not emitted by this event or cannot be decoded.
+        """
+        topics = list(log.topics)
+        if not self.anonymous:
+            if not topics or bytes(topics[0]) != self.topic:
+                raise ValueError(f"Log is not a {self.signature} event")
+            topics = topics[1:]
+        if len(topics) != len(self._topic_decoders):
+            raise ValueError(
+                f"{self.signature} has {len(self._topic_decoders)} indexed arguments, log has {len(topics)}"
+            )
+
+        values: list[Any] = [None] * self._arity
+        try:
+            for (position, decoder), topic in zip(self._topic_decoders, topics, strict=True):
+                values[position] = _decode(decoder, bytes(topic))[0] if decoder is not None else bytes(topic)
+            for position, value in zip(self._data_positions, _decode(self._data_decoder, log.data or b""), strict=True):
+                values[position] = value
+        except Exception as e:
+            raise ValueError(f"Failed to decode {self.signature} log: {str(e)}") from e
+
+        return _wrap(self._result_type, tuple(values))
+
+    def __repr__(self) -> str:
+        return f"ContractEvent({self.signature})"
+
+
+class Contract:
+    """
+    Bindings for every function and event of a contract ABI.
+
+    Functions are available by name as attributes (`contract.balanceOf.call(client, owner)`)
+    or through `function()`, which also accepts signatures to select overloads.
+    """
+
+    def __init__(
+        self,
+        contract_id: ContractId | None,
+        methods: Iterable[ContractMethod] = (),
+        events: Iterable[ContractEvent] = (),
+    ) -> None:
+        self.contract_id: ContractId | None = contract_id
+        self._methods: dict[str, ContractMethod] = {}
+        self._methods_by_name: dict[str, list[ContractMethod]] = {}
+        for method in methods:
+            self._methods[method.signature] = method
+            self._methods_by_name.setdefault(method.name, []).append(method)
+
+        self._event_list: list[ContractEvent] = list(events)
+        self._events: dict[str, ContractEvent] = {}
+        self._events_by_topic: dict[bytes, ContractEvent] = {}
+        for event in self._event_list:
+            self._events[event.signature] = event
+            self._events.setdefault(event.name, event)
+            if event.topic is not None:
+                self._events_by_topic[event.topic] = event
+
+    @classmethod
+    def from_abi(
+        cls,
+        abi: str | Sequence[Mapping[str, Any]],
+        contract_id: ContractId | None = None,
+    ) -> Contract:
+        """
+        Compiles bindings for a contract ABI.
+
+        Args:
+            abi (str | Sequence[Mapping]): The contract ABI as JSON text or parsed JSON.
+            contract_id (ContractId, optional): The deployed contract. Required to call functions.
+
+        Raises:
+            ValueError: If the ABI contains an invalid type.
+        """
+        entries = _load_abi(abi)
+        methods = []
+        events = []
+        for entry in entries:
+            entry_type = entry.get("type", "function")
+            if entry_type == "function":
+                methods.append(
+                    ContractMethod(
+                        ContractFunction.from_abi(entry),
+                        contract_id,
+                        entry.get("outputs", []),
+                        entry.get("stateMutability"),
+                    )
+                )
+            elif entry_type == "event":
+                events.append(ContractEvent(entry))
+        return cls(contract_id, methods, events)
+
+    @property
+    def functions(self) -> list[ContractMethod]:
+        """All bound functions."""
+        return list(self._methods.values())
+
+    @property
+    def events(self) -> list[ContractEvent]:
+        """All events."""
+        return list(self._event_list)
+
+    def function(self, name: str) -> ContractMethod:
+        """
+        Returns a bound function by name, or by signature for overloaded functions.
+
+        Raises:
+            ValueError: If no function matches, or the name is overloaded.
+        """
+        method = self._methods.get(name)
+        if method is not None:
+            return method
+
+        candidates = self._methods_by_name.get(name)
+        if not candidates:
+            raise ValueError(f"No function {name!r} in contract ABI")
+        if len(candidates) > 1:
+            raise ValueError(f"Function {name!r} is overloaded; select it by signature")
+        return candidates[0]
+
+    def event(self, name: str) -> ContractEvent:
+        """
+        Returns an event by name or signature.
+
+        Raises:
+            ValueError: If no event matches.
+        """
+        event = self._events.get(name)
+        if event is None:
+            raise ValueError(f"No event {name!r} in contract ABI")
+        return event
+
+    def decode_log(self, log: ContractLogInfo) -> tuple[ContractEvent, tuple[Any, ...]] | None:
+        """
+        Decodes a log entry with the event whose topic it carries.
+
+        Returns:
+            tuple[ContractEvent, tuple] | None: The event and its decoded arguments, or
+                None if the log does not match any non-anonymous event of the ABI.
+        """
+        if not log.topics:
+            return None
+        event = self._events_by_topic.get(bytes(log.topics[0]))
+        if event is None:
+            return None
+        return event, event.decode_log(log)
+
+    def with_contract_id(self, contract_id: ContractId) -> Contract:
+        """Returns bindings for another deployment of the same ABI, sharing the compiled codecs."""
+        methods = []
+        for method in self._methods.values():
+            rebound = copy.copy(method)
+            rebound.contract_id = contract_id
+            methods.append(rebound)
+        return Contract(contract_id, methods, self._event_list)
+
+    def __getattr__(self, name: str) -> ContractMethod:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self.function(name)
+        except ValueError as e:
+            raise AttributeError(str(e)) from e
@@ -0,0 +1,308 @@
+"""
+Batched read-only contract calls through a Multicall3 aggregator.
+
+Every `ContractCallQuery` is a separate paid query with its own cost lookup and
+payment. A `ContractCallBatch` packs many view calls into `aggregate3` calls on
+a Multicall3 contract, splitting the batch wherever the gas, call data or result
+size limits would be exceeded, and decodes each sub-call's result separately.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from eth_abi.grammar import TupleType, parse
+
+from hiero_sdk_python.contract.contract import ContractMethod
+from hiero_sdk_python.contract.contract_call_query import ContractCallQuery
+from hiero_sdk_python.contract.contract_function import ContractFunction
+from hiero_sdk_python.contract.contract_id import ContractId
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.client import Client
+
+
+# Canonical Multicall3 deployment address; override it with set_multicall_address()
+# on networks where Multicall3 is deployed elsewhere.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+DEFAULT_MAX_GAS = 15_000_000
+DEFAULT_GAS_PER_CALL = 50_000
+DEFAULT_MAX_RESULT_SIZE = 32 * 1024  # bytes
+DEFAULT_MAX_CALL_DATA_SIZE = 5 * 1024  # bytes, leaving room in the 6 KiB query limit
+DEFAULT_DYNAMIC_RESULT_SIZE = 256  # bytes assumed for a result of dynamic size
+
+# aggregate3((address target, bool allowFailure, bytes callData)[]) returns ((bool success, bytes returnData)[])
+AGGREGATE3 = ContractFunction("aggregate3", ["(address,bool,bytes)[]"], ["(bool,bytes)[]"])
+
+_BASE_GAS = 30_000  # the aggregator's own overhead per aggregate3 call
+_WORD = 32
+_ERROR_SELECTOR = bytes.fromhex("08c379a0")  # Error(string)
+_ERROR_DECODER = ContractFunction("Error", output_types=["string"])
+
+
+def _padded(size: int) -> int:
+    return -(-size // _WORD) * _WORD
+
+
+def _static_size(abi_type: Any) -> int:
+    if abi_type.is_array:
+        return abi_type.arrlist[-1][0] * _static_size(abi_type.item_type)
+    if isinstance(abi_type, TupleType):
+        return sum(_static_size(component) for component in abi_type.components)
+    return _WORD
+
+
+@lru_cache(maxsize=1024)
+def _result_size(output_types: tuple[str, ...]) -> int | None:
+    """Returns the encoded size of static outputs, or None if any output is dynamic."""
+    abi_types = [parse(type_str) for type_str in output_types]
+    if any(abi_type.is_dynamic for abi_type in abi_types):
+        return None
+    return sum(_static_size(abi_type) for abi_type in abi_types)
+
+
+def _revert_reason(data: bytes) -> str | None:
+    if data[:4] != _ERROR_SELECTOR:
+        return None
+    try:
+        return _ERROR_DECODER.decode_output(data[4:])[0]
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class ContractCallBatchResult:
+    """
+    The result of one call of a `ContractCallBatch`.
+
+    Attributes:
+        success (bool): Whether the call succeeded and its return data could be decoded.
+        return_data (bytes): The raw return data, or the revert data of a failed call.
+        values (tuple, optional): The decoded outputs of a successful call.
+        error (str, optional): The revert reason or decoding error of a failed call.
+    """
+
+    success: bool
+    return_data: bytes
+    values: tuple[Any, ...] | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class _BatchCall:
+    target: str
+    function: ContractFunction | ContractMethod
+    call_data: bytes
+    allow_failure: bool
+    gas: int
+    result_size: int
+
+    @property
+    def call_data_size(self) -> int:
+        # Offset, then the (address, bool, offset) head, the length word and the padded call data
+        return _WORD + 3 * _WORD + _WORD + _padded(len(self.call_data))
+
+    @property
+    def response_size(self) -> int:
+        # Offset, then the (bool, offset) head, the length word and the padded return data
+        return _WORD + 2 * _WORD + _WORD + _padded(self.result_size)
+
+
+class ContractCallBatch:
+    """
+    Runs many read-only contract calls as a few `aggregate3` calls on a Multicall3 contract.
+
+    Calls are added with `add()` and run, in order, by `execute()`, which returns one
+    `ContractCallBatchResult` per call. Only view and pure functions should be batched:
+    the aggregator runs every call as a local, read-only `ContractCallQuery`.
+    """
+
+    def __init__(self, multicall_address: ContractId | str = MULTICALL3_ADDRESS) -> None:
+        """
+        Creates an empty batch.
+
+        Args:
+            multicall_address (ContractId | str, optional): The Multicall3 contract, as a
+                ContractId or an EVM address.
+        """
+        self.multicall_id: ContractId = self._to_contract_id(multicall_address)
+        self.max_gas: int = DEFAULT_MAX_GAS
+        self.gas_per_call: int = DEFAULT_GAS_PER_CALL
+        self.max_result_size: int = DEFAULT_MAX_RESULT_SIZE
+        self.max_call_data_size: int = DEFAULT_MAX_CALL_DATA_SIZE
+        self._calls: list[_BatchCall] = []
+
+    @staticmethod
+    def _to_contract_id(address: ContractId | str) -> ContractId:
+        if isinstance(address, ContractId):
+            return address
+        if isinstance(address, str):
+            return ContractId.from_evm_address(0, 0, address)
+        raise TypeError(f"multicall_address must be a ContractId or str, got {type(address).__name__}")
+
+    @staticmethod
+    def _positive(name: str, value: int) -> int:
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"{name} must be an int, got {type(value).__name__}")
+        if value <= 0:
+            raise ValueError(f"{name} must be greater than 0")
+        return value
+
+    def set_multicall_address(self, multicall_address: ContractId | str) -> ContractCallBatch:
+        """Sets the Multicall3 contract, as a ContractId or an EVM address."""
+        self.multicall_id = self._to_contract_id(multicall_address)
+        return self
+
+    def set_max_gas(self, max_gas: int) -> ContractCallBatch:
+        """Sets the gas limit of one `aggregate3` call. Larger batches are split."""
+        self.max_gas = self._positive("max_gas", max_gas)
+        return self
+
+    def set_gas_per_call(self, gas_per_call: int) -> ContractCallBatch:
+        """Sets the gas budgeted for a call added without an explicit `gas`."""
+        self.gas_per_call = self._positive("gas_per_call", gas_per_call)
+        return self
+
+    def set_max_result_size(self, max_result_size: int) -> ContractCallBatch:
+        """Sets the largest `aggregate3` result, in bytes. Larger batches are split."""
+        self.max_result_size = self._positive("max_result_size", max_result_size)
+        return self
+
+    def set_max_call_data_size(self, max_call_data_size: int) -> ContractCallBatch:
+        """Sets the largest `aggregate3` call data, in bytes. Larger batches are split."""
+        self.max_call_data_size = self._positive("max_call_data_size", max_call_data_size)
+        return self
+
+    def add(
+        self,
+        function: ContractFunction | ContractMethod,
+        *args: Any,
+        target: ContractId | str | None = None,
+        allow_failure: bool = True,
+        gas: int | None = None,
+        result_size: int | None = None,
+    ) -> int:
+        """
+        Adds a call to the batch.
+
+        Args:
+            function (ContractFunction | ContractMethod): The function to call. A bound
+                `ContractMethod` is called on its own contract unless `target` is given.
+            *args: The function arguments.
+            target (ContractId | str, optional): The contract to call, as a ContractId or EVM address.
+            allow_failure (bool, optional): If False, a revert of this call fails the whole
+                `aggregate3` call it is part of.
+            gas (int, optional): The gas budgeted for the call. Defaults to `gas_per_call`.
+            result_size (int, optional): The expected size of the return data, in bytes.
+                Computed from the output types when they are static.
+
+        Returns:
+            int: The index of the call's result in the list returned by `execute()`.
+
+        Raises:
+            ValueError: If no target is known, or the arguments do not match the function.
+        """
+        if target is None and isinstance(function, ContractMethod):
+            target = function.contract_id
+        if target is None:
+            raise ValueError("target is required unless the function is bound to a contract")
+        address = target.to_evm_address() if isinstance(target, ContractId) else target
+        address = address if address.startswith("0x") else f"0x{address}"
+
+        codec = function.function if isinstance(function, ContractMethod) else function
+        if result_size is None:
+            result_size = _result_size(codec.output_types)
+        self._calls.append(
+            _BatchCall(
+                target=address,
+                function=function,
+                call_data=codec.encode(*args),
+                allow_failure=allow_failure,
+                gas=self._positive("gas", gas) if gas is not None else self.gas_per_call,
+                result_size=result_size if result_size is not None else DEFAULT_DYNAMIC_RESULT_SIZE,
+            )
+        )
+        return len(self._calls) - 1
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _chunks(self) -> list[list[_BatchCall]]:
+        """Splits the calls, in order, into groups that stay within every limit."""
+        chunks: list[list[_BatchCall]] = []
+        chunk: list[_BatchCall] = []
+        gas = call_data_size = result_size = 0
+        for call in self._calls:
+            fits = (
+                _BASE_GAS + gas + call.gas <= self.max_gas
+                and 4 + 2 * _WORD + call_data_size + call.call_data_size <= self.max_call_data_size
+                and 2 * _WORD + result_size + call.response_size <= self.max_result_size
+            )
+            if chunk and not fits:
+                chunks.append(chunk)
+                chunk = []
+                gas = call_data_size = result_size = 0
+            chunk.append(call)
+            gas += call.gas
+            call_data_size += call.call_data_size
+            result_size += call.response_size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def build_queries(self) -> list[ContractCallQuery]:
+        """Returns the `aggregate3` queries the batch runs, in order."""
+        return [self._build_query(chunk) for chunk in self._chunks()]
+
+    def _build_query(self, chunk: Sequence[_BatchCall]) -> ContractCallQuery:
+        calls = [(call.target, call.allow_failure, call.call_data) for call in chunk]
+        return (
+            ContractCallQuery()
+            .set_contract_id(self.multicall_id)
+            .set_gas(min(self.max_gas, _BASE_GAS + sum(call.gas for call in chunk)))
+            .set_max_result_size(self.max_result_size)
+            .set_function_parameters(AGGREGATE3.encode(calls))
+        )
+
+    def execute(self, client: Client, timeout: int | float | None = None) -> list[ContractCallBatchResult]:
+        """
+        Runs every call and decodes the results.
+
+        Args:
+            client (Client): The client to run the queries with.
+            timeout (int | float, optional): The timeout of each `aggregate3` query, in seconds.
+
+        Returns:
+            list[ContractCallBatchResult]: One result per call, in the order they were added.
+
+        Raises:
+            ValueError: If an `aggregate3` result cannot be decoded or has the wrong length.
+            PrecheckError: If an `aggregate3` query fails, e.g. when a call added with
+                `allow_failure=False` reverts.
+        """
+        results: list[ContractCallBatchResult] = []
+        for chunk in self._chunks():
+            response = self._build_query(chunk).execute(client, timeout)
+            (entries,) = AGGREGATE3.decode_output(response.contract_call_result or b"")
+            if len(entries) != len(chunk):
+                raise ValueError(f"aggregate3 returned {len(entries)} results for {len(chunk)} calls")
+            results.extend(
+                self._decode(call, success, bytes(data)) for call, (success, data) in zip(chunk, entries, strict=True)
+            )
+        return results
+
+    @staticmethod
+    def _decode(call: _BatchCall, success: bool, data: bytes) -> ContractCallBatchResult:
+        if not success:
+            return ContractCallBatchResult(False, data, error=_revert_reason(data) or "Call reverted")
+        decode = call.function.decode if isinstance(call.function, ContractMethod) else call.function.decode_output
+        try:
+            values = decode(data)
+        except ValueError as e:
+            return ContractCallBatchResult(False, data, error=str(e))
+        return ContractCallBatchResult(True, data, values)
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import traceback
+from typing import TYPE_CHECKING
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.channels import _Channel
@@ -23,6 +24,10 @@ from hiero_sdk_python.hapi.services import (
 from hiero_sdk_python.query.query import Query
 
 
+if TYPE_CHECKING:
+    from hiero_sdk_python.contract.contract_gas_estimator import ContractGasEstimator
+
+
 class ContractCallQuery(Query):
     """
     A query to call a contract on the network.
@@ -54,6 +59,7 @@ class ContractCallQuery(Query):
         self.max_result_size: int | None = max_result_size
         self.function_parameters: bytes | None = function_parameters
         self.sender: AccountId | None = sender
+        self.gas_estimator: ContractGasEstimator | None = None
 
     def set_contract_id(self, contract_id: ContractId | None) -> ContractCallQuery:
         """
@@ -128,6 +134,19 @@ class ContractCallQuery(Query):
         self.sender = sender
         return self
 
+    def set_gas_estimator(self, gas_estimator: ContractGasEstimator | None) -> ContractCallQuery:
+        """
+        Sets an estimator that fills in the gas and maximum result size on execution.
+
+        Only values that were not set explicitly are estimated, with the estimator's
+        safety margin added.
+
+        Args:
+            gas_estimator (ContractGasEstimator | None): The estimator to use, or None to disable estimation.
+        """
+        self.gas_estimator = gas_estimator
+        return self
+
     def _make_request(self) -> query_pb2.Query:
         """
         Constructs the protobuf request for the query.
@@ -204,6 +223,8 @@ class ContractCallQuery(Query):
             MaxAttemptsError: If the query fails after the maximum number of attempts
             ReceiptStatusError: If the query fails with a receipt status error
         """
+        if self.gas_estimator is not None:
+            self.gas_estimator.apply(self, self.sender or client.operator_account_id)
         self._before_execute(client)
         response = self._execute(client, timeout)
 
@@ -0,0 +1,418 @@
+"""
+Contract deployment that handles bytecode of any size.
+
+`ContractCreateFlow` sends small bytecode inline as the `initcode` of a
+`ContractCreateTransaction`. Larger bytecode is uploaded to a file first: a
+`FileCreateTransaction` with the first chunk, then the remaining chunks through
+a pipelined `FileAppendTransaction`, and the contract is created from the file.
+
+With a `BytecodeFileCache`, uploaded files are kept and reused by every later
+deployment of identical bytecode on the same network.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from hiero_sdk_python.contract.contract_create_transaction import ContractCreateTransaction
+from hiero_sdk_python.contract.contract_function_parameters import ContractFunctionParameters
+from hiero_sdk_python.file.file_append_transaction import FileAppendTransaction
+from hiero_sdk_python.file.file_contents_query import FileContentsQuery
+from hiero_sdk_python.file.file_create_transaction import FileCreateTransaction
+from hiero_sdk_python.file.file_delete_transaction import FileDeleteTransaction
+from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.file.file_info_query import FileInfoQuery
+
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
+
+
+logger = logging.getLogger(__name__)
+
+# Initcode and constructor parameters, or encoded Ethereum data, up to this size
+# are sent inline; a transaction, with its signatures, must fit in 6 KiB.
+DEFAULT_MAX_INLINE_SIZE = 5 * 1024
+DEFAULT_CHUNK_SIZE = 4096
+DEFAULT_PIPELINE_WINDOW = 4
+# A cached file is only reused if it expires later than this, in seconds
+_MIN_REMAINING_LIFETIME = 3600
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Holds an exclusive lock on a lock file, across processes."""
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class BytecodeFileCache:
+    """
+    Maps the content hash of contract bytecode to the file it was uploaded to.
+
+    Entries are kept in memory and, if a path is given, in a JSON file. Each change
+    is merged into the entries on disk under a lock file (`<path>.lock`) and written
+    to a unique temporary file that replaces the JSON file, so deployments in separate
+    processes (e.g. CI jobs) share uploads without losing each other's entries. An
+    unreadable JSON file is treated as empty. Thread-safe.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None) -> None:
+        """
+        Args:
+            path (str | os.PathLike, optional): The JSON file to persist entries in.
+                It is created on the first upload.
+        """
+        self.path: str | None = os.fspath(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._entries: dict[str, FileId] = self._load() if self.path is not None else {}
+
+    @staticmethod
+    def key(network: str, bytecode: bytes) -> str:
+        """Returns the cache key of bytecode deployed on a network."""
+        return f"{network}:{hashlib.sha256(bytecode).hexdigest()}"
+
+    def get(self, key: str) -> FileId | None:
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, file_id: FileId) -> None:
+        self._update(key, file_id)
+
+    def discard(self, key: str) -> None:
+        self._update(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _load(self) -> dict[str, FileId]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {key: FileId.from_string(file_id) for key, file_id in data.items()}
+        except FileNotFoundError:
+            return {}
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning("Ignoring unreadable bytecode file cache %s: %s", self.path, e)
+            return {}
+
+    def _update(self, key: str, file_id: FileId | None) -> None:
+        """Sets (or, with None, removes) an entry, merged with the entries other processes persisted."""
+        with self._lock:
+            if self.path is None:
+                self._apply(self._entries, key, file_id)
+                return
+            with _file_lock(f"{self.path}.lock"):
+                entries = self._load()
+                if self._apply(entries, key, file_id):
+                    self._write(entries)
+            self._entries = entries
+
+    @staticmethod
+    def _apply(entries: dict[str, FileId], key: str, file_id: FileId | None) -> bool:
+        """Applies a change to entries, returning whether they changed."""
+        if file_id is None:
+            return entries.pop(key, None) is not None
+        changed = entries.get(key) != file_id
+        entries[key] = file_id
+        return changed
+
+    def _write(self, entries: dict[str, FileId]) -> None:
+        directory, name = os.path.split(os.path.abspath(self.path))
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=directory, prefix=f"{name}.", suffix=".tmp", delete=False
+        ) as f:
+            try:
+                json.dump({key: str(file_id) for key, file_id in entries.items()}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, self.path)
+
+
+def _to_bytes(bytecode: bytes | str) -> bytes:
+    if isinstance(bytecode, str):
+        bytecode = bytecode.strip()
+        return bytes.fromhex(bytecode[2:] if bytecode.startswith("0x") else bytecode)
+    return bytes(bytecode)
+
+
+def _positive(name: str, value: int) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError(f"{name} must be an int, got {type(value).__name__}")
+    if value <= 0:
+        raise ValueError(f"{name} must be positive")
+    return value
+
+
+def _upload_hex_file(
+    client: Client,
+    data: bytes,
+    memo: str,
+    chunk_size: int,
+    pipeline_window: int,
+    timeout: int | float | None,
+) -> FileId:
+    """
+    Uploads data, hex encoded, to a new file owned by the operator.
+
+    The first chunk is sent with the file creation. The remaining chunks are appended
+    with up to `pipeline_window` chunks awaiting their receipts at once. If an append
+    fails, the partial file is deleted.
+    """
+    contents = data.hex().encode("ascii")
+    first, rest = contents[:chunk_size], contents[chunk_size:]
+
+    receipt = (
+        FileCreateTransaction()
+        .set_keys(client.operator_private_key.public_key())
+        .set_contents(first)
+        .set_file_memo(memo)
+        .execute(client, timeout, validate_status=True)
+    )
+    file_id = receipt.file_id
+    if not rest:
+        return file_id
+
+    try:
+        append = FileAppendTransaction().set_file_id(file_id).set_contents(rest)
+        append.set_chunk_size(chunk_size)
+        append.set_max_chunks(math.ceil(len(rest) / chunk_size))
+        append.set_pipeline_window(pipeline_window)
+        append.execute_all(client, timeout, validate_status=True)
+    except Exception:
+        _delete_file(client, file_id, timeout)
+        raise
+    return file_id
+
+
+def _delete_file(client: Client, file_id: FileId, timeout: int | float | None) -> None:
+    try:
+        FileDeleteTransaction().set_file_id(file_id).execute(client, timeout)
+    except Exception as e:
+        logger.warning("Failed to delete file %s: %s", file_id, e)
+
+
+class ContractCreateFlow:
+    """
+    Deploys a contract, uploading its bytecode to a file first when it is too large to send inline.
+
+    Contract properties such as gas, the admin key or constructor parameters are set on
+    the `ContractCreateTransaction` passed in, or through the setters of this flow.
+    """
+
+    def __init__(self, transaction: ContractCreateTransaction | None = None) -> None:
+        """
+        Args:
+            transaction (ContractCreateTransaction, optional): The contract creation to run.
+                The flow sets its bytecode or bytecode file.
+        """
+        self.transaction: ContractCreateTransaction = (
+            transaction if transaction is not None else ContractCreateTransaction()
+        )
+        self.bytecode: bytes | None = None
+        self.max_inline_size: int = DEFAULT_MAX_INLINE_SIZE
+        self.chunk_size: int = DEFAULT_CHUNK_SIZE
+        self.pipeline_window: int = DEFAULT_PIPELINE_WINDOW
+        self.cache: BytecodeFileCache | None = None
+        self.file_id: FileId | None = None
+
+    def set_bytecode(self, bytecode: bytes | str) -> ContractCreateFlow:
+        """
+        Sets the contract initcode.
+
+        Args:
+            bytecode (bytes | str): The initcode, as raw bytes or a hex string.
+        """
+        self.bytecode = _to_bytes(bytecode)
+        return self
+
+    def set_gas(self, gas: int) -> ContractCreateFlow:
+        self.transaction.set_gas(gas)
+        return self
+
+    def set_constructor_parameters(self, parameters: ContractFunctionParameters | bytes | None) -> ContractCreateFlow:
+        self.transaction.set_constructor_parameters(parameters)
+        return self
+
+    def set_max_inline_size(self, max_inline_size: int) -> ContractCreateFlow:
+        """Sets the largest initcode plus constructor parameters, in bytes, sent without a file."""
+        self.max_inline_size = _positive("max_inline_size", max_inline_size)
+        return self
+
+    def set_chunk_size(self, chunk_size: int) -> ContractCreateFlow:
+        """Sets the size of each file chunk of a bytecode upload, in bytes of hex text."""
+        self.chunk_size = _positive("chunk_size", chunk_size)
+        return self
+
+    def set_pipeline_window(self, pipeline_window: int) -> ContractCreateFlow:
+        """Sets how many file append chunks may await their receipts at once."""
+        self.pipeline_window = _positive("pipeline_window", pipeline_window)
+        return self
+
+    def set_cache(self, cache: BytecodeFileCache | None) -> ContractCreateFlow:
+        """
+        Sets the cache of uploaded bytecode files.
+
+        With a cache, uploaded files are kept after deployment and reused for identical
+        bytecode. Without one, the file is deleted once the contract is created.
+        """
+        self.cache = cache
+        return self
+
+    def _fits_inline(self) -> bool:
+        return len(self.bytecode) + len(self.transaction.parameters or b"") <= self.max_inline_size
+
+    def execute(self, client: Client, timeout: int | float | None = None) -> TransactionReceipt:
+        """
+        Deploys the contract.
+
+        Args:
+            client (Client): The client to deploy with. Its operator pays and owns the bytecode file.
+            timeout (int | float, optional): The timeout of each transaction, in seconds.
+
+        Returns:
+            TransactionReceipt: The receipt of the contract creation.
+
+        Raises:
+            ValueError: If no bytecode is set.
+            ReceiptStatusError: If a transaction of the flow fails.
+        """
+        if not self.bytecode:
+            raise ValueError("Bytecode is required")
+
+        if self._fits_inline():
+            self.file_id = None
+            self.transaction.set_bytecode(self.bytecode)
+            return self.transaction.execute(client, timeout, validate_status=True)
+
+        key = BytecodeFileCache.key(client.network.network, self.bytecode) if self.cache is not None else None
+        file_id = self._cached_file(client, key, timeout) if key is not None else None
+        if file_id is None:
+            file_id = self.upload(client, timeout)
+            if key is not None:
+                self.cache.put(key, file_id)
+
+        self.file_id = file_id
+        self.transaction.set_bytecode(None).set_bytecode_file_id(file_id)
+        try:
+            return self.transaction.execute(client, timeout, validate_status=True)
+        finally:
+            # Without a cache nothing will reuse the file, whether or not the creation succeeded
+            if self.cache is None:
+                _delete_file(client, file_id, timeout)
+
+    def upload(self, client: Client, timeout: int | float | None = None) -> FileId:
+        """
+        Uploads the bytecode, hex encoded, to a new file owned by the operator.
+
+        The first chunk is sent with the file creation. The remaining chunks are appended
+        with up to `pipeline_window` chunks awaiting their receipts at once. If an append
+        fails, the partial file is deleted.
+
+        Returns:
+            FileId: The file holding the bytecode.
+        """
+        return _upload_hex_file(
+            client, self.bytecode, "Contract bytecode", self.chunk_size, self.pipeline_window, timeout
+        )
+
+    def _cached_file(self, client: Client, key: str, timeout: int | float | None) -> FileId | None:
+        """
+        Returns the cached file for the bytecode if it still holds it, dropping stale entries.
+
+        The operator's key can still change the file, so its contents are compared with
+        the bytecode, not only its size.
+        """
+        file_id = self.cache.get(key)
+        if file_id is None:
+            return None
+
+        try:
+            info = FileInfoQuery().set_file_id(file_id).execute(client, timeout)
+        except Exception as e:
+            logger.info("Cached bytecode file %s is unavailable: %s", file_id, e)
+            info = None
+
+        expires = info.expiration_time.seconds if info is not None and info.expiration_time is not None else None
+        if (
+            info is None
+            or info.is_deleted
+            or info.size != 2 * len(self.bytecode)
+            or (expires is not None and expires < time.time() + _MIN_REMAINING_LIFETIME)
+        ):
+            self.cache.discard(key)
+            return None
+
+        try:
+            contents = FileContentsQuery().set_file_id(file_id).execute(client, timeout)
+        except Exception as e:
+            logger.info("Cached bytecode file %s is unavailable: %s", file_id, e)
+            contents = None
+        if contents != self.bytecode.hex().encode("ascii"):
+            self.cache.discard(key)
+            return None
+        return file_id
+
+
+def deploy_contract(
+    client: Client,
+    bytecode: bytes | str,
+    gas: int,
+    constructor_parameters: ContractFunctionParameters | bytes | None = None,
+    cache: BytecodeFileCache | None = None,
+    transaction: ContractCreateTransaction | None = None,
+    timeout: int | float | None = None,
+) -> TransactionReceipt:
+    """
+    Deploys a contract with a `ContractCreateFlow`.
+
+    Args:
+        client (Client): The client to deploy with.
+        bytecode (bytes | str): The initcode, as raw bytes or a hex string.
+        gas (int): The gas limit of the contract creation.
+        constructor_parameters (ContractFunctionParameters | bytes, optional): The constructor arguments.
+        cache (BytecodeFileCache, optional): Reuses files of identical, previously uploaded bytecode.
+        transaction (ContractCreateTransaction, optional): Carries any other contract properties.
+        timeout (int | float, optional): The timeout of each transaction, in seconds.
+
+    Returns:
+        TransactionReceipt: The receipt of the contract creation.
+    """
+    flow = ContractCreateFlow(transaction).set_bytecode(bytecode).set_gas(gas).set_cache(cache)
+    if constructor_parameters is not None:
+        flow.set_constructor_parameters(constructor_parameters)
+    return flow.execute(client, timeout)
@@ -0,0 +1,478 @@
+"""
+Streaming indexer of contract events.
+
+A `ContractEventIndexer` takes a contract ABI and a set of contract IDs, reads
+their logs from a `ContractLogSource`, and yields decoded events in consensus
+order. Logs are matched against the ABI's topic hashes and the configured topic
+filters before they are decoded, and the indexer keeps a checkpoint per
+contract so a stream can be resumed where it stopped.
+
+Two sources are provided: `MirrorContractLogSource` pages through the mirror node
+REST API, and `RecordLogSource` walks `TransactionRecord`s already at hand.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+import eth_abi
+import requests
+
+from hiero_sdk_python.contract.contract import Contract, ContractEvent
+from hiero_sdk_python.contract.contract_id import ContractId
+from hiero_sdk_python.contract.contract_log_info import ContractLogInfo
+from hiero_sdk_python.utils.crypto_utils import keccak256
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.transaction.transaction_record import TransactionRecord
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100  # the mirror node's largest page
+DEFAULT_MAX_WORKERS = 4
+_RETRYABLE_HTTP_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+@dataclass(frozen=True, order=True)
+class EventCheckpoint:
+    """
+    The position of a log in the consensus order of a contract's logs.
+
+    Attributes:
+        consensus_timestamp (int): Consensus timestamp of the transaction, in nanoseconds since the epoch.
+        log_index (int): The index of the log within the transaction.
+    """
+
+    consensus_timestamp: int
+    log_index: int
+
+
+@dataclass(frozen=True)
+class ContractLogEntry:
+    """
+    A contract log with its position, as provided by a `ContractLogSource`.
+
+    Attributes:
+        contract_id (ContractId): The contract that emitted the log.
+        consensus_timestamp (int): Consensus timestamp of the transaction, in nanoseconds since the epoch.
+        log_index (int): The index of the log within the transaction.
+        topics (tuple[bytes, ...]): The log topics.
+        data (bytes): The log data.
+        transaction_hash (bytes, optional): The hash of the transaction that emitted the log.
+    """
+
+    contract_id: ContractId
+    consensus_timestamp: int
+    log_index: int
+    topics: tuple[bytes, ...]
+    data: bytes = b""
+    transaction_hash: bytes | None = None
+
+    @property
+    def position(self) -> EventCheckpoint:
+        return EventCheckpoint(self.consensus_timestamp, self.log_index)
+
+
+@dataclass(frozen=True)
+class IndexedEvent:
+    """
+    A decoded contract event.
+
+    Attributes:
+        event (ContractEvent): The event definition.
+        args (tuple): The decoded arguments, as a named tuple when every argument is named.
+        contract_id (ContractId): The indexed contract that emitted the event.
+        log (ContractLogEntry): The raw log.
+    """
+
+    event: ContractEvent
+    args: tuple[Any, ...]
+    contract_id: ContractId
+    log: ContractLogEntry
+
+    @property
+    def name(self) -> str:
+        return self.event.name
+
+    @property
+    def checkpoint(self) -> EventCheckpoint:
+        return self.log.position
+
+
+class ContractLogSource(ABC):
+    """A source of contract logs for a `ContractEventIndexer`."""
+
+    @abstractmethod
+    def logs(
+        self,
+        contract_ids: Sequence[ContractId],
+        checkpoints: Mapping[ContractId, EventCheckpoint],
+    ) -> Iterator[ContractLogEntry]:
+        """
+        Yields the logs of the given contracts, in consensus order.
+
+        Args:
+            contract_ids (Sequence[ContractId]): The contracts to read logs of.
+            checkpoints (Mapping[ContractId, EventCheckpoint]): For resumed contracts,
+                the position of the last handled log. Sources may skip earlier logs;
+                the indexer drops any that are still yielded.
+        """
+
+
+class RecordLogSource(ContractLogSource):
+    """
+    Reads logs from transaction records already fetched, e.g. with `TransactionRecordQuery`.
+
+    Records are read in the order given, with their child records, and should be in
+    consensus order. Logs are matched to indexed contracts by contract number.
+    """
+
+    def __init__(self, records: Iterable[TransactionRecord]) -> None:
+        self._records = records
+
+    @staticmethod
+    def _timestamp(record: TransactionRecord) -> int:
+        timestamp = record.consensus_timestamp
+        return timestamp.seconds * 1_000_000_000 + timestamp.nanos if timestamp is not None else 0
+
+    def _walk(self, records: Iterable[TransactionRecord]) -> Iterator[TransactionRecord]:
+        for record in records:
+            yield record
+            yield from self._walk(record.children)
+
+    def logs(
+        self,
+        contract_ids: Sequence[ContractId],
+        checkpoints: Mapping[ContractId, EventCheckpoint],  # noqa: ARG002
+    ) -> Iterator[ContractLogEntry]:
+        addresses = {contract_id.to_evm_address() for contract_id in contract_ids}
+        for record in self._walk(self._records):
+            result = record.call_result or record.contract_create_result
+            if result is None:
+                continue
+            timestamp = self._timestamp(record)
+            for index, log in enumerate(result.log_info):
+                if log.contract_id is None or log.contract_id.to_evm_address() not in addresses:
+                    continue
+                yield ContractLogEntry(
+                    contract_id=log.contract_id,
+                    consensus_timestamp=timestamp,
+                    log_index=index,
+                    topics=tuple(bytes(topic) for topic in log.topics),
+                    data=bytes(log.data or b""),
+                    transaction_hash=record.transaction_hash,
+                )
+
+
+def _from_hex(value: str | None) -> bytes:
+    if not value:
+        return b""
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+
+
+def _parse_timestamp(value: str) -> int:
+    seconds, _, nanos = value.partition(".")
+    return int(seconds) * 1_000_000_000 + int(nanos.ljust(9, "0") or 0)
+
+
+class MirrorContractLogSource(ContractLogSource):
+    """
+    Reads logs from the mirror node REST API (`/contracts/{id}/results/logs`).
+
+    Contracts are read concurrently over one pooled HTTP session. While a page is
+    being processed, the next page of the same contract is already being fetched.
+    Transient HTTP errors are retried with exponential back-off.
+    """
+
+    def __init__(
+        self,
+        client: Client | str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_attempts: int = 5,
+        max_backoff: float = 8.0,
+        timeout: float = 30.0,
+        session: requests.Session | None = None,
+    ) -> None:
+        """
+        Args:
+            client (Client | str): The client whose mirror node to use, or the mirror
+                REST URL, e.g. "https://testnet.mirrornode.hedera.com/api/v1".
+            page_size (int, optional): Logs per request, at most 100.
+            max_workers (int, optional): The most requests in flight at once.
+            max_attempts (int, optional): Attempts per request before giving up.
+            max_backoff (float, optional): The longest delay between attempts, in seconds.
+            timeout (float, optional): The timeout of each request, in seconds.
+            session (requests.Session, optional): The HTTP session to use. By default the
+                source creates its own.
+
+        Raises:
+            ValueError: If a numeric option is out of range.
+        """
+        if not 0 < page_size <= DEFAULT_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {DEFAULT_PAGE_SIZE}")
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be greater than 0")
+
+        rest_url = client if isinstance(client, str) else client.network.get_mirror_rest_url()
+        self._rest_url = rest_url.rstrip("/")
+        # Pagination links are absolute paths that already include /api/v1
+        self._base_url = self._rest_url.removesuffix("/api/v1")
+        self._page_size = page_size
+        self._max_workers = max_workers
+        self._max_attempts = max_attempts
+        self._max_backoff = max_backoff
+        self._timeout = timeout
+        self._session = session if session is not None else requests.Session()
+
+    def _first_url(self, contract_id: ContractId, checkpoint: EventCheckpoint | None) -> str:
+        params = {"order": "asc", "limit": self._page_size}
+        if checkpoint is not None:
+            seconds, nanos = divmod(checkpoint.consensus_timestamp, 1_000_000_000)
+            params["timestamp"] = f"gte:{seconds}.{nanos:09d}"
+        return f"{self._rest_url}/contracts/{contract_id}/results/logs?{urlencode(params)}"
+
+    def _fetch_page(self, url: str) -> dict:
+        """GETs a page with retry and exponential back-off."""
+        for attempt in range(self._max_attempts):
+            last_attempt = attempt == self._max_attempts - 1
+            try:
+                response = self._session.get(url, timeout=self._timeout)
+                if response.status_code == 200:
+                    return response.json()
+                if response.status_code not in _RETRYABLE_HTTP_STATUSES or last_attempt:
+                    raise RuntimeError(f"Mirror node error: HTTP {response.status_code} — {response.text}")
+                error: Exception = RuntimeError(f"HTTP {response.status_code}")
+            except (requests.Timeout, requests.ConnectionError) as e:
+                if last_attempt:
+                    raise RuntimeError(f"Failed to fetch contract logs after {self._max_attempts} attempts") from e
+                error = e
+
+            delay = min(0.5 * (2**attempt), self._max_backoff)
+            logger.warning(
+                "Error fetching contract logs (attempt %d/%d). Retrying in %.1fs: %s",
+                attempt + 1,
+                self._max_attempts,
+                delay,
+                error,
+            )
+            time.sleep(delay)
+
+        raise RuntimeError(f"Failed to fetch contract logs after {self._max_attempts} attempts")
+
+    def _contract_logs(
+        self,
+        executor: ThreadPoolExecutor,
+        contract_id: ContractId,
+        first_page: Future,
+    ) -> Iterator[ContractLogEntry]:
+        future: Future | None = first_page
+        try:
+            while future is not None:
+                page = future.result()
+                next_path = (page.get("links") or {}).get("next")
+                future = executor.submit(self._fetch_page, self._base_url + next_path) if next_path else None
+                for log in page.get("logs", []):
+                    yield ContractLogEntry(
+                        contract_id=contract_id,
+                        consensus_timestamp=_parse_timestamp(log["timestamp"]),
+                        log_index=log.get("index", 0),
+                        topics=tuple(_from_hex(topic) for topic in log.get("topics") or []),
+                        data=_from_hex(log.get("data")),
+                        transaction_hash=_from_hex(log.get("transaction_hash")) or None,
+                    )
+        finally:
+            if future is not None:
+                future.cancel()
+
+    def logs(
+        self,
+        contract_ids: Sequence[ContractId],
+        checkpoints: Mapping[ContractId, EventCheckpoint],
+    ) -> Iterator[ContractLogEntry]:
+        executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="contract-logs")
+        # heapq.merge pulls from each stream lazily, so the first pages are submitted here
+        # to fetch them concurrently instead of one contract at a time.
+        streams = [
+            self._contract_logs(
+                executor,
+                contract_id,
+                executor.submit(self._fetch_page, self._first_url(contract_id, checkpoints.get(contract_id))),
+            )
+            for contract_id in contract_ids
+        ]
+        try:
+            yield from heapq.merge(*streams, key=lambda entry: (entry.consensus_timestamp, entry.log_index))
+        finally:
+            for stream in streams:
+                stream.close()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        """Closes the HTTP session."""
+        self._session.close()
+
+
+def _topic_value(type_str: str, value: Any) -> bytes:
+    """Returns the topic that an indexed argument with the given value is stored as."""
+    if ContractEvent._is_value_type(type_str):
+        return eth_abi.encode([type_str], [value])
+    if isinstance(value, str) and type_str == "string":
+        return keccak256(value.encode())
+    if isinstance(value, (bytes, bytearray)) and type_str == "bytes":
+        return keccak256(bytes(value))
+    if isinstance(value, (bytes, bytearray)) and len(value) == 32:
+        return bytes(value)
+    raise ValueError(f"Filter on an indexed {type_str} argument needs its 32-byte topic hash")
+
+
+class ContractEventIndexer:
+    """
+    Streams decoded events of a set of contracts that share an ABI.
+
+    Example:
+        indexer = ContractEventIndexer(erc20_abi, [token_a, token_b]).add_filter("Transfer", to=wallet)
+        for event in indexer.events(MirrorContractLogSource(client)):
+            handle(event.args)
+            save(event.contract_id, event.checkpoint)
+    """
+
+    def __init__(
+        self,
+        abi: str | Sequence[Mapping[str, Any]],
+        contract_ids: ContractId | Iterable[ContractId],
+    ) -> None:
+        """
+        Args:
+            abi (str | Sequence[Mapping]): The contract ABI, as JSON text or parsed JSON.
+            contract_ids (ContractId | Iterable[ContractId]): The contracts to index.
+
+        Raises:
+            ValueError: If no contract ID is given.
+        """
+        if isinstance(contract_ids, ContractId):
+            contract_ids = [contract_ids]
+        self.contract_ids: list[ContractId] = list(contract_ids)
+        if not self.contract_ids:
+            raise ValueError("At least one contract ID is required")
+
+        self._contract = Contract.from_abi(abi)
+        self._events: dict[bytes, ContractEvent] = {
+            event.topic: event for event in self._contract.events if event.topic is not None
+        }
+        self._contracts_by_address = {contract_id.to_evm_address(): contract_id for contract_id in self.contract_ids}
+        self._filters: dict[bytes, list[tuple[bytes | None, ...]]] = {}
+        self._checkpoints: dict[ContractId, EventCheckpoint] = {}
+
+    def add_filter(self, event: str, **indexed_args: Any) -> ContractEventIndexer:
+        """
+        Restricts the stream to an event, optionally with given indexed argument values.
+
+        Once a filter is added, only logs matching one of the filters are decoded.
+        Filters are checked against the raw topics, before decoding.
+
+        Args:
+            event (str): The event name or signature.
+            **indexed_args: Values that indexed arguments must have, by argument name.
+                Dynamic types (string, bytes, arrays, tuples) are matched by their hash.
+
+        Raises:
+            ValueError: If the event is unknown or anonymous, or an argument is not indexed.
+        """
+        definition = self._contract.event(event)
+        if definition.topic is None:
+            raise ValueError(f"Anonymous event {definition.signature} has no topic to filter on")
+
+        indexed = [
+            (name, type_str)
+            for name, type_str, is_indexed in zip(
+                definition.input_names, definition.input_types, definition.indexed, strict=True
+            )
+            if is_indexed
+        ]
+        unknown = set(indexed_args) - {name for name, _ in indexed}
+        if unknown:
+            raise ValueError(f"{definition.signature} has no indexed argument {sorted(unknown)[0]!r}")
+
+        pattern = tuple(
+            _topic_value(type_str, indexed_args[name]) if name in indexed_args else None for name, type_str in indexed
+        )
+        self._filters.setdefault(definition.topic, []).append(pattern)
+        return self
+
+    @property
+    def topics(self) -> list[bytes]:
+        """The topic hashes of the events the stream can yield."""
+        return list(self._filters) if self._filters else list(self._events)
+
+    def set_checkpoint(self, contract_id: ContractId, checkpoint: EventCheckpoint | None) -> ContractEventIndexer:
+        """Resumes a contract's stream after the given position, or from the start if None."""
+        if checkpoint is None:
+            self._checkpoints.pop(contract_id, None)
+        else:
+            self._checkpoints[contract_id] = checkpoint
+        return self
+
+    def get_checkpoint(self, contract_id: ContractId) -> EventCheckpoint | None:
+        """Returns the position of the last log handled for a contract, or None."""
+        return self._checkpoints.get(contract_id)
+
+    @property
+    def checkpoints(self) -> dict[ContractId, EventCheckpoint]:
+        """The position of the last log handled, for every contract with one."""
+        return dict(self._checkpoints)
+
+    def _match(self, topics: Sequence[bytes]) -> ContractEvent | None:
+        if not topics:
+            return None
+        event = self._events.get(topics[0])
+        if event is None or not self._filters:
+            return event
+
+        patterns = self._filters.get(topics[0])
+        if not patterns:
+            return None
+        for pattern in patterns:
+            if len(topics) == len(pattern) + 1 and all(
+                expected is None or expected == topic for expected, topic in zip(pattern, topics[1:], strict=True)
+            ):
+                return event
+        return None
+
+    def events(self, source: ContractLogSource) -> Iterator[IndexedEvent]:
+        """
+        Yields the decoded events of the indexed contracts from a log source, in consensus order.
+
+        A contract's checkpoint advances past a log once it has been skipped, or once
+        the consumer asks for the event after it. A stream stopped by the consumer
+        resumes with the last event it received, so every event is delivered at least once.
+
+        Raises:
+            ValueError: If a log matches an event of the ABI but cannot be decoded as it.
+        """
+        for entry in source.logs(list(self.contract_ids), dict(self._checkpoints)):
+            contract_id = self._contracts_by_address.get(entry.contract_id.to_evm_address())
+            if contract_id is None:
+                continue
+            checkpoint = self._checkpoints.get(contract_id)
+            if checkpoint is not None and entry.position <= checkpoint:
+                continue
+
+            event = self._match(entry.topics)
+            if event is not None:
+                log = ContractLogInfo(contract_id=entry.contract_id, topics=list(entry.topics), data=entry.data)
+                yield IndexedEvent(event, event.decode_log(log), contract_id, entry)
+            self._checkpoints[contract_id] = entry.position
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from hiero_sdk_python.channels import _Channel
 from hiero_sdk_python.contract.contract_function_parameters import (
     ContractFunctionParameters,
@@ -16,6 +18,11 @@ from hiero_sdk_python.hbar import Hbar
 from hiero_sdk_python.transaction.transaction import Transaction
 
 
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.contract.contract_gas_estimator import ContractGasEstimator
+
+
 class ContractExecuteTransaction(Transaction):
     """
     A transaction that executes a smart contract function.
@@ -48,6 +55,7 @@ class ContractExecuteTransaction(Transaction):
         self.gas: int | None = gas
         self.amount: int | None = amount.to_tinybars() if isinstance(amount, Hbar) else amount
         self.function_parameters: bytes | None = function_parameters
+        self.gas_estimator: ContractGasEstimator | None = None
 
     def set_contract_id(self, contract_id: ContractId | None) -> ContractExecuteTransaction:
         """
@@ -118,6 +126,28 @@ class ContractExecuteTransaction(Transaction):
         self.function_parameters = params.to_bytes()
         return self
 
+    def set_gas_estimator(self, gas_estimator: ContractGasEstimator | None) -> ContractExecuteTransaction:
+        """
+        Sets an estimator that fills in the gas when the transaction is frozen.
+
+        The gas is only estimated if it was not set explicitly, with the estimator's
+        safety margin added.
+
+        Args:
+            gas_estimator (ContractGasEstimator | None): The estimator to use, or None to disable estimation.
+        """
+        self._require_not_frozen()
+        self.gas_estimator = gas_estimator
+        return self
+
+    def freeze_with(self, client: Client):
+        if not self._transaction_body_bytes and self.gas is None and self.gas_estimator is not None:
+            sender = self.transaction_id.account_id if self.transaction_id is not None else None
+            if sender is None and client is not None:
+                sender = client.operator_account_id
+            self.gas_estimator.apply(self, sender)
+        return super().freeze_with(client)
+
     def _build_proto_body(self):
         """
         Returns the protobuf body for the contract execute transaction.
@@ -0,0 +1,223 @@
+"""
+This module provides the ContractFunction class, a reusable ABI codec for one smart
+contract function. The function selector and the eth-abi encoder and decoder chains
+are built once, so calling the same function with different arguments only pays for
+encoding the values.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
+from typing import Any
+
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.encoding import TupleEncoder
+from eth_abi.registry import registry
+
+from hiero_sdk_python.utils.crypto_utils import keccak256
+
+
+_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _function_selector(signature: str) -> bytes:
+    """Returns the 4-byte selector of a canonical function signature, hashing it only once."""
+    return keccak256(signature.encode())[:4]
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _tuple_encoder(types: tuple[str, ...]) -> TupleEncoder:
+    """Returns an encoder for a sequence of values of the given ABI types."""
+    return TupleEncoder(encoders=tuple(registry.get_encoder(type_str) for type_str in types))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _tuple_decoder(types: tuple[str, ...], strict: bool = True) -> TupleDecoder:
+    """Returns a decoder for a sequence of values of the given ABI types."""
+    return TupleDecoder(decoders=tuple(registry.get_decoder(type_str, strict=strict) for type_str in types))
+
+
+def _decode(decoder: TupleDecoder, data: bytes) -> tuple[Any, ...]:
+    return decoder(ContextFramesBytesIO(data))
+
+
+def _abi_type(param: Mapping[str, Any]) -> str:
+    """Returns the canonical type string of an ABI JSON parameter, expanding tuples."""
+    type_str = param["type"]
+    if not type_str.startswith("tuple"):
+        return type_str
+
+    components = ",".join(_abi_type(component) for component in param.get("components", []))
+    return f"({components}){type_str[len('tuple') :]}"
+
+
+def _load_abi(abi: str | Mapping[str, Any] | Sequence[Mapping[str, Any]]) -> Any:
+    return json.loads(abi) if isinstance(abi, str) else abi
+
+
+class ContractFunction:
+    """
+    A compiled ABI codec for one contract function.
+
+    Instances are immutable and can be shared between threads.
+
+    Attributes:
+        name (str): The function name.
+        input_types (tuple[str, ...]): The canonical ABI types of the parameters.
+        output_types (tuple[str, ...]): The canonical ABI types of the return values.
+        signature (str): The canonical signature, e.g. "transfer(address,uint256)".
+        selector (bytes): The 4-byte function selector.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        input_types: Sequence[str] = (),
+        output_types: Sequence[str] = (),
+    ) -> None:
+        """
+        Builds the codec for a function.
+
+        Args:
+            name (str): The function name.
+            input_types (Sequence[str], optional): The ABI types of the parameters.
+            output_types (Sequence[str], optional): The ABI types of the return values.
+
+        Raises:
+            ValueError: If the name is empty or a type is not a valid ABI type.
+        """
+        if not name:
+            raise ValueError("Function name is required")
+
+        self.name: str = name
+        self.input_types: tuple[str, ...] = tuple(input_types)
+        self.output_types: tuple[str, ...] = tuple(output_types)
+        self.signature: str = f"{name}({','.join(self.input_types)})"
+        self.selector: bytes = _function_selector(self.signature)
+
+        try:
+            self._encoder = _tuple_encoder(self.input_types)
+            self._decoder = _tuple_decoder(self.output_types)
+        except Exception as e:
+            raise ValueError(f"Invalid ABI type in {self.signature}: {e}") from e
+
+    @classmethod
+    def from_abi(
+        cls,
+        abi: str | Mapping[str, Any] | Sequence[Mapping[str, Any]],
+        name: str | None = None,
+    ) -> ContractFunction:
+        """
+        Builds the codec from ABI JSON.
+
+        Args:
+            abi (str | Mapping | Sequence[Mapping]): A function ABI entry, or a full
+                contract ABI (as JSON text or parsed).
+            name (str, optional): Required with a full ABI: the function name, or its
+                signature (e.g. "transfer(address,uint256)") for overloaded functions.
+
+        Raises:
+            ValueError: If the entry is not a function, or `name` matches no function
+                or more than one.
+        """
+        abi = _load_abi(abi)
+
+        if isinstance(abi, Mapping):
+            entry = abi
+        else:
+            if name is None:
+                raise ValueError("name is required to select a function from a contract ABI")
+            matches = [
+                item
+                for item in abi
+                if item.get("type", "function") == "function" and name in (item.get("name"), cls._entry_signature(item))
+            ]
+            if not matches:
+                raise ValueError(f"No function {name!r} in ABI")
+            if len(matches) > 1:
+                raise ValueError(f"Function {name!r} is overloaded; select it by signature")
+            entry = matches[0]
+
+        if entry.get("type", "function") != "function":
+            raise ValueError(f"ABI entry is a {entry.get('type')!r}, not a function")
+
+        return cls(
+            entry["name"],
+            [_abi_type(param) for param in entry.get("inputs", [])],
+            [_abi_type(param) for param in entry.get("outputs", [])],
+        )
+
+    @staticmethod
+    def _entry_signature(entry: Mapping[str, Any]) -> str:
+        return f"{entry.get('name')}({','.join(_abi_type(param) for param in entry.get('inputs', []))})"
+
+    def encode(self, *values: Any) -> bytes:
+        """
+        Encodes a call: the selector followed by the ABI-encoded arguments.
+
+        Raises:
+            ValueError: If the number of values does not match the parameters.
+            Exception: If a value cannot be encoded as its ABI type.
+        """
+        if len(values) != len(self.input_types):
+            raise ValueError(f"{self.signature} takes {len(self.input_types)} arguments, got {len(values)}")
+        return self.selector + self._encoder(values)
+
+    def encode_many(self, rows: Iterable[Sequence[Any]]) -> list[bytes]:
+        """
+        Encodes one call per row of arguments.
+
+        Raises:
+            ValueError: If a row has the wrong number of values; the message gives its index.
+        """
+        arity = len(self.input_types)
+        selector = self.selector
+        encoder = self._encoder
+
+        encoded = []
+        for i, row in enumerate(rows):
+            if len(row) != arity:
+                raise ValueError(f"Row {i}: {self.signature} takes {arity} arguments, got {len(row)}")
+            encoded.append(selector + encoder(row))
+        return encoded
+
+    def encode_parameters(self, *values: Any) -> bytes:
+        """Encodes the arguments without the selector, e.g. for constructor parameters."""
+        if len(values) != len(self.input_types):
+            raise ValueError(f"{self.signature} takes {len(self.input_types)} arguments, got {len(values)}")
+        return self._encoder(values)
+
+    def decode_input(self, data: bytes) -> tuple[Any, ...]:
+        """
+        Decodes the arguments of encoded call data.
+
+        Raises:
+            ValueError: If the data does not start with this function's selector or cannot be decoded.
+        """
+        if bytes(data[:4]) != self.selector:
+            raise ValueError(f"Call data is not a call to {self.signature}")
+        try:
+            return _decode(_tuple_decoder(self.input_types), bytes(data[4:]))
+        except Exception as e:
+            raise ValueError(f"Failed to decode call data: {str(e)}") from e
+
+    def decode_output(self, data: bytes) -> tuple[Any, ...]:
+        """
+        Decodes the return data of a call.
+
+        Raises:
+            ValueError: If the data cannot be decoded as the output types.
+        """
+        if not data:
+            return ()
+        try:
+            return _decode(self._decoder, bytes(data))
+        except Exception as e:
+            raise ValueError(f"Failed to decode contract result: {str(e)}") from e
+
+    def __repr__(self) -> str:
+        outputs = f" returns ({','.join(self.output_types)})" if self.output_types else ""
+        return f"ContractFunction({self.signature}{outputs})"
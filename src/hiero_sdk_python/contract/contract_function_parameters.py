@@ -8,8 +8,7 @@ from __future__ import annotations
 
 from typing import Any
 
-import eth_abi
-from eth_utils import function_signature_to_4byte_selector
+from hiero_sdk_python.contract.contract_function import _function_selector, _tuple_encoder
 
 
 class ContractFunctionParameters:
@@ -182,7 +181,7 @@ class ContractFunctionParameters:
             raise ValueError("Function name is required for selector")
 
         signature = f"{self.function_name}({','.join(self._types)})"
-        return function_signature_to_4byte_selector(signature)
+        return _function_selector(signature)
 
     def _encode_parameters(self) -> bytes:
         """
@@ -194,7 +193,7 @@ class ContractFunctionParameters:
         Raises:
             Exception: If there is an error encoding the parameters
         """
-        return eth_abi.encode(self._types, self._values)
+        return _tuple_encoder(tuple(self._types))(self._values)
 
     def to_bytes(self) -> bytes:
         """
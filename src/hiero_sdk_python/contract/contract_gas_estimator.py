@@ -0,0 +1,288 @@
+"""
+Gas and result-size estimation for contract calls.
+
+`ContractGasEstimator` simulates calls through the mirror node REST API
+(`POST /contracts/call`) and caches each estimate per contract, function
+selector and argument shape for a limited time. Attached to a
+`ContractCallQuery` or `ContractExecuteTransaction` with `set_gas_estimator`,
+it fills in the gas (and, for queries, the maximum result size) with a safety
+margin whenever they were not set explicitly.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from hiero_sdk_python.contract.contract_id import ContractId
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.account.account_id import AccountId
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.contract.contract_call_query import ContractCallQuery
+    from hiero_sdk_python.contract.contract_execute_transaction import ContractExecuteTransaction
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAFETY_MARGIN = 0.2
+DEFAULT_TTL = 60.0
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_GAS = 15_000_000
+DEFAULT_MAX_CONNECTIONS = 8
+_RETRYABLE_HTTP_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+@dataclass(frozen=True)
+class GasEstimate:
+    """
+    The resources a simulated contract call used, before any safety margin.
+
+    Attributes:
+        gas (int): The gas the call used.
+        result_size (int | None): The size of the returned data in bytes, if it was measured.
+    """
+
+    gas: int
+    result_size: int | None = None
+
+
+def _evm_address(entity: ContractId | AccountId) -> str:
+    address = entity.to_evm_address()
+    return "0x" + address.removeprefix("0x")
+
+
+class ContractGasEstimator:
+    """
+    Estimates the gas and result size of contract calls from mirror node simulations.
+
+    Estimates are cached by contract, function selector and argument shape (the length
+    of the encoded arguments, and whether a value is sent), so repeated calls of a
+    function with similarly sized arguments cost one simulation per `ttl`. Requests
+    go over one pooled HTTP session. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        client: Client | str,
+        safety_margin: float = DEFAULT_SAFETY_MARGIN,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_gas: int = DEFAULT_MAX_GAS,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_attempts: int = 3,
+        max_backoff: float = 4.0,
+        timeout: float = 10.0,
+        session: requests.Session | None = None,
+    ) -> None:
+        """
+        Args:
+            client (Client | str): The client whose mirror node to use, or the mirror
+                REST URL, e.g. "https://testnet.mirrornode.hedera.com/api/v1".
+            safety_margin (float, optional): The fraction added on top of each estimate,
+                e.g. 0.2 for 20%.
+            ttl (float, optional): Seconds an estimate is reused for.
+            max_entries (int, optional): The most estimates kept.
+            max_gas (int, optional): The cap on estimated gas, including the margin.
+            max_connections (int, optional): The size of the HTTP connection pool.
+            max_attempts (int, optional): Attempts per simulation before giving up.
+            max_backoff (float, optional): The longest delay between attempts, in seconds.
+            timeout (float, optional): The timeout of each request, in seconds.
+            session (requests.Session, optional): The HTTP session to use. By default the
+                estimator creates its own pooled session.
+
+        Raises:
+            ValueError: If a numeric option is out of range.
+        """
+        if safety_margin < 0:
+            raise ValueError("safety_margin must be non-negative")
+        if ttl < 0:
+            raise ValueError("ttl must be non-negative")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_gas <= 0:
+            raise ValueError("max_gas must be positive")
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be greater than 0")
+
+        rest_url = client if isinstance(client, str) else client.network.get_mirror_rest_url()
+        self._url = rest_url.rstrip("/") + "/contracts/call"
+        self.safety_margin: float = safety_margin
+        self.ttl: float = ttl
+        self.max_entries: int = max_entries
+        self.max_gas: int = max_gas
+        self._max_attempts = max_attempts
+        self._max_backoff = max_backoff
+        self._timeout = timeout
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self._session = session
+        self._entries: OrderedDict[tuple, tuple[float, GasEstimate]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def cache_key(contract_id: ContractId, call_data: bytes, value: int = 0) -> tuple:
+        """Returns the key estimates of a call are cached under."""
+        return (str(contract_id), bytes(call_data[:4]), len(call_data), value > 0)
+
+    def _lookup(self, key: tuple, result_size: bool) -> GasEstimate | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, estimate = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            if result_size and estimate.result_size is None:
+                return None
+            self._entries.move_to_end(key)
+            return estimate
+
+    def _store(self, key: tuple, estimate: GasEstimate) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), estimate)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, contract_id: ContractId | None = None) -> None:
+        """
+        Drops the cached estimates of one contract, or all estimates if contract_id is None.
+        """
+        with self._lock:
+            if contract_id is None:
+                self._entries.clear()
+                return
+            name = str(contract_id)
+            for key in [key for key in self._entries if key[0] == name]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _post(self, body: dict) -> str:
+        """POSTs a simulation with retry and exponential back-off, returning its hex result."""
+        for attempt in range(self._max_attempts):
+            last_attempt = attempt == self._max_attempts - 1
+            try:
+                response = self._session.post(self._url, json=body, timeout=self._timeout)
+                if response.status_code == 200:
+                    return response.json().get("result") or "0x"
+                if response.status_code not in _RETRYABLE_HTTP_STATUSES or last_attempt:
+                    raise RuntimeError(f"Mirror node error: HTTP {response.status_code} — {response.text}")
+                error: Exception = RuntimeError(f"HTTP {response.status_code}")
+            except (requests.Timeout, requests.ConnectionError) as e:
+                if last_attempt:
+                    raise RuntimeError(f"Failed to simulate contract call after {self._max_attempts} attempts") from e
+                error = e
+
+            delay = min(0.25 * (2**attempt), self._max_backoff)
+            logger.warning(
+                "Error simulating contract call (attempt %d/%d). Retrying in %.1fs: %s",
+                attempt + 1,
+                self._max_attempts,
+                delay,
+                error,
+            )
+            time.sleep(delay)
+
+        raise RuntimeError(f"Failed to simulate contract call after {self._max_attempts} attempts")
+
+    def estimate(
+        self,
+        contract_id: ContractId,
+        call_data: bytes,
+        sender: AccountId | None = None,
+        value: int = 0,
+        result_size: bool = False,
+    ) -> GasEstimate:
+        """
+        Returns the resources a call uses, without safety margin, from the cache or a simulation.
+
+        Args:
+            contract_id (ContractId): The contract to call.
+            call_data (bytes): The function selector and encoded arguments.
+            sender (AccountId, optional): The account the call is made from.
+            value (int, optional): The tinybars sent with the call.
+            result_size (bool, optional): Whether to also measure the size of the returned data.
+
+        Raises:
+            RuntimeError: If the mirror node rejects the simulation, e.g. because the call reverts.
+        """
+        call_data = bytes(call_data or b"")
+        key = self.cache_key(contract_id, call_data, value)
+        cached = self._lookup(key, result_size)
+        if cached is not None:
+            return cached
+
+        body = {
+            "block": "latest",
+            "data": "0x" + call_data.hex(),
+            "estimate": True,
+            "gas": self.max_gas,
+            "to": _evm_address(contract_id),
+            "value": value,
+        }
+        if sender is not None:
+            body["from"] = _evm_address(sender)
+
+        gas = int(self._post(body), 16)
+        size = None
+        if result_size:
+            size = (len(self._post({**body, "estimate": False})) - 2) // 2
+
+        estimate = GasEstimate(gas=gas, result_size=size)
+        self._store(key, estimate)
+        return estimate
+
+    def with_margin(self, amount: int) -> int:
+        """Returns an amount with the safety margin added, capped to `max_gas`."""
+        return min(math.ceil(amount * (1 + self.safety_margin)), self.max_gas)
+
+    def apply(
+        self,
+        target: ContractCallQuery | ContractExecuteTransaction,
+        sender: AccountId | None = None,
+    ) -> None:
+        """
+        Sets the gas of a contract call, and the maximum result size of a query, if they are not set.
+
+        Args:
+            target (ContractCallQuery | ContractExecuteTransaction): The call to fill in.
+            sender (AccountId, optional): The account the call is made from.
+        """
+        from hiero_sdk_python.contract.contract_call_query import ContractCallQuery
+
+        is_query = isinstance(target, ContractCallQuery)
+        needs_size = is_query and target.max_result_size is None
+        if target.gas is not None and not needs_size:
+            return
+        if target.contract_id is None:
+            raise ValueError("Contract ID must be set before estimating gas.")
+
+        estimate = self.estimate(
+            target.contract_id,
+            target.function_parameters or b"",
+            sender,
+            0 if is_query else target.amount or 0,
+            result_size=needs_size,
+        )
+        if target.gas is None:
+            target.gas = self.with_margin(estimate.gas)
+        if needs_size:
+            target.max_result_size = math.ceil(estimate.result_size * (1 + self.safety_margin))
@@ -15,8 +15,12 @@ from hiero_sdk_python.crypto.evm_address import EvmAddress
 from hiero_sdk_python.crypto.key import Key
 from hiero_sdk_python.hapi.services import basic_types_pb2
 from hiero_sdk_python.utils.entity_id_helper import (
+    copy_proto,
+    entity_id_getstate,
+    entity_id_setstate,
     format_to_string_with_checksum,
-    parse_from_string,
+    intern_entity_id,
+    parse_entity_id,
     perform_query_to_mirror_node,
     to_solidity_address,
     validate_checksum,
@@ -29,7 +33,7 @@ if TYPE_CHECKING:
 EVM_ADDRESS_REGEX = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.([a-fA-F0-9]{40}$)")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContractId(Key):
     """
     Represents a unique contract ID on the Hedera network.
@@ -53,6 +57,15 @@ class ContractId(Key):
     contract: int = 0
     evm_address: bytes | None = None
     checksum: str | None = field(default=None, init=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _proto: basic_types_pb2.ContractID | None = field(default=None, init=False, repr=False, compare=False)
+
+    __getstate__ = entity_id_getstate
+    __setstate__ = entity_id_setstate
+
+    def __post_init__(self) -> None:
+        """Precomputes the hash of the ContractId."""
+        object.__setattr__(self, "_hash", hash((self.shard, self.realm, self.contract, self.evm_address)))
 
     @classmethod
     def _from_proto(cls, contract_id_proto: basic_types_pb2.ContractID) -> ContractId:
@@ -74,10 +87,11 @@ class ContractId(Key):
                 evm_address=contract_id_proto.evm_address,
             )
 
-        return cls(
-            shard=contract_id_proto.shardNum,
-            realm=contract_id_proto.realmNum,
-            contract=contract_id_proto.contractNum,
+        return intern_entity_id(
+            cls,
+            contract_id_proto.shardNum,
+            contract_id_proto.realmNum,
+            contract_id_proto.contractNum,
         )
 
     def _to_proto(self):
@@ -88,12 +102,20 @@ class ContractId(Key):
             basic_types_pb2.ContractID: The corresponding protobuf
             ContractID object.
         """
-        return basic_types_pb2.ContractID(
-            shardNum=self.shard,
-            realmNum=self.realm,
-            contractNum=self.contract,
-            evm_address=self.evm_address,
-        )
+        contract_id_proto = self._proto
+        if contract_id_proto is None:
+            contract_id_proto = basic_types_pb2.ContractID(
+                shardNum=self.shard,
+                realmNum=self.realm,
+                contractNum=self.contract,
+                evm_address=self.evm_address,
+            )
+            object.__setattr__(self, "_proto", contract_id_proto)
+        return copy_proto(contract_id_proto)
+
+    def __hash__(self) -> int:
+        """Returns the precomputed hash of the ContractId."""
+        return self._hash
 
     def to_proto_key(self) -> basic_types_pb2.Key:
         """
@@ -138,9 +160,9 @@ class ContractId(Key):
             )
 
         try:
-            shard, realm, contract, checksum = parse_from_string(contract_id_str)
+            shard, realm, contract, checksum = parse_entity_id(contract_id_str)
 
-            contract_id: ContractId = cls(shard=int(shard), realm=int(realm), contract=int(contract))
+            contract_id: ContractId = cls(shard=shard, realm=realm, contract=contract)
             object.__setattr__(contract_id, "checksum", checksum)
             return contract_id
 
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from hiero_sdk_python.client.client import Client
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DelegateContractId(ContractId):
     """
     Represents a delegatable contract identifier used as a key in the Hiero network.
@@ -0,0 +1,116 @@
+"""
+Submission of signed Ethereum transactions of any size.
+
+A transaction, with its signatures, must fit in 6 KiB. `EthereumFlow` sends
+small Ethereum transactions inline as an `EthereumTransaction`. When the
+encoded `ethereum_data` is larger, the call data is uploaded to a file and the
+transaction is sent with empty call data and the file as `call_data`; the
+network rebuilds the signed payload from the file.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hiero_sdk_python.contract.contract_create_flow import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_INLINE_SIZE,
+    DEFAULT_PIPELINE_WINDOW,
+    _delete_file,
+    _positive,
+    _upload_hex_file,
+)
+from hiero_sdk_python.contract.ethereum_transaction import EthereumTransaction
+from hiero_sdk_python.contract.ethereum_transaction_data import EthereumTransactionData
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.file.file_id import FileId
+    from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
+
+
+class EthereumFlow:
+    """Submits a signed Ethereum transaction, moving its call data to a file when it is too large to send inline."""
+
+    def __init__(self) -> None:
+        self.ethereum_data: EthereumTransactionData | None = None
+        self.max_gas_allowed: int | None = None
+        self.max_data_size: int = DEFAULT_MAX_INLINE_SIZE
+        self.chunk_size: int = DEFAULT_CHUNK_SIZE
+        self.pipeline_window: int = DEFAULT_PIPELINE_WINDOW
+        self.call_data_file_id: FileId | None = None
+
+    def set_ethereum_data(self, ethereum_data: EthereumTransactionData | bytes) -> EthereumFlow:
+        """
+        Sets the signed Ethereum transaction.
+
+        Args:
+            ethereum_data (EthereumTransactionData | bytes): The transaction, or its signed encoding.
+
+        Raises:
+            ValueError: If the bytes are not a supported Ethereum transaction.
+        """
+        if isinstance(ethereum_data, (bytes, bytearray)):
+            ethereum_data = EthereumTransactionData.from_bytes(ethereum_data)
+        if not isinstance(ethereum_data, EthereumTransactionData):
+            raise TypeError(
+                f"ethereum_data must be EthereumTransactionData or bytes, got {type(ethereum_data).__name__}"
+            )
+        self.ethereum_data = ethereum_data
+        return self
+
+    def set_max_gas_allowed(self, max_gas_allowed: int | None) -> EthereumFlow:
+        """Sets the most gas, in tinybars, the operator pays when the sender's balance falls short."""
+        self.max_gas_allowed = max_gas_allowed
+        return self
+
+    def set_max_data_size(self, max_data_size: int) -> EthereumFlow:
+        """Sets the largest encoded `ethereum_data`, in bytes, sent without a call data file."""
+        self.max_data_size = _positive("max_data_size", max_data_size)
+        return self
+
+    def set_chunk_size(self, chunk_size: int) -> EthereumFlow:
+        """Sets the size of each file chunk of a call data upload, in bytes of hex text."""
+        self.chunk_size = _positive("chunk_size", chunk_size)
+        return self
+
+    def set_pipeline_window(self, pipeline_window: int) -> EthereumFlow:
+        """Sets how many file append chunks may await their receipts at once."""
+        self.pipeline_window = _positive("pipeline_window", pipeline_window)
+        return self
+
+    def execute(self, client: Client, timeout: int | float | None = None) -> TransactionReceipt:
+        """
+        Submits the Ethereum transaction.
+
+        Args:
+            client (Client): The client to submit with. Its operator pays for the call data file.
+            timeout (int | float, optional): The timeout of each transaction, in seconds.
+
+        Returns:
+            TransactionReceipt: The receipt of the Ethereum transaction.
+
+        Raises:
+            ValueError: If no Ethereum data is set.
+            ReceiptStatusError: If a transaction of the flow fails.
+        """
+        if self.ethereum_data is None:
+            raise ValueError("Ethereum data is required")
+
+        transaction = EthereumTransaction(max_gas_allowed=self.max_gas_allowed)
+        encoded = self.ethereum_data.to_bytes()
+        if len(encoded) <= self.max_data_size:
+            self.call_data_file_id = None
+            return transaction.set_ethereum_data(encoded).execute(client, timeout, validate_status=True)
+
+        file_id = _upload_hex_file(
+            client, self.ethereum_data.call_data, "Ethereum call data", self.chunk_size, self.pipeline_window, timeout
+        )
+        self.call_data_file_id = file_id
+        transaction.set_ethereum_data(self.ethereum_data.without_call_data().to_bytes())
+        transaction.set_call_data_file_id(file_id)
+        try:
+            return transaction.execute(client, timeout, validate_status=True)
+        finally:
+            _delete_file(client, file_id, timeout)
@@ -0,0 +1,472 @@
+"""
+Signed Ethereum transaction payloads for `EthereumTransaction`.
+
+`EthereumTransactionDataEip1559` (type 2) and `EthereumTransactionDataLegacy`
+(with EIP-155 replay protection when a chain id is set) build, sign, encode
+and parse the RLP `ethereum_data` the network executes.
+
+Signing uses coincurve (libsecp256k1), which signs with a recovery id natively,
+when it is installed. Otherwise `cryptography` signs with deterministic
+(RFC 6979) nonces, s is normalized to the low form Ethereum requires, and the
+recovery id, the y parity of the nonce point R, is settled by one more native
+verification in `cryptography`. `SIGNING_BACKEND` names the signer in use.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed, decode_dss_signature, encode_dss_signature
+
+from hiero_sdk_python.crypto.evm_address import EvmAddress
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.public_key import PublicKey
+from hiero_sdk_python.utils import rlp
+from hiero_sdk_python.utils.crypto_utils import SECP256K1_CURVE, keccak256
+
+
+# secp256k1: y^2 = x^3 + 7 over the field of size _P, with base point _G of order _N
+_P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+_G = (
+    0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+)
+_HALF_N = _N // 2
+_EIP1559_TYPE = b"\x02"
+
+AccessList = list[tuple[bytes, list[bytes]]]
+
+# Points in Jacobian coordinates (X, Y, Z), with Z == 0 for the point at infinity
+_Jacobian = tuple[int, int, int]
+_INFINITY: _Jacobian = (0, 1, 0)
+
+
+def _double(point: _Jacobian) -> _Jacobian:
+    x, y, z = point
+    if not y or not z:
+        return _INFINITY
+    yy = y * y % _P
+    s = 4 * x * yy % _P
+    m = 3 * x * x % _P
+    nx = (m * m - 2 * s) % _P
+    return nx, (m * (s - nx) - 8 * yy * yy) % _P, 2 * y * z % _P
+
+
+def _add(a: _Jacobian, b: _Jacobian) -> _Jacobian:
+    if not a[2]:
+        return b
+    if not b[2]:
+        return a
+    az2, bz2 = a[2] * a[2] % _P, b[2] * b[2] % _P
+    u1, u2 = a[0] * bz2 % _P, b[0] * az2 % _P
+    s1, s2 = a[1] * bz2 * b[2] % _P, b[1] * az2 * a[2] % _P
+    if u1 == u2:
+        return _double(a) if s1 == s2 else _INFINITY
+    h, r = (u2 - u1) % _P, (s2 - s1) % _P
+    hh = h * h % _P
+    hhh = h * hh % _P
+    v = u1 * hh % _P
+    nx = (r * r - hhh - 2 * v) % _P
+    return nx, (r * (v - nx) - s1 * hhh) % _P, h * a[2] * b[2] % _P
+
+
+def _multiply_add(k1: int, p1: _Jacobian, k2: int, p2: _Jacobian) -> tuple[int, int] | None:
+    """Returns k1 * p1 + k2 * p2 in affine coordinates, or None for the point at infinity."""
+    both = _add(p1, p2)
+    result = _INFINITY
+    for bit in range(max(k1.bit_length(), k2.bit_length()) - 1, -1, -1):
+        result = _double(result)
+        pick = (k1 >> bit & 1, k2 >> bit & 1)
+        if pick == (1, 1):
+            result = _add(result, both)
+        elif pick == (1, 0):
+            result = _add(result, p1)
+        elif pick == (0, 1):
+            result = _add(result, p2)
+    x, y, z = result
+    if not z:
+        return None
+    z_inv = pow(z, -1, _P)
+    z_inv2 = z_inv * z_inv % _P
+    return x * z_inv2 % _P, y * z_inv2 * z_inv % _P
+
+
+def _recover_point(message_hash: bytes, recovery_id: int, r: int, s: int) -> tuple[int, int] | None:
+    y_squared = (pow(r, 3, _P) + 7) % _P
+    y = pow(y_squared, (_P + 1) // 4, _P)
+    if y * y % _P != y_squared:
+        return None
+    if y & 1 != recovery_id:
+        y = _P - y
+    # Q = r^-1 * (s * R - z * G)
+    r_inv = pow(r, -1, _N)
+    z = int.from_bytes(message_hash, "big") % _N
+    return _multiply_add(-z * r_inv % _N, (*_G, 1), s * r_inv % _N, (r, y, 1))
+
+
+def recover_public_key(message_hash: bytes, recovery_id: int, r: int, s: int) -> PublicKey:
+    """
+    Recovers the public key that signed a 32-byte hash.
+
+    Args:
+        message_hash (bytes): The Keccak-256 hash that was signed.
+        recovery_id (int): The recovery id (0 or 1) of the signature.
+        r (int): The r value of the signature.
+        s (int): The s value of the signature.
+
+    Returns:
+        PublicKey: The signer's ECDSA (secp256k1) public key.
+
+    Raises:
+        ValueError: If the signature values are out of range or no key can be recovered.
+    """
+    if len(message_hash) != 32:
+        raise ValueError("message_hash must be 32 bytes")
+    if recovery_id not in (0, 1) or not 0 < r < _N or not 0 < s < _N:
+        raise ValueError("Invalid signature values")
+    point = _recover_point(message_hash, recovery_id, r, s)
+    if point is None:
+        raise ValueError("No public key can be recovered from the signature")
+    return PublicKey(ec.EllipticCurvePublicNumbers(*point, SECP256K1_CURVE).public_key())
+
+
+def _nonce_point_parity(public_key: ec.EllipticCurvePublicKey, message_hash: bytes, r: int, s: int) -> int | None:
+    """
+    Returns the y parity of the nonce point R = u1*G + u2*Q of a signature, or None if it is ambiguous.
+
+    R is either (r, y) or (r, -y), and the two candidates give different x coordinates
+    for R + G. One native ECDSA verification, with a hash and signature chosen so that
+    it checks x((u1 + 1)*G + u2*Q) = x(R + G), tells which candidate it is. Only the
+    public key and public signature values are used here.
+    """
+    y_squared = (pow(r, 3, _P) + 7) % _P
+    y = pow(y_squared, (_P + 1) // 4, _P)
+    if y * y % _P != y_squared or r == _G[0]:
+        return None
+    if y & 1:
+        y = _P - y
+
+    inverse = pow(_G[0] - r, -1, _P)
+    sums = []
+    for candidate_y in (y, _P - y):
+        slope = (_G[1] - candidate_y) * inverse % _P
+        sums.append((slope * slope - r - _G[0]) % _P % _N)
+    even_sum = sums[0]
+    if even_sum == sums[1] or not even_sum:
+        return None
+
+    z = int.from_bytes(message_hash, "big") % _N
+    s_inv = pow(s, -1, _N)
+    u1, u2 = z * s_inv % _N, r * s_inv % _N
+    # With w = 1/s', verification computes x((z' * w)*G + (r' * w)*Q) and compares it with r'
+    forged_s = even_sum * pow(u2, -1, _N) % _N
+    forged_z = (u1 + 1) * forged_s % _N
+    try:
+        public_key.verify(
+            encode_dss_signature(even_sum, forged_s),
+            forged_z.to_bytes(32, "big"),
+            ec.ECDSA(Prehashed(hashes.SHA256())),
+        )
+    except InvalidSignature:
+        return 1
+    return 0
+
+
+def _sign_with_cryptography(private_key: PrivateKey, message_hash: bytes) -> tuple[int, int, int]:
+    key = private_key._private_key
+    r, s = decode_dss_signature(
+        key.sign(message_hash, ec.ECDSA(Prehashed(hashes.SHA256()), deterministic_signing=True))
+    )
+    if s > _HALF_N:
+        s = _N - s
+
+    recovery_id = _nonce_point_parity(key.public_key(), message_hash, r, s)
+    if recovery_id is not None:
+        return recovery_id, r, s
+
+    # The ambiguous cases have negligible probability; recover both candidates instead.
+    numbers = key.public_key().public_numbers()
+    for candidate in (0, 1):
+        if _recover_point(message_hash, candidate, r, s) == (numbers.x, numbers.y):
+            return candidate, r, s
+    raise ValueError("Signature does not recover to the signing key")
+
+
+def _coincurve_signer():
+    import coincurve
+
+    def sign(private_key: PrivateKey, message_hash: bytes) -> tuple[int, int, int]:
+        signature = coincurve.PrivateKey(private_key.to_bytes_ecdsa_raw()).sign_recoverable(message_hash, hasher=None)
+        return signature[64], int.from_bytes(signature[:32], "big"), int.from_bytes(signature[32:64], "big")
+
+    return sign
+
+
+def _select_signer():
+    try:
+        return "coincurve", _coincurve_signer()
+    except ImportError:
+        return "cryptography", _sign_with_cryptography
+
+
+# The signer is chosen once, at import
+SIGNING_BACKEND, _sign = _select_signer()
+
+
+def sign_recoverable(private_key: PrivateKey, message_hash: bytes) -> tuple[int, int, int]:
+    """
+    Signs a 32-byte hash with a secp256k1 key the way Ethereum does.
+
+    Signatures are deterministic (RFC 6979) and low-s with either backend.
+
+    Args:
+        private_key (PrivateKey): An ECDSA (secp256k1) private key.
+        message_hash (bytes): The Keccak-256 hash to sign.
+
+    Returns:
+        tuple[int, int, int]: The recovery id (0 or 1), r and the low-s s.
+
+    Raises:
+        ValueError: If the key is not an ECDSA key or the hash is not 32 bytes.
+    """
+    if len(message_hash) != 32:
+        raise ValueError("message_hash must be 32 bytes")
+    if not private_key.is_ecdsa():
+        raise ValueError("Ethereum transactions must be signed with an ECDSA (secp256k1) key")
+    return _sign(private_key, message_hash)
+
+
+def _to_address(to: bytes | str | EvmAddress | None) -> bytes:
+    if to is None:
+        return b""
+    if isinstance(to, EvmAddress):
+        return to.address_bytes
+    if isinstance(to, str):
+        to = bytes.fromhex(to[2:] if to.startswith("0x") else to)
+    if not isinstance(to, (bytes, bytearray)):
+        raise TypeError(f"to must be bytes, a hex string or an EvmAddress, got {type(to).__name__}")
+    if len(to) not in (0, 20):
+        raise ValueError("to must be a 20-byte address, or empty for a contract creation")
+    return bytes(to)
+
+
+def _to_bytes(value: bytes | str) -> bytes:
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+class EthereumTransactionData(ABC):
+    """An RLP-encoded Ethereum transaction, as carried in `EthereumTransaction.ethereum_data`."""
+
+    call_data: bytes
+
+    @abstractmethod
+    def _unsigned_payload(self) -> bytes:
+        """Returns the encoding whose Keccak-256 hash is signed."""
+
+    @abstractmethod
+    def _set_signature(self, recovery_id: int, r: int, s: int) -> None: ...
+
+    @abstractmethod
+    def to_bytes(self) -> bytes:
+        """Returns the signed transaction encoding."""
+
+    def signing_hash(self) -> bytes:
+        """Returns the hash a sender signs for this transaction."""
+        return keccak256(self._unsigned_payload())
+
+    def sign(self, private_key: PrivateKey) -> EthereumTransactionData:
+        """
+        Signs the transaction, replacing any existing signature.
+
+        Args:
+            private_key (PrivateKey): The sender's ECDSA (secp256k1) key.
+
+        Returns:
+            EthereumTransactionData: This transaction data.
+        """
+        self._set_signature(*sign_recoverable(private_key, self.signing_hash()))
+        return self
+
+    def without_call_data(self) -> EthereumTransactionData:
+        """
+        Returns a copy with empty call data and the same signature.
+
+        The network rebuilds the signed transaction from the call data file of the
+        `EthereumTransaction`, so the signature still covers the full call data.
+        """
+        return replace(self, call_data=b"")
+
+    @staticmethod
+    def from_bytes(data: bytes) -> EthereumTransactionData:
+        """
+        Parses a signed EIP-1559 or legacy transaction.
+
+        Raises:
+            ValueError: If the data is not a supported Ethereum transaction.
+        """
+        data = bytes(data)
+        if data[:1] == _EIP1559_TYPE:
+            return EthereumTransactionDataEip1559.from_bytes(data)
+        if data[:1] and data[0] >= 0xC0:
+            return EthereumTransactionDataLegacy.from_bytes(data)
+        raise ValueError("Unsupported Ethereum transaction type")
+
+
+def _decode_fields(data: bytes, count: int) -> list:
+    fields = rlp.decode(data)
+    if not isinstance(fields, list) or len(fields) != count:
+        raise ValueError(f"Expected an RLP list of {count} fields")
+    return fields
+
+
+@dataclass
+class EthereumTransactionDataEip1559(EthereumTransactionData):
+    """
+    A type 2 (EIP-1559) Ethereum transaction.
+
+    Gas prices and the value are in weibars (1 tinybar = 10^10 weibars).
+    """
+
+    chain_id: int = 0
+    nonce: int = 0
+    max_priority_gas: int = 0
+    max_gas: int = 0
+    gas_limit: int = 0
+    to: bytes = b""
+    value: int = 0
+    call_data: bytes = b""
+    access_list: AccessList = field(default_factory=list)
+    recovery_id: int = 0
+    r: int = 0
+    s: int = 0
+
+    def __post_init__(self) -> None:
+        self.to = _to_address(self.to)
+        self.call_data = _to_bytes(self.call_data)
+
+    def _fields(self) -> list:
+        return [
+            self.chain_id,
+            self.nonce,
+            self.max_priority_gas,
+            self.max_gas,
+            self.gas_limit,
+            self.to,
+            self.value,
+            self.call_data,
+            [[address, list(keys)] for address, keys in self.access_list],
+        ]
+
+    def _unsigned_payload(self) -> bytes:
+        return rlp.encode(self._fields(), prefix=_EIP1559_TYPE)
+
+    def _set_signature(self, recovery_id: int, r: int, s: int) -> None:
+        self.recovery_id, self.r, self.s = recovery_id, r, s
+
+    def to_bytes(self) -> bytes:
+        return rlp.encode([*self._fields(), self.recovery_id, self.r, self.s], prefix=_EIP1559_TYPE)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> EthereumTransactionDataEip1559:
+        """
+        Parses a signed type 2 transaction.
+
+        Raises:
+            ValueError: If the data is not a type 2 transaction.
+        """
+        if data[:1] != _EIP1559_TYPE:
+            raise ValueError("Not an EIP-1559 transaction")
+        fields = _decode_fields(data[1:], 12)
+        access_list = [(bytes(entry[0]), [bytes(key) for key in entry[1]]) for entry in fields[8]]
+        ints = [rlp.to_int(fields[i]) for i in (0, 1, 2, 3, 4, 6, 9, 10, 11)]
+        return cls(
+            chain_id=ints[0],
+            nonce=ints[1],
+            max_priority_gas=ints[2],
+            max_gas=ints[3],
+            gas_limit=ints[4],
+            to=fields[5],
+            value=ints[5],
+            call_data=fields[7],
+            access_list=access_list,
+            recovery_id=ints[6],
+            r=ints[7],
+            s=ints[8],
+        )
+
+
+@dataclass
+class EthereumTransactionDataLegacy(EthereumTransactionData):
+    """
+    A legacy Ethereum transaction.
+
+    With a `chain_id`, the transaction is signed with EIP-155 replay protection
+    (v = chain_id * 2 + 35 + recovery id); without one, v is 27 or 28.
+    """
+
+    nonce: int = 0
+    gas_price: int = 0
+    gas_limit: int = 0
+    to: bytes = b""
+    value: int = 0
+    call_data: bytes = b""
+    chain_id: int | None = None
+    v: int = 0
+    r: int = 0
+    s: int = 0
+
+    def __post_init__(self) -> None:
+        self.to = _to_address(self.to)
+        self.call_data = _to_bytes(self.call_data)
+
+    def _fields(self) -> list:
+        return [self.nonce, self.gas_price, self.gas_limit, self.to, self.value, self.call_data]
+
+    def _unsigned_payload(self) -> bytes:
+        if self.chain_id is None:
+            return rlp.encode(self._fields())
+        return rlp.encode([*self._fields(), self.chain_id, 0, 0])
+
+    def _set_signature(self, recovery_id: int, r: int, s: int) -> None:
+        base = 27 if self.chain_id is None else self.chain_id * 2 + 35
+        self.v, self.r, self.s = base + recovery_id, r, s
+
+    @property
+    def recovery_id(self) -> int:
+        return (self.v - 27) if self.chain_id is None else (self.v - 35 - self.chain_id * 2)
+
+    def to_bytes(self) -> bytes:
+        return rlp.encode([*self._fields(), self.v, self.r, self.s])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> EthereumTransactionDataLegacy:
+        """
+        Parses a signed legacy transaction, deriving the chain id from an EIP-155 v.
+
+        Raises:
+            ValueError: If the data is not a legacy transaction or v is not 27, 28 or an EIP-155 value.
+        """
+        fields = _decode_fields(data, 9)
+        nonce, gas_price, gas_limit = (rlp.to_int(value) for value in fields[:3])
+        v = rlp.to_int(fields[6])
+        if v not in (27, 28) and v < 35:
+            raise ValueError(f"Invalid legacy transaction v: {v}")
+        return cls(
+            nonce=nonce,
+            gas_price=gas_price,
+            gas_limit=gas_limit,
+            to=fields[3],
+            value=rlp.to_int(fields[4]),
+            call_data=fields[5],
+            chain_id=(v - 35) // 2 if v >= 35 else None,
+            v=v,
+            r=rlp.to_int(fields[7]),
+            s=rlp.to_int(fields[8]),
+        )
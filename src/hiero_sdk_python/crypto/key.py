@@ -13,6 +13,8 @@ class Key(ABC):
     Concrete implementations must implement to_proto_key.
     """
 
+    __slots__ = ()
+
     @classmethod
     def from_proto_key(cls, proto: basic_types_pb2.Key) -> Key:
         """
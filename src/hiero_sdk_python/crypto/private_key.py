@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import warnings
+from functools import cached_property
 
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import (
@@ -292,6 +293,11 @@ class PrivateKey(Key):
 
     def public_key(self) -> PublicKey:
         """Derive the public key from this private key."""
+        return self._public_key
+
+    @cached_property
+    def _public_key(self) -> PublicKey:
+        # PublicKey is immutable, so the derived key and its cached encodings are shared
         return PublicKey(self._private_key.public_key())
 
     #
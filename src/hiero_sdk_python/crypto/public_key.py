@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import warnings
+from functools import cached_property
 
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import (
@@ -33,6 +34,8 @@ class PublicKey(Key):
     Supports multiple key formats: raw bytes, DER-encoded keys,
     hex strings, and a protobuf (“proto”) representation.
 
+    A PublicKey is immutable. Its encodings and EVM address are computed on first
+    use and cached, so keys are cheap to compare, hash and serialize repeatedly.
     """
 
     def __init__(self, public_key: ec.EllipticCurvePublicKey | ed25519.Ed25519PublicKey) -> None:
@@ -352,7 +355,7 @@ class PublicKey(Key):
 
     def is_ed25519(self) -> bool:
         """Checks if this key (private or public) is Ed25519."""
-        return isinstance(self._public_key, ed25519.Ed25519PublicKey)
+        return self._is_ed25519
 
     def is_ecdsa(self) -> bool:
         """Checks if this public key is ECDSA (secp256k1)."""
@@ -385,33 +388,58 @@ class PublicKey(Key):
             - If `is_ed25519() == True`, a 32-byte Ed25519 point.
             - Otherwise, a 33-byte compressed secp256k1 point.
         """
-        if self.is_ed25519():
+        return self._raw_bytes
+
+    @cached_property
+    def _is_ed25519(self) -> bool:
+        return isinstance(self._public_key, ed25519.Ed25519PublicKey)
+
+    @cached_property
+    def _raw_bytes(self) -> bytes:
+        if self._is_ed25519:
             return self.to_bytes_ed25519()
         # ECDSA
         return self.to_bytes_ecdsa()
 
+    @cached_property
+    def _ed25519_bytes(self) -> bytes:
+        return self._public_key.public_bytes(encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw)
+
+    @cached_property
+    def _ecdsa_compressed_bytes(self) -> bytes:
+        return self._public_key.public_bytes(
+            encoding=serialization.Encoding.X962, format=serialization.PublicFormat.CompressedPoint
+        )
+
+    @cached_property
+    def _ecdsa_uncompressed_bytes(self) -> bytes:
+        return self._public_key.public_bytes(
+            encoding=serialization.Encoding.X962, format=serialization.PublicFormat.UncompressedPoint
+        )
+
+    @cached_property
+    def _der_bytes(self) -> bytes:
+        return self._public_key.public_bytes(
+            encoding=serialization.Encoding.DER, format=serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+
     def to_bytes_ed25519(self) -> bytes:
         """
         Specific name for clarity.
         Returns the Ed25519 public key in 32-bytes raw form.
         """
-        return self._public_key.public_bytes(encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw)
+        return self._ed25519_bytes
 
     def to_bytes_ecdsa(self, compressed: bool = True) -> bytes:
         """
         Specific name for clarity.
         Returns the ECDSA public key in compressed or uncompressed form.
         """
-        format_ = (
-            serialization.PublicFormat.CompressedPoint if compressed else serialization.PublicFormat.UncompressedPoint
-        )
-        return self._public_key.public_bytes(encoding=serialization.Encoding.X962, format=format_)
+        return self._ecdsa_compressed_bytes if compressed else self._ecdsa_uncompressed_bytes
 
     def to_bytes_der(self) -> bytes:
         """Returns the DER-encoded public key."""
-        return self._public_key.public_bytes(
-            encoding=serialization.Encoding.DER, format=serialization.PublicFormat.SubjectPublicKeyInfo
-        )
+        return self._der_bytes
 
     @classmethod
     def _encode_vlq(cls, value: int) -> bytes:
@@ -487,7 +515,10 @@ class PublicKey(Key):
         """
         if not self.is_ecdsa():
             raise ValueError("Compressed ECDSA DER export is only supported for ECDSA keys")
+        return self._der_ecdsa_compressed_bytes
 
+    @cached_property
+    def _der_ecdsa_compressed_bytes(self) -> bytes:
         # id-ecPublicKey + secp256k1 OID algorithm identifier
         algorithm_id = self._encode_der_sequence(
             self._encode_der_oid("1.2.840.10045.2.1") + self._encode_der_oid("1.3.132.0.10")
@@ -522,6 +553,10 @@ class PublicKey(Key):
         Specific naming for clarity.
         Hex-encoded DER form of the public key.
         """
+        return self._der_string
+
+    @cached_property
+    def _der_string(self) -> str:
         return self.to_bytes_der().hex()
 
     def to_string_der_ecdsa_compressed(self) -> str:
@@ -563,11 +598,13 @@ class PublicKey(Key):
         if self.is_ed25519():
             raise ValueError("Cannot derive an EVM address from an Ed25519 key.")
 
+        return EvmAddress.from_bytes(self._evm_address_bytes)
+
+    @cached_property
+    def _evm_address_bytes(self) -> bytes:
         uncompressed_bytes = self.to_bytes_ecdsa(compressed=False)
         keccak_bytes = keccak256(uncompressed_bytes[1:])
-        evm_address = keccak_bytes[-20:]
-
-        return EvmAddress.from_bytes(evm_address)
+        return keccak_bytes[-20:]
 
     #
     # ----------------------------
@@ -623,6 +660,10 @@ class PublicKey(Key):
         data_hash = keccak256(data)
         self._public_key.verify(signature_der, data_hash, ec.ECDSA(asym_utils.Prehashed(hashes.SHA256())))
 
+    def __reduce__(self) -> tuple:
+        """Pickles the key as its DER encoding."""
+        return (PublicKey.from_der, (self.to_bytes_der(),))
+
     def __repr__(self) -> str:
         """Returns a string representation of the PublicKey."""
         if self.is_ed25519():
@@ -633,13 +674,19 @@ class PublicKey(Key):
         """Compare two PublicKey objects for equality."""
         if not isinstance(other, PublicKey):
             return NotImplemented
+        if self is other:
+            return True
 
         # Different algorithms can never be equal
-        if self.is_ed25519() != other.is_ed25519():
+        if self._is_ed25519 != other._is_ed25519:
             return False
 
-        return self.to_bytes_raw() == other.to_bytes_raw()
+        return self._raw_bytes == other._raw_bytes
 
     def __hash__(self) -> int:
         """Returns the hash value for the public key."""
-        return hash((self.is_ed25519(), self.to_bytes_raw()))
+        return self._hash
+
+    @cached_property
+    def _hash(self) -> int:
+        return hash((self._is_ed25519, self._raw_bytes))
@@ -14,8 +14,10 @@ to build and execute a file append transaction.
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, Any
+import os
+from typing import TYPE_CHECKING, Any, BinaryIO
 
+from hiero_sdk_python.file.file_contents_stream import _FileContentsStream
 from hiero_sdk_python.file.file_id import FileId
 from hiero_sdk_python.hapi.services import file_append_pb2
 from hiero_sdk_python.hapi.services.schedulable_transaction_body_pb2 import SchedulableTransactionBody
@@ -25,7 +27,10 @@ from hiero_sdk_python.transaction.chunked_transaction import ChunkedTransaction
 
 if TYPE_CHECKING:
     from hiero_sdk_python.channels import _Channel
+    from hiero_sdk_python.client.client import Client
     from hiero_sdk_python.executable import _Method
+    from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
+    from hiero_sdk_python.transaction.transaction_response import TransactionResponse
 
 
 class FileAppendTransaction(ChunkedTransaction):
@@ -52,6 +57,8 @@ class FileAppendTransaction(ChunkedTransaction):
         super().__init__()
         self.file_id: FileId | None = file_id
         self.contents: bytes | None = self._encode_contents(contents)
+        self._contents_stream: _FileContentsStream | None = None
+        self._contents_stream_released: bool = False
         self.max_chunks: int = 20
         self.chunk_size: int = 4096
         self._default_transaction_fee = Hbar(5).to_tinybars()
@@ -67,6 +74,9 @@ class FileAppendTransaction(ChunkedTransaction):
         """
         Helper method to encode string contents to UTF-8 bytes.
 
+        Contents are encoded once here; chunks are later sliced from this single
+        buffer without re-encoding or copying the whole payload.
+
         Args:
             contents (Optional[str | bytes]): The contents to encode.
 
@@ -86,9 +96,14 @@ class FileAppendTransaction(ChunkedTransaction):
         Returns:
             int: The total number of chunks needed.
         """
-        if self.contents is None:
+        payload = self._payload()
+        if payload is None:
             return 1
-        return math.ceil(len(self.contents) / self.chunk_size)
+        return math.ceil(len(payload) / self.chunk_size)
+
+    def _payload(self) -> bytes | _FileContentsStream | None:
+        """Returns the contents to chunk: the streamed contents if set, else the in-memory contents."""
+        return self._contents_stream if self._contents_stream is not None else self.contents
 
     def get_required_chunks(self) -> int:
         """
@@ -126,9 +141,75 @@ class FileAppendTransaction(ChunkedTransaction):
         """
         self._require_not_frozen()
         self.contents = self._encode_contents(contents)
+        self._close_contents_stream()
+        self._contents_stream_released = False
+        self._total_chunks = self._calculate_total_chunks()
+        return self
+
+    def set_contents_stream(self, source: BinaryIO | str | os.PathLike) -> FileAppendTransaction:
+        """
+        Sets the contents to append from a file, without loading it into memory.
+
+        Regular files are memory-mapped and each chunk is read only while its
+        transaction body is built, so large files upload with constant memory.
+        File objects are read from their current position and must stay open
+        until the transaction has been executed. The stream is released once
+        `execute_all()` returns or raises, so a transaction with streamed contents
+        is executed once; to retry a failed upload, build a new transaction.
+
+        Args:
+            source (BinaryIO | str | os.PathLike): A path, or a seekable binary file object.
+
+        Returns:
+            FileAppendTransaction: This transaction instance.
+
+        Raises:
+            TypeError: If source is neither a path nor a binary file object.
+            ValueError: If the file object is not seekable.
+        """
+        self._require_not_frozen()
+        stream = _FileContentsStream(source)
+        self._close_contents_stream()
+        self._contents_stream = stream
+        self._contents_stream_released = False
+        self.contents = None
         self._total_chunks = self._calculate_total_chunks()
         return self
 
+    def _close_contents_stream(self) -> None:
+        """Releases the streamed contents, if any."""
+        if self._contents_stream is not None:
+            self._contents_stream.close()
+            self._contents_stream = None
+
+    def execute_all(
+        self,
+        client: Client,
+        timeout: int | float | None = None,
+        wait_for_receipt: bool = True,
+        validate_status: bool = False,
+    ) -> list[TransactionReceipt] | list[TransactionResponse]:
+        """
+        Executes all chunks of the transaction, then releases any streamed contents.
+
+        See `ChunkedTransaction.execute_all()`. A contents stream set with
+        `set_contents_stream()` is closed and detached whether or not execution succeeds.
+
+        Raises:
+            ValueError: If the streamed contents were already released by a previous call.
+        """
+        if self._contents_stream_released:
+            raise ValueError(
+                "The contents stream was released by a previous execute_all(); "
+                "create a new transaction with set_contents_stream() to upload again"
+            )
+        try:
+            return super().execute_all(client, timeout, wait_for_receipt, validate_status)
+        finally:
+            if self._contents_stream is not None:
+                self._close_contents_stream()
+                self._contents_stream_released = True
+
     def set_max_chunks(self, max_chunks: int) -> FileAppendTransaction:
         """
         Sets the maximum number of chunks allowed for this transaction.
@@ -169,12 +250,8 @@ class FileAppendTransaction(ChunkedTransaction):
         if self.file_id is None:
             raise ValueError("Missing required FileID")
 
-        if self.contents is None:
-            chunk_contents = b""
-        else:
-            start_index = self._current_chunk_index * self.chunk_size
-            end_index = min(start_index + self.chunk_size, len(self.contents))
-            chunk_contents = self.contents[start_index:end_index]
+        payload = self._payload()
+        chunk_contents = b"" if payload is None else self._current_chunk(payload)
 
         return file_append_pb2.FileAppendTransactionBody(
             fileID=self.file_id._to_proto() if self.file_id else None, contents=chunk_contents
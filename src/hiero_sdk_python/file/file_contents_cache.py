@@ -0,0 +1,133 @@
+"""
+In-memory cache of file contents for FileContentsQuery.
+
+Entries are keyed by FileId and validated against the file's metadata returned
+by FileInfoQuery, so unchanged files (fee schedules, address books, ...) only cost
+an info query instead of a full download, until the entry reaches its maximum age.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.file.file_info import FileInfo
+
+
+# Seconds an entry is trusted on its metadata alone before it is downloaded again
+DEFAULT_MAX_AGE = 60.0
+
+
+class FileContentsCache:
+    """
+    Thread-safe, size-bounded LRU cache of file contents.
+
+    The network does not expose a modification timestamp or hash for files, so a
+    cached entry is considered current while the file's size, expiration time,
+    deletion flag and memo are unchanged. This fingerprint is a heuristic, not proof
+    that the contents are unchanged: an update that keeps the size, such as a new
+    exchange rate in file 0.0.112 or a fee schedule edit, is not detected. Such
+    updates are only picked up once the entry is older than `max_age`.
+
+    The info query and the contents download are separate requests, so an update
+    landing between them can pair new contents with old metadata. Contents whose
+    length disagrees with the metadata are not cached.
+    """
+
+    def __init__(self, max_entries: int = 64, max_age: float | None = DEFAULT_MAX_AGE) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries (int, optional): The maximum number of files kept.
+            max_age (float, optional): Seconds after which an entry is refetched
+                even if its metadata is unchanged. None trusts the metadata
+                indefinitely, so same-size updates are never seen.
+
+        Raises:
+            ValueError: If max_entries is not positive or max_age is negative.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_age is not None and max_age < 0:
+            raise ValueError("max_age must be non-negative")
+
+        self.max_entries: int = max_entries
+        self.max_age: float | None = max_age
+        self._entries: OrderedDict[FileId, tuple[tuple, float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _fingerprint(info: FileInfo) -> tuple:
+        expiration = info.expiration_time
+        return (
+            info.size,
+            (expiration.seconds, expiration.nanos) if expiration is not None else None,
+            info.is_deleted,
+            info.file_memo,
+        )
+
+    def get(self, file_id: FileId, info: FileInfo) -> bytes | None:
+        """
+        Returns the cached contents of a file if they are still current.
+
+        Args:
+            file_id (FileId): The file to look up.
+            info (FileInfo): The file's current metadata from FileInfoQuery.
+
+        Returns:
+            bytes | None: The cached contents, or None on a miss or a stale entry.
+        """
+        with self._lock:
+            entry = self._entries.get(file_id)
+            if entry is None:
+                return None
+
+            fingerprint, stored_at, contents = entry
+            expired = self.max_age is not None and time.monotonic() - stored_at > self.max_age
+            if expired or fingerprint != self._fingerprint(info) or len(contents) != info.size:
+                del self._entries[file_id]
+                return None
+
+            self._entries.move_to_end(file_id)
+            return contents
+
+    def put(self, file_id: FileId, info: FileInfo, contents: bytes) -> None:
+        """
+        Stores the contents of a file along with the metadata they correspond to.
+
+        Args:
+            file_id (FileId): The file the contents belong to.
+            info (FileInfo): The metadata fetched before the contents were downloaded.
+            contents (bytes): The file contents. They are not stored if their length
+                differs from the metadata, since the file changed in between.
+        """
+        if len(contents) != info.size:
+            self.invalidate(file_id)
+            return
+        with self._lock:
+            self._entries[file_id] = (self._fingerprint(info), time.monotonic(), contents)
+            self._entries.move_to_end(file_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, file_id: FileId | None = None) -> None:
+        """
+        Removes one file from the cache, or every file if file_id is None.
+
+        Args:
+            file_id (FileId, optional): The file to remove.
+        """
+        with self._lock:
+            if file_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(file_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, file_id: FileId) -> bool:
+        return file_id in self._entries
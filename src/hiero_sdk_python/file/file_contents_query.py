@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
+
 from hiero_sdk_python.channels import _Channel
 from hiero_sdk_python.client.client import Client
 from hiero_sdk_python.executable import _Method
+from hiero_sdk_python.file.file_contents_cache import FileContentsCache
 from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.file.file_info_query import FileInfoQuery
 from hiero_sdk_python.hapi.services import (
     file_get_contents_pb2,
     query_pb2,
     response_pb2,
 )
 from hiero_sdk_python.hapi.services.file_get_contents_pb2 import FileGetContentsResponse
+from hiero_sdk_python.hbar import Hbar
 from hiero_sdk_python.query.query import Query
 
 
@@ -33,6 +40,7 @@ class FileContentsQuery(Query):
         """
         super().__init__()
         self.file_id = file_id
+        self.cache: FileContentsCache | None = None
 
     def set_file_id(self, file_id: FileId | None) -> FileContentsQuery:
         """
@@ -47,6 +55,25 @@ class FileContentsQuery(Query):
         self.file_id = file_id
         return self
 
+    def set_cache(self, cache: FileContentsCache | None) -> FileContentsQuery:
+        """
+        Sets a cache consulted before downloading the file contents.
+
+        With a cache, execute() first runs a FileInfoQuery and returns the cached
+        contents if the file's metadata is unchanged and the entry is younger than
+        the cache's `max_age`; otherwise the contents are downloaded and stored in
+        the cache. Unchanged metadata does not prove unchanged contents, see
+        `FileContentsCache`.
+
+        Args:
+            cache (Optional[FileContentsCache]): The cache to use, or None to disable caching.
+
+        Returns:
+            FileContentsQuery: Returns self for method chaining.
+        """
+        self.cache = cache
+        return self
+
     def _make_request(self) -> query_pb2.Query:
         """
         Constructs the protobuf request for the query.
@@ -94,12 +121,13 @@ class FileContentsQuery(Query):
         """
         return _Method(transaction_func=None, query_func=channel.file.getFileContent)
 
-    def execute(self, client: Client, timeout: int | float | None = None) -> str:
+    def execute(self, client: Client, timeout: int | float | None = None) -> bytes:
         """
         Executes the file contents query.
 
         Sends the query to the Hedera network and processes the response
-        to return the file contents.
+        to return the file contents. If a cache is set and the file is unchanged,
+        the cached contents are returned without downloading them.
 
         This function delegates the core logic to `_execute()`, and may propagate
         exceptions raised by it.
@@ -109,18 +137,108 @@ class FileContentsQuery(Query):
             timeout (Optional[Union[int, float]]): The total execution timeout (in seconds) for this execution.
 
         Returns:
-            str: The contents of the file from the network
+            bytes: The contents of the file from the network
 
         Raises:
             PrecheckError: If the query fails with a non-retryable error
             MaxAttemptsError: If the query fails after the maximum number of attempts
             ReceiptStatusError: If the query fails with a receipt status error
         """
+        if self.cache is None:
+            return self._fetch_contents(client, timeout)
+
+        info = FileInfoQuery(self.file_id).execute(client, timeout)
+        contents = self.cache.get(self.file_id, info)
+        if contents is None:
+            contents = self._fetch_contents(client, timeout)
+            self.cache.put(self.file_id, info, contents)
+        return contents
+
+    def _fetch_contents(self, client: Client, timeout: int | float | None) -> bytes:
         self._before_execute(client)
         response = self._execute(client, timeout)
 
         return response.fileGetContents.fileContents.contents
 
+    def execute_to(
+        self, client: Client, sink: BinaryIO | bytearray | memoryview, timeout: int | float | None = None
+    ) -> int:
+        """
+        Executes the query and writes the file contents into `sink`.
+
+        Args:
+            client (Client): The client instance to use for execution
+            sink (BinaryIO | bytearray | memoryview): A writable binary file object, a
+                bytearray that the contents are appended to, or a writable memoryview
+                the contents are copied into from its start.
+            timeout (Optional[Union[int, float]]): The total execution timeout (in seconds) for this execution.
+
+        Returns:
+            int: The number of bytes written.
+
+        Raises:
+            ValueError: If a memoryview sink is too small for the contents.
+            TypeError: If sink is not a supported type.
+        """
+        contents = self.execute(client, timeout)
+        size = len(contents)
+
+        if isinstance(sink, bytearray):
+            sink += contents
+        elif isinstance(sink, memoryview):
+            if sink.readonly:
+                raise TypeError("memoryview sink must be writable")
+            if sink.nbytes < size:
+                raise ValueError(f"memoryview sink holds {sink.nbytes} bytes but the file has {size}")
+            sink.cast("B")[:size] = contents
+        elif hasattr(sink, "write"):
+            sink.write(contents)
+        else:
+            raise TypeError(f"sink must be a binary file object, bytearray or memoryview, got {type(sink).__name__}")
+        return size
+
+    @staticmethod
+    def execute_many(
+        client: Client,
+        file_ids: Iterable[FileId],
+        max_workers: int = 4,
+        timeout: int | float | None = None,
+        cache: FileContentsCache | None = None,
+        query_payment: Hbar | None = None,
+    ) -> dict[FileId, bytes]:
+        """
+        Fetches the contents of several files concurrently.
+
+        Args:
+            client (Client): The client instance to use for execution
+            file_ids (Iterable[FileId]): The files to fetch. Duplicates are fetched once.
+            max_workers (int, optional): The maximum number of concurrent queries.
+            timeout (Optional[Union[int, float]]): The execution timeout (in seconds) of each query.
+            cache (Optional[FileContentsCache]): A cache shared by all queries.
+            query_payment (Optional[Hbar]): A fixed payment for each query. Setting it
+                skips the cost query otherwise made before every paid query.
+
+        Returns:
+            dict[FileId, bytes]: The contents of each file, in the order first requested.
+
+        Raises:
+            ValueError: If max_workers is not positive.
+            Exception: The first error raised by any of the queries.
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+
+        unique_ids = list(dict.fromkeys(file_ids))
+
+        def fetch(file_id: FileId) -> bytes:
+            query = FileContentsQuery(file_id).set_cache(cache)
+            if query_payment is not None:
+                query.set_query_payment(query_payment)
+            return query.execute(client, timeout)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, max(len(unique_ids), 1))) as executor:
+            return dict(zip(unique_ids, executor.map(fetch, unique_ids), strict=True))
+
     def _get_query_response(self, response: response_pb2.Response) -> FileGetContentsResponse:
         """
         Extracts the file contents response from the full response.
@@ -0,0 +1,99 @@
+"""
+Random-access reader used to stream file contents into chunked transactions.
+
+A stream wraps either a path or a binary file object. Regular files are
+memory-mapped so chunks are paged in on demand; other seekable file objects are
+read with seek()/read(). Only the chunk currently being built is ever copied
+into memory.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+from typing import BinaryIO
+
+
+class _FileContentsStream:
+    """
+    Read-only, sliceable view over file contents that are not held in memory.
+
+    Supports `len()` and slicing with a step of 1, so it can be used wherever
+    chunked transactions slice an in-memory payload.
+    """
+
+    def __init__(self, source: BinaryIO | str | os.PathLike) -> None:
+        """
+        Opens a stream over `source`.
+
+        Args:
+            source (BinaryIO | str | os.PathLike): A path, or a seekable binary file object.
+                File objects are read from their current position.
+
+        Raises:
+            TypeError: If source is neither a path nor a binary file object.
+            ValueError: If the file object is not seekable.
+        """
+        self._mmap: mmap.mmap | None = None
+        self._fileobj: BinaryIO | None = None
+        self._offset: int = 0
+
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                self._size = os.fstat(f.fileno()).st_size
+                self._map(f, 0)
+            return
+
+        if not hasattr(source, "read") or not hasattr(source, "seek"):
+            raise TypeError(f"source must be a path or a binary file object, got {type(source).__name__}")
+        if not source.seekable():
+            raise ValueError("source file object must be seekable")
+
+        self._offset = source.tell()
+        self._size = source.seek(0, io.SEEK_END) - self._offset
+        source.seek(self._offset)
+        if not self._map(source, self._offset):
+            self._fileobj = source
+
+    def _map(self, fileobj: BinaryIO, offset: int) -> bool:
+        """Memory-maps `fileobj` if it is backed by a regular, non-empty file."""
+        try:
+            fileno = fileobj.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return False
+        if self._size <= 0:
+            return True  # nothing to read; mmap refuses empty files
+        # The mapping stays valid after the file object is closed.
+        self._mmap = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        self._offset = offset
+        return True
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, key: slice) -> bytes:
+        if not isinstance(key, slice):
+            raise TypeError("_FileContentsStream only supports slicing")
+        start, stop, step = key.indices(self._size)
+        if step != 1:
+            raise ValueError("_FileContentsStream slices must have a step of 1")
+        if stop <= start:
+            return b""
+
+        if self._mmap is not None:
+            return self._mmap[self._offset + start : self._offset + stop]
+        if self._fileobj is None:
+            raise ValueError("Cannot read from a closed contents stream")
+
+        self._fileobj.seek(self._offset + start)
+        data = self._fileobj.read(stop - start)
+        if len(data) != stop - start:
+            raise ValueError("File contents changed while streaming: unexpected end of file")
+        return data
+
+    def close(self) -> None:
+        """Releases the memory mapping, if any. The source file object is left open."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
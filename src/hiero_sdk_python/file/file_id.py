@@ -12,10 +12,18 @@ from dataclasses import dataclass, field
 
 from hiero_sdk_python.client.client import Client
 from hiero_sdk_python.hapi.services import basic_types_pb2
-from hiero_sdk_python.utils.entity_id_helper import format_to_string_with_checksum, parse_from_string, validate_checksum
-
-
-@dataclass(frozen=True)
+from hiero_sdk_python.utils.entity_id_helper import (
+    copy_proto,
+    entity_id_getstate,
+    entity_id_setstate,
+    format_to_string_with_checksum,
+    intern_entity_id,
+    parse_entity_id,
+    validate_checksum,
+)
+
+
+@dataclass(frozen=True, slots=True)
 class FileId:
     """
     Represents a file ID on the network.
@@ -34,6 +42,15 @@ class FileId:
     realm: int = 0
     file: int = 0
     checksum: str | None = field(default=None, init=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _proto: basic_types_pb2.FileID | None = field(default=None, init=False, repr=False, compare=False)
+
+    __getstate__ = entity_id_getstate
+    __setstate__ = entity_id_setstate
+
+    def __post_init__(self) -> None:
+        """Precomputes the hash of the FileId."""
+        object.__setattr__(self, "_hash", hash((self.shard, self.realm, self.file)))
 
     @classmethod
     def _from_proto(cls, file_id_proto: basic_types_pb2.FileID) -> FileId:
@@ -47,7 +64,7 @@ class FileId:
         Returns:
             FileId: A new instance of the FileId class.
         """
-        return cls(shard=file_id_proto.shardNum, realm=file_id_proto.realmNum, file=file_id_proto.fileNum)
+        return intern_entity_id(cls, file_id_proto.shardNum, file_id_proto.realmNum, file_id_proto.fileNum)
 
     def _to_proto(self) -> basic_types_pb2.FileID:
         """
@@ -56,7 +73,15 @@ class FileId:
         Returns:
             basic_types_pb2.FileID: The protobuf representation of the FileId.
         """
-        return basic_types_pb2.FileID(shardNum=self.shard, realmNum=self.realm, fileNum=self.file)
+        file_id_proto = self._proto
+        if file_id_proto is None:
+            file_id_proto = basic_types_pb2.FileID(shardNum=self.shard, realmNum=self.realm, fileNum=self.file)
+            object.__setattr__(self, "_proto", file_id_proto)
+        return copy_proto(file_id_proto)
+
+    def __hash__(self) -> int:
+        """Returns the precomputed hash of the FileId."""
+        return self._hash
 
     @classmethod
     def from_string(cls, file_id_str: str) -> FileId:
@@ -74,9 +99,9 @@ class FileId:
             ValueError: If the input string is malformed or cannot be parsed.
         """
         try:
-            shard, realm, file, checksum = parse_from_string(file_id_str)
+            shard, realm, file, checksum = parse_entity_id(file_id_str)
 
-            file_id: FileId = cls(shard=int(shard), realm=int(realm), file=int(file))
+            file_id: FileId = cls(shard=shard, realm=realm, file=file)
             object.__setattr__(file_id, "checksum", checksum)
 
             return file_id
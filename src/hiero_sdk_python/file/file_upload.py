@@ -0,0 +1,362 @@
+"""
+High-level helper to upload a file to the network.
+
+`upload_file()` creates the file with its first chunk and appends the rest with
+a pipelined `FileAppendTransaction` that streams the remaining contents from disk.
+
+Uploads can be made resumable by passing a checkpoint path. The checkpoint is a
+small JSON file rewritten after every confirmed chunk; running the same upload
+again continues after the chunks the file on the network already holds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from collections.abc import Callable
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from hiero_sdk_python.exceptions import MaxAttemptsError
+from hiero_sdk_python.file.file_append_transaction import FileAppendTransaction
+from hiero_sdk_python.file.file_create_transaction import FileCreateTransaction
+from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.file.file_info_query import FileInfoQuery
+from hiero_sdk_python.query.transaction_get_receipt_query import TransactionGetReceiptQuery
+from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.transaction.transaction_id import TransactionId
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.crypto.private_key import PrivateKey
+    from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
+
+
+DEFAULT_UPLOAD_CHUNK_SIZE = 4096
+DEFAULT_UPLOAD_PIPELINE_WINDOW = 1
+
+_HASH_READ_SIZE = 1024 * 1024
+
+# Receipt statuses meaning the network holds no receipt, e.g. because it expired.
+_RECEIPT_UNAVAILABLE_STATUSES = {ResponseCode.RECEIPT_NOT_FOUND, ResponseCode.RECORD_NOT_FOUND, ResponseCode.UNKNOWN}
+
+
+@dataclass
+class UploadCheckpoint:
+    """
+    Progress of a resumable file upload.
+
+    Chunk 0 is the contents sent with the FileCreateTransaction; chunk i > 0 is
+    the i-th FileAppendTransaction chunk.
+
+    Attributes:
+        content_hash (str): Hex SHA-256 of the uploaded contents.
+        total_size (int): Size of the uploaded contents in bytes.
+        chunk_size (int): Size of each chunk in bytes.
+        file_id (FileId, optional): The created file, once chunk 0 is confirmed.
+        next_chunk (int): Index of the first chunk not confirmed yet.
+        transaction_ids (list[TransactionId | None]): The transaction ID each chunk
+            was last submitted with, or None if it was never submitted.
+    """
+
+    content_hash: str
+    total_size: int
+    chunk_size: int
+    file_id: FileId | None = None
+    next_chunk: int = 0
+    transaction_ids: list[TransactionId | None] = field(default_factory=list)
+
+    @property
+    def total_chunks(self) -> int:
+        """The number of chunks the contents are uploaded in."""
+        return max(1, math.ceil(self.total_size / self.chunk_size))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns a JSON-serializable representation of the checkpoint."""
+        return {
+            "content_hash": self.content_hash,
+            "total_size": self.total_size,
+            "chunk_size": self.chunk_size,
+            "file_id": str(self.file_id) if self.file_id is not None else None,
+            "next_chunk": self.next_chunk,
+            "transaction_ids": [str(tx_id) if tx_id is not None else None for tx_id in self.transaction_ids],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> UploadCheckpoint:
+        """Restores a checkpoint from the representation returned by `to_dict()`."""
+        return cls(
+            content_hash=data["content_hash"],
+            total_size=data["total_size"],
+            chunk_size=data["chunk_size"],
+            file_id=FileId.from_string(data["file_id"]) if data.get("file_id") else None,
+            next_chunk=data["next_chunk"],
+            transaction_ids=[
+                TransactionId.from_string(tx_id) if tx_id is not None else None for tx_id in data["transaction_ids"]
+            ],
+        )
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Atomically writes the checkpoint to `path`."""
+        tmp_path = f"{os.fspath(path)}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> UploadCheckpoint | None:
+        """Reads a checkpoint from `path`, returning None if it does not exist."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+
+
+def upload_file(
+    client: Client,
+    source: BinaryIO | str | os.PathLike,
+    keys: list[PrivateKey] | None = None,
+    file_memo: str | None = None,
+    chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    pipeline_window: int = DEFAULT_UPLOAD_PIPELINE_WINDOW,
+    progress: Callable[[int, int], None] | None = None,
+    timeout: int | float | None = None,
+    checkpoint_path: str | os.PathLike | None = None,
+) -> FileId:
+    """
+    Uploads the contents of a file to a new file on the network.
+
+    The first chunk is sent with a `FileCreateTransaction`; the remainder is
+    streamed from `source` by a `FileAppendTransaction` with up to
+    `pipeline_window` chunks awaiting their receipt at once. The default window
+    of 1 does not pipeline: each chunk is appended only after the previous one
+    reached consensus. Pass a larger window to overlap chunks.
+
+    With `checkpoint_path`, progress is persisted after every confirmed chunk.
+    If the checkpoint already exists, it is reconciled with the size of the file on
+    the network and the receipts of the chunks submitted by the interrupted run, and
+    the upload continues after the chunks the file already holds. The checkpoint is
+    removed once the upload completes.
+
+    Args:
+        client (Client): The client to execute the transactions with.
+        source (BinaryIO | str | os.PathLike): A path, or a seekable binary file object
+            read from its current position.
+        keys (list[PrivateKey], optional): Keys controlling the file. They sign every
+            transaction. Defaults to the operator key.
+        file_memo (str, optional): The memo of the new file.
+        chunk_size (int, optional): The size of each chunk in bytes.
+        pipeline_window (int, optional): The number of append chunks allowed in flight.
+            Defaults to 1, which appends chunks one at a time without pipelining.
+        progress (Callable[[int, int], None], optional): Called with
+            (uploaded_bytes, total_bytes) after the file is created and after each
+            appended chunk is confirmed.
+        timeout (int | float, optional): The execution timeout (in seconds) of each transaction.
+        checkpoint_path (str | os.PathLike, optional): Where to persist upload progress.
+
+    Returns:
+        FileId: The ID of the created file.
+
+    Raises:
+        ValueError: If chunk_size is not positive, the source is not seekable, or the
+            checkpoint belongs to different contents or chunk size.
+        RuntimeError: If the interrupted run left chunks that reached consensus out of order,
+            or the file size does not match the checkpoint.
+        ReceiptStatusError: If a transaction does not succeed.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    with ExitStack() as stack:
+        fileobj = source
+        if isinstance(source, (str, os.PathLike)):
+            fileobj = stack.enter_context(open(source, "rb"))  # noqa: SIM115
+
+        start = fileobj.tell()
+        total = _remaining(fileobj)
+        checkpoint = _start_checkpoint(client, fileobj, total, chunk_size, checkpoint_path, pipeline_window, timeout)
+
+        def save() -> None:
+            if checkpoint_path is not None:
+                checkpoint.save(checkpoint_path)
+
+        def report() -> None:
+            if progress is not None:
+                progress(min(checkpoint.next_chunk * chunk_size, total), total)
+
+        if checkpoint.file_id is None:
+            fileobj.seek(start)
+            create_tx = FileCreateTransaction().set_contents(fileobj.read(chunk_size)).set_file_memo(file_memo)
+            create_tx.set_keys(
+                [key.public_key() for key in keys] if keys else [client.operator_private_key.public_key()]
+            )
+            create_tx.freeze_with(client)
+            for key in keys or []:
+                create_tx.sign(key)
+
+            checkpoint.transaction_ids = [create_tx.transaction_id] + [None] * (checkpoint.total_chunks - 1)
+            save()
+            checkpoint.file_id = create_tx.execute(client, timeout=timeout, validate_status=True).file_id
+            checkpoint.next_chunk = 1
+            save()
+        report()
+
+        first_append = checkpoint.next_chunk
+        if first_append < checkpoint.total_chunks:
+            fileobj.seek(start + first_append * chunk_size)
+            append_tx = (
+                FileAppendTransaction()
+                .set_file_id(checkpoint.file_id)
+                .set_chunk_size(chunk_size)
+                .set_max_chunks(checkpoint.total_chunks - first_append)
+                .set_contents_stream(fileobj)
+                .set_pipeline_window(pipeline_window)
+            )
+            stack.callback(append_tx._close_contents_stream)
+
+            def on_chunk(chunk_index: int, _receipt: TransactionReceipt) -> None:
+                checkpoint.next_chunk = first_append + chunk_index + 1
+                save()
+                report()
+
+            append_tx.set_chunk_callback(on_chunk)
+            append_tx.freeze_with(client)
+            for key in keys or []:
+                append_tx.sign(key)
+
+            checkpoint.transaction_ids[first_append:] = append_tx._transaction_ids
+            save()
+            append_tx.execute_all(client, timeout=timeout, validate_status=True)
+
+        if checkpoint_path is not None:
+            try:
+                os.remove(checkpoint_path)
+            except FileNotFoundError:
+                pass
+        return checkpoint.file_id
+
+
+def _remaining(fileobj: BinaryIO) -> int:
+    if not fileobj.seekable():
+        raise ValueError("source file object must be seekable")
+    start = fileobj.tell()
+    end = fileobj.seek(0, os.SEEK_END)
+    fileobj.seek(start)
+    return end - start
+
+
+def _hash_contents(fileobj: BinaryIO) -> str:
+    start = fileobj.tell()
+    digest = hashlib.sha256()
+    while data := fileobj.read(_HASH_READ_SIZE):
+        digest.update(data)
+    fileobj.seek(start)
+    return digest.hexdigest()
+
+
+def _start_checkpoint(
+    client: Client,
+    fileobj: BinaryIO,
+    total: int,
+    chunk_size: int,
+    checkpoint_path: str | os.PathLike | None,
+    pipeline_window: int,
+    timeout: int | float | None,
+) -> UploadCheckpoint:
+    """Loads and reconciles an existing checkpoint, or starts a new one."""
+    if checkpoint_path is None:
+        return UploadCheckpoint(content_hash="", total_size=total, chunk_size=chunk_size)
+
+    content_hash = _hash_contents(fileobj)
+    checkpoint = UploadCheckpoint.load(checkpoint_path)
+    if checkpoint is None:
+        return UploadCheckpoint(content_hash=content_hash, total_size=total, chunk_size=chunk_size)
+
+    if (checkpoint.content_hash, checkpoint.total_size, checkpoint.chunk_size) != (content_hash, total, chunk_size):
+        raise ValueError(f"Checkpoint {os.fspath(checkpoint_path)} belongs to different contents or chunk size")
+
+    _confirm_submitted_chunks(client, checkpoint, pipeline_window, timeout)
+    checkpoint.save(checkpoint_path)
+    return checkpoint
+
+
+def _confirm_submitted_chunks(
+    client: Client, checkpoint: UploadCheckpoint, pipeline_window: int, timeout: int | float | None
+) -> None:
+    """
+    Reconciles `checkpoint` with the network after an interrupted upload.
+
+    The file ID comes from the receipt of chunk 0. After that the size reported by
+    `FileInfoQuery` decides how far the upload got: every chunk the file holds
+    reached consensus, even if its receipt has already expired. Chunks submitted
+    after those (at most `pipeline_window - 1` of them can have been in flight)
+    must not have succeeded, otherwise appending the missing chunk now would put
+    the file contents out of order.
+
+    Raises:
+        RuntimeError: If the file size does not match the confirmed chunks, or chunks
+            reached consensus out of order.
+    """
+    transaction_ids = checkpoint.transaction_ids
+    if checkpoint.file_id is None:
+        receipt = _get_receipt(client, transaction_ids[0], timeout) if transaction_ids and transaction_ids[0] else None
+        if receipt is None or receipt.status != ResponseCode.SUCCESS:
+            return
+        checkpoint.file_id = receipt.file_id
+        checkpoint.next_chunk = 1
+
+    size = FileInfoQuery().set_file_id(checkpoint.file_id).execute(client, timeout).size
+    confirmed = min(checkpoint.next_chunk * checkpoint.chunk_size, checkpoint.total_size)
+    if (
+        size < confirmed
+        or size > checkpoint.total_size
+        or (size % checkpoint.chunk_size and size != checkpoint.total_size)
+    ):
+        raise RuntimeError(
+            f"File {checkpoint.file_id} holds {size} bytes but the checkpoint confirms {confirmed}; "
+            "the upload cannot be resumed"
+        )
+    landed = checkpoint.total_chunks if size == checkpoint.total_size else size // checkpoint.chunk_size
+
+    for index in range(checkpoint.next_chunk, landed):
+        receipt = _get_receipt(client, transaction_ids[index], timeout) if transaction_ids[index] else None
+        if receipt is not None and receipt.status != ResponseCode.SUCCESS:
+            raise RuntimeError(
+                f"Chunk {index} failed with {ResponseCode(receipt.status).name} but the file holds its bytes; "
+                "the upload cannot be resumed"
+            )
+    checkpoint.next_chunk = landed
+
+    for later in range(landed, min(landed + pipeline_window, len(transaction_ids))):
+        transaction_id = transaction_ids[later]
+        if transaction_id is None:
+            break
+        receipt = _get_receipt(client, transaction_id, timeout)
+        if receipt is not None and receipt.status == ResponseCode.SUCCESS:
+            raise RuntimeError(
+                f"Chunk {later} reached consensus but the file only holds {landed} chunks; the upload cannot be resumed"
+            )
+
+
+def _get_receipt(
+    client: Client, transaction_id: TransactionId, timeout: int | float | None
+) -> TransactionReceipt | None:
+    """
+    Returns the receipt of `transaction_id`, or None if the network has no receipt for it.
+
+    Receipts are only kept for a few minutes after consensus, and never exist for a
+    transaction that did not reach a node. Any other error is raised.
+    """
+    try:
+        return TransactionGetReceiptQuery().set_transaction_id(transaction_id).execute(client, timeout)
+    except MaxAttemptsError as e:
+        if getattr(e.last_error, "status", None) in _RECEIPT_UNAVAILABLE_STATUSES:
+            return None
+        raise
@@ -1,35 +1,277 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 import grpc
 
 from hiero_sdk_python.client.client import Client
+from hiero_sdk_python.consensus.topic_checkpoint_store import TopicCheckpoint, TopicCheckpointStore
 from hiero_sdk_python.consensus.topic_id import TopicId
 from hiero_sdk_python.consensus.topic_message import TopicMessage
+from hiero_sdk_python.consensus.topic_message_batch import TopicMessageBatch
 from hiero_sdk_python.hapi.mirror import consensus_service_pb2 as mirror_proto
 from hiero_sdk_python.hapi.services import basic_types_pb2, timestamp_pb2
 from hiero_sdk_python.transaction.transaction_id import TransactionId
 from hiero_sdk_python.utils.subscription_handle import SubscriptionHandle
 
 
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.mirror_channel_pool import MirrorChannelPool
+
+
 logger = logging.getLogger(__name__)
 
 RST_STREAM = re.compile(r"\brst[^0-9a-zA-Z]stream\b", re.IGNORECASE | re.DOTALL)
 
 
+DEFAULT_STREAM_QUEUE_SIZE = 1000
+
+DEFAULT_CHECKPOINT_EVERY = 100
+DEFAULT_CHECKPOINT_INTERVAL = 5.0
+
+DEFAULT_MAX_BATCH_SIZE = 500
+DEFAULT_MAX_BATCH_LATENCY = 0.25
+
+BATCH_MODE_MESSAGES = "messages"
+BATCH_MODE_RAW = "raw"
+BATCH_MODE_COLUMNAR = "columnar"
+
+EVICTED_MAX_PENDING_MESSAGES = "max_pending_messages"
+EVICTED_MAX_PENDING_BYTES = "max_pending_bytes"
+EVICTED_MAX_PENDING_AGE = "max_pending_age"
+
+
+class PendingMessage:
+    """
+    The chunks received so far for one multi-chunk message.
+
+    Chunks are keyed by `chunkInfo.number`, so the message is assembled in order
+    without sorting. Only received chunks take memory, however large the
+    advertised `chunkInfo.total` is.
+    """
+
+    def __init__(self, total: int, first_timestamp: int) -> None:
+        """
+        Args:
+            total (int): The number of chunks the message consists of.
+            first_timestamp (int): Consensus timestamp of the first chunk received, in nanoseconds.
+        """
+        self.total: int = total
+        self.chunks: dict[int, mirror_proto.ConsensusTopicResponse] = {}
+        self.size: int = 0
+        self.first_timestamp: int = first_timestamp
+
+    @property
+    def received(self) -> int:
+        """The number of distinct chunks received."""
+        return len(self.chunks)
+
+    def add(self, response: mirror_proto.ConsensusTopicResponse) -> int:
+        """
+        Stores a chunk under its number.
+
+        Returns:
+            int: The number of bytes added, 0 for duplicate or out-of-range chunks.
+        """
+        number = response.chunkInfo.number
+        if not 1 <= number <= self.total or number in self.chunks:
+            return 0
+
+        self.chunks[number] = response
+        self.size += len(response.message)
+        return len(response.message)
+
+    def is_complete(self) -> bool:
+        """Returns True once every chunk has been received."""
+        return len(self.chunks) == self.total
+
+    def ordered(self) -> list[mirror_proto.ConsensusTopicResponse]:
+        """Returns the chunks of a complete message in chunk order."""
+        return [self.chunks[number] for number in range(1, self.total + 1)]
+
+
 @dataclass
 class SubscriptionState:
     attempt: int = 0
     count: int = 0
     last_message: mirror_proto.ConsensusTopicResponse | None = None
-    pending_messages: dict[TransactionId, list[mirror_proto.ConsensusTopicResponse]] = field(default_factory=dict)
+    pending_messages: dict[TransactionId, PendingMessage] = field(default_factory=dict)
+    pending_bytes: int = 0
+    delivered_sequence_number: int = 0
+
+
+class _CheckpointTracker:
+    """Saves the position of a subscription to a checkpoint store every N messages or T seconds."""
+
+    def __init__(
+        self,
+        store: TopicCheckpointStore | None,
+        topic_id: TopicId,
+        save_every: int | None,
+        save_interval: float | None,
+    ) -> None:
+        self._store = store
+        self._topic_id = topic_id
+        self._save_every = save_every
+        self._save_interval = save_interval
+
+        self._latest: TopicCheckpoint | None = None
+        self._unsaved = 0
+        self._last_saved = time.monotonic()
+        self._lock = threading.Lock()
+
+    def restore(self, state: SubscriptionState) -> None:
+        """Positions a new subscription right after the saved checkpoint, if any."""
+        if self._store is None:
+            return
+
+        checkpoint = self._store.load(self._topic_id)
+        if checkpoint is None:
+            return
+
+        seconds, nanos = divmod(checkpoint.consensus_timestamp, 1_000_000_000)
+        state.last_message = mirror_proto.ConsensusTopicResponse(
+            consensusTimestamp=timestamp_pb2.Timestamp(seconds=seconds, nanos=nanos),
+            sequenceNumber=checkpoint.sequence_number,
+        )
+        state.delivered_sequence_number = checkpoint.sequence_number
+
+    def record(self, checkpoint: TopicCheckpoint | None, count: int = 1) -> None:
+        """Records that messages up to `checkpoint` were handled, saving it if due."""
+        if self.note(checkpoint, count):
+            self.flush()
+
+    def note(self, checkpoint: TopicCheckpoint | None, count: int = 1) -> bool:
+        """
+        Records that messages up to `checkpoint` were handled, without saving.
+
+        Returns:
+            bool: True if a save is due and `flush()` should be called.
+        """
+        if self._store is None or checkpoint is None:
+            return False
+
+        with self._lock:
+            self._latest = checkpoint
+            self._unsaved += count
+            return (self._save_every is not None and self._unsaved >= self._save_every) or (
+                self._save_interval is not None and time.monotonic() - self._last_saved >= self._save_interval
+            )
+
+    @property
+    def dirty(self) -> bool:
+        """Whether a recorded checkpoint has not been saved yet."""
+        return self._store is not None and self._unsaved > 0
+
+    def flush(self) -> None:
+        """Saves the latest recorded checkpoint if it has not been saved yet."""
+        if self._store is None:
+            return
+
+        with self._lock:
+            if self._unsaved:
+                self._save()
+
+    def _save(self) -> None:
+        self._store.save(self._topic_id, self._latest)
+        self._unsaved = 0
+        self._last_saved = time.monotonic()
+
+
+class _Batcher:
+    """
+    Collects items from the stream thread and hands them to `on_batch` on a delivery thread.
+
+    A batch is flushed when it is full or its oldest item has waited `max_latency`
+    seconds. While a full batch is waiting for the delivery thread, `add()` blocks,
+    which pauses reading from the stream.
+    """
+
+    def __init__(
+        self,
+        on_batch: Callable[[Any], None],
+        max_size: int,
+        max_latency: float,
+        convert: Callable[[list], Any] | None,
+        on_failure: Callable[[Exception], None],
+        on_delivered: Callable[[TopicCheckpoint | None, int], None],
+    ) -> None:
+        self._on_batch = on_batch
+        self._max_size = max_size
+        self._max_latency = max_latency
+        self._convert = convert
+        self._on_failure = on_failure
+        self._on_delivered = on_delivered
+
+        self._items: list = []
+        self._checkpoint: TopicCheckpoint | None = None
+        self._first_added: float | None = None
+        self._closed = False
+        self._failed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add(self, item: Any, checkpoint: TopicCheckpoint | None = None) -> None:
+        """Adds an item, and the subscription position after it, waiting while a full batch is pending delivery."""
+        with self._condition:
+            while len(self._items) >= self._max_size and not self._failed:
+                self._condition.wait()
+            if self._failed:
+                return
+
+            if not self._items:
+                self._first_added = time.monotonic()
+            self._items.append(item)
+            self._checkpoint = checkpoint
+            if len(self._items) >= self._max_size:
+                self._condition.notify_all()
+
+    def close(self) -> None:
+        """Flushes the remaining items and stops the delivery thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _next_batch(self) -> tuple[list, TopicCheckpoint | None] | None:
+        with self._condition:
+            while True:
+                if self._items:
+                    waited = time.monotonic() - self._first_added
+                    if len(self._items) >= self._max_size or self._closed or waited >= self._max_latency:
+                        batch, self._items = self._items, []
+                        self._first_added = None
+                        self._condition.notify_all()
+                        return batch, self._checkpoint
+                    self._condition.wait(self._max_latency - waited)
+                elif self._closed:
+                    return None
+                else:
+                    self._condition.wait()
+
+    def _run(self) -> None:
+        while (next_batch := self._next_batch()) is not None:
+            batch, checkpoint = next_batch
+            try:
+                self._on_batch(self._convert(batch) if self._convert else batch)
+                self._on_delivered(checkpoint, len(batch))
+            except Exception as e:  # noqa: PERF203
+                with self._condition:
+                    self._failed = True
+                    self._items = []
+                    self._condition.notify_all()
+                self._on_failure(e)
+                return
 
 
 class TopicMessageQuery:
@@ -58,8 +300,18 @@ class TopicMessageQuery:
         self._max_attempts: int = 10
         self._max_backoff: float = 8.0
 
+        # Reassembly limits are opt-in, since evicting drops a message that may still complete
+        self._max_pending_messages: int | None = None
+        self._max_pending_bytes: int | None = None
+        self._max_pending_age: float | None = None
+
+        self._checkpoint_store: TopicCheckpointStore | None = None
+        self._checkpoint_every: int | None = DEFAULT_CHECKPOINT_EVERY
+        self._checkpoint_interval: float | None = DEFAULT_CHECKPOINT_INTERVAL
+
         self._completion_handler: Callable[[], None] | None = self._on_complete
         self._error_handler: Callable[[], None] | None = self._on_error
+        self._eviction_handler: Callable[[TransactionId, str], None] | None = self._on_evict
 
     def set_max_attempts(self, attempts: int) -> TopicMessageQuery:
         """Sets the maximum number of attempts to reconnect on failure."""
@@ -77,6 +329,91 @@ class TopicMessageQuery:
         self._max_backoff = backoff
         return self
 
+    def set_max_pending_messages(self, max_messages: int | None) -> TopicMessageQuery:
+        """
+        Sets how many partially received chunked messages are buffered at once.
+
+        When a chunk of a new message arrives and the limit is reached, the oldest
+        incomplete message is evicted. None, the default, disables the limit.
+        """
+        if max_messages is not None and max_messages <= 0:
+            raise ValueError("max_pending_messages must be greater than 0")
+
+        self._max_pending_messages = max_messages
+        return self
+
+    def set_max_pending_bytes(self, max_bytes: int | None) -> TopicMessageQuery:
+        """
+        Sets the total size of buffered chunks across all incomplete messages.
+
+        Oldest incomplete messages are evicted until the total fits. None, the default,
+        disables the limit.
+        """
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_pending_bytes must be greater than 0")
+
+        self._max_pending_bytes = max_bytes
+        return self
+
+    def set_max_pending_age(self, max_age: float | None) -> TopicMessageQuery:
+        """
+        Sets how long (in seconds of consensus time) an incomplete message is kept.
+
+        A message is evicted once a chunk arrives whose consensus timestamp is more
+        than `max_age` seconds after the message's first chunk. None, the default,
+        disables the limit.
+        """
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_pending_age must be greater than 0")
+
+        self._max_pending_age = max_age
+        return self
+
+    def set_checkpoint_store(
+        self,
+        store: TopicCheckpointStore | None,
+        save_every: int | None = DEFAULT_CHECKPOINT_EVERY,
+        save_interval: float | None = DEFAULT_CHECKPOINT_INTERVAL,
+    ) -> TopicMessageQuery:
+        """
+        Persists how far the topic has been consumed, and resumes from there.
+
+        When a subscription starts and the store holds a checkpoint for the topic,
+        it resumes right after the checkpoint instead of from the start time, and
+        messages at or below the checkpoint's sequence number are dropped. A
+        checkpoint is saved once a message has been handled (the callback returned,
+        or the consumer asked for the next message), after every `save_every`
+        messages or `save_interval` seconds, and when the subscription ends.
+
+        Args:
+            store (TopicCheckpointStore | None): The store to use, or None to disable checkpoints.
+            save_every (int, optional): Save after this many handled messages. None disables the count.
+            save_interval (float, optional): Save once this many seconds have passed since the last
+                save. None disables the interval.
+        """
+        if store is not None and not isinstance(store, TopicCheckpointStore):
+            raise TypeError("store must be a TopicCheckpointStore")
+        if save_every is not None and save_every <= 0:
+            raise ValueError("save_every must be greater than 0")
+        if save_interval is not None and save_interval <= 0:
+            raise ValueError("save_interval must be greater than 0")
+
+        self._checkpoint_store = store
+        self._checkpoint_every = save_every
+        self._checkpoint_interval = save_interval
+        return self
+
+    def set_eviction_handler(self, handler: Callable[[TransactionId, str], None]) -> TopicMessageQuery:
+        """
+        Sets a handler called with the initial transaction ID of an evicted incomplete
+        message and the name of the limit that caused the eviction.
+        """
+        if not callable(handler):
+            raise TypeError("handler must be a callable object")
+
+        self._eviction_handler = handler
+        return self
+
     def set_completion_handler(self, handler: Callable[[], None]) -> TopicMessageQuery:
         """Sets a completion handler that is called when the subscription completes."""
         if not callable(handler):
@@ -127,6 +464,9 @@ class TopicMessageQuery:
         else:
             logger.error(f"Error attempting to subscribe to topic {self._topic_id}: {err}")
 
+    def _on_evict(self, transaction_id: TransactionId, reason: str) -> None:
+        logger.warning(f"Dropped incomplete chunked message {transaction_id} on topic {self._topic_id}: {reason}")
+
     def _should_retry(self, err: Exception) -> bool:
         if isinstance(err, grpc.RpcError):
             return err.code() in (
@@ -137,6 +477,17 @@ class TopicMessageQuery:
 
         return True
 
+    def _is_endpoint_failure(self, err: Exception) -> bool:
+        """Returns True for errors that say more about the mirror endpoint than about the query."""
+        return isinstance(err, grpc.RpcError) and err.code() in (
+            grpc.StatusCode.UNAVAILABLE,
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            grpc.StatusCode.INTERNAL,
+        )
+
+    def _retry_delay(self, state: SubscriptionState) -> float:
+        return min(0.5 * (2 ** (state.attempt)), self._max_backoff)
+
     def _parse_topic_id(self, topic_id: str | TopicId) -> basic_types_pb2.TopicID:
         """Parses a topic ID from a string or TopicId object into a protobuf TopicID."""
         if isinstance(topic_id, str):
@@ -187,26 +538,99 @@ class TopicMessageQuery:
         state.last_message = response
 
         if not self._chunking_enabled or not response.HasField("chunkInfo") or response.chunkInfo.total <= 1:
-            message = TopicMessage.of_single(response)
-            on_message(message)
-
-            state.count += 1
+            self._deliver(TopicMessage.of_single(response), state, on_message)
             return
 
         initial_tx_id = TransactionId._from_proto(response.chunkInfo.initialTransactionID)
+        timestamp = response.consensusTimestamp.seconds * 1_000_000_000 + response.consensusTimestamp.nanos
+
+        self._evict_expired(state, timestamp)
+
+        pending = state.pending_messages.get(initial_tx_id)
+        if pending is None:
+            if self._max_pending_messages is not None:
+                while len(state.pending_messages) >= self._max_pending_messages:
+                    self._evict_oldest(state, EVICTED_MAX_PENDING_MESSAGES)
 
-        if initial_tx_id not in state.pending_messages:
-            state.pending_messages[initial_tx_id] = []
+            pending = PendingMessage(response.chunkInfo.total, timestamp)
+            state.pending_messages[initial_tx_id] = pending
 
-        chunks = state.pending_messages[initial_tx_id]
-        chunks.append(response)
+        state.pending_bytes += pending.add(response)
 
-        if len(chunks) == response.chunkInfo.total:
+        if pending.is_complete():
             del state.pending_messages[initial_tx_id]
-            message = TopicMessage.of_many(chunks)
-            on_message(message)
+            state.pending_bytes -= pending.size
+            self._deliver(TopicMessage._of_ordered(pending.ordered()), state, on_message)
+            return
+
+        if self._max_pending_bytes is not None:
+            while state.pending_bytes > self._max_pending_bytes and state.pending_messages:
+                self._evict_oldest(state, EVICTED_MAX_PENDING_BYTES)
+
+    def _deliver(
+        self, message: TopicMessage, state: SubscriptionState, on_message: Callable[[TopicMessage], None]
+    ) -> None:
+        """Hands a message to `on_message` unless its sequence number was already delivered."""
+        if not self._accept(message.sequence_number, state):
+            return
+
+        on_message(message)
+
+    def _accept(self, sequence_number: int, state: SubscriptionState) -> bool:
+        """Records a message as delivered, returning False if it is a duplicate."""
+        if sequence_number and sequence_number <= state.delivered_sequence_number:
+            return False
+
+        state.delivered_sequence_number = max(state.delivered_sequence_number, sequence_number)
+        state.count += 1
+        return True
+
+    def _checkpoint_position(self, state: SubscriptionState) -> TopicCheckpoint | None:
+        """
+        Returns the checkpoint matching the messages delivered so far.
+
+        While chunked messages are incomplete, the subscription must resume before
+        their first chunk, so the checkpoint stops just short of it.
+        """
+        if self._checkpoint_store is None or state.last_message is None:
+            return None
 
-            state.count += 1
+        if state.pending_messages:
+            timestamp = next(iter(state.pending_messages.values())).first_timestamp - 1
+        else:
+            last = state.last_message.consensusTimestamp
+            timestamp = last.seconds * 1_000_000_000 + last.nanos
+        return TopicCheckpoint(timestamp, state.delivered_sequence_number)
+
+    def _checkpoint_tracker(self) -> _CheckpointTracker:
+        return _CheckpointTracker(
+            self._checkpoint_store,
+            TopicId._from_proto(self._topic_id) if self._topic_id else None,
+            self._checkpoint_every,
+            self._checkpoint_interval,
+        )
+
+    def _evict_expired(self, state: SubscriptionState, timestamp: int) -> None:
+        """Evicts incomplete messages whose first chunk is older than the max pending age."""
+        if self._max_pending_age is None:
+            return
+
+        cutoff = timestamp - int(self._max_pending_age * 1_000_000_000)
+        # Messages are kept in arrival order, which follows consensus order.
+        while state.pending_messages:
+            pending = next(iter(state.pending_messages.values()))
+            if pending.first_timestamp >= cutoff:
+                return
+            self._evict_oldest(state, EVICTED_MAX_PENDING_AGE)
+
+    def _evict_oldest(self, state: SubscriptionState, reason: str) -> None:
+        """Drops the incomplete message that started first and notifies the eviction handler."""
+        transaction_id = next(iter(state.pending_messages))
+        pending = state.pending_messages.pop(transaction_id)
+        state.pending_bytes -= pending.size
+
+        if self._eviction_handler:
+            self._eviction_handler(transaction_id, reason)
 
     def subscribe(
         self,
@@ -215,28 +639,148 @@ class TopicMessageQuery:
         on_error: Callable[[Exception], None] | None = None,
     ) -> SubscriptionHandle:
         """Subscribes to messages from the specified topic."""
+        tracker = self._checkpoint_tracker()
+
+        def deliver(response, state: SubscriptionState) -> None:
+            def handle(message: TopicMessage) -> None:
+                on_message(message)
+                tracker.record(self._checkpoint_position(state))
+
+            self._handle_response(response, state, handle)
+
+        return self._subscribe(client, deliver, on_error, tracker)
+
+    def subscribe_batches(
+        self,
+        client: Client,
+        on_batch: Callable[[list], None],
+        on_error: Callable[[Exception], None] | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_latency: float = DEFAULT_MAX_BATCH_LATENCY,
+        mode: str = BATCH_MODE_MESSAGES,
+    ) -> SubscriptionHandle:
+        """
+        Subscribes to messages from the specified topic, delivering them in batches.
+
+        A batch is handed to `on_batch` once it holds `max_batch_size` messages, or
+        `max_batch_latency` seconds after its first message arrived, whichever
+        comes first. Remaining messages are flushed when the subscription ends.
+        Batches are delivered on a separate thread; the stream pauses while one
+        full batch is waiting behind a batch that is still being processed.
+
+        Modes:
+            "messages": `on_batch` receives a list of `TopicMessage`.
+            "raw": `on_batch` receives the list of `ConsensusTopicResponse` protos as received.
+            "columnar": `on_batch` receives a `TopicMessageBatch` of timestamps,
+                sequence numbers and payload views.
+
+        The raw and columnar modes skip building `TopicMessage` objects and do not
+        reassemble chunked messages, so they cannot be combined with chunking.
+
+        Args:
+            client (Client): The client whose mirror node is queried.
+            on_batch (Callable[[list], None]): Called with each batch.
+            on_error (Callable[[Exception], None], optional): Called if the subscription
+                fails or `on_batch` raises. The subscription is cancelled in the latter case.
+            max_batch_size (int, optional): The maximum number of messages per batch.
+            max_batch_latency (float, optional): The maximum time in seconds a message waits for its batch.
+            mode (str, optional): One of "messages", "raw" or "columnar".
+
+        Returns:
+            SubscriptionHandle: The handle of the subscription.
+
+        Raises:
+            ValueError: If the limits are not positive, the mode is unknown, or a raw
+                mode is combined with chunking.
+        """
+        if not callable(on_batch):
+            raise TypeError("on_batch must be a callable object")
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be greater than 0")
+        if max_batch_latency <= 0:
+            raise ValueError("max_batch_latency must be greater than 0")
+        if mode not in (BATCH_MODE_MESSAGES, BATCH_MODE_RAW, BATCH_MODE_COLUMNAR):
+            raise ValueError(f"Unknown batch mode: {mode!r}")
+        if mode != BATCH_MODE_MESSAGES and self._chunking_enabled:
+            raise ValueError(f"Batch mode {mode!r} cannot be used with chunking enabled")
+
+        subscription_handle = SubscriptionHandle()
+
+        def on_failure(err: Exception) -> None:
+            if self._error_handler:
+                self._error_handler(err)
+            if on_error:
+                on_error(err)
+            subscription_handle.cancel()
+
+        tracker = self._checkpoint_tracker()
+        convert = TopicMessageBatch.from_responses if mode == BATCH_MODE_COLUMNAR else None
+        batcher = _Batcher(on_batch, max_batch_size, max_batch_latency, convert, on_failure, tracker.record)
+
+        if mode == BATCH_MODE_MESSAGES:
+
+            def deliver(response, state: SubscriptionState) -> None:
+                self._handle_response(
+                    response, state, lambda message: batcher.add(message, self._checkpoint_position(state))
+                )
+
+        else:
+
+            def deliver(response, state: SubscriptionState) -> None:
+                state.last_message = response
+                if self._accept(response.sequenceNumber, state):
+                    batcher.add(response, self._checkpoint_position(state))
+
+        try:
+            return self._subscribe(
+                client, deliver, on_error, tracker, on_exit=batcher.close, subscription_handle=subscription_handle
+            )
+        except Exception:
+            batcher.close()
+            raise
+
+    def _subscribe(
+        self,
+        client: Client,
+        deliver: Callable[[mirror_proto.ConsensusTopicResponse, SubscriptionState], None],
+        on_error: Callable[[Exception], None] | None,
+        tracker: _CheckpointTracker,
+        on_exit: Callable[[], None] | None = None,
+        subscription_handle: SubscriptionHandle | None = None,
+    ) -> SubscriptionHandle:
+        """
+        Runs the subscription on a thread, passing every response to `deliver`.
+
+        With a mirror channel pool on the client, every attempt is placed on the
+        least-loaded pooled channel, and a failed attempt marks its endpoint so the
+        retry fails over to another one.
+        """
         if not self._topic_id:
             raise ValueError("Topic ID must be set before subscribing.")
-        if not client.mirror_stub:
+        pool = client.mirror_channel_pool
+        if pool is None and not client.mirror_stub:
             raise ValueError("Client has no mirror_stub. Did you configure a mirror node address?")
 
-        subscription_handle = SubscriptionHandle()
+        subscription_handle = subscription_handle or SubscriptionHandle()
         state = SubscriptionState()
+        tracker.restore(state)
 
         def run_stream():
             while state.attempt < self._max_attempts and not subscription_handle.is_cancelled():
                 state.attempt += 1
                 request = self._build_query_request(state)
+                channel = pool.acquire() if pool is not None else None
 
                 try:
-                    message_stream = client.mirror_stub.subscribeTopic(request)
+                    stub = channel.stub if channel is not None else client.mirror_stub
+                    message_stream = stub.subscribeTopic(request)
                     subscription_handle._set_call(message_stream)
 
                     for response in message_stream:
                         if subscription_handle.is_cancelled():
                             return
 
-                        self._handle_response(response, state, on_message)
+                        deliver(response, state)
 
                     if self._completion_handler:
                         self._completion_handler()
@@ -246,6 +790,9 @@ class TopicMessageQuery:
                     if subscription_handle.is_cancelled():
                         return
 
+                    if channel is not None and self._is_endpoint_failure(e):
+                        pool.mark_failed(channel)
+
                     if state.attempt >= self._max_attempts or not self._should_retry(e):
                         if self._error_handler:
                             self._error_handler(e)
@@ -253,13 +800,151 @@ class TopicMessageQuery:
                             on_error(e)
                         return
 
-                    delay = min(0.5 * (2 ** (state.attempt)), self._max_backoff)
+                    delay = self._retry_delay(state)
                     logger.warning(f"Error subscribing to topic attempt {state.attempt}. Retrying in {int(delay)}s...")
 
                     time.sleep(delay)
 
-        thread = threading.Thread(target=run_stream, daemon=True)
+                finally:
+                    if channel is not None:
+                        pool.release(channel)
+
+        def run():
+            try:
+                run_stream()
+            finally:
+                if on_exit:
+                    on_exit()
+                tracker.flush()
+
+        thread = threading.Thread(target=run, daemon=True)
         subscription_handle.set_thread(thread)
         thread.start()
 
         return subscription_handle
+
+    async def stream(
+        self, client: Client, max_queue_size: int = DEFAULT_STREAM_QUEUE_SIZE
+    ) -> AsyncIterator[TopicMessage]:
+        """
+        Streams messages from the specified topic over `grpc.aio`.
+
+        Usage:
+            async for message in query.stream(client):
+                ...
+
+        Messages are read by a background task into a queue of at most
+        `max_queue_size` messages. When the consumer falls behind, the task stops
+        reading and gRPC flow control slows the mirror node down instead of
+        buffering without bound. All streams on one event loop share the client's
+        asyncio mirror channel, so many topics can be followed without a thread each.
+        With a mirror channel pool on the client, each attempt is instead placed on
+        the least-loaded pooled channel and fails over between endpoints.
+
+        Reconnection follows the same rules as `subscribe()`. Leaving the `async for`
+        loop cancels the underlying call. Checkpoints are saved on a worker thread,
+        so a slow checkpoint store does not block the event loop.
+
+        Args:
+            client (Client): The client whose mirror node is queried.
+            max_queue_size (int, optional): The maximum number of messages buffered
+                ahead of the consumer.
+
+        Raises:
+            ValueError: If the topic ID is not set or max_queue_size is not positive.
+            Exception: The error that ended the subscription, once retries are exhausted.
+        """
+        if not self._topic_id:
+            raise ValueError("Topic ID must be set before subscribing.")
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be greater than 0")
+
+        pool = client.mirror_channel_pool
+        stub = client.mirror_aio_stub if pool is None else None
+        tracker = self._checkpoint_tracker()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        done = object()
+        producer = asyncio.create_task(self._produce(stub, pool, queue, done, tracker))
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                message, checkpoint = item
+                yield message
+                if tracker.note(checkpoint):
+                    # Stores write to disk or a database; keep that off the event loop.
+                    await asyncio.to_thread(tracker.flush)
+        finally:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+            if tracker.dirty:
+                await asyncio.to_thread(tracker.flush)
+
+    async def _produce(
+        self,
+        stub,
+        pool: MirrorChannelPool | None,
+        queue: asyncio.Queue,
+        done: object,
+        tracker: _CheckpointTracker,
+    ) -> None:
+        """
+        Reads the subscription into `queue`, reconnecting on retryable errors.
+
+        With a pool, every attempt is placed on the least-loaded pooled asyncio
+        channel, and a failed attempt marks its endpoint so the retry fails over.
+        """
+        state = SubscriptionState()
+        # Loading a checkpoint reads its store, which may block
+        await asyncio.to_thread(tracker.restore, state)
+        ready: list[tuple[TopicMessage, TopicCheckpoint | None]] = []
+
+        def handle(message: TopicMessage) -> None:
+            ready.append((message, self._checkpoint_position(state)))
+
+        while state.attempt < self._max_attempts:
+            state.attempt += 1
+            channel = pool.acquire_aio() if pool is not None else None
+            call = (channel.stub if channel is not None else stub).subscribeTopic(self._build_query_request(state))
+
+            try:
+                async for response in call:
+                    self._handle_response(response, state, handle)
+                    for item in ready:
+                        await queue.put(item)
+                    ready.clear()
+
+                if self._completion_handler:
+                    self._completion_handler()
+                await queue.put(done)
+                return
+
+            except asyncio.CancelledError:
+                call.cancel()
+                raise
+
+            except Exception as e:
+                if channel is not None and self._is_endpoint_failure(e):
+                    pool.mark_failed(channel)
+
+                if state.attempt >= self._max_attempts or not self._should_retry(e):
+                    if self._error_handler:
+                        self._error_handler(e)
+                    await queue.put(e)
+                    return
+
+                delay = self._retry_delay(state)
+                logger.warning(f"Error streaming topic attempt {state.attempt}. Retrying in {int(delay)}s...")
+
+                await asyncio.sleep(delay)
+
+            finally:
+                if channel is not None:
+                    pool.release(channel)
@@ -27,6 +27,7 @@ class TransactionRecordQuery(Query):
         transaction_id: TransactionId | None = None,
         include_children: bool = False,
         include_duplicates: bool = False,
+        lazy_decoding: bool = False,
     ) -> None:
         """
         Initializes the TransactionRecordQuery with the provided transaction ID.
@@ -35,6 +36,7 @@ class TransactionRecordQuery(Query):
             transaction_id (TransactionId, optional): The ID of the transaction.
             include_children (bool): Whether to include child transaction records.
             include_duplicates (bool): Whether to include duplicate transaction records.
+            lazy_decoding (bool): Whether to decode record fields lazily on first access.
         """
         super().__init__()
         if not isinstance(include_duplicates, bool):
@@ -48,9 +50,13 @@ class TransactionRecordQuery(Query):
         if not isinstance(include_children, bool):
             raise TypeError(f"include_children must be a bool (True or False), got {type(include_children).__name__}")
 
+        if not isinstance(lazy_decoding, bool):
+            raise TypeError(f"lazy_decoding must be a bool (True or False), got {type(lazy_decoding).__name__}")
+
         self.transaction_id: TransactionId | None = transaction_id
         self.include_children: bool = bool(include_children)
         self.include_duplicates: bool = bool(include_duplicates)
+        self.lazy_decoding: bool = lazy_decoding
 
     def set_include_duplicates(self, include_duplicates: bool) -> TransactionRecordQuery:
         """
@@ -104,6 +110,27 @@ class TransactionRecordQuery(Query):
         self.include_children = include_children
         return self
 
+    def set_lazy_decoding(self, lazy_decoding: bool) -> TransactionRecordQuery:
+        """
+        Sets whether the returned records decode their fields lazily.
+
+        Lazy records keep the protobuf response and decode each field (transfers,
+        contract results, custom fees, ...) only on first access. This avoids
+        allocating objects that are never read, e.g. when only the receipt status
+        of many child records is needed.
+
+        Args:
+            lazy_decoding: Whether to decode record fields lazily.
+
+        Returns:
+            TransactionRecordQuery: The current instance for method chaining.
+        """
+        if not isinstance(lazy_decoding, bool):
+            raise TypeError(f"lazy_decoding must be a boolean, got {type(lazy_decoding).__name__}")
+
+        self.lazy_decoding = lazy_decoding
+        return self
+
     def _make_request(self):
         """
         Constructs the protobuf request for the transaction record query.
@@ -156,7 +183,9 @@ class TransactionRecordQuery(Query):
         records: list[TransactionRecord] = []
         for proto_record in proto_records:
             # We pass the same transaction_id as the main record
-            record = TransactionRecord._from_proto(proto_record, transaction_id=self.transaction_id)
+            record = TransactionRecord._from_proto(
+                proto_record, transaction_id=self.transaction_id, lazy=self.lazy_decoding
+            )
             records.append(record)
         return records
 
@@ -288,6 +317,7 @@ class TransactionRecordQuery(Query):
             transaction_id=self.transaction_id,
             duplicates=duplicates,
             children=children,
+            lazy=self.lazy_decoding,
         )
 
     def _get_query_response(self, response: Any):
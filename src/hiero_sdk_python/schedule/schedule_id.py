@@ -6,10 +6,18 @@ from dataclasses import dataclass, field
 
 from hiero_sdk_python.client.client import Client
 from hiero_sdk_python.hapi.services.basic_types_pb2 import ScheduleID as ProtoScheduleID
-from hiero_sdk_python.utils.entity_id_helper import format_to_string_with_checksum, parse_from_string, validate_checksum
-
-
-@dataclass(frozen=True)
+from hiero_sdk_python.utils.entity_id_helper import (
+    copy_proto,
+    entity_id_getstate,
+    entity_id_setstate,
+    format_to_string_with_checksum,
+    intern_entity_id,
+    parse_entity_id,
+    validate_checksum,
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ScheduleId:
     """
     Represents the unique identifier for a schedule.
@@ -27,6 +35,15 @@ class ScheduleId:
     realm: int = 0
     schedule: int = 0
     checksum: str | None = field(default=None, init=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _proto: ProtoScheduleID | None = field(default=None, init=False, repr=False, compare=False)
+
+    __getstate__ = entity_id_getstate
+    __setstate__ = entity_id_setstate
+
+    def __post_init__(self) -> None:
+        """Precomputes the hash of the ScheduleId."""
+        object.__setattr__(self, "_hash", hash((self.shard, self.realm, self.schedule)))
 
     @classmethod
     def from_string(cls, id_str: str) -> ScheduleId:
@@ -48,12 +65,12 @@ class ScheduleId:
                 exactly 3 dot-separated components, or contains non-integer values.
         """
         try:
-            shard, realm, schedule, checksum = parse_from_string(id_str)
+            shard, realm, schedule, checksum = parse_entity_id(id_str)
 
             schedule_id: ScheduleId = cls(
-                shard=int(shard),
-                realm=int(realm),
-                schedule=int(schedule),
+                shard=shard,
+                realm=realm,
+                schedule=schedule,
             )
             object.__setattr__(schedule_id, "checksum", checksum)
 
@@ -99,6 +116,10 @@ class ScheduleId:
             return NotImplemented
         return self.shard == other.shard and self.realm == other.realm and self.schedule == other.schedule
 
+    def __hash__(self) -> int:
+        """Returns the precomputed hash of the ScheduleId."""
+        return self._hash
+
     def _to_proto(self) -> ProtoScheduleID:
         """
         Converts the ScheduleId instance to a protobuf ScheduleID object.
@@ -110,11 +131,15 @@ class ScheduleId:
         Note:
             This is an internal method and should not be used directly by client code.
         """
-        return ProtoScheduleID(
-            shardNum=self.shard,
-            realmNum=self.realm,
-            scheduleNum=self.schedule,
-        )
+        schedule_id_proto = self._proto
+        if schedule_id_proto is None:
+            schedule_id_proto = ProtoScheduleID(
+                shardNum=self.shard,
+                realmNum=self.realm,
+                scheduleNum=self.schedule,
+            )
+            object.__setattr__(self, "_proto", schedule_id_proto)
+        return copy_proto(schedule_id_proto)
 
     @classmethod
     def _from_proto(cls, proto: ProtoScheduleID) -> ScheduleId:
@@ -131,7 +156,7 @@ class ScheduleId:
         Returns:
             ScheduleId: A new ScheduleId instance with the values from the protobuf object.
         """
-        return cls(shard=proto.shardNum, realm=proto.realmNum, schedule=proto.scheduleNum)
+        return intern_entity_id(cls, proto.shardNum, proto.realmNum, proto.scheduleNum)
 
     def validate_checksum(self, client: Client) -> None:
         """Validate the checksum for the scheduleId."""
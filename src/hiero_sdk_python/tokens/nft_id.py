@@ -15,9 +15,10 @@ from dataclasses import dataclass, field
 from hiero_sdk_python.client.client import Client
 from hiero_sdk_python.hapi.services import basic_types_pb2
 from hiero_sdk_python.tokens.token_id import TokenId
+from hiero_sdk_python.utils.entity_id_helper import copy_proto, entity_id_getstate, entity_id_setstate
 
 
-@dataclass(frozen=True, init=False)
+@dataclass(frozen=True, init=False, slots=True)
 class NftId:
     """
     A unique identifier for Non-Fungible Tokens (NFTs).
@@ -26,6 +27,11 @@ class NftId:
 
     token_id: TokenId = field()
     serial_number: int = field()
+    _hash: int = field(init=False, repr=False, compare=False)
+    _proto: basic_types_pb2.NftID | None = field(init=False, repr=False, compare=False)
+
+    __getstate__ = entity_id_getstate
+    __setstate__ = entity_id_setstate
 
     def __init__(
         self,
@@ -41,6 +47,7 @@ class NftId:
         # Bypass frozen to set attributes
         object.__setattr__(self, "token_id", token_id)
         object.__setattr__(self, "serial_number", serial_number)
+        object.__setattr__(self, "_proto", None)
 
         # Run validation logic
         self.__post_init__()
@@ -55,6 +62,7 @@ class NftId:
             raise TypeError(f"serial_number must be an integer, got {type(self.serial_number)}")
         if self.serial_number < 0:
             raise ValueError("serial_number must be non-negative")
+        object.__setattr__(self, "_hash", hash((self.token_id, self.serial_number)))
 
     @classmethod
     def _from_proto(cls, nft_id_proto: basic_types_pb2.NftID | None = None) -> NftId:
@@ -71,10 +79,14 @@ class NftId:
 
     def _to_proto(self) -> basic_types_pb2.NftID:
         """:return: a protobuf NftID object representation of this NftId object"""
-        return basic_types_pb2.NftID(
-            token_ID=self.token_id._to_proto(),
-            serial_number=self.serial_number,
-        )
+        nft_id_proto = self._proto
+        if nft_id_proto is None:
+            nft_id_proto = basic_types_pb2.NftID(
+                token_ID=self.token_id._to_proto(),
+                serial_number=self.serial_number,
+            )
+            object.__setattr__(self, "_proto", nft_id_proto)
+        return copy_proto(nft_id_proto)
 
     @classmethod
     def from_string(cls, nft_id_str: str) -> NftId:
@@ -110,3 +122,7 @@ class NftId:
             str: A string in the format 'NftId(token_id=X.X.X, serial_number=Y)'.
         """
         return f"NftId(token_id={self.token_id}, serial_number={self.serial_number})"
+
+    def __hash__(self) -> int:
+        """:return: the precomputed hash of the NftId"""
+        return self._hash
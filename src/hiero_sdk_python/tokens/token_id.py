@@ -2,8 +2,8 @@
 hiero_sdk_python.tokens.token_id.py.
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-Defines TokenId, a frozen dataclass for representing Hedera token identifiers
-(shard, realm, num) with validation and protobuf conversion utilities.
+Defines TokenId, a frozen, slotted dataclass for representing Hedera token
+identifiers (shard, realm, num) with validation and protobuf conversion utilities.
 """
 
 from __future__ import annotations
@@ -13,19 +13,25 @@ from dataclasses import dataclass, field
 from hiero_sdk_python.client.client import Client
 from hiero_sdk_python.hapi.services import basic_types_pb2
 from hiero_sdk_python.utils.entity_id_helper import (
+    copy_proto,
+    entity_id_getstate,
+    entity_id_setstate,
     format_to_string,
     format_to_string_with_checksum,
-    parse_from_string,
+    intern_entity_id,
+    parse_entity_id,
     validate_checksum,
 )
 
 
-@dataclass(frozen=True, eq=True, init=True, repr=True)
+@dataclass(frozen=True, eq=True, init=True, repr=True, slots=True)
 class TokenId:
     """Represents an immutable Hedera token identifier (shard, realm, num).
 
     This is a frozen dataclass providing validation, string parsing,
-    and protobuf conversion utilities for a token ID.
+    and protobuf conversion utilities for a token ID. Instances use
+    ``__slots__``, precompute their hash and cache their protobuf form,
+    as they are used heavily as dictionary keys in transfer lists.
 
     Attributes:
         shard (int): The shard number (non-negative).
@@ -40,6 +46,11 @@ class TokenId:
     realm: int
     num: int
     checksum: str | None = field(default=None, init=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _proto: basic_types_pb2.TokenID | None = field(default=None, init=False, repr=False, compare=False)
+
+    __getstate__ = entity_id_getstate
+    __setstate__ = entity_id_setstate
 
     def __post_init__(self) -> None:
         """
@@ -54,6 +65,7 @@ class TokenId:
             raise ValueError("Realm must be >= 0")
         if self.num < 0:
             raise ValueError("Num must be >= 0")
+        object.__setattr__(self, "_hash", hash((self.shard, self.realm, self.num)))
 
     @classmethod
     def _from_proto(cls, token_id_proto: basic_types_pb2.TokenID) -> TokenId:
@@ -72,7 +84,7 @@ class TokenId:
         if token_id_proto is None:
             raise ValueError("TokenId is required")
 
-        return cls(shard=token_id_proto.shardNum, realm=token_id_proto.realmNum, num=token_id_proto.tokenNum)
+        return intern_entity_id(cls, token_id_proto.shardNum, token_id_proto.realmNum, token_id_proto.tokenNum)
 
     def _to_proto(self) -> basic_types_pb2.TokenID:
         """Converts the TokenId instance to a protobuf TokenID object.
@@ -80,11 +92,11 @@ class TokenId:
         Returns:
             basic_types_pb2.TokenID: The corresponding protobuf TokenID object.
         """
-        token_id_proto = basic_types_pb2.TokenID()
-        token_id_proto.shardNum = self.shard
-        token_id_proto.realmNum = self.realm
-        token_id_proto.tokenNum = self.num
-        return token_id_proto
+        token_id_proto = self._proto
+        if token_id_proto is None:
+            token_id_proto = basic_types_pb2.TokenID(shardNum=self.shard, realmNum=self.realm, tokenNum=self.num)
+            object.__setattr__(self, "_proto", token_id_proto)
+        return copy_proto(token_id_proto)
 
     @classmethod
     def from_string(cls, token_id_str: str) -> TokenId:
@@ -107,9 +119,9 @@ class TokenId:
             raise ValueError("token_id_str cannot be None")
 
         try:
-            shard, realm, num, checksum = parse_from_string(token_id_str)
+            shard, realm, num, checksum = parse_entity_id(token_id_str)
 
-            token_id = cls(shard=int(shard), realm=int(realm), num=int(num))
+            token_id = cls(shard=shard, realm=realm, num=num)
             object.__setattr__(token_id, "checksum", checksum)
 
             return token_id
@@ -170,4 +182,4 @@ class TokenId:
         Returns:
             int: A hash of the TokenId instance.
         """
-        return hash((self.shard, self.realm, self.num))
+        return self._hash
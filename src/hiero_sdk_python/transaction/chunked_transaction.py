@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Literal, overload
 
 from hiero_sdk_python.client.client import Client
@@ -39,6 +42,15 @@ class ChunkedTransaction(Transaction, ABC):
         self.chunk_size: int = 1024
         self.max_chunks: int = 20
 
+        # Number of chunks allowed in flight during execute_all (1 = strictly sequential)
+        self.pipeline_window: int = 1
+
+        # (payload, start, end, chunk) of the last chunk copied by _current_chunk()
+        self._chunk_cache: tuple[bytes | memoryview, int, int, bytes] | None = None
+
+        # Called by execute_all() with (chunk_index, result) as each chunk completes
+        self._chunk_callback: Callable[[int, TransactionReceipt | TransactionResponse], None] | None = None
+
     @abstractmethod
     def _build_proto_body(self):
         """
@@ -56,6 +68,40 @@ class ChunkedTransaction(Transaction, ABC):
         """
         pass
 
+    def _current_chunk(self, payload: bytes | memoryview) -> bytes:
+        """
+        Returns the slice of `payload` belonging to the current chunk.
+
+        The slice is taken through a memoryview and copied once into the bytes
+        protobuf requires. The copy is reused while the same chunk is rebuilt, e.g.
+        once per node during freeze_with(). Payloads that are not buffers, such as
+        streamed file contents, are sliced directly and read on demand.
+
+        Args:
+            payload (bytes | memoryview): The full, already encoded payload, or any
+                object supporting len() and slicing to bytes.
+
+        Returns:
+            bytes: The contents of the current chunk.
+        """
+        start = self._current_chunk_index * self.chunk_size
+        end = min(start + self.chunk_size, len(payload))
+
+        cached = self._chunk_cache
+        if cached is not None and cached[0] is payload and cached[1] == start and cached[2] == end:
+            return cached[3]
+
+        if start == 0 and end == len(payload) and isinstance(payload, bytes):
+            chunk = payload
+        elif isinstance(payload, (bytes, bytearray, memoryview)):
+            with memoryview(payload) as view:
+                chunk = view[start:end].tobytes()
+        else:
+            chunk = payload[start:end]
+
+        self._chunk_cache = (payload, start, end, chunk)
+        return chunk
+
     def set_chunk_size(self, chunk_size: int) -> ChunkedTransaction:
         """
         Sets the chunk size for this transaction.
@@ -97,6 +143,60 @@ class ChunkedTransaction(Transaction, ABC):
         self.max_chunks = max_chunks
         return self
 
+    def set_pipeline_window(self, pipeline_window: int) -> ChunkedTransaction:
+        """
+        Sets how many chunks execute_all() may have in flight at once.
+
+        With a window of 1 (the default) every chunk is submitted only after the
+        receipt of the previous one was received. With a larger window, chunks are
+        still built and submitted one after another in chunk order, all to the node
+        that accepted the first chunk, and up to `pipeline_window` receipts are
+        awaited concurrently in the background.
+
+        Args:
+            pipeline_window (int): The maximum number of chunks awaiting a receipt.
+
+        Returns:
+            ChunkedTransaction: This transaction instance for chaining.
+
+        Raises:
+            TypeError: If pipeline_window is not an integer.
+            ValueError: If pipeline_window is not positive.
+        """
+        if isinstance(pipeline_window, bool) or not isinstance(pipeline_window, int):
+            raise TypeError(f"pipeline_window must be an int, got {type(pipeline_window).__name__}")
+        if pipeline_window <= 0:
+            raise ValueError("pipeline_window must be positive")
+
+        self.pipeline_window = pipeline_window
+        return self
+
+    def set_chunk_callback(
+        self, callback: Callable[[int, TransactionReceipt | TransactionResponse], None] | None
+    ) -> ChunkedTransaction:
+        """
+        Sets a callback invoked by execute_all() as each chunk completes.
+
+        The callback receives the zero-based chunk index and the chunk's receipt
+        (or response when not waiting for receipts). Callbacks are invoked in chunk
+        order from the calling thread, which makes them suitable for progress reporting.
+
+        Args:
+            callback (Callable[[int, TransactionReceipt | TransactionResponse], None] | None):
+                The callback, or None to remove it.
+
+        Returns:
+            ChunkedTransaction: This transaction instance for chaining.
+        """
+        if callback is not None and not callable(callback):
+            raise TypeError(f"callback must be callable, got {type(callback).__name__}")
+        self._chunk_callback = callback
+        return self
+
+    def _notify_chunk(self, chunk_index: int, result: TransactionReceipt | TransactionResponse) -> None:
+        if self._chunk_callback is not None:
+            self._chunk_callback(chunk_index, result)
+
     def _validate_chunking(self) -> int:
         """
         Validates that the required chunks don't exceed max_chunks.
@@ -237,7 +337,9 @@ class ChunkedTransaction(Transaction, ABC):
         """
         Executes all chunks of the transaction sequentially.
 
-        Returns a list of responses for each chunk executed.
+        Returns a list of responses for each chunk executed. When a pipeline window
+        larger than 1 is set with `set_pipeline_window()`, chunk receipts are
+        collected concurrently (see `_execute_all_pipelined()`).
 
         Args:
             client: The client to execute the transaction with.
@@ -253,19 +355,22 @@ class ChunkedTransaction(Transaction, ABC):
 
         # For single-chunk transactions, delegate to the standard execution flow.
         if self.get_required_chunks() == 1:
-            return [
-                super().execute(
-                    client,
-                    timeout=timeout,
-                    wait_for_receipt=wait_for_receipt,
-                    validate_status=validate_status,
-                )
-            ]
+            response = super().execute(
+                client,
+                timeout=timeout,
+                wait_for_receipt=wait_for_receipt,
+                validate_status=validate_status,
+            )
+            self._notify_chunk(0, response)
+            return [response]
 
         # For multi-chunk transactions, ensure we are frozen before proceeding.
         if not self._transaction_body_bytes:
             self.freeze_with(client)
 
+        if self.pipeline_window > 1:
+            return self._execute_all_pipelined(client, timeout, wait_for_receipt, validate_status)
+
         responses = []
 
         for chunk_index in range(self.get_required_chunks()):
@@ -290,9 +395,91 @@ class ChunkedTransaction(Transaction, ABC):
                 validate_status=validate_status,
             )
             responses.append(response)
+            self._notify_chunk(chunk_index, response)
 
         return responses
 
+    def _prepare_chunk(self, client: Client, chunk_index: int) -> None:
+        """
+        Builds and signs the body of one chunk, making it the current chunk.
+
+        Only the current chunk's bodies and signatures are kept, so memory does not
+        grow with the number of chunks.
+
+        Args:
+            client (Client): The client whose operator key signs the chunk.
+            chunk_index (int): The zero-based index of the chunk.
+        """
+        self._current_chunk_index = chunk_index
+        self.transaction_id = self._transaction_ids[chunk_index]
+        self._transaction_body_bytes = {}
+        self._signature_map = {}
+
+        self.freeze_with(client)
+
+        for signing_key in self._signing_keys:
+            super().sign(signing_key)
+        if client.operator_private_key is not None:
+            super().sign(client.operator_private_key)
+
+    def _execute_all_pipelined(
+        self,
+        client: Client,
+        timeout: int | float | None,
+        wait_for_receipt: bool,
+        validate_status: bool,
+    ) -> list[TransactionReceipt] | list[TransactionResponse]:
+        """
+        Executes all chunks with up to `pipeline_window` receipts outstanding.
+
+        Chunks are built, signed and submitted one at a time from the calling thread,
+        each only after the previous one passed precheck, and every chunk after the
+        first is pinned to the node that accepted the first one. A chunk retried on
+        BUSY therefore cannot be overtaken by a later chunk reaching consensus through
+        another node. Receipts are fetched on worker threads; once the window is full,
+        the oldest receipt is awaited before the next chunk is built. A failing receipt
+        stops further submissions and is raised.
+        """
+        node_account_id, node_account_ids = self.node_account_id, self.node_account_ids
+        node_account_ids_index = self._node_account_ids_index
+        responses = []
+        receipts = []
+        pending: deque[Future] = deque()
+
+        with ThreadPoolExecutor(max_workers=self.pipeline_window) as executor:
+            try:
+                for chunk_index in range(len(self._transaction_ids)):
+                    if len(pending) >= self.pipeline_window:
+                        receipts.append(pending.popleft().result())
+                        self._notify_chunk(len(receipts) - 1, receipts[-1])
+
+                    self._prepare_chunk(client, chunk_index)
+                    response = super().execute(client, timeout=timeout, wait_for_receipt=False)
+                    responses.append(response)
+
+                    if chunk_index == 0:
+                        # freeze_with() builds single-node bodies once node_account_id is set.
+                        self.node_account_id = response.node_id
+                        self.node_account_ids = [response.node_id]
+                        self._node_account_ids_index = 0
+
+                    if wait_for_receipt:
+                        pending.append(executor.submit(response.get_receipt, client, timeout, validate_status))
+                    else:
+                        self._notify_chunk(chunk_index, response)
+
+                while pending:
+                    receipts.append(pending.popleft().result())
+                    self._notify_chunk(len(receipts) - 1, receipts[-1])
+            finally:
+                for future in pending:
+                    future.cancel()
+                # Unpin the node, so a later execution picks from the original nodes again
+                self.node_account_id, self.node_account_ids = node_account_id, node_account_ids
+                self._node_account_ids_index = node_account_ids_index
+
+        return receipts if wait_for_receipt else responses
+
     def sign(self, private_key: PrivateKey) -> ChunkedTransaction:
         """
         Signs the transaction using the provided private key.
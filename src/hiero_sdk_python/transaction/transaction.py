@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Literal, overload
 
 from hiero_sdk_python.account.account_id import AccountId
@@ -28,6 +29,68 @@ if TYPE_CHECKING:
     from hiero_sdk_python.transaction.custom_fee_limit import CustomFeeLimit
 
 
+# Maps a TransactionBody "data" oneof field name to the import path of its SDK class.
+_TRANSACTION_CLASS_PATHS: dict[str, str | None] = {
+    "cryptoTransfer": "hiero_sdk_python.transaction.transfer_transaction.TransferTransaction",
+    "contractCall": "hiero_sdk_python.contract.contract_execute_transaction.ContractExecuteTransaction",
+    "contractCreateInstance": "hiero_sdk_python.contract.contract_create_transaction.ContractCreateTransaction",
+    "contractUpdateInstance": "hiero_sdk_python.contract.contract_update_transaction.ContractUpdateTransaction",
+    "contractDeleteInstance": "hiero_sdk_python.contract.contract_delete_transaction.ContractDeleteTransaction",
+    "ethereumTransaction": "hiero_sdk_python.contract.ethereum_transaction.EthereumTransaction",
+    "cryptoAddLiveHash": None,  # Not implemented in SDK
+    "cryptoApproveAllowance": "hiero_sdk_python.account.account_allowance_approve_transaction.AccountAllowanceApproveTransaction",
+    "cryptoDeleteAllowance": "hiero_sdk_python.account.account_allowance_delete_transaction.AccountAllowanceDeleteTransaction",
+    "cryptoCreateAccount": "hiero_sdk_python.account.account_create_transaction.AccountCreateTransaction",
+    "cryptoDelete": "hiero_sdk_python.account.account_delete_transaction.AccountDeleteTransaction",
+    "cryptoDeleteLiveHash": None,  # Not implemented in SDK
+    "cryptoUpdateAccount": "hiero_sdk_python.account.account_update_transaction.AccountUpdateTransaction",
+    "fileAppend": "hiero_sdk_python.file.file_append_transaction.FileAppendTransaction",
+    "fileCreate": "hiero_sdk_python.file.file_create_transaction.FileCreateTransaction",
+    "fileDelete": "hiero_sdk_python.file.file_delete_transaction.FileDeleteTransaction",
+    "fileUpdate": "hiero_sdk_python.file.file_update_transaction.FileUpdateTransaction",
+    "systemDelete": None,  # Admin transaction
+    "systemUndelete": None,  # Admin transaction
+    "freeze": None,  # Admin transaction
+    "consensusCreateTopic": "hiero_sdk_python.consensus.topic_create_transaction.TopicCreateTransaction",
+    "consensusUpdateTopic": "hiero_sdk_python.consensus.topic_update_transaction.TopicUpdateTransaction",
+    "consensusDeleteTopic": "hiero_sdk_python.consensus.topic_delete_transaction.TopicDeleteTransaction",
+    "consensusSubmitMessage": "hiero_sdk_python.consensus.topic_message_submit_transaction.TopicMessageSubmitTransaction",
+    "tokenCreation": "hiero_sdk_python.tokens.token_create_transaction.TokenCreateTransaction",
+    "tokenFreeze": "hiero_sdk_python.tokens.token_freeze_transaction.TokenFreezeTransaction",
+    "tokenUnfreeze": "hiero_sdk_python.tokens.token_unfreeze_transaction.TokenUnfreezeTransaction",
+    "tokenGrantKyc": "hiero_sdk_python.tokens.token_grant_kyc_transaction.TokenGrantKycTransaction",
+    "tokenRevokeKyc": "hiero_sdk_python.tokens.token_revoke_kyc_transaction.TokenRevokeKycTransaction",
+    "tokenDeletion": "hiero_sdk_python.tokens.token_delete_transaction.TokenDeleteTransaction",
+    "tokenUpdate": "hiero_sdk_python.tokens.token_update_transaction.TokenUpdateTransaction",
+    "tokenMint": "hiero_sdk_python.tokens.token_mint_transaction.TokenMintTransaction",
+    "tokenBurn": "hiero_sdk_python.tokens.token_burn_transaction.TokenBurnTransaction",
+    "tokenWipe": "hiero_sdk_python.tokens.token_wipe_transaction.TokenWipeTransaction",
+    "tokenAssociate": "hiero_sdk_python.tokens.token_associate_transaction.TokenAssociateTransaction",
+    "tokenDissociate": "hiero_sdk_python.tokens.token_dissociate_transaction.TokenDissociateTransaction",
+    "tokenPause": "hiero_sdk_python.tokens.token_pause_transaction.TokenPauseTransaction",
+    "tokenUnpause": "hiero_sdk_python.tokens.token_pause_transaction.TokenUnpauseTransaction",
+    "scheduleCreate": "hiero_sdk_python.schedule.schedule_create_transaction.ScheduleCreateTransaction",
+    "scheduleDelete": "hiero_sdk_python.schedule.schedule_delete_transaction.ScheduleDeleteTransaction",
+    "scheduleSign": "hiero_sdk_python.schedule.schedule_sign_transaction.ScheduleSignTransaction",
+    "tokenFeeScheduleUpdate": None,  # Not commonly used
+    "tokenUpdateNfts": "hiero_sdk_python.tokens.token_update_nfts_transaction.TokenUpdateNftsTransaction",
+    "nodeCreate": "hiero_sdk_python.nodes.node_create_transaction.NodeCreateTransaction",
+    "nodeUpdate": "hiero_sdk_python.nodes.node_update_transaction.NodeUpdateTransaction",
+    "nodeDelete": "hiero_sdk_python.nodes.node_delete_transaction.NodeDeleteTransaction",
+    "registeredNodeCreate": "hiero_sdk_python.nodes.registered_node_create_transaction.RegisteredNodeCreateTransaction",
+    "registeredNodeUpdate": "hiero_sdk_python.nodes.registered_node_update_transaction.RegisteredNodeUpdateTransaction",
+    "registeredNodeDelete": "hiero_sdk_python.nodes.registered_node_delete_transaction.RegisteredNodeDeleteTransaction",
+    "utilPrng": "hiero_sdk_python.prng_transaction.PrngTransaction",
+    "tokenReject": "hiero_sdk_python.tokens.token_reject_transaction.TokenRejectTransaction",
+    "tokenAirdrop": "hiero_sdk_python.tokens.token_airdrop_transaction.TokenAirdropTransaction",
+    "tokenCancelAirdrop": "hiero_sdk_python.tokens.token_cancel_airdrop_transaction.TokenCancelAirdropTransaction",
+    "atomic_batch": "hiero_sdk_python.transaction.batch_transaction.BatchTransaction",
+}
+
+# Resolved classes for _TRANSACTION_CLASS_PATHS, filled on first use of each transaction type.
+_TRANSACTION_CLASS_CACHE: dict[str, type[Transaction] | None] = {}
+
+
 class Transaction(_Executable):
     """
     Base class for all Hedera transactions.
@@ -744,20 +807,19 @@ class Transaction(_Executable):
             raise ValueError("transaction_bytes cannot be empty")
 
         try:
-            transaction_proto = transaction_pb2.Transaction()
-            transaction_proto.ParseFromString(transaction_bytes)
+            transaction_proto = transaction_pb2.Transaction.FromString(transaction_bytes)
         except Exception as e:
             raise ValueError(f"Failed to parse transaction bytes: {e}") from e
 
         try:
-            signed_transaction = transaction_contents_pb2.SignedTransaction()
-            signed_transaction.ParseFromString(transaction_proto.signedTransactionBytes)
+            signed_transaction = transaction_contents_pb2.SignedTransaction.FromString(
+                transaction_proto.signedTransactionBytes
+            )
         except Exception as e:
             raise ValueError(f"Failed to parse signed transaction: {e}") from e
 
         try:
-            transaction_body = transaction_pb2.TransactionBody()
-            transaction_body.ParseFromString(signed_transaction.bodyBytes)
+            transaction_body = transaction_pb2.TransactionBody.FromString(signed_transaction.bodyBytes)
         except Exception as e:
             raise ValueError(f"Failed to parse transaction body: {e}") from e
 
@@ -775,85 +837,64 @@ class Transaction(_Executable):
             transaction_body, signed_transaction.bodyBytes, signed_transaction.sigMap
         )
 
+    @staticmethod
+    def from_bytes_many(transactions_bytes: Iterable[bytes]) -> list[Transaction]:
+        """
+        Deserializes many transactions from their protobuf-encoded byte representations.
+
+        Each item is restored exactly as by `from_bytes()`. Transaction classes are
+        resolved once per transaction type, so bulk deserialization of signed
+        transaction files only pays for protobuf parsing.
+
+        Args:
+            transactions_bytes (Iterable[bytes]): The protobuf-encoded transactions.
+
+        Returns:
+            list[Transaction]: The reconstructed transactions, in input order.
+
+        Raises:
+            ValueError: If any item cannot be deserialized. The message includes its index.
+        """
+        transactions = []
+        for index, transaction_bytes in enumerate(transactions_bytes):
+            try:
+                transactions.append(Transaction.from_bytes(transaction_bytes))
+            except ValueError as e:  # noqa: PERF203
+                raise ValueError(f"Failed to deserialize transaction at index {index}: {e}") from e
+        return transactions
+
     @staticmethod
     def _get_transaction_class(transaction_type: str):
         """
         Maps a protobuf transaction type field name to the corresponding Python class.
 
+        The class is imported on first use and cached, so repeated lookups are a dict access.
+
         Args:
             transaction_type (str): The protobuf field name (e.g., "cryptoTransfer")
 
         Returns:
             type: The corresponding transaction class, or None if unknown
         """
-        transaction_type_map = {
-            "cryptoTransfer": "hiero_sdk_python.transaction.transfer_transaction.TransferTransaction",
-            "contractCall": "hiero_sdk_python.contract.contract_execute_transaction.ContractExecuteTransaction",
-            "contractCreateInstance": "hiero_sdk_python.contract.contract_create_transaction.ContractCreateTransaction",
-            "contractUpdateInstance": "hiero_sdk_python.contract.contract_update_transaction.ContractUpdateTransaction",
-            "contractDeleteInstance": "hiero_sdk_python.contract.contract_delete_transaction.ContractDeleteTransaction",
-            "ethereumTransaction": "hiero_sdk_python.contract.ethereum_transaction.EthereumTransaction",
-            "cryptoAddLiveHash": None,  # Not implemented in SDK
-            "cryptoApproveAllowance": "hiero_sdk_python.account.account_allowance_approve_transaction.AccountAllowanceApproveTransaction",
-            "cryptoDeleteAllowance": "hiero_sdk_python.account.account_allowance_delete_transaction.AccountAllowanceDeleteTransaction",
-            "cryptoCreateAccount": "hiero_sdk_python.account.account_create_transaction.AccountCreateTransaction",
-            "cryptoDelete": "hiero_sdk_python.account.account_delete_transaction.AccountDeleteTransaction",
-            "cryptoDeleteLiveHash": None,  # Not implemented in SDK
-            "cryptoUpdateAccount": "hiero_sdk_python.account.account_update_transaction.AccountUpdateTransaction",
-            "fileAppend": "hiero_sdk_python.file.file_append_transaction.FileAppendTransaction",
-            "fileCreate": "hiero_sdk_python.file.file_create_transaction.FileCreateTransaction",
-            "fileDelete": "hiero_sdk_python.file.file_delete_transaction.FileDeleteTransaction",
-            "fileUpdate": "hiero_sdk_python.file.file_update_transaction.FileUpdateTransaction",
-            "systemDelete": None,  # Admin transaction
-            "systemUndelete": None,  # Admin transaction
-            "freeze": None,  # Admin transaction
-            "consensusCreateTopic": "hiero_sdk_python.consensus.topic_create_transaction.TopicCreateTransaction",
-            "consensusUpdateTopic": "hiero_sdk_python.consensus.topic_update_transaction.TopicUpdateTransaction",
-            "consensusDeleteTopic": "hiero_sdk_python.consensus.topic_delete_transaction.TopicDeleteTransaction",
-            "consensusSubmitMessage": "hiero_sdk_python.consensus.topic_message_submit_transaction.TopicMessageSubmitTransaction",
-            "tokenCreation": "hiero_sdk_python.tokens.token_create_transaction.TokenCreateTransaction",
-            "tokenFreeze": "hiero_sdk_python.tokens.token_freeze_transaction.TokenFreezeTransaction",
-            "tokenUnfreeze": "hiero_sdk_python.tokens.token_unfreeze_transaction.TokenUnfreezeTransaction",
-            "tokenGrantKyc": "hiero_sdk_python.tokens.token_grant_kyc_transaction.TokenGrantKycTransaction",
-            "tokenRevokeKyc": "hiero_sdk_python.tokens.token_revoke_kyc_transaction.TokenRevokeKycTransaction",
-            "tokenDeletion": "hiero_sdk_python.tokens.token_delete_transaction.TokenDeleteTransaction",
-            "tokenUpdate": "hiero_sdk_python.tokens.token_update_transaction.TokenUpdateTransaction",
-            "tokenMint": "hiero_sdk_python.tokens.token_mint_transaction.TokenMintTransaction",
-            "tokenBurn": "hiero_sdk_python.tokens.token_burn_transaction.TokenBurnTransaction",
-            "tokenWipe": "hiero_sdk_python.tokens.token_wipe_transaction.TokenWipeTransaction",
-            "tokenAssociate": "hiero_sdk_python.tokens.token_associate_transaction.TokenAssociateTransaction",
-            "tokenDissociate": "hiero_sdk_python.tokens.token_dissociate_transaction.TokenDissociateTransaction",
-            "tokenPause": "hiero_sdk_python.tokens.token_pause_transaction.TokenPauseTransaction",
-            "tokenUnpause": "hiero_sdk_python.tokens.token_pause_transaction.TokenUnpauseTransaction",
-            "scheduleCreate": "hiero_sdk_python.schedule.schedule_create_transaction.ScheduleCreateTransaction",
-            "scheduleDelete": "hiero_sdk_python.schedule.schedule_delete_transaction.ScheduleDeleteTransaction",
-            "scheduleSign": "hiero_sdk_python.schedule.schedule_sign_transaction.ScheduleSignTransaction",
-            "tokenFeeScheduleUpdate": None,  # Not commonly used
-            "tokenUpdateNfts": "hiero_sdk_python.tokens.token_update_nfts_transaction.TokenUpdateNftsTransaction",
-            "nodeCreate": "hiero_sdk_python.nodes.node_create_transaction.NodeCreateTransaction",
-            "nodeUpdate": "hiero_sdk_python.nodes.node_update_transaction.NodeUpdateTransaction",
-            "nodeDelete": "hiero_sdk_python.nodes.node_delete_transaction.NodeDeleteTransaction",
-            "registeredNodeCreate": "hiero_sdk_python.nodes.registered_node_create_transaction.RegisteredNodeCreateTransaction",
-            "registeredNodeUpdate": "hiero_sdk_python.nodes.registered_node_update_transaction.RegisteredNodeUpdateTransaction",
-            "registeredNodeDelete": "hiero_sdk_python.nodes.registered_node_delete_transaction.RegisteredNodeDeleteTransaction",
-            "utilPrng": "hiero_sdk_python.prng_transaction.PrngTransaction",
-            "tokenReject": "hiero_sdk_python.tokens.token_reject_transaction.TokenRejectTransaction",
-            "tokenAirdrop": "hiero_sdk_python.tokens.token_airdrop_transaction.TokenAirdropTransaction",
-            "tokenCancelAirdrop": "hiero_sdk_python.tokens.token_cancel_airdrop_transaction.TokenCancelAirdropTransaction",
-            "atomic_batch": "hiero_sdk_python.transaction.batch_transaction.BatchTransaction",
-        }
+        try:
+            return _TRANSACTION_CLASS_CACHE[transaction_type]
+        except KeyError:
+            pass
 
-        class_path = transaction_type_map.get(transaction_type)
+        class_path = _TRANSACTION_CLASS_PATHS.get(transaction_type)
 
         if class_path is None:
-            return None
-
-        try:
-            module_path, class_name = class_path.rsplit(".", 1)
-            module = __import__(module_path, fromlist=[class_name])
-            return getattr(module, class_name)
-        except (ImportError, AttributeError) as e:
-            raise ValueError(f"Failed to import transaction class for type '{transaction_type}': {e}") from e
+            transaction_class = None
+        else:
+            try:
+                module_path, class_name = class_path.rsplit(".", 1)
+                module = __import__(module_path, fromlist=[class_name])
+                transaction_class = getattr(module, class_name)
+            except (ImportError, AttributeError) as e:
+                raise ValueError(f"Failed to import transaction class for type '{transaction_type}': {e}") from e
+
+        _TRANSACTION_CLASS_CACHE[transaction_type] = transaction_class
+        return transaction_class
 
     @classmethod
     def _from_protobuf(cls, transaction_body, body_bytes: bytes, sig_map):
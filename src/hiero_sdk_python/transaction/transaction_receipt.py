@@ -6,7 +6,8 @@ Defines the TransactionReceipt class, which represents the outcome of a Hedera t
 
 This module provides structured access to fields in a transaction receipt,
 including associated IDs like TokenId, TopicId, AccountId, and FileId.
-It wraps the underlying protobuf object and exposes key properties.
+It wraps the underlying protobuf object and exposes key properties. Entity ID
+properties are decoded on first access and cached on the receipt.
 
 Classes:
     - TransactionReceipt: Parses and exposes fields from a transaction receipt protobuf.
@@ -14,6 +15,7 @@ Classes:
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import cast
 
 from hiero_sdk_python.account.account_id import AccountId
@@ -59,7 +61,7 @@ class TransactionReceipt:
         self._children: list[TransactionReceipt] = children or []
         self._duplicates: list[TransactionReceipt] = duplicates or []
 
-    @property
+    @cached_property
     def token_id(self) -> TokenId | None:
         """
         Retrieves the TokenId associated with the transaction receipt, if available.
@@ -71,7 +73,7 @@ class TransactionReceipt:
             return TokenId._from_proto(self._receipt_proto.tokenID)
         return None
 
-    @property
+    @cached_property
     def topic_id(self) -> TopicId | None:
         """
         Retrieves the TopicId associated with the transaction receipt, if available.
@@ -83,7 +85,7 @@ class TransactionReceipt:
             return TopicId._from_proto(self._receipt_proto.topicID)
         return None
 
-    @property
+    @cached_property
     def account_id(self) -> AccountId | None:
         """
         Retrieves the AccountId associated with the transaction receipt, if available.
@@ -120,7 +122,7 @@ class TransactionReceipt:
         """
         return self._receipt_proto.newTotalSupply
 
-    @property
+    @cached_property
     def file_id(self) -> FileId | None:
         """
         Returns the file ID associated with this receipt.
@@ -139,7 +141,7 @@ class TransactionReceipt:
         """
         return self._transaction_id
 
-    @property
+    @cached_property
     def contract_id(self):
         """
         Returns the contract ID associated with this receipt.
@@ -152,7 +154,7 @@ class TransactionReceipt:
 
         return None
 
-    @property
+    @cached_property
     def schedule_id(self):
         """
         Returns the schedule ID associated with this receipt.
@@ -165,7 +167,7 @@ class TransactionReceipt:
 
         return None
 
-    @property
+    @cached_property
     def scheduled_transaction_id(self):
         """
         Returns the schedule transaction ID associated with this receipt.
@@ -22,6 +22,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import cached_property
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.contract.contract_function_result import ContractFunctionResult
@@ -175,6 +176,7 @@ class TransactionRecord:
         transaction_id: TransactionId | None = None,
         duplicates: list[TransactionRecord] | None = None,
         children: list[TransactionRecord] | None = None,
+        lazy: bool = False,
     ) -> TransactionRecord:
         """Creates a TransactionRecord instance from a protobuf transaction record.
 
@@ -203,6 +205,9 @@ class TransactionRecord:
                         Defaults to an empty list.
             children: Optional list of child transaction records to attach.
                       Defaults to an empty list.
+            lazy: If True, return a view that keeps the protobuf and decodes each
+                  field on first access, caching the result. Useful when only a
+                  few fields (e.g. the receipt status) of many records are read.
 
         Returns:
             TransactionRecord: A new instance containing all processed and structured data.
@@ -211,51 +216,11 @@ class TransactionRecord:
         duplicates = duplicates or []
         children = children or []
 
-        token_transfers, nft_transfers = cls._parse_token_transfers(proto)
-        transfers = cls._parse_hbar_transfers(proto)
-        new_pending_airdrops = cls._parse_pending_airdrops(proto)
-        call_result = None
-        contract_create_result = None
-
-        body_case = proto.WhichOneof("body")
-        if body_case == "contractCallResult":
-            call_result = ContractFunctionResult._from_proto(proto.contractCallResult)
-        elif body_case == "contractCreateResult":
-            contract_create_result = ContractFunctionResult._from_proto(proto.contractCreateResult)
-
-        consensus_timestamp = (
-            Timestamp._from_protobuf(proto.consensusTimestamp) if proto.HasField("consensusTimestamp") else None
-        )
-        parent_consensus_timestamp = (
-            Timestamp._from_protobuf(proto.parent_consensus_timestamp)
-            if proto.HasField("parent_consensus_timestamp")
-            else None
-        )
-        schedule_ref = ScheduleId._from_proto(proto.scheduleRef) if proto.HasField("scheduleRef") else None
-        assessed_custom_fees = [AssessedCustomFee._from_proto(fee) for fee in proto.assessed_custom_fees]
-        automatic_token_associations = [
-            TokenAssociation._from_proto(assoc) for assoc in proto.automatic_token_associations
-        ]
-        paid_staking_rewards = [(AccountId._from_proto(r.accountID), r.amount) for r in proto.paid_staking_rewards]
-        contract_create_result = (
-            ContractFunctionResult._from_proto(proto.contractCreateResult)
-            if proto.HasField("contractCreateResult")
-            else None
-        )
-
-        alias = proto.alias if proto.alias else None
-        ethereum_hash = proto.ethereum_hash if proto.ethereum_hash else None
-        evm_address = proto.evm_address if proto.evm_address else None
-
-        entropy_case = proto.WhichOneof("entropy")
-
-        prng_number = None
-        prng_bytes = None
+        if lazy:
+            return _LazyTransactionRecord._wrap(proto, tx_id, duplicates, children)
 
-        if entropy_case == "prng_number":
-            prng_number = proto.prng_number
-        elif entropy_case == "prng_bytes":
-            prng_bytes = proto.prng_bytes
+        token_transfers, nft_transfers = cls._parse_token_transfers(proto)
+        prng_number, prng_bytes = cls._parse_prng(proto)
 
         return cls(
             transaction_id=tx_id,
@@ -265,23 +230,23 @@ class TransactionRecord:
             receipt=TransactionReceipt._from_proto(proto.receipt, tx_id),
             token_transfers=token_transfers,
             nft_transfers=nft_transfers,
-            transfers=transfers,
-            new_pending_airdrops=new_pending_airdrops,
-            call_result=call_result,
+            transfers=cls._parse_hbar_transfers(proto),
+            new_pending_airdrops=cls._parse_pending_airdrops(proto),
+            call_result=cls._parse_contract_call_result(proto),
             prng_number=prng_number,
             prng_bytes=prng_bytes,
             duplicates=duplicates,
             children=children,
-            consensus_timestamp=consensus_timestamp,
-            schedule_ref=schedule_ref,
-            assessed_custom_fees=assessed_custom_fees,
-            automatic_token_associations=automatic_token_associations,
-            parent_consensus_timestamp=parent_consensus_timestamp,
-            alias=alias,
-            ethereum_hash=ethereum_hash,
-            paid_staking_rewards=paid_staking_rewards,
-            evm_address=evm_address,
-            contract_create_result=contract_create_result,
+            consensus_timestamp=cls._parse_timestamp(proto, "consensusTimestamp"),
+            schedule_ref=cls._parse_schedule_ref(proto),
+            assessed_custom_fees=cls._parse_assessed_custom_fees(proto),
+            automatic_token_associations=cls._parse_automatic_token_associations(proto),
+            parent_consensus_timestamp=cls._parse_timestamp(proto, "parent_consensus_timestamp"),
+            alias=proto.alias if proto.alias else None,
+            ethereum_hash=proto.ethereum_hash if proto.ethereum_hash else None,
+            paid_staking_rewards=cls._parse_paid_staking_rewards(proto),
+            evm_address=proto.evm_address if proto.evm_address else None,
+            contract_create_result=cls._parse_contract_create_result(proto),
             high_volume_pricing_multiplier=proto.high_volume_pricing_multiplier,
         )
 
@@ -347,6 +312,67 @@ class TransactionRecord:
             return ContractFunctionResult._from_proto(proto.contractCallResult)
         return None
 
+    @staticmethod
+    def _parse_contract_create_result(
+        proto: transaction_record_pb2.TransactionRecord,
+    ) -> ContractFunctionResult | None:
+        """Parses contract create result from proto if present."""
+        if proto.HasField("contractCreateResult"):
+            return ContractFunctionResult._from_proto(proto.contractCreateResult)
+        return None
+
+    @staticmethod
+    def _parse_timestamp(
+        proto: transaction_record_pb2.TransactionRecord,
+        field_name: str,
+    ) -> Timestamp | None:
+        """Parses the named timestamp field from proto if present."""
+        if proto.HasField(field_name):
+            return Timestamp._from_protobuf(getattr(proto, field_name))
+        return None
+
+    @staticmethod
+    def _parse_schedule_ref(
+        proto: transaction_record_pb2.TransactionRecord,
+    ) -> ScheduleId | None:
+        """Parses the schedule reference from proto if present."""
+        if proto.HasField("scheduleRef"):
+            return ScheduleId._from_proto(proto.scheduleRef)
+        return None
+
+    @staticmethod
+    def _parse_assessed_custom_fees(
+        proto: transaction_record_pb2.TransactionRecord,
+    ) -> list[AssessedCustomFee]:
+        """Parses assessed custom fees from proto."""
+        return [AssessedCustomFee._from_proto(fee) for fee in proto.assessed_custom_fees]
+
+    @staticmethod
+    def _parse_automatic_token_associations(
+        proto: transaction_record_pb2.TransactionRecord,
+    ) -> list[TokenAssociation]:
+        """Parses automatic token associations from proto."""
+        return [TokenAssociation._from_proto(assoc) for assoc in proto.automatic_token_associations]
+
+    @staticmethod
+    def _parse_paid_staking_rewards(
+        proto: transaction_record_pb2.TransactionRecord,
+    ) -> list[tuple[AccountId, int]]:
+        """Parses paid staking rewards from proto."""
+        return [(AccountId._from_proto(r.accountID), r.amount) for r in proto.paid_staking_rewards]
+
+    @staticmethod
+    def _parse_prng(
+        proto: transaction_record_pb2.TransactionRecord,
+    ) -> tuple[int | None, bytes | None]:
+        """Parses the PRNG number or bytes (entropy oneof) from proto."""
+        entropy_case = proto.WhichOneof("entropy")
+        if entropy_case == "prng_number":
+            return proto.prng_number, None
+        if entropy_case == "prng_bytes":
+            return None, proto.prng_bytes
+        return None, None
+
     def _to_proto(self) -> transaction_record_pb2.TransactionRecord:
         """Converts the TransactionRecord instance to its protobuf representation.
 
@@ -467,3 +493,124 @@ class TransactionRecord:
             record_proto.high_volume_pricing_multiplier = self.high_volume_pricing_multiplier
 
         return record_proto
+
+
+class _LazyTransactionRecord(TransactionRecord):
+    """
+    A TransactionRecord view that keeps the underlying protobuf and decodes fields lazily.
+
+    Each field is decoded on first access and cached on the instance, so reading only the
+    receipt or consensus timestamp of many records does not allocate transfer maps,
+    NFT transfers, custom fees or contract results. Assigning a field works as for a
+    regular TransactionRecord.
+    """
+
+    _proto: transaction_record_pb2.TransactionRecord
+
+    @classmethod
+    def _wrap(
+        cls,
+        proto: transaction_record_pb2.TransactionRecord,
+        transaction_id: TransactionId,
+        duplicates: list[TransactionRecord],
+        children: list[TransactionRecord],
+    ) -> _LazyTransactionRecord:
+        """Creates a lazy record around proto without decoding any of its fields."""
+        record = cls.__new__(cls)
+        record._proto = proto
+        record.transaction_id = transaction_id
+        record.duplicates = duplicates
+        record.children = children
+        return record
+
+    @cached_property
+    def transaction_hash(self) -> bytes | None:
+        return self._proto.transactionHash
+
+    @cached_property
+    def transaction_memo(self) -> str | None:
+        return self._proto.memo
+
+    @cached_property
+    def transaction_fee(self) -> int | None:
+        return self._proto.transactionFee
+
+    @cached_property
+    def high_volume_pricing_multiplier(self) -> int | None:
+        return self._proto.high_volume_pricing_multiplier
+
+    @cached_property
+    def receipt(self) -> TransactionReceipt | None:
+        return TransactionReceipt._from_proto(self._proto.receipt, self.transaction_id)
+
+    @cached_property
+    def call_result(self) -> ContractFunctionResult | None:
+        return self._parse_contract_call_result(self._proto)
+
+    @cached_property
+    def token_transfers(self) -> defaultdict[TokenId, defaultdict[AccountId, int]]:
+        token_transfers, nft_transfers = self._parse_token_transfers(self._proto)
+        self.__dict__.setdefault("nft_transfers", nft_transfers)
+        return token_transfers
+
+    @cached_property
+    def nft_transfers(self) -> defaultdict[TokenId, list[TokenNftTransfer]]:
+        token_transfers, nft_transfers = self._parse_token_transfers(self._proto)
+        self.__dict__.setdefault("token_transfers", token_transfers)
+        return nft_transfers
+
+    @cached_property
+    def transfers(self) -> defaultdict[AccountId, int]:
+        return self._parse_hbar_transfers(self._proto)
+
+    @cached_property
+    def new_pending_airdrops(self) -> list[PendingAirdropRecord]:
+        return self._parse_pending_airdrops(self._proto)
+
+    @cached_property
+    def prng_number(self) -> int | None:
+        return self._parse_prng(self._proto)[0]
+
+    @cached_property
+    def prng_bytes(self) -> bytes | None:
+        return self._parse_prng(self._proto)[1]
+
+    @cached_property
+    def consensus_timestamp(self) -> Timestamp | None:
+        return self._parse_timestamp(self._proto, "consensusTimestamp")
+
+    @cached_property
+    def schedule_ref(self) -> ScheduleId | None:
+        return self._parse_schedule_ref(self._proto)
+
+    @cached_property
+    def assessed_custom_fees(self) -> list[AssessedCustomFee]:
+        return self._parse_assessed_custom_fees(self._proto)
+
+    @cached_property
+    def automatic_token_associations(self) -> list[TokenAssociation]:
+        return self._parse_automatic_token_associations(self._proto)
+
+    @cached_property
+    def parent_consensus_timestamp(self) -> Timestamp | None:
+        return self._parse_timestamp(self._proto, "parent_consensus_timestamp")
+
+    @cached_property
+    def alias(self) -> bytes | None:
+        return self._proto.alias if self._proto.alias else None
+
+    @cached_property
+    def ethereum_hash(self) -> bytes | None:
+        return self._proto.ethereum_hash if self._proto.ethereum_hash else None
+
+    @cached_property
+    def paid_staking_rewards(self) -> list[tuple[AccountId, int]]:
+        return self._parse_paid_staking_rewards(self._proto)
+
+    @cached_property
+    def evm_address(self) -> bytes | None:
+        return self._proto.evm_address if self._proto.evm_address else None
+
+    @cached_property
+    def contract_create_result(self) -> ContractFunctionResult | None:
+        return self._parse_contract_create_result(self._proto)
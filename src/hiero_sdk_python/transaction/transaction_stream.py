@@ -0,0 +1,229 @@
+"""
+Length-delimited streaming serialization of transactions.
+
+Transactions are written as a sequence of records, each being a base-128 varint
+length prefix followed by the `Transaction.to_bytes()` payload. This is the same
+framing protobuf uses for delimited messages, so streams can also be produced or
+consumed by other Hiero SDKs.
+
+Example:
+    with open("signed.txs", "wb") as f:
+        write_transactions(signed_transactions, f)
+
+    with open("signed.txs", "rb") as f:
+        for transaction in read_transactions(f, use_mmap=True):
+            ...
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+import stat
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
+
+from hiero_sdk_python.transaction.transaction import Transaction
+
+
+# A stream source: a readable binary file object or an in-memory buffer (bytes, mmap, ...).
+TransactionSource = BinaryIO | bytes | bytearray | memoryview | mmap.mmap
+
+# Largest accepted record; guards against reading garbage as a huge length prefix.
+MAX_RECORD_SIZE = 64 * 1024 * 1024
+
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+def _encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _decode_varint(buffer: memoryview | bytes, offset: int) -> tuple[int, int]:
+    """
+    Decodes a varint starting at `offset`.
+
+    Returns:
+        tuple[int, int]: The decoded value and the offset just past it.
+
+    Raises:
+        ValueError: If the varint is truncated or longer than 10 bytes.
+    """
+    value = 0
+    shift = 0
+    end = len(buffer)
+    while offset < end:
+        byte = buffer[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+        if shift >= 70:
+            raise ValueError("Invalid length prefix: varint is too long")
+    raise ValueError("Truncated length prefix at end of stream")
+
+
+def _check_record_size(size: int) -> None:
+    if size > MAX_RECORD_SIZE:
+        raise ValueError(f"Record size {size} exceeds the maximum of {MAX_RECORD_SIZE} bytes")
+
+
+def write_transactions(transactions: Iterable[Transaction | bytes], fileobj: BinaryIO) -> int:
+    """
+    Writes transactions to a binary file object as length-delimited records.
+
+    The iterable is consumed lazily, so generators of arbitrary length can be
+    written without holding every transaction in memory.
+
+    Args:
+        transactions (Iterable[Transaction | bytes]): Frozen transactions, or bytes
+            previously produced by `Transaction.to_bytes()`.
+        fileobj (BinaryIO): A writable binary file object or socket file.
+
+    Returns:
+        int: The number of transactions written.
+
+    Raises:
+        TypeError: If an item is neither a Transaction nor bytes.
+        Exception: If a transaction is not frozen (raised by `to_bytes()`).
+    """
+    count = 0
+    for transaction in transactions:
+        if isinstance(transaction, Transaction):
+            payload = transaction.to_bytes()
+        elif isinstance(transaction, (bytes, bytearray, memoryview)):
+            payload = bytes(transaction)
+        else:
+            raise TypeError(f"transactions must contain Transaction or bytes, got {type(transaction).__name__}")
+        fileobj.write(_encode_varint(len(payload)))
+        fileobj.write(payload)
+        count += 1
+    return count
+
+
+def _iter_buffer_records(buffer: memoryview) -> Iterator[bytes]:
+    offset = 0
+    end = len(buffer)
+    while offset < end:
+        size, offset = _decode_varint(buffer, offset)
+        _check_record_size(size)
+        if offset + size > end:
+            raise ValueError("Truncated transaction record at end of stream")
+        yield bytes(buffer[offset : offset + size])
+        offset += size
+
+
+def _iter_file_records(fileobj: BinaryIO) -> Iterator[bytes]:
+    buffer = bytearray()
+    offset = 0
+    eof = False
+    while True:
+        if offset == len(buffer):
+            if eof:
+                return
+            buffer = bytearray()
+            offset = 0
+        try:
+            size, start = _decode_varint(buffer, offset)
+        except ValueError:
+            if eof or len(buffer) - offset >= 10:
+                raise
+            size = start = None
+
+        if size is not None:
+            _check_record_size(size)
+            if start + size <= len(buffer):
+                yield bytes(buffer[start : start + size])
+                offset = start + size
+                continue
+            if eof:
+                raise ValueError("Truncated transaction record at end of stream")
+
+        # Need more data: drop the consumed prefix and read the next chunk.
+        del buffer[:offset]
+        offset = 0
+        wanted = max(_READ_CHUNK_SIZE, (size or 0) + 16 - len(buffer))
+        chunk = fileobj.read(wanted)
+        if not chunk:
+            eof = True
+            if not buffer:
+                return
+        else:
+            buffer += chunk
+
+
+def iter_transaction_bytes(source: TransactionSource, use_mmap: bool = False) -> Iterator[bytes]:
+    """
+    Yields the raw serialized transactions of a length-delimited stream.
+
+    Args:
+        source (TransactionSource): A readable binary file object or an in-memory buffer.
+        use_mmap (bool, optional): Memory-map `source` when it is a regular file,
+            instead of reading it in chunks. Pipes, sockets and other sources that
+            cannot be mapped are read in chunks.
+
+    Yields:
+        bytes: Each record payload, suitable for `Transaction.from_bytes()`.
+
+    Raises:
+        ValueError: If the stream is truncated or contains an invalid length prefix.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        with memoryview(source) as view:
+            yield from _iter_buffer_records(view)
+        return
+
+    if use_mmap:
+        try:
+            fileno = source.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            fileno = None
+        mapped = None
+        file_stat = os.fstat(fileno) if fileno is not None else None
+        if file_stat is not None and stat.S_ISREG(file_stat.st_mode):
+            if file_stat.st_size == 0:
+                return  # mmap refuses empty files
+            try:
+                mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mapped = None
+        if mapped is not None:
+            with mapped:
+                start = source.tell() if source.seekable() else 0
+                with memoryview(mapped) as full, full[start:] as view:
+                    yield from _iter_buffer_records(view)
+            return
+
+    yield from _iter_file_records(source)
+
+
+def read_transactions(source: TransactionSource, use_mmap: bool = False) -> Iterator[Transaction]:
+    """
+    Reads transactions lazily from a length-delimited stream.
+
+    Each record is deserialized with `Transaction.from_bytes()`, so only one
+    transaction at a time is materialized.
+
+    Args:
+        source (TransactionSource): A readable binary file object or an in-memory buffer
+            such as bytes or an `mmap.mmap`.
+        use_mmap (bool, optional): Memory-map `source` when it is a regular file.
+
+    Yields:
+        Transaction: The deserialized transactions, in stream order.
+
+    Raises:
+        ValueError: If the stream is malformed or a record cannot be deserialized.
+    """
+    for index, payload in enumerate(iter_transaction_bytes(source, use_mmap=use_mmap)):
+        try:
+            yield Transaction.from_bytes(payload)
+        except ValueError as e:  # noqa: PERF203
+            raise ValueError(f"Failed to deserialize transaction at index {index}: {e}") from e
@@ -1,16 +1,146 @@
 from __future__ import annotations
 
+import os
+import threading
+from collections.abc import Callable, Iterable
+
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 
 
-try:
+SECP256K1_CURVE = ec.SECP256K1()
+
+# Keccak-256 backends in order of preference; override with HIERO_KECCAK_BACKEND
+KECCAK_BACKENDS = ("pysha3", "pycryptodome", "eth_hash")
+# Backends that are only used when named in HIERO_KECCAK_BACKEND
+OPT_IN_KECCAK_BACKENDS = ("pycryptodome-raw",)
+# The pycryptodome releases whose private Keccak C interface the raw backend was checked against
+_RAW_PYCRYPTODOME_VERSIONS = ((3, 18), (4, 0))
+# Known digests each backend must reproduce: a single block, and input spanning several 136-byte blocks
+_KECCAK_VECTORS = (
+    (b"", bytes.fromhex("c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470")),
+    (bytes(range(256)) * 2, bytes.fromhex("f55ba327291604f0e5be6651752398b7be2331aad65f5763ce067df95cc13be1")),
+)
+
+
+def _pycryptodome_raw_backend() -> Callable[[bytes], bytes]:
+    """
+    Calls pycryptodome's Keccak C functions directly through cffi.
+
+    Each thread keeps one Keccak state that is reset after every digest, which
+    skips the per-call state allocation and wrapper objects of `keccak.new`.
+    This relies on pycryptodome internals, so it is opt-in and limited to the
+    supported pycryptodome releases.
+    """
+    import Crypto  # nosec B413
+    from Crypto.Hash import keccak  # nosec B413
+    from Crypto.Util import _raw_api
+
+    try:
+        version = tuple(int(part) for part in Crypto.__version__.split(".")[:2])
+    except ValueError as e:
+        raise ImportError(f"Unrecognized pycryptodome version {Crypto.__version__!r}") from e
+    low, high = _RAW_PYCRYPTODOME_VERSIONS
+    if not low <= version < high:
+        raise ImportError(f"pycryptodome {Crypto.__version__} is not supported by the raw keccak backend")
+    if _raw_api.backend != "cffi":
+        raise ImportError("pycryptodome is not using its cffi backend")
+    lib, ffi = keccak._raw_keccak_lib, _raw_api.ffi
+    absorb, digest, reset = lib.keccak_absorb, lib.keccak_digest, lib.keccak_reset
+    local = threading.local()
+
+    def _state():
+        state_ptr = ffi.new("void **")
+        if lib.keccak_init(state_ptr, 64, 24):
+            raise RuntimeError("Error while instantiating keccak")
+        out = ffi.new("uint8_t[32]")
+        local.state = (ffi.gc(state_ptr[0], lib.keccak_destroy), out, ffi.buffer(out))
+        return local.state
+
+    def _keccak256(data: bytes) -> bytes:
+        state, out, view = getattr(local, "state", None) or _state()
+        if type(data) is not bytes:
+            data = ffi.from_buffer(data)
+        if absorb(state, data, len(data)):
+            reset(state)
+            raise RuntimeError("Error while hashing with keccak")
+        if digest(state, out, 32, 0x01) or reset(state):
+            raise RuntimeError("Error while finalizing keccak")
+        return view[:]
+
+    return _keccak256
+
+
+def _pysha3_backend() -> Callable[[bytes], bytes]:
+    import sha3  # nosec B413
+
+    keccak_256 = sha3.keccak_256
+    return lambda data: keccak_256(data).digest()
+
+
+def _pycryptodome_backend() -> Callable[[bytes], bytes]:
     from Crypto.Hash import keccak  # nosec B413
-except ImportError:
-    keccak = None
 
+    new = keccak.new
+    return lambda data: new(digest_bits=256, data=data).digest()
 
-SECP256K1_CURVE = ec.SECP256K1()
+
+def _eth_hash_backend() -> Callable[[bytes], bytes]:
+    from eth_hash.auto import keccak as eth_keccak
+
+    return lambda data: eth_keccak(data if isinstance(data, (bytes, bytearray)) else bytes(data))
+
+
+_BACKEND_LOADERS: dict[str, Callable[[], Callable[[bytes], bytes]]] = {
+    "pycryptodome-raw": _pycryptodome_raw_backend,
+    "pysha3": _pysha3_backend,
+    "pycryptodome": _pycryptodome_backend,
+    "eth_hash": _eth_hash_backend,
+}
+
+
+def load_keccak_backend(name: str) -> Callable[[bytes], bytes]:
+    """
+    Loads a Keccak-256 backend and checks it against a known digest.
+
+    Args:
+        name (str): One of `KECCAK_BACKENDS` or `OPT_IN_KECCAK_BACKENDS`.
+
+    Returns:
+        Callable[[bytes], bytes]: The backend's hash function.
+
+    Raises:
+        ValueError: If the name is not a known backend.
+        ImportError: If the backend's library is not available or misbehaves.
+    """
+    loader = _BACKEND_LOADERS.get(name)
+    if loader is None:
+        names = ", ".join((*KECCAK_BACKENDS, *OPT_IN_KECCAK_BACKENDS))
+        raise ValueError(f"Unknown keccak backend {name!r}; expected one of {names}")
+    try:
+        hash_function = loader()
+        valid = all(hash_function(data) == expected for data, expected in _KECCAK_VECTORS)
+    except ImportError:
+        raise
+    except Exception as e:
+        raise ImportError(f"Keccak backend {name!r} failed to load: {e}") from e
+    if not valid:
+        raise ImportError(f"Keccak backend {name!r} returned a wrong digest")
+    return hash_function
+
+
+def _select_keccak_backend() -> tuple[str | None, Callable[[bytes], bytes] | None]:
+    preferred = os.environ.get("HIERO_KECCAK_BACKEND")
+    for name in (preferred, *KECCAK_BACKENDS) if preferred else KECCAK_BACKENDS:
+        try:
+            return name, load_keccak_backend(name)
+        except (ImportError, ValueError):  # noqa: PERF203
+            continue
+    return None, None
+
+
+# The backend is chosen once, at import
+KECCAK_BACKEND, _keccak256 = _select_keccak_backend()
 
 
 def keccak256(data: bytes) -> bytes:
@@ -28,12 +158,28 @@ def keccak256(data: bytes) -> bytes:
     Raises:
         RuntimeError: If pycryptodome or similar keccak library is not installed.
     """
-    global keccak
-    if keccak is None:
+    if _keccak256 is None:
+        raise RuntimeError("Keccak not available. Install pycryptodome or similar.")
+    return _keccak256(data)
+
+
+def keccak256_many(items: Iterable[bytes]) -> list[bytes]:
+    """
+    Compute the Keccak-256 hashes of many inputs.
+
+    Args:
+        items: The byte strings to hash.
+
+    Returns:
+        list[bytes]: The 32-byte digests, in input order.
+
+    Raises:
+        RuntimeError: If pycryptodome or similar keccak library is not installed.
+    """
+    hash_function = _keccak256
+    if hash_function is None:
         raise RuntimeError("Keccak not available. Install pycryptodome or similar.")
-    k = keccak.new(digest_bits=256)
-    k.update(data)
-    return k.digest()
+    return [hash_function(item) for item in items]
 
 
 def compress_point_unchecked(x: int, y: int) -> bytes:
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import dataclasses
 import re
 import struct
-from typing import TYPE_CHECKING, Any
+from array import array
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import requests
 
 
 if TYPE_CHECKING:
+    from google.protobuf.message import Message
+
     from hiero_sdk_python.client.client import Client
 
 ID_REGEX = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-([a-z]{5}))?$")
@@ -16,6 +21,27 @@ MULTIPLIER = 1000003
 P3 = 26**3
 P5 = 26**5
 
+DEFAULT_INTERN_TABLE_SIZE = 65536
+
+T = TypeVar("T")
+M = TypeVar("M", bound="Message")
+
+# Derived fields of the frozen entity ID dataclasses that are rebuilt rather than copied or pickled
+_CACHED_FIELDS = ("_hash", "_proto")
+
+
+class _InternTable(dict):
+    """Bounded mapping of (shard, realm, num) to a shared entity ID instance."""
+
+    __slots__ = ("max_size",)
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__()
+        self.max_size = max_size
+
+
+_INTERN_TABLES: dict[type, _InternTable] = {}
+
 
 def parse_from_string(address: str) -> tuple[str, str, str, str | None]:
     """
@@ -41,6 +67,202 @@ def parse_from_string(address: str) -> tuple[str, str, str, str | None]:
     return shard, realm, num, checksum
 
 
+def parse_entity_id(address: str) -> tuple[int, int, int, str | None]:
+    """
+    Parse an address string of the form <shard>.<realm>.<num>[-<checksum>] into integers.
+
+    This is the fast path used by the entity ID ``from_string`` methods. Plain numeric
+    triples are split without a regex, the common zero shard and realm skip ``int()``,
+    and the checksum is only extracted when a ``-xxxxx`` suffix is present. Anything
+    else falls back to ``parse_from_string``, which accepts exactly the same strings.
+
+    Args:
+        address: The entity ID string to parse.
+
+    Returns:
+        tuple[int, int, int, str | None]: A tuple of (shard, realm, num, checksum)
+            where checksum is None if not present in the input string.
+
+    Raises:
+        ValueError: If the string is not a valid entity ID.
+    """
+    parts = address.split(".")
+    if len(parts) == 3 and address.isascii():
+        shard, realm, num = parts
+        checksum = None
+        if len(num) > 6 and num[-6] == "-":
+            checksum = num[-5:]
+            num = num[:-6]
+
+        if (
+            (checksum is None or (checksum.isalpha() and checksum.islower()))
+            and shard.isdigit()
+            and realm.isdigit()
+            and num.isdigit()
+            # No leading zeros, as in ID_REGEX.
+            and (shard[0] != "0" or len(shard) == 1)
+            and (realm[0] != "0" or len(realm) == 1)
+            and (num[0] != "0" or len(num) == 1)
+        ):
+            return (
+                0 if shard == "0" else int(shard),
+                0 if realm == "0" else int(realm),
+                int(num),
+                checksum,
+            )
+
+    shard, realm, num, checksum = parse_from_string(address)
+    return int(shard), int(realm), int(num), checksum
+
+
+def parse_many(strings: Iterable[str], id_class: type[T] | None = None) -> list[T] | array:
+    """
+    Parse many entity ID strings in one call.
+
+    Args:
+        strings: The entity ID strings, each in '<shard>.<realm>.<num>[-<checksum>]' form.
+        id_class: Optional entity ID class (e.g. AccountId). If given, a list of instances
+            is returned, reusing interned instances when interning is enabled for the class.
+
+    Returns:
+        list[T] | array: A list of ``id_class`` instances, or, when no class is given, a flat
+            ``array('q')`` of (shard, realm, num) triples. Checksums are validated for
+            format but not kept in the array form.
+
+    Raises:
+        ValueError: If any item is not a valid entity ID string, or, without an id_class, holds a
+            number that does not fit in 64 bits. The message includes its index.
+    """
+    if id_class is None:
+        triples = array("q")
+        append = triples.append
+        for index, address in enumerate(strings):
+            try:
+                shard, realm, num, _ = parse_entity_id(address)
+                # Values that do not fit a signed 64-bit array item raise OverflowError
+                append(shard)
+                append(realm)
+                append(num)
+            except (AttributeError, OverflowError, TypeError, ValueError) as e:  # noqa: PERF203
+                raise ValueError(f"Invalid entity ID at index {index}: {address!r}") from e
+        return triples
+
+    entity_ids = []
+    for index, address in enumerate(strings):
+        try:
+            shard, realm, num, checksum = parse_entity_id(address)
+        except (AttributeError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid entity ID at index {index}: {address!r}") from e
+        if checksum is None:
+            entity_ids.append(intern_entity_id(id_class, shard, realm, num))
+        else:
+            entity_ids.append(id_class.from_string(address))
+    return entity_ids
+
+
+def enable_interning(*id_classes: type, max_size: int = DEFAULT_INTERN_TABLE_SIZE) -> None:
+    """
+    Enable interning of plain (shard, realm, num) entity IDs decoded from protobuf.
+
+    When enabled, ``_from_proto`` of the given classes returns one shared instance per
+    (shard, realm, num) triple instead of allocating a new object for every occurrence.
+    Only immutable (frozen dataclass) IDs can be interned, since every holder of an
+    interned ID shares the same instance.
+
+    Args:
+        *id_classes: The entity ID classes to intern (e.g. TokenId, FileId).
+        max_size: The maximum number of IDs kept per class. Once full, further IDs
+            are created normally and not interned.
+
+    Raises:
+        ValueError: If max_size is not positive.
+        TypeError: If a class is mutable, such as AccountId.
+    """
+    if max_size <= 0:
+        raise ValueError("max_size must be a positive integer")
+    for id_class in id_classes:
+        params = getattr(id_class, "__dataclass_params__", None)
+        if params is None or not params.frozen:
+            raise TypeError(f"{id_class.__name__} instances are mutable and cannot be interned")
+
+    for id_class in id_classes:
+        _INTERN_TABLES[id_class] = _InternTable(max_size)
+
+
+def disable_interning(*id_classes: type) -> None:
+    """
+    Disable interning for the given entity ID classes and drop their cached instances.
+
+    Args:
+        *id_classes: The entity ID classes to stop interning. If none are given,
+            interning is disabled for every class.
+    """
+    if not id_classes:
+        _INTERN_TABLES.clear()
+        return
+
+    for id_class in id_classes:
+        _INTERN_TABLES.pop(id_class, None)
+
+
+def intern_entity_id(id_class: type[T], shard: int, realm: int, num: int) -> T:
+    """
+    Return the entity ID for (shard, realm, num), reusing an interned instance if enabled.
+
+    Args:
+        id_class: The entity ID class, constructed as ``id_class(shard, realm, num)``.
+        shard: Shard number of the entity ID.
+        realm: Realm number of the entity ID.
+        num: Entity number (account, token, topic, etc.).
+
+    Returns:
+        An instance of ``id_class``.
+    """
+    table = _INTERN_TABLES.get(id_class)
+    if table is None:
+        return id_class(shard, realm, num)
+
+    key = (shard, realm, num)
+    entity_id = table.get(key)
+    if entity_id is None:
+        entity_id = id_class(shard, realm, num)
+        if len(table) < table.max_size:
+            table[key] = entity_id
+
+    return entity_id
+
+
+def copy_proto(message: M) -> M:
+    """
+    Return a copy of a cached protobuf message.
+
+    Entity IDs cache their protobuf form and hand out copies, so a caller that
+    modifies the returned message cannot change the ID, or the interned instances
+    shared with other callers.
+    """
+    copy = type(message)()
+    copy.CopyFrom(message)
+    return copy
+
+
+def entity_id_getstate(entity_id: Any) -> dict[str, Any]:
+    """
+    Return the state of a frozen, slotted entity ID for copy and pickle.
+
+    The cached hash and protobuf message are left out: protobuf messages cannot be
+    pickled, and both are rebuilt by ``entity_id_setstate``.
+    """
+    return {f.name: getattr(entity_id, f.name) for f in dataclasses.fields(entity_id) if f.name not in _CACHED_FIELDS}
+
+
+def entity_id_setstate(entity_id: Any, state: dict[str, Any]) -> None:
+    """Restore a frozen, slotted entity ID from ``entity_id_getstate``, recomputing its hash."""
+    for name, value in state.items():
+        object.__setattr__(entity_id, name, value)
+    object.__setattr__(entity_id, "_proto", None)
+    entity_id.__post_init__()
+
+
 def generate_checksum(ledger_id: bytes, address: str) -> str:
     r"""
     Compute the 5-character checksum for a Hiero entity ID string (HIP-15).
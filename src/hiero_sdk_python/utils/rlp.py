@@ -0,0 +1,153 @@
+"""
+Recursive Length Prefix (RLP) encoding, as used by Ethereum transactions.
+
+Items are bytes, non-negative ints (encoded big-endian without leading zeros)
+and lists of items. Encoding measures the whole item tree first and then writes
+it into one preallocated buffer, so no intermediate byte strings are built.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+
+RlpItem = bytes | bytearray | memoryview | int | Sequence["RlpItem"]
+
+_SHORT_LIMIT = 56
+
+
+def _int_bytes(value: int) -> bytes:
+    if value < 0:
+        raise ValueError("RLP cannot encode negative integers")
+    return value.to_bytes((value.bit_length() + 7) // 8, "big")
+
+
+def _length_of_length(length: int) -> int:
+    return 0 if length < _SHORT_LIMIT else (length.bit_length() + 7) // 8
+
+
+def _measure(item: RlpItem, payload_lengths: list[int]) -> int:
+    """Returns the encoded size of an item, recording the payload length of every list in pre-order."""
+    if isinstance(item, int) and not isinstance(item, bool):
+        item = _int_bytes(item)
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        length = len(item)
+        if length == 1 and item[0] < 0x80:
+            return 1
+        return 1 + _length_of_length(length) + length
+    if isinstance(item, (list, tuple)):
+        slot = len(payload_lengths)
+        payload_lengths.append(0)
+        payload = sum(_measure(child, payload_lengths) for child in item)
+        payload_lengths[slot] = payload
+        return 1 + _length_of_length(payload) + payload
+    raise TypeError(f"Cannot RLP encode {type(item).__name__}")
+
+
+def _write_prefix(buf: bytearray, pos: int, length: int, offset: int) -> int:
+    if length < _SHORT_LIMIT:
+        buf[pos] = offset + length
+        return pos + 1
+    size = _length_of_length(length)
+    buf[pos] = offset + _SHORT_LIMIT - 1 + size
+    buf[pos + 1 : pos + 1 + size] = length.to_bytes(size, "big")
+    return pos + 1 + size
+
+
+def _write(item: RlpItem, buf: bytearray, pos: int, payload_lengths: list[int], slot: list[int]) -> int:
+    if isinstance(item, int) and not isinstance(item, bool):
+        item = _int_bytes(item)
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        length = len(item)
+        if length == 1 and item[0] < 0x80:
+            buf[pos] = item[0]
+            return pos + 1
+        pos = _write_prefix(buf, pos, length, 0x80)
+        buf[pos : pos + length] = item
+        return pos + length
+
+    payload = payload_lengths[slot[0]]
+    slot[0] += 1
+    pos = _write_prefix(buf, pos, payload, 0xC0)
+    for child in item:
+        pos = _write(child, buf, pos, payload_lengths, slot)
+    return pos
+
+
+def encode(item: RlpItem, prefix: bytes = b"") -> bytes:
+    """
+    RLP-encodes an item.
+
+    Args:
+        item (RlpItem): Bytes, a non-negative int, or a (nested) list of items.
+        prefix (bytes, optional): Bytes written before the encoding, e.g. a typed
+            transaction's type byte.
+
+    Raises:
+        TypeError: If the item contains a value of another type.
+        ValueError: If the item contains a negative integer.
+    """
+    payload_lengths: list[int] = []
+    size = _measure(item, payload_lengths)
+    buf = bytearray(len(prefix) + size)
+    buf[: len(prefix)] = prefix
+    _write(item, buf, len(prefix), payload_lengths, [0])
+    return bytes(buf)
+
+
+def _decode_at(data: bytes, pos: int) -> tuple[bytes | list, int]:
+    if pos >= len(data):
+        raise ValueError("Invalid RLP: unexpected end of data")
+    first = data[pos]
+    if first < 0x80:
+        return data[pos : pos + 1], pos + 1
+
+    is_list = first >= 0xC0
+    short = first - (0xC0 if is_list else 0x80)
+    if short < _SHORT_LIMIT:
+        start, length = pos + 1, short
+    else:
+        size = short - _SHORT_LIMIT + 1
+        start = pos + 1 + size
+        if start > len(data) or data[pos + 1] == 0:
+            raise ValueError("Invalid RLP: bad length prefix")
+        length = int.from_bytes(data[pos + 1 : start], "big")
+        if length < _SHORT_LIMIT:
+            raise ValueError("Invalid RLP: non-canonical length")
+    end = start + length
+    if end > len(data):
+        raise ValueError("Invalid RLP: item exceeds data")
+
+    if not is_list:
+        if length == 1 and data[start] < 0x80:
+            raise ValueError("Invalid RLP: non-canonical single byte")
+        return data[start:end], end
+
+    items = []
+    while start < end:
+        child, start = _decode_at(data, start)
+        items.append(child)
+    if start != end:
+        raise ValueError("Invalid RLP: list length mismatch")
+    return items, end
+
+
+def decode(data: bytes) -> bytes | list:
+    """
+    Decodes an RLP item. Integers come back as their big-endian bytes.
+
+    Raises:
+        ValueError: If the data is not exactly one canonical RLP item.
+    """
+    data = bytes(data)
+    item, end = _decode_at(data, 0)
+    if end != len(data):
+        raise ValueError("Invalid RLP: trailing bytes")
+    return item
+
+
+def to_int(value: bytes) -> int:
+    """Converts a decoded RLP integer to an int, rejecting leading zeros."""
+    if value[:1] == b"\x00":
+        raise ValueError("Invalid RLP: integer with leading zero")
+    return int.from_bytes(value, "big")
@@ -3,10 +3,11 @@ from __future__ import annotations
 import warnings
 
 import pytest
-from hypothesis import given
+from hypothesis import given, strategies as st
 
 from hiero_sdk_python import AccountId, TokenId
 from hiero_sdk_python.contract.contract_id import ContractId
+from hiero_sdk_python.utils.entity_id_helper import parse_entity_id, parse_from_string
 from tests.fuzz.conftest import AccountIdAliasCase, EntityIdCase, get_strategy
 
 
@@ -184,3 +185,21 @@ def test_contract_id_rejects_invalid_strings(text: str) -> None:
     """Malformed contract ID text must raise ValueError."""
     with pytest.raises(ValueError):
         ContractId.from_string(text)
+
+
+@given(
+    text=st.one_of(
+        get_strategy("token_id_invalid_string"),
+        get_strategy("entity_id_valid_dotted").map(lambda case: case.text),
+        get_strategy("entity_id_valid_checksum").map(lambda case: case.text),
+    )
+)
+def test_parse_entity_id_matches_regex_parser(text: str) -> None:
+    """The regex-free fast path must accept and reject exactly what parse_from_string does."""
+    try:
+        shard, realm, num, checksum = parse_from_string(text)
+    except ValueError:
+        with pytest.raises(ValueError):
+            parse_entity_id(text)
+    else:
+        assert parse_entity_id(text) == (int(shard), int(realm), int(num), checksum)
@@ -4,6 +4,8 @@ Unit tests for the AccountId class.
 
 from __future__ import annotations
 
+import copy
+import pickle
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -956,3 +958,70 @@ def test_from_evm_address_invalid_string():
     """Test passing an invalid EVM address string should raise ValueError."""
     with pytest.raises(ValueError, match="Invalid EVM address string"):
         AccountId.from_evm_address("0xINVALID", shard=0, realm=0)
+
+
+def test_account_id_uses_slots():
+    """AccountId instances do not carry a per-instance __dict__."""
+    assert not hasattr(AccountId(0, 0, 1), "__dict__")
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda account_id: pickle.loads(pickle.dumps(account_id))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_account_id_copy_and_pickle(clone, alias_key):
+    """Copies and unpickled AccountIds keep every field and hash like the original."""
+    plain = AccountId(0, 0, 5)
+    aliased = AccountId(1, 2, 0, alias_key=alias_key)
+    with_evm = AccountId(0, 0, 0, evm_address=EvmAddress.from_string("0x" + "ab" * 20))
+    with_checksum = AccountId.from_string("0.0.123-vfmkw")
+
+    for original in (plain, aliased, with_evm, with_checksum):
+        cloned = clone(original)
+        assert cloned == original
+        assert hash(cloned) == hash(original)
+        assert cloned.alias_key == original.alias_key
+        assert cloned.evm_address == original.evm_address
+        assert cloned.checksum == original.checksum
+        assert cloned._to_proto() == original._to_proto()
+
+    cloned = clone(plain)
+    cloned.num = 6
+    assert plain.num == 5
+    assert hash(cloned) == hash(AccountId(0, 0, 6))
+
+
+def test_to_proto_returns_copies():
+    """Changing a returned protobuf object does not change the account ID."""
+    account_id = AccountId(0, 0, 100)
+    account_id._to_proto().accountNum = 99
+
+    assert account_id._to_proto().accountNum == 100
+
+
+def test_mutation_invalidates_cached_proto_and_hash(alias_key):
+    """Changing an identity field rebuilds the proto and the hash."""
+    account_id = AccountId(0, 0, 100)
+    proto = account_id._to_proto()
+
+    account_id.num = 200
+
+    assert hash(account_id) == hash(AccountId(0, 0, 200))
+    assert account_id._to_proto() is not proto
+    assert account_id._to_proto().accountNum == 200
+
+    account_id.alias_key = alias_key
+
+    assert account_id._to_proto().alias == alias_key._to_proto().SerializeToString()
+
+
+def test_from_string_numeric_skips_evm_address_check():
+    """Plain shard.realm.num strings take the parse fast path without the EVM address check."""
+    with patch.object(AccountId, "_is_evm_address", wraps=AccountId._is_evm_address) as is_evm_address:
+        assert AccountId.from_string("0.0.1234") == AccountId(0, 0, 1234)
+        is_evm_address.assert_not_called()
+
+        evm = "0x" + "ab" * 20
+        assert AccountId.from_string(evm).evm_address == EvmAddress.from_string(evm)
+        is_evm_address.assert_called_once_with(evm)
@@ -206,3 +206,36 @@ def get_account_record_responses(transaction_records):
             ),
         ]
     ]
+
+
+def test_account_record_query_lazy_decoding(mock_account_ids):
+    """AccountRecordsQuery returns lazily decoded records when lazy_decoding is set."""
+    account_id = mock_account_ids[0]
+    consensus_timestamp = TimestampProto(seconds=1718745600, nanos=123456789)
+
+    transaction_record = transaction_record_pb2.TransactionRecord(
+        transactionID=basic_types_pb2.TransactionID(
+            accountID=account_id._to_proto(), transactionValidStart=consensus_timestamp
+        ),
+        consensusTimestamp=consensus_timestamp,
+        memo="lazy memo",
+        receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS),
+    )
+
+    response_sequences = get_account_record_responses([transaction_record])
+
+    with mock_hedera_servers(response_sequences) as client:
+        query = AccountRecordsQuery().set_account_id(account_id).set_lazy_decoding(True)
+        query.get_cost(client)
+        (record,) = query.execute(client)
+
+        assert "transaction_memo" not in vars(record)
+        assert record.transaction_memo == "lazy memo"
+        assert record.receipt.status == ResponseCode.SUCCESS
+        assert record.consensus_timestamp.seconds == 1718745600
+
+
+def test_set_lazy_decoding_invalid_type():
+    """set_lazy_decoding rejects non-boolean values."""
+    with pytest.raises(TypeError, match="lazy_decoding must be a boolean"):
+        AccountRecordsQuery().set_lazy_decoding(1)
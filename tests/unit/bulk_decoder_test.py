@@ -0,0 +1,195 @@
+"""
+Unit tests for the columnar contract result and event log decoder.
+
+Every test runs with the array module fallback, and again with NumPy when it is installed.
+"""
+
+from __future__ import annotations
+
+import eth_abi
+import pytest
+from eth_utils import keccak
+
+from hiero_sdk_python.contract import bulk_decoder
+from hiero_sdk_python.contract.bulk_decoder import EventLogIndex, decode_array, decode_event_logs
+from hiero_sdk_python.contract.contract import ContractEvent
+from hiero_sdk_python.contract.contract_function_result import ContractFunctionResult
+from hiero_sdk_python.contract.contract_id import ContractId
+from hiero_sdk_python.contract.contract_log_info import ContractLogInfo
+
+
+pytestmark = pytest.mark.unit
+
+ADDRESSES = ["0x" + f"{i:02x}" * 20 for i in range(0, 256, 51)]
+
+TRANSFER = {
+    "type": "event",
+    "name": "Transfer",
+    "inputs": [
+        {"name": "from", "type": "address", "indexed": True},
+        {"name": "to", "type": "address", "indexed": True},
+        {"name": "value", "type": "uint256", "indexed": False},
+    ],
+}
+SWAP = {
+    "type": "event",
+    "name": "Swap",
+    "inputs": [
+        {"name": "note", "type": "string", "indexed": True},
+        {"name": "amount", "type": "int64", "indexed": False},
+        {"name": "exact", "type": "bool", "indexed": False},
+    ],
+}
+MEMO = {
+    "type": "event",
+    "name": "Memo",
+    "inputs": [{"name": "text", "type": "string", "indexed": False}],
+}
+
+
+@pytest.fixture(params=["array", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(bulk_decoder, "np", None)
+    return request.param
+
+
+def _values(column):
+    """Normalizes a column to a list of Python values."""
+    if hasattr(column, "ndim") and column.ndim == 2:
+        return [bytes(row) for row in column]
+    return list(column)
+
+
+@pytest.mark.parametrize(
+    ("type_str", "values"),
+    [
+        ("uint8[]", [0, 1, 255]),
+        ("uint64[]", [0, 2**64 - 1, 12345]),
+        ("int32[]", [-(2**31), -1, 0, 2**31 - 1]),
+        ("int64[]", [-(2**63), 2**63 - 1]),
+        ("uint256[]", [0, 2**64, 2**256 - 1]),
+        ("int256[]", [-(2**255), -1, 2**255 - 1]),
+        ("bool[]", [True, False, True]),
+        ("address[]", ADDRESSES),
+        ("bytes4[]", [b"\x00\x01\x02\x03", b"\xff\x00\x00\x00"]),
+        ("bytes32[]", [bytes(range(32))]),
+        ("uint16[]", []),
+    ],
+)
+def test_decode_array_matches_eth_abi(backend, type_str, values):
+    data = eth_abi.encode([type_str], [values])
+    expected = list(eth_abi.decode([type_str], data)[0])
+
+    decoded = _values(decode_array(data, type_str))
+
+    if type_str == "address[]":
+        decoded = ["0x" + value.hex() for value in decoded]
+        expected = [value.lower() for value in expected]
+    assert decoded == expected
+
+
+def test_decode_array_column_types(backend):
+    data = eth_abi.encode(["uint64[]"], [[1, 2]])
+    column = decode_array(data, "uint64[]")
+    if backend == "numpy":
+        assert str(column.dtype) == "uint64"
+    else:
+        assert column.typecode == "Q"
+
+
+def test_decode_array_at_position_and_fixed_size(backend):
+    data = eth_abi.encode(["string", "uint32[]", "bool[3]"], ["x", [7, 8], [True, False, True]])
+    result = ContractFunctionResult(contract_call_result=data)
+
+    assert _values(decode_array(result, "uint32[]", position=1)) == [7, 8]
+    assert _values(decode_array(result, "bool[3]", position=2)) == [True, False, True]
+
+
+@pytest.mark.parametrize(
+    ("type_str", "data"),
+    [
+        ("uint8[]", eth_abi.encode(["uint16[]"], [[256]])),
+        ("int8[]", eth_abi.encode(["int16[]"], [[-129]])),
+        ("bool[]", eth_abi.encode(["uint8[]"], [[2]])),
+        ("address[]", eth_abi.encode(["uint256[]"], [[2**160]])),
+        ("bytes4[]", eth_abi.encode(["bytes5[]"], [[b"\x01" * 5]])),
+        ("uint128[]", eth_abi.encode(["uint256[]"], [[2**128]])),
+    ],
+)
+def test_decode_array_rejects_out_of_range_values(backend, type_str, data):
+    with pytest.raises(ValueError, match="Invalid"):
+        decode_array(data, type_str)
+
+
+def test_decode_array_rejects_bad_input():
+    with pytest.raises(ValueError, match="not an array type"):
+        decode_array(b"", "uint256")
+    with pytest.raises(ValueError, match="not a fixed-width static type"):
+        decode_array(b"", "string[]")
+    with pytest.raises(ValueError, match="too short"):
+        decode_array(eth_abi.encode(["uint256[]"], [[1, 2]])[:-32], "uint256[]")
+
+
+def _transfer_log(sender: str, receiver: str, value: int) -> ContractLogInfo:
+    return ContractLogInfo(
+        contract_id=ContractId(0, 0, 7),
+        topics=[
+            keccak(text="Transfer(address,address,uint256)"),
+            eth_abi.encode(["address"], [sender]),
+            eth_abi.encode(["address"], [receiver]),
+        ],
+        data=eth_abi.encode(["uint256"], [value]),
+    )
+
+
+def _swap_log(note: str, amount: int, exact: bool) -> ContractLogInfo:
+    return ContractLogInfo(
+        topics=[keccak(text="Swap(string,int64,bool)"), keccak(text=note)],
+        data=eth_abi.encode(["int64", "bool"], [amount, exact]),
+    )
+
+
+def test_decode_event_logs_columns(backend):
+    logs = [_swap_log("a", -5, True), _swap_log("b", 9, False)]
+
+    columns = decode_event_logs(ContractEvent(SWAP), logs)
+
+    assert list(columns) == ["note", "amount", "exact"]
+    assert _values(columns["note"]) == [keccak(text="a"), keccak(text="b")]
+    assert _values(columns["amount"]) == [-5, 9]
+    assert _values(columns["exact"]) == [True, False]
+
+
+def test_decode_event_logs_rejects_other_events(backend):
+    with pytest.raises(ValueError, match="is not a Transfer"):
+        decode_event_logs(ContractEvent(TRANSFER), [_swap_log("a", 1, True)])
+
+
+def test_event_log_index_groups_and_decodes(backend):
+    """Test that a mixed scan is split by topic hash and each event decoded in bulk."""
+    memo = ContractLogInfo(topics=[keccak(text="Memo(string)")], data=eth_abi.encode(["string"], ["hi"]))
+    unknown = ContractLogInfo(topics=[b"\x01" * 32], data=b"")
+    logs = [
+        _transfer_log(ADDRESSES[1], ADDRESSES[2], 10),
+        _swap_log("a", 3, True),
+        unknown,
+        _transfer_log(ADDRESSES[3], ADDRESSES[4], 2**200),
+        memo,
+        ContractLogInfo(),
+    ]
+    index = EventLogIndex.from_abi([TRANSFER, SWAP, MEMO, {"type": "function", "name": "f", "inputs": []}])
+
+    transfers, swaps, memos = index.decode(logs)
+
+    assert len(index.topics) == 3
+    assert index.get(keccak(text="Memo(string)")).name == "Memo"
+    assert transfers.event.name == "Transfer"
+    assert transfers.positions == [0, 3]
+    assert transfers.contract_ids == [ContractId(0, 0, 7)] * 2
+    assert ["0x" + a.hex() for a in _values(transfers.columns["to"])] == [ADDRESSES[2], ADDRESSES[4]]
+    assert _values(transfers.columns["value"]) == [10, 2**200]
+    assert len(swaps) == 1
+    assert memos.columns == {"text": ["hi"]}
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from unittest.mock import patch
+from contextlib import nullcontext
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.file.file_append_transaction import FileAppendTransaction
+from hiero_sdk_python.file.file_id import FileId
 from hiero_sdk_python.hapi.services import timestamp_pb2
+from hiero_sdk_python.hapi.services.transaction_response_pb2 import TransactionResponse as TransactionResponseProto
+from hiero_sdk_python.response_code import ResponseCode
 from hiero_sdk_python.transaction.chunked_transaction import ChunkedTransaction
 from hiero_sdk_python.transaction.transaction import Transaction
 from hiero_sdk_python.transaction.transaction_id import TransactionId
+from hiero_sdk_python.transaction.transaction_response import TransactionResponse
+from tests.unit.mock_server import mock_hedera_servers
 
 
 pytestmark = pytest.mark.unit
@@ -174,3 +181,132 @@ def test_validate_chunking_allows_required_equal_to_max_chunks():
     tx._validate_chunking()
     assert tx._total_chunks == 3
     assert tx._current_chunk_index == 0
+
+
+def _frozen_multi_chunk(mock_client, private_key, required_chunks):
+    tx = DummyChunkedTransaction(required_chunks=required_chunks)
+    tx.transaction_id = TransactionId(
+        account_id=AccountId(0, 0, 1234),
+        valid_start=timestamp_pb2.Timestamp(seconds=123, nanos=456),
+    )
+    tx.freeze_with(mock_client)
+    tx.sign(private_key)
+    return tx
+
+
+def _recording_execute(submitted, receipt_side_effect=None):
+    def execute(tx, client, timeout=None, wait_for_receipt=True, validate_status=False):
+        assert wait_for_receipt is False
+        body_bytes = tx._transaction_body_bytes[AccountId(0, 0, 3)]
+        chunk_index = tx._current_chunk_index
+        submitted.append((chunk_index, tx.transaction_id, body_bytes, tx._signature_map[body_bytes]))
+
+        response = MagicMock()
+        response.node_id = tx.node_account_id
+        if receipt_side_effect is not None and chunk_index in receipt_side_effect:
+            response.get_receipt.side_effect = receipt_side_effect[chunk_index]
+        else:
+            response.get_receipt.return_value = f"receipt-{chunk_index}"
+        return response
+
+    return execute
+
+
+@pytest.mark.parametrize("value, error", [(0, ValueError), (-1, ValueError), (1.5, TypeError), (True, TypeError)])
+def test_set_pipeline_window_rejects_invalid_values(value, error):
+    with pytest.raises(error, match="pipeline_window"):
+        DummyChunkedTransaction().set_pipeline_window(value)
+
+
+def test_execute_all_pipelined_submits_in_order_and_collects_receipts(mock_client, private_key):
+    tx = _frozen_multi_chunk(mock_client, private_key, required_chunks=5).set_pipeline_window(2)
+    submitted = []
+
+    with patch.object(Transaction, "execute", autospec=True, side_effect=_recording_execute(submitted)):
+        receipts = tx.execute_all(mock_client)
+
+    assert receipts == [f"receipt-{i}" for i in range(5)]
+    assert [chunk_index for chunk_index, *_ in submitted] == list(range(5))
+    assert [transaction_id for _, transaction_id, *_ in submitted] == tx._transaction_ids
+    assert len({body_bytes for _, _, body_bytes, _ in submitted}) == 5
+
+    signer_prefixes = {
+        private_key.public_key().to_bytes_raw(),
+        mock_client.operator_private_key.public_key().to_bytes_raw(),
+    }
+    for *_, sig_map in submitted:
+        assert {sig_pair.pubKeyPrefix for sig_pair in sig_map.sigPair} == signer_prefixes
+
+
+def test_execute_all_pipelined_without_receipts_returns_responses(mock_client, private_key):
+    tx = _frozen_multi_chunk(mock_client, private_key, required_chunks=3).set_pipeline_window(4)
+    submitted = []
+
+    with patch.object(Transaction, "execute", autospec=True, side_effect=_recording_execute(submitted)):
+        responses = tx.execute_all(mock_client, wait_for_receipt=False)
+
+    assert len(responses) == 3
+    assert all(response.get_receipt.call_count == 0 for response in responses)
+
+
+def test_execute_all_pipelined_stops_on_failed_receipt(mock_client, private_key):
+    tx = _frozen_multi_chunk(mock_client, private_key, required_chunks=5).set_pipeline_window(2)
+    submitted = []
+    execute = _recording_execute(submitted, receipt_side_effect={0: RuntimeError("receipt failed")})
+
+    with (
+        patch.object(Transaction, "execute", autospec=True, side_effect=execute),
+        pytest.raises(RuntimeError, match="receipt failed"),
+    ):
+        tx.execute_all(mock_client)
+
+    # The failing receipt of chunk 0 is awaited once the window of 2 is full.
+    assert [chunk_index for chunk_index, *_ in submitted] == [0, 1]
+
+
+@pytest.mark.parametrize("receipt_side_effect", [None, {0: RuntimeError("receipt failed")}])
+def test_execute_all_pipelined_unpins_the_node_afterwards(mock_client, private_key, receipt_side_effect):
+    """Test that the node pinned for the chunks is released whether or not execution succeeds."""
+    tx = _frozen_multi_chunk(mock_client, private_key, required_chunks=3).set_pipeline_window(2)
+    tx.node_account_id = None
+    node_account_ids = tx.node_account_ids
+    execute = _recording_execute([], receipt_side_effect)
+
+    def execute_on_first_node(tx, *args, **kwargs):
+        response = execute(tx, *args, **kwargs)
+        response.node_id = AccountId(0, 0, 3)
+        return response
+
+    expectation = nullcontext() if receipt_side_effect is None else pytest.raises(RuntimeError)
+    with patch.object(Transaction, "execute", autospec=True, side_effect=execute_on_first_node), expectation:
+        tx.execute_all(mock_client)
+
+    assert tx.node_account_id is None
+    assert tx.node_account_ids is node_account_ids
+    assert tx._node_account_ids_index == 0
+
+
+def test_execute_all_pipelined_retries_chunk_on_the_pinned_node():
+    """Test that a chunk retried mid-window stays on the first chunk's node and keeps chunk order."""
+    ok = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+    busy = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
+    receipt = MagicMock(status=ResponseCode.SUCCESS)
+
+    with (
+        mock_hedera_servers([[ok, busy, ok, ok], [ok, busy, ok, ok]]) as client,
+        patch.object(TransactionResponse, "get_receipt", autospec=True, return_value=receipt) as get_receipt,
+    ):
+        tx = (
+            FileAppendTransaction(file_id=FileId(0, 0, 777), contents=b"x" * 30, chunk_size=10)
+            .set_pipeline_window(2)
+            .freeze_with(client)
+        )
+        node_account_id, node_account_ids = tx.node_account_id, tx.node_account_ids
+        receipts = tx.execute_all(client)
+
+    assert receipts == [receipt] * 3
+    responses = [call.args[0] for call in get_receipt.call_args_list]
+    assert [response.transaction_id for response in responses] == tx._transaction_ids
+    assert len({response.node_id for response in responses}) == 1
+    assert tx.node_account_id == node_account_id
+    assert tx.node_account_ids == node_account_ids
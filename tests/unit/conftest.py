@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -11,7 +12,13 @@ from hiero_sdk_python.client.network import Network
 from hiero_sdk_python.consensus.topic_id import TopicId
 from hiero_sdk_python.contract.contract_id import ContractId
 from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.file.file_append_transaction import FileAppendTransaction
+from hiero_sdk_python.file.file_contents_query import FileContentsQuery
+from hiero_sdk_python.file.file_create_transaction import FileCreateTransaction
+from hiero_sdk_python.file.file_delete_transaction import FileDeleteTransaction
 from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.file.file_info import FileInfo
+from hiero_sdk_python.file.file_info_query import FileInfoQuery
 from hiero_sdk_python.logger.log_level import LogLevel
 from hiero_sdk_python.node import _Node
 from hiero_sdk_python.tokens.nft_id import NftId
@@ -121,3 +128,61 @@ def mock_client():
     client.set_operator(operator_id, operator_key)
 
     return client
+
+
+class _FileNetwork:
+    """Stands in for the file service and records what the patched transactions were given."""
+
+    def __init__(self) -> None:
+        self.created_files: list[bytes] = []
+        self.appends: list[FileAppendTransaction] = []
+        self.deleted: list[FileId] = []
+        self.info: dict[FileId, FileInfo] = {}
+        self.contents: dict[FileId, bytes] = {}
+        self.submitted: list = []
+        self.append_error: Exception | None = None
+        self.submit_error: Exception | None = None
+
+    def create_file(self, transaction, _client, _timeout=None, **_kwargs):
+        self.created_files.append(transaction.contents)
+        file_id = FileId(0, 0, 500 + len(self.created_files))
+        self.contents[file_id] = transaction.contents
+        return MagicMock(file_id=file_id)
+
+    def append(self, transaction, _client, _timeout=None, **_kwargs):
+        if self.append_error is not None:
+            raise self.append_error
+        self.appends.append(transaction)
+        self.contents[transaction.file_id] += transaction.contents
+        return [MagicMock()] * transaction.get_required_chunks()
+
+    def delete_file(self, transaction, _client, _timeout=None, **_kwargs):
+        self.deleted.append(transaction.file_id)
+
+    def file_info(self, query, _client, _timeout=None):
+        return self.info[query.file_id]
+
+    def file_contents(self, query, _client, _timeout=None):
+        return self.contents[query.file_id]
+
+    def submit(self, transaction, _client, _timeout=None, **kwargs):
+        """Records a transaction that uses the files, e.g. a contract creation."""
+        assert kwargs.get("validate_status")
+        self.submitted.append(transaction)
+        if self.submit_error is not None:
+            raise self.submit_error
+        return MagicMock(contract_id=ContractId(0, 0, 900 + len(self.submitted)))
+
+
+@pytest.fixture
+def file_network():
+    """Fixture that patches the file transactions and queries with a recording fake."""
+    fake = _FileNetwork()
+    with (
+        patch.object(FileCreateTransaction, "execute", autospec=True, side_effect=fake.create_file),
+        patch.object(FileAppendTransaction, "execute_all", autospec=True, side_effect=fake.append),
+        patch.object(FileDeleteTransaction, "execute", autospec=True, side_effect=fake.delete_file),
+        patch.object(FileInfoQuery, "execute", autospec=True, side_effect=fake.file_info),
+        patch.object(FileContentsQuery, "execute", autospec=True, side_effect=fake.file_contents),
+    ):
+        yield fake
@@ -0,0 +1,206 @@
+"""
+Unit tests for ContractCallBatch.
+
+The network is replaced by an in-memory Multicall3: aggregate3 call data is
+decoded and each sub-call is dispatched to a Python implementation of the
+target contract.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import eth_abi
+import pytest
+
+from hiero_sdk_python.contract.contract import Contract
+from hiero_sdk_python.contract.contract_call_batch import (
+    AGGREGATE3,
+    MULTICALL3_ADDRESS,
+    ContractCallBatch,
+)
+from hiero_sdk_python.contract.contract_call_query import ContractCallQuery
+from hiero_sdk_python.contract.contract_function import ContractFunction
+from hiero_sdk_python.contract.contract_function_result import ContractFunctionResult
+from hiero_sdk_python.contract.contract_id import ContractId
+from hiero_sdk_python.exceptions import PrecheckError
+from hiero_sdk_python.response_code import ResponseCode
+
+
+pytestmark = pytest.mark.unit
+
+TOKEN_ID = ContractId(0, 0, 1234)
+TOKEN = "0x" + TOKEN_ID.to_evm_address()
+OWNERS = ["0x" + f"{i:040x}" for i in range(1, 101)]
+
+BALANCE_OF = ContractFunction("balanceOf", ["address"], ["uint256"])
+NAME = ContractFunction("name", [], ["string"])
+FAIL = ContractFunction("fail", [], ["uint256"])
+
+
+def _revert(reason: str) -> bytes:
+    return bytes.fromhex("08c379a0") + eth_abi.encode(["string"], [reason])
+
+
+class _Revert(Exception):
+    def __init__(self, data: bytes) -> None:
+        super().__init__()
+        self.data = data
+
+
+class InMemoryMulticall:
+    """Executes aggregate3 queries against Python stand-ins for the target contracts."""
+
+    def __init__(self) -> None:
+        self.contracts = {
+            TOKEN.lower(): {
+                BALANCE_OF.selector: lambda data: eth_abi.encode(
+                    ["uint256"], [int(BALANCE_OF.decode_input(data)[0], 16) * 10]
+                ),
+                NAME.selector: lambda _data: eth_abi.encode(["string"], ["Token"]),
+                FAIL.selector: self._fail,
+            }
+        }
+        self.queries: list[ContractCallQuery] = []
+
+    @staticmethod
+    def _fail(_data: bytes) -> bytes:
+        raise _Revert(_revert("nope"))
+
+    def execute(self, query: ContractCallQuery, _client, _timeout=None) -> ContractFunctionResult:
+        self.queries.append(query)
+        assert query.contract_id == ContractId.from_evm_address(0, 0, MULTICALL3_ADDRESS)
+
+        (calls,) = AGGREGATE3.decode_input(query.function_parameters)
+        results = []
+        for target, allow_failure, call_data in calls:
+            try:
+                results.append((True, self.contracts[target.lower()][call_data[:4]](call_data)))
+            except _Revert as revert:
+                if not allow_failure:
+                    raise PrecheckError(ResponseCode.CONTRACT_REVERT_EXECUTED) from revert
+                results.append((False, revert.data))
+        return ContractFunctionResult(contract_call_result=eth_abi.encode(["(bool,bytes)[]"], [results]))
+
+
+@pytest.fixture
+def multicall():
+    stand_in = InMemoryMulticall()
+    with patch.object(ContractCallQuery, "execute", autospec=True, side_effect=stand_in.execute):
+        yield stand_in
+
+
+def test_batch_decodes_each_call_in_order(multicall, mock_client):
+    batch = ContractCallBatch()
+    indices = [batch.add(BALANCE_OF, owner, target=TOKEN_ID) for owner in OWNERS[:3]]
+    name_index = batch.add(NAME, target=TOKEN)
+
+    results = batch.execute(mock_client)
+
+    assert indices == [0, 1, 2]
+    assert [result.values for result in results[:3]] == [(10,), (20,), (30,)]
+    assert results[name_index].success
+    assert results[name_index].values == ("Token",)
+    assert len(multicall.queries) == 1
+
+
+def test_failed_calls_carry_revert_reason(multicall, mock_client):
+    batch = ContractCallBatch()
+    batch.add(FAIL, target=TOKEN)
+    batch.add(NAME, target=TOKEN)
+
+    failed, ok = batch.execute(mock_client)
+
+    assert not failed.success
+    assert failed.values is None
+    assert failed.error == "nope"
+    assert ok.values == ("Token",)
+
+
+def test_disallowed_failure_fails_the_query(multicall, mock_client):
+    batch = ContractCallBatch()
+    batch.add(FAIL, target=TOKEN, allow_failure=False)
+
+    with pytest.raises(PrecheckError):
+        batch.execute(mock_client)
+
+
+def test_undecodable_return_data_is_reported_per_call(multicall, mock_client):
+    batch = ContractCallBatch()
+    batch.add(ContractFunction("name", [], ["uint256[]"]), target=TOKEN)
+
+    (result,) = batch.execute(mock_client)
+
+    assert not result.success
+    assert "Failed to decode" in result.error
+
+
+def test_bound_methods_use_their_contract_and_result_names(multicall, mock_client):
+    token = Contract.from_abi(
+        [
+            {
+                "type": "function",
+                "name": "balanceOf",
+                "inputs": [{"name": "owner", "type": "address"}],
+                "outputs": [{"name": "balance", "type": "uint256"}],
+            }
+        ],
+        TOKEN_ID,
+    )
+    batch = ContractCallBatch()
+    batch.add(token.balanceOf, OWNERS[4])
+
+    (result,) = batch.execute(mock_client)
+
+    assert result.values.balance == 50
+
+
+@pytest.mark.parametrize(
+    "configure",
+    [
+        lambda batch: batch.set_max_gas(30_000 + 10 * 50_000),
+        lambda batch: batch.set_max_call_data_size(4 + 64 + 10 * 224),
+        lambda batch: batch.set_max_result_size(64 + 10 * 160),
+    ],
+)
+def test_batch_splits_at_limits(multicall, mock_client, configure):
+    """Test that each limit splits 100 calls into queries of 10, preserving order."""
+    batch = configure(ContractCallBatch())
+    for owner in OWNERS:
+        batch.add(BALANCE_OF, owner, target=TOKEN)
+
+    results = batch.execute(mock_client)
+
+    assert len(multicall.queries) == 10
+    assert all(len(AGGREGATE3.decode_input(q.function_parameters)[0]) == 10 for q in multicall.queries)
+    assert [result.values[0] for result in results] == [i * 10 for i in range(1, 101)]
+
+
+def test_oversized_call_runs_alone(multicall, mock_client):
+    batch = ContractCallBatch().set_max_gas(100_000)
+    batch.add(NAME, target=TOKEN, gas=500_000)
+    batch.add(NAME, target=TOKEN)
+
+    assert len(batch.build_queries()) == 2
+    assert batch.build_queries()[0].gas == 100_000
+    assert len(batch.execute(mock_client)) == 2
+
+
+def test_configuration_validation():
+    batch = ContractCallBatch(ContractId(0, 0, 99))
+    assert batch.multicall_id == ContractId(0, 0, 99)
+    assert (
+        batch.set_multicall_address(MULTICALL3_ADDRESS).multicall_id.evm_address.hex() == MULTICALL3_ADDRESS[2:].lower()
+    )
+
+    with pytest.raises(ValueError, match="max_gas must be greater than 0"):
+        batch.set_max_gas(0)
+    with pytest.raises(TypeError, match="max_result_size must be an int"):
+        batch.set_max_result_size("big")
+    with pytest.raises(TypeError, match="multicall_address"):
+        ContractCallBatch(1234)
+    with pytest.raises(ValueError, match="target is required"):
+        batch.add(NAME)
+    with pytest.raises(ValueError, match="takes 1 arguments"):
+        batch.add(BALANCE_OF, target=TOKEN)
+    assert len(batch) == 0
@@ -0,0 +1,202 @@
+"""
+Unit tests for ContractCreateFlow and BytecodeFileCache.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from hiero_sdk_python.contract.contract_create_flow import (
+    BytecodeFileCache,
+    ContractCreateFlow,
+    deploy_contract,
+)
+from hiero_sdk_python.contract.contract_create_transaction import ContractCreateTransaction
+from hiero_sdk_python.contract.contract_id import ContractId
+from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.file.file_info import FileInfo
+from hiero_sdk_python.timestamp import Timestamp
+
+
+pytestmark = pytest.mark.unit
+
+SMALL = bytes(range(256)) * 4
+LARGE = bytes(range(256)) * 40  # 10 KiB, 20 KiB of hex
+
+
+@pytest.fixture
+def network(file_network):
+    with patch.object(ContractCreateTransaction, "execute", autospec=True, side_effect=file_network.submit):
+        yield file_network
+
+
+def test_small_bytecode_is_sent_inline(network, mock_client):
+    receipt = deploy_contract(mock_client, "0x" + SMALL.hex(), gas=100_000)
+
+    assert receipt.contract_id == ContractId(0, 0, 901)
+    (transaction,) = network.submitted
+    assert transaction.bytecode == SMALL
+    assert transaction.bytecode_file_id is None
+    assert transaction.gas == 100_000
+    assert network.created_files == []
+
+
+def test_large_bytecode_is_uploaded_then_deleted(network, mock_client):
+    """Test that large bytecode goes through a file that is removed after deployment."""
+    flow = ContractCreateFlow().set_bytecode(LARGE).set_gas(500_000).set_pipeline_window(8)
+
+    flow.execute(mock_client)
+
+    hex_contents = LARGE.hex().encode()
+    assert network.created_files == [hex_contents[:4096]]
+    (append,) = network.appends
+    assert append.contents == hex_contents[4096:]
+    assert append.get_required_chunks() == 4
+    assert append.pipeline_window == 8
+
+    (transaction,) = network.submitted
+    assert transaction.bytecode_file_id == flow.file_id == FileId(0, 0, 501)
+    assert transaction.bytecode is None
+    assert network.deleted == [FileId(0, 0, 501)]
+
+
+def test_constructor_parameters_count_towards_inline_size(network, mock_client):
+    flow = ContractCreateFlow().set_bytecode(SMALL).set_gas(1).set_max_inline_size(len(SMALL) + 31)
+    flow.set_constructor_parameters(bytes(32))
+
+    flow.execute(mock_client)
+
+    assert network.submitted[0].bytecode_file_id is not None
+
+
+def test_cached_uploads_are_reused(network, mock_client, tmp_path):
+    path = tmp_path / "bytecode-files.json"
+    cache = BytecodeFileCache(path)
+
+    deploy_contract(mock_client, LARGE, gas=1, cache=cache)
+    file_id = network.submitted[0].bytecode_file_id
+    network.info[file_id] = FileInfo(
+        size=2 * len(LARGE), is_deleted=False, expiration_time=Timestamp(int(time.time()) + 86400, 0)
+    )
+
+    deploy_contract(mock_client, LARGE, gas=1, cache=BytecodeFileCache(path))
+
+    assert len(network.created_files) == 1
+    assert network.deleted == []
+    assert [t.bytecode_file_id for t in network.submitted] == [file_id, file_id]
+
+
+@pytest.mark.parametrize(
+    "info",
+    [
+        FileInfo(size=0, is_deleted=True),
+        FileInfo(size=123, is_deleted=False),
+        FileInfo(size=2 * len(LARGE), is_deleted=False, expiration_time=Timestamp(int(time.time()) + 60, 0)),
+    ],
+)
+def test_stale_cache_entries_are_replaced(network, mock_client, info):
+    cache = BytecodeFileCache()
+    key = BytecodeFileCache.key(mock_client.network.network, LARGE)
+    cache.put(key, FileId(0, 0, 77))
+    network.info[FileId(0, 0, 77)] = info
+
+    deploy_contract(mock_client, LARGE, gas=1, cache=cache)
+
+    assert len(network.created_files) == 1
+    assert cache.get(key) == FileId(0, 0, 501)
+
+
+def test_cached_files_with_other_contents_are_replaced(network, mock_client):
+    cache = BytecodeFileCache()
+    key = BytecodeFileCache.key(mock_client.network.network, LARGE)
+    cache.put(key, FileId(0, 0, 77))
+    network.info[FileId(0, 0, 77)] = FileInfo(
+        size=2 * len(LARGE), is_deleted=False, expiration_time=Timestamp(int(time.time()) + 86400, 0)
+    )
+    network.contents[FileId(0, 0, 77)] = bytes(2 * len(LARGE))
+
+    deploy_contract(mock_client, LARGE, gas=1, cache=cache)
+
+    assert len(network.created_files) == 1
+    assert network.submitted[0].bytecode_file_id == cache.get(key) == FileId(0, 0, 501)
+
+
+def test_cache_file_merges_entries_of_other_instances(tmp_path):
+    path = tmp_path / "bytecode-files.json"
+    first, second = BytecodeFileCache(path), BytecodeFileCache(path)
+
+    first.put("a", FileId(0, 0, 1))
+    second.put("b", FileId(0, 0, 2))
+    first.discard("c")
+
+    assert BytecodeFileCache(path).get("a") == FileId(0, 0, 1)
+    assert BytecodeFileCache(path).get("b") == FileId(0, 0, 2)
+    assert len(first) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bytecode-files.json", "bytecode-files.json.lock"]
+
+
+def test_concurrent_puts_keep_every_entry(tmp_path):
+    path = tmp_path / "bytecode-files.json"
+    caches = [BytecodeFileCache(path) for _ in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: caches[i].put(str(i), FileId(0, 0, i)), range(8)))
+
+    assert len(BytecodeFileCache(path)) == 8
+
+
+@pytest.mark.parametrize("contents", ["{not json", "[1, 2]", '{"a": 5}', '{"a": "not an id"}'])
+def test_corrupt_cache_file_starts_empty(tmp_path, contents):
+    path = tmp_path / "bytecode-files.json"
+    path.write_text(contents, encoding="utf-8")
+
+    cache = BytecodeFileCache(path)
+    assert len(cache) == 0
+
+    cache.put("a", FileId(0, 0, 1))
+    assert BytecodeFileCache(path).get("a") == FileId(0, 0, 1)
+
+
+def test_failed_append_deletes_the_partial_file(network, mock_client):
+    network.append_error = RuntimeError("append failed")
+    cache = BytecodeFileCache()
+
+    with pytest.raises(RuntimeError, match="append failed"):
+        deploy_contract(mock_client, LARGE, gas=1, cache=cache)
+
+    assert network.deleted == [FileId(0, 0, 501)]
+    assert network.submitted == []
+    assert len(cache) == 0
+
+
+def test_failed_creation_still_deletes_the_uncached_file(network, mock_client):
+    network.submit_error = RuntimeError("create failed")
+
+    with pytest.raises(RuntimeError, match="create failed"):
+        deploy_contract(mock_client, LARGE, gas=1)
+
+    assert network.deleted == [FileId(0, 0, 501)]
+
+
+def test_failed_creation_keeps_the_cached_file(network, mock_client):
+    network.submit_error = RuntimeError("create failed")
+    cache = BytecodeFileCache()
+
+    with pytest.raises(RuntimeError, match="create failed"):
+        deploy_contract(mock_client, LARGE, gas=1, cache=cache)
+
+    assert network.deleted == []
+    assert len(cache) == 1
+
+
+def test_flow_validation(mock_client):
+    with pytest.raises(ValueError, match="Bytecode is required"):
+        ContractCreateFlow().execute(mock_client)
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        ContractCreateFlow().set_chunk_size(0)
+    with pytest.raises(TypeError, match="pipeline_window must be an int"):
+        ContractCreateFlow().set_pipeline_window(2.5)
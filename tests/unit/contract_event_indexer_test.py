@@ -0,0 +1,266 @@
+"""
+Unit tests for ContractEventIndexer and its log sources.
+"""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import eth_abi
+import pytest
+from eth_utils import keccak
+
+from hiero_sdk_python.contract.contract_event_indexer import (
+    ContractEventIndexer,
+    EventCheckpoint,
+    MirrorContractLogSource,
+    RecordLogSource,
+)
+from hiero_sdk_python.contract.contract_function_result import ContractFunctionResult
+from hiero_sdk_python.contract.contract_id import ContractId
+from hiero_sdk_python.contract.contract_log_info import ContractLogInfo
+from hiero_sdk_python.timestamp import Timestamp
+from hiero_sdk_python.transaction.transaction_record import TransactionRecord
+
+
+pytestmark = pytest.mark.unit
+
+TOKEN_A = ContractId(0, 0, 1001)
+TOKEN_B = ContractId(0, 0, 1002)
+OTHER = ContractId(0, 0, 9999)
+ALICE = "0x" + "aa" * 20
+BOB = "0x" + "bb" * 20
+
+ABI = [
+    {
+        "type": "event",
+        "name": "Transfer",
+        "inputs": [
+            {"name": "from", "type": "address", "indexed": True},
+            {"name": "to", "type": "address", "indexed": True},
+            {"name": "value", "type": "uint256", "indexed": False},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "Memo",
+        "inputs": [{"name": "text", "type": "string", "indexed": True}],
+    },
+]
+TRANSFER_TOPIC = keccak(text="Transfer(address,address,uint256)")
+
+
+def _transfer(contract_id: ContractId, sender: str, receiver: str, value: int) -> ContractLogInfo:
+    return ContractLogInfo(
+        contract_id=contract_id,
+        topics=[TRANSFER_TOPIC, eth_abi.encode(["address"], [sender]), eth_abi.encode(["address"], [receiver])],
+        data=eth_abi.encode(["uint256"], [value]),
+    )
+
+
+def _record(seconds: int, *logs: ContractLogInfo, children=()) -> TransactionRecord:
+    return TransactionRecord(
+        call_result=ContractFunctionResult(log_info=list(logs)),
+        consensus_timestamp=Timestamp(seconds, 0),
+        transaction_hash=bytes([seconds]) * 48,
+        children=list(children),
+    )
+
+
+@pytest.fixture
+def records():
+    return [
+        _record(1, _transfer(TOKEN_A, ALICE, BOB, 1), _transfer(OTHER, ALICE, BOB, 99)),
+        _record(
+            2,
+            ContractLogInfo(contract_id=TOKEN_A, topics=[b"\x01" * 32], data=b"garbage"),
+            children=[_record(3, _transfer(TOKEN_B, BOB, ALICE, 2))],
+        ),
+        TransactionRecord(consensus_timestamp=Timestamp(4, 0)),
+        _record(5, _transfer(TOKEN_A, BOB, BOB, 3), _transfer(TOKEN_A, ALICE, BOB, 4)),
+    ]
+
+
+def test_streams_decoded_events_from_records(records):
+    """Test that logs of other contracts and unknown events are skipped."""
+    indexer = ContractEventIndexer(ABI, [TOKEN_A, TOKEN_B])
+
+    events = list(indexer.events(RecordLogSource(records)))
+
+    assert [(e.contract_id, e.args.value) for e in events] == [(TOKEN_A, 1), (TOKEN_B, 2), (TOKEN_A, 3), (TOKEN_A, 4)]
+    assert events[0].name == "Transfer"
+    assert events[0].args.to.lower() == BOB
+    assert events[0].log.transaction_hash == b"\x01" * 48
+    assert events[3].checkpoint == EventCheckpoint(5_000_000_000, 1)
+    assert indexer.checkpoints == {
+        TOKEN_A: EventCheckpoint(5_000_000_000, 1),
+        TOKEN_B: EventCheckpoint(3_000_000_000, 0),
+    }
+
+
+def test_topic_filters_apply_before_decoding(records):
+    indexer = ContractEventIndexer(ABI, [TOKEN_A, TOKEN_B]).add_filter("Transfer", to=BOB)
+
+    with patch("hiero_sdk_python.contract.contract.ContractEvent.decode_log", autospec=True) as decode_log:
+        decode_log.side_effect = lambda _event, log: ("decoded", len(log.topics))
+        events = list(indexer.events(RecordLogSource(records)))
+
+    assert len(events) == 3
+    assert decode_log.call_count == 3
+    assert indexer.topics == [TRANSFER_TOPIC]
+
+
+def test_filters_on_dynamic_indexed_arguments_use_hashes():
+    memo = ContractLogInfo(contract_id=TOKEN_A, topics=[keccak(text="Memo(string)"), keccak(text="hello")])
+    other = ContractLogInfo(contract_id=TOKEN_A, topics=[keccak(text="Memo(string)"), keccak(text="bye")])
+    indexer = ContractEventIndexer(ABI, TOKEN_A).add_filter("Memo", text="hello")
+
+    (event,) = indexer.events(RecordLogSource([_record(1, memo, other)]))
+
+    assert event.args.text == keccak(text="hello")
+
+
+def test_filter_validation():
+    indexer = ContractEventIndexer(ABI, TOKEN_A)
+    with pytest.raises(ValueError, match="no indexed argument 'value'"):
+        indexer.add_filter("Transfer", value=1)
+    with pytest.raises(ValueError, match="No event"):
+        indexer.add_filter("Approval")
+    with pytest.raises(ValueError, match="At least one contract ID"):
+        ContractEventIndexer(ABI, [])
+
+
+def test_checkpoints_resume_with_at_least_once_delivery(records):
+    indexer = ContractEventIndexer(ABI, [TOKEN_A, TOKEN_B])
+    stream = indexer.events(RecordLogSource(records))
+    first = next(stream)
+    second = next(stream)
+    stream.close()
+
+    # TOKEN_A's unknown log after the first event was skipped, so its checkpoint moved past it
+    assert first.checkpoint == EventCheckpoint(1_000_000_000, 0)
+    assert indexer.get_checkpoint(TOKEN_A) == EventCheckpoint(2_000_000_000, 0)
+    assert indexer.get_checkpoint(TOKEN_B) is None
+
+    resumed = list(indexer.events(RecordLogSource(records)))
+    assert [e.args.value for e in resumed] == [second.args.value, 3, 4]
+
+    indexer.set_checkpoint(TOKEN_A, None).set_checkpoint(TOKEN_B, EventCheckpoint(10_000_000_000, 0))
+    assert [e.args.value for e in indexer.events(RecordLogSource(records))] == [1, 3, 4]
+
+
+def _mirror_log(seconds: int, index: int, value: int) -> dict:
+    log = _transfer(TOKEN_A, ALICE, BOB, value)
+    return {
+        "timestamp": f"{seconds}.000000001",
+        "index": index,
+        "topics": ["0x" + topic.hex() for topic in log.topics],
+        "data": "0x" + log.data.hex(),
+        "transaction_hash": "0x" + "ab" * 32,
+    }
+
+
+def _response(status_code: int, body: dict | None = None) -> MagicMock:
+    response = MagicMock(status_code=status_code, text="error")
+    response.json.return_value = body
+    return response
+
+
+class _FakeSession:
+    def __init__(self, pages: dict) -> None:
+        self.pages = pages
+        self.urls: list[str] = []
+
+    def get(self, url: str, timeout: float):
+        assert timeout == 30.0
+        self.urls.append(url)
+        for prefix, responses in self.pages.items():
+            if url.startswith(prefix):
+                return responses.pop(0) if len(responses) > 1 else responses[0]
+        raise AssertionError(f"Unexpected URL {url}")
+
+
+def test_mirror_source_pages_and_merges_contracts():
+    base = "https://mirror.test/api/v1"
+    session = _FakeSession(
+        {
+            f"{base}/contracts/0.0.1001/results/logs": [
+                _response(
+                    200,
+                    {
+                        "logs": [_mirror_log(1, 0, 1), _mirror_log(3, 0, 3)],
+                        "links": {"next": "/api/v1/contracts/0.0.1001/page2"},
+                    },
+                )
+            ],
+            f"{base}/contracts/0.0.1001/page2": [_response(503), _response(200, {"logs": [_mirror_log(5, 0, 5)]})],
+            f"{base}/contracts/0.0.1002/results/logs": [
+                _response(200, {"logs": [_mirror_log(2, 0, 2), _mirror_log(4, 0, 4)], "links": {"next": None}})
+            ],
+        }
+    )
+    indexer = ContractEventIndexer(ABI, [TOKEN_A, TOKEN_B])
+
+    with patch("hiero_sdk_python.contract.contract_event_indexer.time.sleep"):
+        events = list(indexer.events(MirrorContractLogSource(base, session=session)))
+
+    assert [e.args.value for e in events] == [1, 2, 3, 4, 5]
+    assert [e.contract_id for e in events] == [TOKEN_A, TOKEN_B, TOKEN_A, TOKEN_B, TOKEN_A]
+    assert events[0].checkpoint == EventCheckpoint(1_000_000_001, 0)
+    assert "order=asc" in session.urls[0]
+    assert "limit=100" in session.urls[0]
+
+
+def test_mirror_source_fetches_first_pages_of_all_contracts_concurrently():
+    base = "https://mirror.test/api/v1"
+    session = _FakeSession(
+        {
+            f"{base}/contracts/0.0.1001/results/logs": [_response(200, {"logs": [_mirror_log(1, 0, 1)]})],
+            f"{base}/contracts/0.0.1002/results/logs": [_response(200, {"logs": [_mirror_log(2, 0, 2)]})],
+        }
+    )
+    # Each first-page request waits for the other one, so fetching them one at a time breaks the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+    fetch = session.get
+
+    def get(url: str, timeout: float):
+        barrier.wait()
+        return fetch(url, timeout)
+
+    session.get = get
+    indexer = ContractEventIndexer(ABI, [TOKEN_A, TOKEN_B])
+
+    events = list(indexer.events(MirrorContractLogSource(base, session=session)))
+
+    assert [e.args.value for e in events] == [1, 2]
+    assert len(session.urls) == 2
+
+
+def test_mirror_source_resumes_from_checkpoint_timestamp():
+    base = "https://mirror.test/api/v1"
+    session = _FakeSession(
+        {
+            f"{base}/contracts/0.0.1001/results/logs": [
+                _response(200, {"logs": [_mirror_log(7, 0, 7), _mirror_log(7, 1, 8)]})
+            ]
+        }
+    )
+    indexer = ContractEventIndexer(ABI, TOKEN_A).set_checkpoint(TOKEN_A, EventCheckpoint(7_000_000_001, 0))
+
+    events = list(indexer.events(MirrorContractLogSource(base, session=session)))
+
+    assert [e.args.value for e in events] == [8]
+    assert "timestamp=gte%3A7.000000001" in session.urls[0]
+
+
+def test_mirror_source_raises_on_non_retryable_errors():
+    base = "https://mirror.test/api/v1"
+    session = _FakeSession({f"{base}/contracts/0.0.1001/results/logs": [_response(400)]})
+    indexer = ContractEventIndexer(ABI, TOKEN_A)
+
+    with pytest.raises(RuntimeError, match="HTTP 400"):
+        list(indexer.events(MirrorContractLogSource(base, session=session)))
+
+    with pytest.raises(ValueError, match="page_size"):
+        MirrorContractLogSource(base, page_size=1000)
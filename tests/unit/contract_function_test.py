@@ -0,0 +1,119 @@
+"""
+Unit tests for the ContractFunction ABI codec.
+"""
+
+from __future__ import annotations
+
+import json
+
+import eth_abi
+import pytest
+
+from hiero_sdk_python.contract.contract_function import ContractFunction
+from hiero_sdk_python.contract.contract_function_parameters import ContractFunctionParameters
+
+
+pytestmark = pytest.mark.unit
+
+ADDRESS = "0x" + "ab" * 20
+
+TOKEN_ABI = [
+    {"type": "constructor", "inputs": [{"name": "supply", "type": "uint256"}]},
+    {
+        "type": "function",
+        "name": "transfer",
+        "inputs": [{"name": "to", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        "outputs": [{"name": "", "type": "bool"}],
+    },
+    {
+        "type": "function",
+        "name": "getOrder",
+        "inputs": [{"name": "id", "type": "uint64"}],
+        "outputs": [
+            {
+                "name": "order",
+                "type": "tuple",
+                "components": [{"name": "owner", "type": "address"}, {"name": "amounts", "type": "uint256[]"}],
+            },
+            {"name": "tags", "type": "tuple[]", "components": [{"name": "tag", "type": "string"}]},
+        ],
+    },
+    {"type": "function", "name": "mint", "inputs": [{"name": "amount", "type": "uint256"}], "outputs": []},
+    {
+        "type": "function",
+        "name": "mint",
+        "inputs": [{"name": "to", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        "outputs": [],
+    },
+]
+
+
+def test_encode_matches_contract_function_parameters():
+    """Test that the compiled codec produces the same call data as ContractFunctionParameters."""
+    function = ContractFunction("transfer", ["address", "uint256"], ["bool"])
+    expected = ContractFunctionParameters("transfer").add_address(ADDRESS).add_uint256(10**18).to_bytes()
+
+    assert function.signature == "transfer(address,uint256)"
+    assert function.selector == bytes.fromhex("a9059cbb")
+    assert function.encode(ADDRESS, 10**18) == expected
+    assert function.encode_parameters(ADDRESS, 10**18) == expected[4:]
+
+
+def test_encode_many_encodes_each_row():
+    function = ContractFunction("transfer", ["address", "uint256"])
+
+    encoded = function.encode_many([(ADDRESS, i) for i in range(3)])
+
+    assert encoded == [function.encode(ADDRESS, i) for i in range(3)]
+    with pytest.raises(ValueError, match="Row 1"):
+        function.encode_many([(ADDRESS, 1), (ADDRESS,)])
+
+
+def test_encode_rejects_wrong_arity():
+    with pytest.raises(ValueError, match="takes 2 arguments, got 1"):
+        ContractFunction("transfer", ["address", "uint256"]).encode(ADDRESS)
+
+
+def test_from_abi_expands_tuples_and_decodes_outputs():
+    """Test that tuple components in ABI JSON become canonical type strings."""
+    function = ContractFunction.from_abi(json.dumps(TOKEN_ABI), "getOrder")
+
+    assert function.output_types == ("(address,uint256[])", "(string)[]")
+
+    data = eth_abi.encode(function.output_types, [(ADDRESS, [1, 2]), [("a",), ("b",)]])
+    order, tags = function.decode_output(data)
+    assert order == (ADDRESS, (1, 2))
+    assert tags == (("a",), ("b",))
+
+
+def test_from_abi_selects_overloads_by_signature():
+    function = ContractFunction.from_abi(TOKEN_ABI, "mint(address,uint256)")
+
+    assert function.input_types == ("address", "uint256")
+    with pytest.raises(ValueError, match="overloaded"):
+        ContractFunction.from_abi(TOKEN_ABI, "mint")
+    with pytest.raises(ValueError, match="No function 'burn'"):
+        ContractFunction.from_abi(TOKEN_ABI, "burn")
+    with pytest.raises(ValueError, match="not a function"):
+        ContractFunction.from_abi(TOKEN_ABI[0])
+
+
+def test_decode_input_round_trip():
+    function = ContractFunction("transfer", ["address", "uint256"])
+
+    assert function.decode_input(function.encode(ADDRESS, 5)) == (ADDRESS, 5)
+    with pytest.raises(ValueError, match="not a call to"):
+        function.decode_input(b"\x00" * 36)
+
+
+def test_decode_output_errors_and_empty_result():
+    function = ContractFunction("balanceOf", ["address"], ["uint256"])
+
+    assert function.decode_output(b"") == ()
+    with pytest.raises(ValueError, match="Failed to decode contract result"):
+        function.decode_output(b"\x01")
+
+
+def test_invalid_type_is_rejected():
+    with pytest.raises(ValueError, match="Invalid ABI type"):
+        ContractFunction("f", ["uint7"])
@@ -0,0 +1,188 @@
+"""
+Unit tests for ContractGasEstimator.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.contract.contract_call_query import ContractCallQuery
+from hiero_sdk_python.contract.contract_execute_transaction import ContractExecuteTransaction
+from hiero_sdk_python.contract.contract_gas_estimator import ContractGasEstimator, GasEstimate
+from hiero_sdk_python.contract.contract_id import ContractId
+from hiero_sdk_python.transaction.transaction_id import TransactionId
+
+
+pytestmark = pytest.mark.unit
+
+URL = "https://mirror.example/api/v1"
+CONTRACT = ContractId(0, 0, 1234)
+SELECTOR = bytes.fromhex("a9059cbb")
+
+
+class _Response:
+    def __init__(self, status_code: int, body: dict | None = None) -> None:
+        self.status_code = status_code
+        self._body = body or {}
+        self.text = str(body)
+
+    def json(self) -> dict:
+        return self._body
+
+
+class _Mirror:
+    """Stands in for the mirror node's /contracts/call endpoint."""
+
+    def __init__(self, gas: int = 50_000, result: bytes = bytes(64)) -> None:
+        self.gas = gas
+        self.result = result
+        self.requests: list[dict] = []
+        self.failures: list[int] = []
+
+    def post(self, url, json=None, timeout=None):
+        assert url == f"{URL}/contracts/call"
+        assert timeout is not None
+        self.requests.append(json)
+        if self.failures:
+            return _Response(self.failures.pop(0))
+        if json["estimate"]:
+            return _Response(200, {"result": hex(self.gas)})
+        return _Response(200, {"result": "0x" + self.result.hex()})
+
+
+@pytest.fixture
+def mirror():
+    return _Mirror()
+
+
+@pytest.fixture
+def estimator(mirror):
+    return ContractGasEstimator(URL, session=mirror)
+
+
+def test_estimate_simulates_once_per_shape(estimator, mirror):
+    first = estimator.estimate(CONTRACT, SELECTOR + bytes(64), sender=AccountId(0, 0, 2))
+    again = estimator.estimate(CONTRACT, SELECTOR + b"\x01" * 64)
+
+    assert first == again == GasEstimate(gas=50_000)
+    (request,) = mirror.requests
+    assert request["to"] == "0x" + CONTRACT.to_evm_address()
+    assert request["from"] == "0x" + AccountId(0, 0, 2).to_evm_address()
+    assert request["data"] == "0x" + (SELECTOR + bytes(64)).hex()
+    assert request["estimate"] is True
+
+
+def test_different_shapes_are_cached_separately(estimator, mirror):
+    estimator.estimate(CONTRACT, SELECTOR + bytes(64))
+    estimator.estimate(CONTRACT, SELECTOR + bytes(96))
+    estimator.estimate(CONTRACT, bytes.fromhex("70a08231") + bytes(64))
+    estimator.estimate(CONTRACT, SELECTOR + bytes(64), value=5)
+
+    assert len(mirror.requests) == 4
+    assert len(estimator) == 4
+
+
+def test_entries_expire_and_can_be_invalidated(mirror):
+    estimator = ContractGasEstimator(URL, ttl=10, session=mirror)
+    with patch("hiero_sdk_python.contract.contract_gas_estimator.time.monotonic", side_effect=[0, 5, 20, 20]):
+        estimator.estimate(CONTRACT, SELECTOR)
+        estimator.estimate(CONTRACT, SELECTOR)
+        estimator.estimate(CONTRACT, SELECTOR)
+    assert len(mirror.requests) == 2
+
+    estimator.invalidate(ContractId(0, 0, 1))
+    assert len(estimator) == 1
+    estimator.invalidate(CONTRACT)
+    assert len(estimator) == 0
+
+
+def test_lru_eviction(mirror):
+    estimator = ContractGasEstimator(URL, max_entries=2, session=mirror)
+    for num in range(3):
+        estimator.estimate(ContractId(0, 0, num), SELECTOR)
+
+    assert len(estimator) == 2
+    estimator.estimate(ContractId(0, 0, 0), SELECTOR)
+    assert len(mirror.requests) == 4
+
+
+def test_result_size_is_measured_on_demand(estimator, mirror):
+    estimator.estimate(CONTRACT, SELECTOR)
+    estimate = estimator.estimate(CONTRACT, SELECTOR, result_size=True)
+
+    assert estimate == GasEstimate(gas=50_000, result_size=64)
+    assert [request["estimate"] for request in mirror.requests] == [True, True, False]
+
+
+def test_retries_transient_errors(estimator, mirror):
+    mirror.failures = [503, 429]
+    with patch("hiero_sdk_python.contract.contract_gas_estimator.time.sleep"):
+        assert estimator.estimate(CONTRACT, SELECTOR).gas == 50_000
+    assert len(mirror.requests) == 3
+
+
+def test_reverted_simulation_raises(estimator, mirror):
+    mirror.failures = [400]
+    with pytest.raises(RuntimeError, match="HTTP 400"):
+        estimator.estimate(CONTRACT, SELECTOR)
+    assert len(estimator) == 0
+
+
+def test_margin_is_capped(mirror):
+    estimator = ContractGasEstimator(URL, safety_margin=0.25, max_gas=100_000, session=mirror)
+
+    assert estimator.with_margin(40_000) == 50_000
+    assert estimator.with_margin(90_000) == 100_000
+
+
+def test_query_fills_unset_gas_and_result_size(estimator, mirror, mock_client):
+    query = ContractCallQuery().set_contract_id(CONTRACT).set_function_parameters(SELECTOR).set_gas_estimator(estimator)
+    result = MagicMock()
+    with (
+        patch.object(ContractCallQuery, "_before_execute"),
+        patch.object(ContractCallQuery, "_execute", return_value=result),
+        patch("hiero_sdk_python.contract.contract_call_query.ContractFunctionResult._from_proto"),
+    ):
+        query.execute(mock_client)
+
+    assert query.gas == 60_000
+    assert query.max_result_size == 77
+    assert mirror.requests[0]["from"] == "0x" + mock_client.operator_account_id.to_evm_address()
+
+
+def test_explicit_values_are_kept(estimator, mirror):
+    query = ContractCallQuery(contract_id=CONTRACT, gas=1, max_result_size=2)
+    estimator.apply(query)
+
+    assert (query.gas, query.max_result_size) == (1, 2)
+    assert mirror.requests == []
+
+
+def test_transaction_estimates_gas_on_freeze(estimator, mirror, mock_client):
+    transaction = (
+        ContractExecuteTransaction()
+        .set_contract_id(CONTRACT)
+        .set_function_parameters(SELECTOR)
+        .set_payable_amount(7)
+        .set_gas_estimator(estimator)
+    )
+    transaction.transaction_id = TransactionId.generate(AccountId(0, 0, 99))
+
+    transaction.freeze_with(mock_client)
+
+    assert transaction.gas == 60_000
+    (request,) = mirror.requests
+    assert request["value"] == 7
+    assert request["from"] == "0x" + AccountId(0, 0, 99).to_evm_address()
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        ContractGasEstimator(URL, safety_margin=-0.1)
+    with pytest.raises(ValueError):
+        ContractGasEstimator(URL, max_entries=0)
+    with pytest.raises(ValueError, match="Contract ID"):
+        ContractGasEstimator(URL, session=_Mirror()).apply(ContractCallQuery())
@@ -0,0 +1,164 @@
+"""
+Unit tests for the ABI-driven Contract bindings.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import eth_abi
+import pytest
+from eth_utils import keccak
+
+from hiero_sdk_python.contract.contract import Contract
+from hiero_sdk_python.contract.contract_call_query import ContractCallQuery
+from hiero_sdk_python.contract.contract_execute_transaction import ContractExecuteTransaction
+from hiero_sdk_python.contract.contract_function_result import ContractFunctionResult
+from hiero_sdk_python.contract.contract_id import ContractId
+from hiero_sdk_python.contract.contract_log_info import ContractLogInfo
+
+
+pytestmark = pytest.mark.unit
+
+OWNER = "0x" + "11" * 20
+SPENDER = "0x" + "22" * 20
+
+ABI = [
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "stateMutability": "view",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "balance", "type": "uint256"}],
+    },
+    {
+        "type": "function",
+        "name": "info",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "string"}, {"name": "", "type": "uint8"}],
+    },
+    {
+        "type": "function",
+        "name": "approve",
+        "stateMutability": "nonpayable",
+        "inputs": [{"name": "spender", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        "outputs": [{"name": "", "type": "bool"}],
+    },
+    {
+        "type": "event",
+        "name": "Approval",
+        "anonymous": False,
+        "inputs": [
+            {"name": "owner", "type": "address", "indexed": True},
+            {"name": "spender", "type": "address", "indexed": True},
+            {"name": "value", "type": "uint256", "indexed": False},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "Note",
+        "anonymous": False,
+        "inputs": [
+            {"name": "text", "type": "string", "indexed": True},
+            {"name": "data", "type": "bytes", "indexed": False},
+        ],
+    },
+]
+
+
+@pytest.fixture
+def contract():
+    return Contract.from_abi(json.dumps(ABI), ContractId(0, 0, 1001))
+
+
+def _address_topic(address: str) -> bytes:
+    return eth_abi.encode(["address"], [address])
+
+
+def test_call_builds_query_and_decodes_named_outputs(contract, mock_client):
+    """Test that call() runs a ContractCallQuery and decodes into a named tuple."""
+    result = ContractFunctionResult(contract_call_result=eth_abi.encode(["uint256"], [500]))
+
+    with patch.object(ContractCallQuery, "execute", autospec=True, return_value=result) as execute:
+        balance = contract.balanceOf.call(mock_client, OWNER, gas=50_000)
+
+    assert balance == (500,)
+    assert balance.balance == 500
+
+    query = execute.call_args.args[0]
+    assert query.contract_id == ContractId(0, 0, 1001)
+    assert query.gas == 50_000
+    assert query.function_parameters == contract.balanceOf.encode(OWNER)
+
+
+def test_unnamed_outputs_decode_to_plain_tuples(contract):
+    data = eth_abi.encode(["string", "uint8"], ["Token", 18])
+
+    decoded = contract.info.decode(data)
+
+    assert decoded == ("Token", 18)
+    assert type(decoded) is tuple
+
+
+def test_execute_builds_contract_execute_transaction(contract, mock_client):
+    with patch.object(ContractExecuteTransaction, "execute", autospec=True, return_value="receipt") as execute:
+        receipt = contract.function("approve(address,uint256)").execute(mock_client, SPENDER, 7, gas=90_000)
+
+    assert receipt == "receipt"
+    transaction = execute.call_args.args[0]
+    assert transaction.contract_id == ContractId(0, 0, 1001)
+    assert transaction.gas == 90_000
+    assert transaction.function_parameters == contract.approve.encode(SPENDER, 7)
+
+
+def test_events_decode_indexed_and_data_arguments(contract):
+    """Test that logs are decoded by their topic into named tuples."""
+    approval = contract.event("Approval")
+    log = ContractLogInfo(
+        contract_id=ContractId(0, 0, 1001),
+        topics=[keccak(text="Approval(address,address,uint256)"), _address_topic(OWNER), _address_topic(SPENDER)],
+        data=eth_abi.encode(["uint256"], [42]),
+    )
+
+    assert approval.topic == keccak(text="Approval(address,address,uint256)")
+    event, args = contract.decode_log(log)
+    assert event is approval
+    assert args == (OWNER, SPENDER, 42)
+    assert args.spender == SPENDER
+
+
+def test_indexed_dynamic_event_arguments_are_returned_as_hashes(contract):
+    text_hash = keccak(text="hello")
+    log = ContractLogInfo(
+        topics=[keccak(text="Note(string,bytes)"), text_hash],
+        data=eth_abi.encode(["bytes"], [b"\x01\x02"]),
+    )
+
+    assert contract.event("Note").decode_log(log) == (text_hash, b"\x01\x02")
+
+
+def test_decode_log_mismatches(contract):
+    assert contract.decode_log(ContractLogInfo(topics=[b"\x00" * 32])) is None
+    assert contract.decode_log(ContractLogInfo()) is None
+
+    with pytest.raises(ValueError, match="is not a Approval"):
+        contract.event("Approval").decode_log(ContractLogInfo(topics=[keccak(text="Note(string,bytes)")]))
+
+
+def test_unknown_functions_and_missing_contract_id(contract):
+    with pytest.raises(AttributeError, match="No function 'transfer'"):
+        _ = contract.transfer
+    with pytest.raises(ValueError, match="No event"):
+        contract.event("Transfer")
+
+    unbound = Contract.from_abi(ABI)
+    with pytest.raises(ValueError, match="Contract ID must be set"):
+        unbound.balanceOf.query(OWNER)
+
+    rebound = unbound.with_contract_id(ContractId(0, 0, 5))
+    assert rebound.balanceOf.query(OWNER).contract_id == ContractId(0, 0, 5)
+    assert rebound.balanceOf.function is unbound.balanceOf.function
+    assert len(rebound.functions) == 3
+    assert [event.name for event in rebound.events] == ["Approval", "Note"]
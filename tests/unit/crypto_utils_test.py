@@ -5,11 +5,16 @@ from __future__ import annotations
 import pytest
 from cryptography.hazmat.primitives.asymmetric import ec
 
+from hiero_sdk_python.utils import crypto_utils
 from hiero_sdk_python.utils.crypto_utils import (
+    KECCAK_BACKENDS,
+    OPT_IN_KECCAK_BACKENDS,
     compress_point_unchecked,
     compress_with_cryptography,
     decompress_point,
     keccak256,
+    keccak256_many,
+    load_keccak_backend,
 )
 
 
@@ -28,6 +33,111 @@ def test_keccak256():
     assert keccak256(b"Transfer").hex() == "f099cd8bde557814842a3121e8ddfd433a539b8c9f14bf31ebf108d12e6196e9"
 
 
+@pytest.mark.parametrize("name", KECCAK_BACKENDS + OPT_IN_KECCAK_BACKENDS)
+def test_keccak_backends_agree(name):
+    """Every available backend produces the same digests."""
+    try:
+        backend = load_keccak_backend(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+    for data in (b"", b"hello", bytes(range(256)) * 20, bytearray(b"abc"), memoryview(b"x" * 135)):
+        assert backend(data) == crypto_utils._pycryptodome_backend()(bytes(data))
+
+
+def test_keccak_backend_is_selected_once():
+    """A backend is selected at import and used by keccak256."""
+    assert crypto_utils.KECCAK_BACKEND in KECCAK_BACKENDS + OPT_IN_KECCAK_BACKENDS
+    with pytest.raises(ValueError, match="Unknown keccak backend"):
+        load_keccak_backend("md5")
+
+
+def test_opt_in_keccak_backends_are_only_used_when_named(monkeypatch):
+    """The raw pycryptodome backend is skipped unless HIERO_KECCAK_BACKEND names it."""
+    monkeypatch.delenv("HIERO_KECCAK_BACKEND", raising=False)
+    assert crypto_utils._select_keccak_backend()[0] in KECCAK_BACKENDS
+
+    pytest.importorskip("Crypto")
+    try:
+        load_keccak_backend("pycryptodome-raw")
+    except ImportError:
+        pytest.skip("pycryptodome-raw is not available")
+    monkeypatch.setenv("HIERO_KECCAK_BACKEND", "pycryptodome-raw")
+    assert crypto_utils._select_keccak_backend()[0] == "pycryptodome-raw"
+
+
+@pytest.mark.parametrize("version", ["3.17.0", "4.0.0", "dev"])
+def test_raw_keccak_backend_requires_a_supported_pycryptodome(monkeypatch, version):
+    """The raw backend refuses pycryptodome releases outside the supported range."""
+    crypto = pytest.importorskip("Crypto")
+    monkeypatch.setattr(crypto, "__version__", version)
+
+    with pytest.raises(ImportError, match="pycryptodome"):
+        load_keccak_backend("pycryptodome-raw")
+
+
+def test_raw_keccak_backend_checks_return_codes(monkeypatch):
+    """A failing Keccak C call raises instead of returning a stale digest."""
+    try:
+        load_keccak_backend("pycryptodome-raw")
+    except ImportError:
+        pytest.skip("pycryptodome-raw is not available")
+    from Crypto.Hash import keccak
+
+    class FailingLib:
+        def __init__(self, lib):
+            self._lib = lib
+
+        def __getattr__(self, name):
+            return getattr(self._lib, name)
+
+        def keccak_absorb(self, *_args):
+            return 1
+
+    monkeypatch.setattr(keccak, "_raw_keccak_lib", FailingLib(keccak._raw_keccak_lib))
+
+    with pytest.raises(ImportError, match="Error while hashing"):
+        load_keccak_backend("pycryptodome-raw")
+
+
+def test_keccak_backends_are_checked_against_a_multi_block_vector(monkeypatch):
+    """A backend that only gets short inputs right is rejected."""
+
+    def short_only(data):
+        return crypto_utils._pycryptodome_backend()(bytes(data)[:136])
+
+    monkeypatch.setitem(crypto_utils._BACKEND_LOADERS, "pycryptodome", lambda: short_only)
+
+    with pytest.raises(ImportError, match="wrong digest"):
+        load_keccak_backend("pycryptodome")
+
+
+def test_keccak256_many():
+    """keccak256_many hashes each input in order."""
+    items = [b"", b"hello", b"Transfer", bytes(1000)]
+    assert keccak256_many(items) == [keccak256(item) for item in items]
+    assert keccak256_many(iter([])) == []
+
+
+def test_keccak_raw_backend_is_thread_safe():
+    """Concurrent hashing through the selected backend returns correct digests."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    items = [bytes([i]) * (i * 7) for i in range(200)]
+    expected = [crypto_utils._pycryptodome_backend()(item) for item in items]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(keccak256, items)) == expected
+
+
+def test_keccak_unavailable(monkeypatch):
+    """keccak256 raises when no backend could be loaded."""
+    monkeypatch.setattr(crypto_utils, "_keccak256", None)
+    with pytest.raises(RuntimeError, match="Keccak not available"):
+        crypto_utils.keccak256(b"")
+    with pytest.raises(RuntimeError, match="Keccak not available"):
+        crypto_utils.keccak256_many([b""])
+
+
 def test_compress_point_unchecked():
     """Test point compression logic."""
     # Use cryptography to generate a valid point
@@ -1,16 +1,31 @@
 from __future__ import annotations
 
+import copy
+import pickle
 import struct
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.consensus.topic_id import TopicId
+from hiero_sdk_python.contract.contract_id import ContractId
+from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.hapi.services import basic_types_pb2
+from hiero_sdk_python.schedule.schedule_id import ScheduleId
+from hiero_sdk_python.tokens.nft_id import NftId
+from hiero_sdk_python.tokens.token_id import TokenId
 from hiero_sdk_python.utils.entity_id_helper import (
+    disable_interning,
+    enable_interning,
     format_to_string,
     format_to_string_with_checksum,
     generate_checksum,
+    intern_entity_id,
+    parse_entity_id,
     parse_from_string,
+    parse_many,
     perform_query_to_mirror_node,
     to_solidity_address,
     validate_checksum,
@@ -230,3 +245,154 @@ def test_perform_query_to_mirror_node_invalid_url_empty():
     """Test url must be a non-empty string (empty string case)."""
     with pytest.raises(ValueError, match="url must be a non-empty string"):
         perform_query_to_mirror_node("")
+
+
+@pytest.fixture
+def interning():
+    """Enable interning for FileId and TokenId for the duration of a test."""
+    enable_interning(FileId, TokenId, max_size=2)
+    yield
+    disable_interning()
+
+
+def test_intern_entity_id_disabled_creates_new_instances():
+    """Without interning every call returns a new, equal instance."""
+    first = intern_entity_id(TokenId, 0, 0, 5)
+    second = intern_entity_id(TokenId, 0, 0, 5)
+
+    assert first == second
+    assert first is not second
+
+
+def test_intern_entity_id_returns_shared_instance(interning):
+    """With interning enabled the same (shard, realm, num) yields the same object."""
+    proto = basic_types_pb2.TokenID(shardNum=0, realmNum=0, tokenNum=5)
+
+    assert TokenId._from_proto(proto) is TokenId._from_proto(proto)
+    assert FileId._from_proto(basic_types_pb2.FileID(fileNum=7)) is intern_entity_id(FileId, 0, 0, 7)
+
+
+def test_intern_entity_id_respects_max_size(interning):
+    """Once the table is full, new IDs are created but not interned."""
+    intern_entity_id(TokenId, 0, 0, 1)
+    intern_entity_id(TokenId, 0, 0, 2)
+
+    assert intern_entity_id(TokenId, 0, 0, 3) is not intern_entity_id(TokenId, 0, 0, 3)
+    assert intern_entity_id(TokenId, 0, 0, 1) is intern_entity_id(TokenId, 0, 0, 1)
+
+
+def test_mutable_account_ids_are_never_interned():
+    """AccountId is mutable, so sharing instances would let one holder change another's ID."""
+    with pytest.raises(TypeError, match="AccountId instances are mutable"):
+        enable_interning(AccountId)
+
+    proto = basic_types_pb2.AccountID(accountNum=7)
+    assert AccountId._from_proto(proto) is not AccountId._from_proto(proto)
+
+
+def test_interned_ids_cannot_be_changed_through_their_proto(interning):
+    """Changing a returned protobuf message does not change the shared interned ID."""
+    token_id = TokenId._from_proto(basic_types_pb2.TokenID(tokenNum=5))
+    token_id._to_proto().tokenNum = 99
+
+    assert token_id._to_proto().tokenNum == 5
+    assert TokenId._from_proto(basic_types_pb2.TokenID(tokenNum=5)).num == 5
+
+
+def test_disable_interning_for_single_class(interning):
+    """Disabling one class leaves interning active for the others."""
+    disable_interning(TokenId)
+
+    assert intern_entity_id(TokenId, 0, 0, 5) is not intern_entity_id(TokenId, 0, 0, 5)
+    assert intern_entity_id(FileId, 0, 0, 5) is intern_entity_id(FileId, 0, 0, 5)
+
+
+@pytest.mark.parametrize(
+    "entity_id",
+    [
+        TokenId.from_string("0.0.5-vfmkw"),
+        FileId(0, 0, 112),
+        TopicId(1, 2, 3),
+        ContractId(0, 0, 1001),
+        ContractId(evm_address=bytes(range(20))),
+        ScheduleId(0, 0, 42),
+        NftId(TokenId(0, 0, 5), 7),
+    ],
+    ids=lambda entity_id: type(entity_id).__name__,
+)
+@pytest.mark.parametrize(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda entity_id: pickle.loads(pickle.dumps(entity_id))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_entity_ids_copy_and_pickle_after_to_proto(entity_id, clone):
+    """IDs whose protobuf form has been cached can still be copied and pickled."""
+    proto = entity_id._to_proto()
+
+    cloned = clone(entity_id)
+
+    assert cloned == entity_id
+    assert hash(cloned) == hash(entity_id)
+    assert getattr(cloned, "checksum", None) == getattr(entity_id, "checksum", None)
+    assert cloned._to_proto() == proto
+
+
+def test_enable_interning_invalid_max_size():
+    """max_size must be positive."""
+    with pytest.raises(ValueError, match="max_size must be a positive integer"):
+        enable_interning(TokenId, max_size=0)
+
+
+def test_parse_entity_id_returns_integers():
+    """parse_entity_id returns integer components and an optional checksum."""
+    assert parse_entity_id("1.2.3") == (1, 2, 3, None)
+    assert parse_entity_id("0.0.123-vfmkw") == (0, 0, 123, "vfmkw")
+
+
+@pytest.mark.parametrize(
+    "invalid_address",
+    ["0.00.123", "0.0.123\n0", "0.0.-1", "0.0.١", "0.0.123-VFMKW", "0.0.1.2", "", "-abcde"],
+)
+def test_parse_entity_id_rejects_invalid_addresses(invalid_address):
+    """The fast path rejects everything ID_REGEX rejects."""
+    with pytest.raises(ValueError, match="Invalid format for entity ID"):
+        parse_entity_id(invalid_address)
+
+
+def test_parse_many_returns_flat_triples():
+    """Without an id_class, parse_many returns a flat array of (shard, realm, num) triples."""
+    triples = parse_many(["0.0.1", "1.2.3-abcde", "0.0.99"])
+
+    assert triples.typecode == "q"
+    assert list(triples) == [0, 0, 1, 1, 2, 3, 0, 0, 99]
+
+
+def test_parse_many_returns_entity_ids():
+    """With an id_class, parse_many returns instances and keeps checksums."""
+    token_ids = parse_many(["0.0.1", "0.0.123-vfmkw"], TokenId)
+
+    assert [str(token_id) for token_id in token_ids] == ["0.0.1", "0.0.123"]
+    assert token_ids[0].checksum is None
+    assert token_ids[1].checksum == "vfmkw"
+
+
+def test_parse_many_reports_invalid_index():
+    """The index of the first invalid string is included in the error."""
+    with pytest.raises(ValueError, match="Invalid entity ID at index 1"):
+        parse_many(["0.0.1", "0.0.x"])
+
+
+@pytest.mark.parametrize("id_class", [None, TokenId])
+@pytest.mark.parametrize("item", [None, 5, b"0.0.1"])
+def test_parse_many_rejects_non_strings(id_class, item):
+    """Items that are not strings raise the documented ValueError."""
+    with pytest.raises(ValueError, match="Invalid entity ID at index 1"):
+        parse_many(["0.0.1", item], id_class)
+
+
+@pytest.mark.parametrize("address", ["0.0.99999999999999999999", "9223372036854775808.0.1"])
+def test_parse_many_rejects_numbers_too_large_for_the_array(address):
+    """Without an id_class, numbers that do not fit in 64 bits raise ValueError, not OverflowError."""
+    with pytest.raises(ValueError, match="Invalid entity ID at index 0") as exc_info:
+        parse_many([address])
+    assert isinstance(exc_info.value.__cause__, OverflowError)
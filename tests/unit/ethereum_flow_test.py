@@ -0,0 +1,71 @@
+"""
+Unit tests for EthereumFlow.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from hiero_sdk_python.contract.ethereum_flow import EthereumFlow
+from hiero_sdk_python.contract.ethereum_transaction import EthereumTransaction
+from hiero_sdk_python.contract.ethereum_transaction_data import (
+    EthereumTransactionData,
+    EthereumTransactionDataEip1559,
+)
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.file.file_id import FileId
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def network(file_network):
+    with patch.object(EthereumTransaction, "execute", autospec=True, side_effect=file_network.submit):
+        yield file_network
+
+
+def _signed(call_data: bytes) -> EthereumTransactionDataEip1559:
+    data = EthereumTransactionDataEip1559(chain_id=298, gas_limit=1_000_000, to=b"\x11" * 20, call_data=call_data)
+    return data.sign(PrivateKey.generate_ecdsa())
+
+
+def test_small_transaction_is_sent_inline(network, mock_client):
+    data = _signed(b"\x01" * 100)
+
+    EthereumFlow().set_ethereum_data(data.to_bytes()).set_max_gas_allowed(5).execute(mock_client)
+
+    (transaction,) = network.submitted
+    assert transaction.ethereum_data == data.to_bytes()
+    assert transaction.call_data is None
+    assert transaction.max_gas_allowed == 5
+    assert network.created_files == []
+
+
+def test_large_call_data_moves_to_a_file(network, mock_client):
+    call_data = bytes(range(256)) * 40
+    data = _signed(call_data)
+    flow = EthereumFlow().set_ethereum_data(data)
+
+    flow.execute(mock_client)
+
+    (transaction,) = network.submitted
+    assert transaction.call_data == flow.call_data_file_id == FileId(0, 0, 501)
+    sent = EthereumTransactionData.from_bytes(transaction.ethereum_data)
+    assert sent.call_data == b""
+    assert (sent.r, sent.s) == (data.r, data.s)
+    assert b"".join(
+        [*network.created_files, *(append.contents for append in network.appends)]
+    ) == call_data.hex().encode("ascii")
+    assert network.deleted == [FileId(0, 0, 501)]
+
+
+def test_validation(mock_client):
+    with pytest.raises(ValueError, match="required"):
+        EthereumFlow().execute(mock_client)
+    with pytest.raises(TypeError):
+        EthereumFlow().set_ethereum_data("0x02")
+    with pytest.raises(ValueError):
+        EthereumFlow().set_max_data_size(0)
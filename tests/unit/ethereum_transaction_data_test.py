@@ -0,0 +1,176 @@
+"""
+Unit tests for EthereumTransactionData signing and encoding.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from hiero_sdk_python.contract import ethereum_transaction_data
+from hiero_sdk_python.contract.ethereum_transaction_data import (
+    EthereumTransactionData,
+    EthereumTransactionDataEip1559,
+    EthereumTransactionDataLegacy,
+    recover_public_key,
+    sign_recoverable,
+)
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.utils.crypto_utils import keccak256
+
+
+pytestmark = pytest.mark.unit
+
+TO = bytes.fromhex("11" * 20)
+
+
+@pytest.fixture
+def ecdsa_key():
+    return PrivateKey.generate_ecdsa()
+
+
+def _eip1559(**overrides):
+    fields = {
+        "chain_id": 298,
+        "nonce": 7,
+        "max_priority_gas": 0,
+        "max_gas": 710_000_000_000,
+        "gas_limit": 300_000,
+        "to": TO,
+        "value": 10**10,
+        "call_data": bytes.fromhex("a9059cbb") + bytes(64),
+        "access_list": [(bytes.fromhex("22" * 20), [bytes(32)])],
+    }
+    fields.update(overrides)
+    return EthereumTransactionDataEip1559(**fields)
+
+
+HALF_N = 0x7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF5D576E7357A4501DDFE92F46681B20A0
+
+
+def test_signatures_recover_to_the_signer_with_low_s(ecdsa_key):
+    public_key = ecdsa_key.public_key().to_bytes_ecdsa()
+
+    for nonce in range(20):
+        message_hash = keccak256(nonce.to_bytes(4, "big"))
+        recovery_id, r, s = sign_recoverable(ecdsa_key, message_hash)
+        assert recovery_id in (0, 1)
+        assert s <= HALF_N
+        assert recover_public_key(message_hash, recovery_id, r, s).to_bytes_ecdsa() == public_key
+
+
+def test_cryptography_signer_matches_the_selected_signer(ecdsa_key):
+    public_key = ecdsa_key.public_key().to_bytes_ecdsa()
+
+    for nonce in range(20):
+        message_hash = keccak256(nonce.to_bytes(4, "big"))
+        recovery_id, r, s = ethereum_transaction_data._sign_with_cryptography(ecdsa_key, message_hash)
+        assert s <= HALF_N
+        assert recover_public_key(message_hash, recovery_id, r, s).to_bytes_ecdsa() == public_key
+        assert (recovery_id, r, s) == sign_recoverable(ecdsa_key, message_hash)
+
+
+def test_coincurve_signer_matches_the_cryptography_signer(ecdsa_key):
+    pytest.importorskip("coincurve")
+    sign = ethereum_transaction_data._coincurve_signer()
+
+    for nonce in range(20):
+        message_hash = keccak256(nonce.to_bytes(4, "big"))
+        assert sign(ecdsa_key, message_hash) == ethereum_transaction_data._sign_with_cryptography(
+            ecdsa_key, message_hash
+        )
+
+
+def test_recovered_keys_match_eth_keys(ecdsa_key):
+    eth_keys = pytest.importorskip("eth_keys")
+
+    for nonce in range(10):
+        message_hash = keccak256(nonce.to_bytes(4, "big"))
+        recovery_id, r, s = sign_recoverable(ecdsa_key, message_hash)
+        for candidate in (0, 1):
+            expected = eth_keys.keys.Signature(vrs=(candidate, r, s)).recover_public_key_from_msg_hash(message_hash)
+            recovered = recover_public_key(message_hash, candidate, r, s)
+            assert recovered.to_bytes_ecdsa(compressed=False)[1:] == expected.to_bytes()
+
+
+def test_eip1559_encoding_matches_reference(ecdsa_key):
+    reference = pytest.importorskip("rlp")
+    data = _eip1559().sign(ecdsa_key)
+
+    encoded = data.to_bytes()
+    assert encoded[:1] == b"\x02"
+    fields = reference.decode(encoded[1:])
+    assert len(fields) == 12
+    assert fields[5] == TO
+    assert data.signing_hash() == keccak256(b"\x02" + reference.encode(fields[:9]))
+
+
+@pytest.mark.parametrize("chain_id", [None, 298])
+def test_signed_transactions_recover_to_the_sender(ecdsa_key, chain_id):
+    sender = ecdsa_key.public_key().to_evm_address()
+
+    for data in (
+        _eip1559().sign(ecdsa_key),
+        EthereumTransactionDataLegacy(nonce=1, gas_price=10, gas_limit=21_000, to=TO, value=1, chain_id=chain_id).sign(
+            ecdsa_key
+        ),
+    ):
+        recovered = recover_public_key(data.signing_hash(), data.recovery_id, data.r, data.s)
+        assert recovered.to_evm_address() == sender
+
+
+def test_legacy_v_follows_eip155(ecdsa_key):
+    protected = EthereumTransactionDataLegacy(nonce=1, to=TO, chain_id=298).sign(ecdsa_key)
+    unprotected = EthereumTransactionDataLegacy(nonce=1, to=TO).sign(ecdsa_key)
+
+    assert protected.v in (298 * 2 + 35, 298 * 2 + 36)
+    assert unprotected.v in (27, 28)
+
+
+def test_signing_is_deterministic_with_low_s(ecdsa_key):
+    first = _eip1559().sign(ecdsa_key)
+    second = _eip1559().sign(ecdsa_key)
+
+    assert first.to_bytes() == second.to_bytes()
+    assert first.s <= HALF_N
+
+
+def test_from_bytes_round_trip(ecdsa_key):
+    eip1559 = _eip1559(to="0x" + "33" * 20).sign(ecdsa_key)
+    legacy = EthereumTransactionDataLegacy(nonce=3, gas_price=5, gas_limit=9, call_data="0xabcd", chain_id=296).sign(
+        ecdsa_key
+    )
+
+    assert EthereumTransactionData.from_bytes(eip1559.to_bytes()) == eip1559
+    assert EthereumTransactionData.from_bytes(legacy.to_bytes()) == legacy
+    assert EthereumTransactionData.from_bytes(legacy.to_bytes()).chain_id == 296
+
+
+def test_without_call_data_keeps_the_signature(ecdsa_key):
+    data = _eip1559().sign(ecdsa_key)
+    stripped = data.without_call_data()
+
+    assert stripped.call_data == b""
+    assert (stripped.recovery_id, stripped.r, stripped.s) == (data.recovery_id, data.r, data.s)
+    assert data.call_data
+
+
+def test_invalid_inputs(ecdsa_key):
+    with pytest.raises(ValueError, match="ECDSA"):
+        _eip1559().sign(PrivateKey.generate_ed25519())
+    with pytest.raises(ValueError, match="32 bytes"):
+        sign_recoverable(ecdsa_key, b"short")
+    with pytest.raises(ValueError, match="Invalid signature"):
+        recover_public_key(bytes(32), 2, 1, 1)
+    with pytest.raises(ValueError, match="20-byte"):
+        _eip1559(to=b"\x01" * 19)
+    with pytest.raises(ValueError, match="Unsupported"):
+        EthereumTransactionData.from_bytes(b"\x01\xc0")
+
+
+@pytest.mark.parametrize("v", [0, 1, 26, 29, 34])
+def test_legacy_from_bytes_rejects_invalid_v(ecdsa_key, v):
+    signed = EthereumTransactionDataLegacy(nonce=1, to=TO).sign(ecdsa_key)
+    data = EthereumTransactionDataLegacy(nonce=1, to=TO, v=v, r=signed.r, s=signed.s).to_bytes()
+
+    with pytest.raises(ValueError, match="Invalid legacy transaction v"):
+        EthereumTransactionData.from_bytes(data)
@@ -151,6 +151,20 @@ def test_multi_chunk_execution():
         assert Transaction.execute.call_count == 3
 
 
+def test_build_proto_body_slices_chunks_without_reencoding():
+    """Test that chunks are sliced from one buffer and reused while the chunk is rebuilt."""
+    content = memoryview(b"Chunk1Chunk2Chu")
+    file_tx = FileAppendTransaction(file_id=FileId(0, 0, 12345), contents=content, chunk_size=6)
+
+    chunks = []
+    for index in range(file_tx.get_required_chunks()):
+        file_tx._current_chunk_index = index
+        chunks.append(file_tx._build_proto_body().contents)
+
+    assert chunks == [b"Chunk1", b"Chunk2", b"Chu"]
+    assert file_tx._current_chunk(content) is file_tx._current_chunk(content)
+
+
 def test_build_transaction_body_missing_file_id():
     """Test build_transaction_body raises error when file ID is missing."""
     file_tx = FileAppendTransaction()
@@ -0,0 +1,100 @@
+"""Unit tests for FileContentsCache."""
+
+from __future__ import annotations
+
+import pytest
+
+from hiero_sdk_python.file import file_contents_cache
+from hiero_sdk_python.file.file_contents_cache import FileContentsCache
+from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.file.file_info import FileInfo
+from hiero_sdk_python.timestamp import Timestamp
+
+
+pytestmark = pytest.mark.unit
+
+
+def _info(file_id: FileId, size: int, memo: str = "") -> FileInfo:
+    return FileInfo(file_id=file_id, size=size, expiration_time=Timestamp(1_000, 5), file_memo=memo)
+
+
+def test_get_returns_contents_while_metadata_is_unchanged():
+    """Test hits for unchanged metadata and eviction of stale entries."""
+    cache = FileContentsCache()
+    file_id = FileId(0, 0, 102)
+    cache.put(file_id, _info(file_id, 3), b"abc")
+
+    assert cache.get(file_id, _info(file_id, 3)) == b"abc"
+    assert cache.get(file_id, _info(file_id, 3, memo="updated")) is None
+    assert file_id not in cache
+
+
+def test_get_rejects_contents_that_do_not_match_size():
+    """Test that an entry whose contents disagree with the reported size is stale."""
+    cache = FileContentsCache()
+    file_id = FileId(0, 0, 102)
+    cache.put(file_id, _info(file_id, 3), b"abc")
+    cache.put(file_id, _info(file_id, 3), b"abcd")
+
+    assert file_id not in cache
+    assert cache.get(file_id, _info(file_id, 3)) is None
+
+
+def test_same_size_updates_are_refetched_after_the_default_max_age(monkeypatch):
+    """Test that entries are not trusted forever on metadata that cannot see same-size edits."""
+    now = [100.0]
+    monkeypatch.setattr(file_contents_cache.time, "monotonic", lambda: now[0])
+    cache = FileContentsCache()
+    file_id = FileId(0, 0, 112)
+    cache.put(file_id, _info(file_id, 3), b"old")
+
+    assert cache.max_age == file_contents_cache.DEFAULT_MAX_AGE
+    assert cache.get(file_id, _info(file_id, 3)) == b"old"
+    now[0] += file_contents_cache.DEFAULT_MAX_AGE + 1
+    assert cache.get(file_id, _info(file_id, 3)) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test that max_entries bounds the cache in LRU order."""
+    cache = FileContentsCache(max_entries=2)
+    ids = [FileId(0, 0, num) for num in (1, 2, 3)]
+    cache.put(ids[0], _info(ids[0], 1), b"1")
+    cache.put(ids[1], _info(ids[1], 1), b"2")
+    cache.get(ids[0], _info(ids[0], 1))
+    cache.put(ids[2], _info(ids[2], 1), b"3")
+
+    assert len(cache) == 2
+    assert ids[0] in cache
+    assert ids[1] not in cache
+
+
+def test_max_age_expires_entries(monkeypatch):
+    """Test that entries older than max_age are refetched."""
+    now = [100.0]
+    monkeypatch.setattr(file_contents_cache.time, "monotonic", lambda: now[0])
+    cache = FileContentsCache(max_age=10)
+    file_id = FileId(0, 0, 111)
+    cache.put(file_id, _info(file_id, 1), b"x")
+
+    now[0] = 105.0
+    assert cache.get(file_id, _info(file_id, 1)) == b"x"
+    now[0] = 111.0
+    assert cache.get(file_id, _info(file_id, 1)) is None
+
+
+def test_invalidate_and_validation():
+    """Test explicit invalidation and constructor validation."""
+    cache = FileContentsCache()
+    ids = [FileId(0, 0, num) for num in (1, 2)]
+    for file_id in ids:
+        cache.put(file_id, _info(file_id, 1), b"1")
+
+    cache.invalidate(ids[0])
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError, match="max_entries"):
+        FileContentsCache(max_entries=0)
+    with pytest.raises(ValueError, match="max_age"):
+        FileContentsCache(max_age=-1)
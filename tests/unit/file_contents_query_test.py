@@ -4,19 +4,25 @@ Unit tests for FileContentsQuery.
 
 from __future__ import annotations
 
-from unittest.mock import Mock
+import io
+from unittest.mock import Mock, patch
 
 import pytest
 
+from hiero_sdk_python.file.file_contents_cache import FileContentsCache
 from hiero_sdk_python.file.file_contents_query import FileContentsQuery
 from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.file.file_info import FileInfo
+from hiero_sdk_python.file.file_info_query import FileInfoQuery
 from hiero_sdk_python.hapi.services import (
     file_get_contents_pb2,
     response_header_pb2,
     response_pb2,
 )
 from hiero_sdk_python.hapi.services.query_header_pb2 import ResponseType
+from hiero_sdk_python.hbar import Hbar
 from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.timestamp import Timestamp
 from tests.unit.mock_server import mock_hedera_servers
 
 
@@ -115,3 +121,86 @@ def get_file_contents_responses(file_contents_response):
             ),
         ]
     ]
+
+
+def _fake_fetch(contents_by_file):
+    def fetch(query, client, timeout=None):
+        return contents_by_file[query.file_id]
+
+    return fetch
+
+
+@pytest.mark.parametrize("sink_factory", [io.BytesIO, bytearray])
+def test_execute_to_writes_into_sink(mock_client, sink_factory):
+    """Test that execute_to writes the contents into file objects and bytearrays."""
+    file_id = FileId(0, 0, 150)
+    sink = sink_factory()
+
+    with patch.object(FileContentsQuery, "_fetch_contents", autospec=True, side_effect=_fake_fetch({file_id: b"data"})):
+        written = FileContentsQuery(file_id).execute_to(mock_client, sink)
+
+    assert written == 4
+    assert bytes(sink.getvalue() if isinstance(sink, io.BytesIO) else sink) == b"data"
+
+
+def test_execute_to_memoryview_sink(mock_client):
+    """Test that a memoryview sink is filled from its start and must be large enough."""
+    file_id = FileId(0, 0, 150)
+    buffer = bytearray(6)
+
+    with patch.object(FileContentsQuery, "_fetch_contents", autospec=True, side_effect=_fake_fetch({file_id: b"data"})):
+        assert FileContentsQuery(file_id).execute_to(mock_client, memoryview(buffer)) == 4
+        with pytest.raises(ValueError, match="holds 2 bytes"):
+            FileContentsQuery(file_id).execute_to(mock_client, memoryview(buffer)[:2])
+        with pytest.raises(TypeError, match="sink must be"):
+            FileContentsQuery(file_id).execute_to(mock_client, "not a sink")
+
+    assert buffer == bytearray(b"data\x00\x00")
+
+
+def test_execute_with_cache_skips_download_for_unchanged_file(mock_client):
+    """Test that cached contents are reused until the file metadata changes."""
+    file_id = FileId(0, 0, 111)
+    cache = FileContentsCache()
+    info = FileInfo(file_id=file_id, size=4, expiration_time=Timestamp(100, 0), file_memo="fees")
+    fetch = Mock(side_effect=_fake_fetch({file_id: b"v1.."}))
+
+    with (
+        patch.object(FileContentsQuery, "_fetch_contents", autospec=True, side_effect=fetch),
+        patch.object(FileInfoQuery, "execute", autospec=True, side_effect=lambda *_args, **_kwargs: info),
+    ):
+        first = FileContentsQuery(file_id).set_cache(cache).execute(mock_client)
+        second = FileContentsQuery(file_id).set_cache(cache).execute(mock_client)
+        assert fetch.call_count == 1
+
+        info = FileInfo(file_id=file_id, size=4, expiration_time=Timestamp(200, 0), file_memo="fees")
+        FileContentsQuery(file_id).set_cache(cache).execute(mock_client)
+
+    assert first == second == b"v1.."
+    assert fetch.call_count == 2
+
+
+def test_execute_many_fetches_each_file_once(mock_client):
+    """Test concurrent fetching of several files, with duplicates collapsed."""
+    contents = {FileId(0, 0, num): f"file-{num}".encode() for num in (101, 102, 111, 112)}
+    fetched = []
+
+    def fetch(query, client, timeout=None):
+        fetched.append(query.file_id)
+        assert query.payment_amount == Hbar(1)
+        return contents[query.file_id]
+
+    with patch.object(FileContentsQuery, "_fetch_contents", autospec=True, side_effect=fetch):
+        result = FileContentsQuery.execute_many(
+            mock_client,
+            [FileId(0, 0, 112), FileId(0, 0, 101), FileId(0, 0, 112), FileId(0, 0, 102)],
+            max_workers=2,
+            query_payment=Hbar(1),
+        )
+
+    assert list(result) == [FileId(0, 0, 112), FileId(0, 0, 101), FileId(0, 0, 102)]
+    assert result[FileId(0, 0, 101)] == b"file-101"
+    assert sorted(fetched, key=str) == [FileId(0, 0, 101), FileId(0, 0, 102), FileId(0, 0, 112)]
+
+    with pytest.raises(ValueError, match="max_workers must be positive"):
+        FileContentsQuery.execute_many(mock_client, [], max_workers=0)
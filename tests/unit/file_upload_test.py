@@ -0,0 +1,362 @@
+"""Tests for streamed file contents and the upload_file helper."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.exceptions import MaxAttemptsError, PrecheckError
+from hiero_sdk_python.file.file_append_transaction import FileAppendTransaction
+from hiero_sdk_python.file.file_contents_stream import _FileContentsStream
+from hiero_sdk_python.file.file_create_transaction import FileCreateTransaction
+from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.file.file_info_query import FileInfoQuery
+from hiero_sdk_python.file.file_upload import UploadCheckpoint, upload_file
+from hiero_sdk_python.hapi.services import transaction_pb2
+from hiero_sdk_python.query.transaction_get_receipt_query import TransactionGetReceiptQuery
+from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.transaction.transaction import Transaction
+from hiero_sdk_python.transaction.transaction_id import TransactionId
+
+
+pytestmark = pytest.mark.unit
+
+# 251 is prime, so no two 512-byte chunks are equal.
+CONTENTS = bytes(i % 251 for i in range(2560))
+
+
+@pytest.fixture
+def contents_file(tmp_path):
+    path = tmp_path / "contents.bin"
+    path.write_bytes(CONTENTS)
+    return path
+
+
+def test_contents_stream_from_path_is_memory_mapped(contents_file):
+    """Test slicing a path-backed stream reads from the memory mapping."""
+    stream = _FileContentsStream(contents_file)
+
+    assert len(stream) == len(CONTENTS)
+    assert stream._mmap is not None
+    assert stream[10:20] == CONTENTS[10:20]
+    assert stream[2550:9999] == CONTENTS[2550:]
+
+    stream.close()
+    with pytest.raises(ValueError, match="closed"):
+        stream[0:1]
+
+
+def test_contents_stream_from_file_object_starts_at_current_position():
+    """Test that file objects without a file descriptor are read with seek/read."""
+    fileobj = io.BytesIO(CONTENTS)
+    fileobj.seek(100)
+
+    stream = _FileContentsStream(fileobj)
+
+    assert stream._mmap is None
+    assert len(stream) == len(CONTENTS) - 100
+    assert stream[0:5] == CONTENTS[100:105]
+    assert stream[:] == CONTENTS[100:]
+
+
+def test_contents_stream_rejects_invalid_sources(tmp_path):
+    """Test source validation and empty files."""
+    with pytest.raises(TypeError, match="path or a binary file object"):
+        _FileContentsStream(123)
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    stream = _FileContentsStream(empty)
+    assert len(stream) == 0
+    assert stream[0:10] == b""
+
+
+def test_set_contents_stream_builds_chunks_on_demand(contents_file):
+    """Test that chunk bodies are read from the stream."""
+    file_tx = FileAppendTransaction(file_id=FileId(0, 0, 12345), chunk_size=1000).set_contents_stream(contents_file)
+
+    assert file_tx.contents is None
+    assert file_tx.get_required_chunks() == 3
+
+    chunks = []
+    for index in range(3):
+        file_tx._current_chunk_index = index
+        chunks.append(file_tx._build_proto_body().contents)
+    assert b"".join(chunks) == CONTENTS
+
+    file_tx.set_contents(b"in memory")
+    assert file_tx._contents_stream is None
+    assert file_tx.get_required_chunks() == 1
+
+
+def _fake_network(uploaded: list[bytes], fail_on: bytes | None = None, submitted: dict | None = None):
+    receipt = MagicMock(file_id=FileId(0, 0, 777), status=ResponseCode.SUCCESS)
+
+    def execute(tx, client, timeout=None, wait_for_receipt=True, validate_status=False):
+        body = transaction_pb2.TransactionBody.FromString(tx._transaction_body_bytes[AccountId(0, 0, 3)])
+        if isinstance(tx, FileCreateTransaction):
+            contents = body.fileCreate.contents
+        else:
+            assert body.fileAppend.fileID.fileNum == 777
+            contents = body.fileAppend.contents
+        if contents == fail_on:
+            raise RuntimeError("link dropped")
+        uploaded.append(contents)
+        if submitted is not None:
+            submitted[str(tx.transaction_id)] = receipt
+        if wait_for_receipt:
+            return receipt
+        response = MagicMock(node_id=tx.node_account_id)
+        response.get_receipt.return_value = receipt
+        return response
+
+    return execute
+
+
+@pytest.mark.parametrize("pipeline_window", [1, 3])
+def test_upload_file_creates_and_appends_in_order(mock_client, contents_file, pipeline_window):
+    """Test that upload_file sends the first chunk on create and streams the rest."""
+    uploaded = []
+    progress = []
+
+    with patch.object(Transaction, "execute", autospec=True, side_effect=_fake_network(uploaded)):
+        file_id = upload_file(
+            mock_client,
+            contents_file,
+            chunk_size=512,
+            pipeline_window=pipeline_window,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+
+    assert file_id == FileId(0, 0, 777)
+    assert b"".join(uploaded) == CONTENTS
+    assert len(uploaded) == 5
+    assert progress == [(512, 2560), (1024, 2560), (1536, 2560), (2048, 2560), (2560, 2560)]
+
+
+def test_execute_all_closes_contents_stream_on_failure(mock_client, contents_file):
+    """Test that the contents stream is released even when an append fails."""
+    uploaded = []
+    file_tx = (
+        FileAppendTransaction(file_id=FileId(0, 0, 777), chunk_size=512)
+        .set_contents_stream(contents_file)
+        .set_max_chunks(5)
+    )
+    stream = file_tx._contents_stream
+
+    with (
+        patch.object(
+            Transaction, "execute", autospec=True, side_effect=_fake_network(uploaded, fail_on=CONTENTS[512:1024])
+        ),
+        pytest.raises(RuntimeError, match="link dropped"),
+    ):
+        file_tx.execute_all(mock_client)
+
+    assert uploaded == [CONTENTS[:512]]
+    assert file_tx._contents_stream is None
+    with pytest.raises(ValueError, match="closed"):
+        stream[0:1]
+
+
+def test_execute_all_again_after_releasing_the_stream_is_rejected(mock_client, contents_file):
+    """Test that a second execute_all() fails clearly instead of appending empty chunks."""
+    uploaded = []
+    file_tx = (
+        FileAppendTransaction(file_id=FileId(0, 0, 777), chunk_size=512)
+        .set_contents_stream(contents_file)
+        .set_max_chunks(5)
+    )
+
+    with patch.object(Transaction, "execute", autospec=True, side_effect=_fake_network(uploaded)):
+        file_tx.execute_all(mock_client)
+        with pytest.raises(ValueError, match="released by a previous execute_all"):
+            file_tx.execute_all(mock_client)
+
+    assert b"".join(uploaded) == CONTENTS
+
+
+def test_upload_file_closes_contents_stream_on_failure(mock_client, contents_file):
+    """Test that upload_file releases the append stream when the upload fails."""
+    uploaded = []
+
+    with (
+        patch.object(_FileContentsStream, "close", autospec=True) as close,
+        patch.object(
+            Transaction, "execute", autospec=True, side_effect=_fake_network(uploaded, fail_on=CONTENTS[1024:1536])
+        ),
+        pytest.raises(RuntimeError, match="link dropped"),
+    ):
+        upload_file(mock_client, contents_file, chunk_size=512)
+
+    assert close.call_count >= 1
+
+
+def test_upload_small_file_only_creates(mock_client):
+    """Test that contents fitting in one chunk need no append."""
+    uploaded = []
+
+    with patch.object(Transaction, "execute", autospec=True, side_effect=_fake_network(uploaded)):
+        file_id = mock_client.upload_file(io.BytesIO(b"tiny"))
+
+    assert file_id == FileId(0, 0, 777)
+    assert uploaded == [b"tiny"]
+
+
+def test_upload_file_rejects_non_positive_chunk_size(mock_client):
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        upload_file(mock_client, io.BytesIO(b"data"), chunk_size=0)
+
+
+def test_upload_checkpoint_round_trip(tmp_path):
+    """Test that checkpoints survive a save/load cycle."""
+    checkpoint = UploadCheckpoint(
+        content_hash="ab" * 32,
+        total_size=10_000,
+        chunk_size=4096,
+        file_id=FileId(0, 0, 777),
+        next_chunk=2,
+        transaction_ids=[TransactionId.generate(AccountId(0, 0, 1234)), None, None],
+    )
+    path = tmp_path / "upload.checkpoint"
+
+    checkpoint.save(path)
+
+    assert UploadCheckpoint.load(path) == checkpoint
+    assert checkpoint.total_chunks == 3
+    assert UploadCheckpoint.load(tmp_path / "missing") is None
+
+
+def _receipt_lookup(submitted: dict):
+    def execute(query, client, timeout=None):
+        receipt = submitted.get(str(query.transaction_id))
+        if receipt is None:
+            raise MaxAttemptsError("Exceeded maximum attempts", "0.0.3", PrecheckError(ResponseCode.RECEIPT_NOT_FOUND))
+        return receipt
+
+    return execute
+
+
+def _file_info(*uploaded: list[bytes]):
+    def execute(query, client, timeout=None):
+        return MagicMock(size=sum(len(contents) for chunks in uploaded for contents in chunks))
+
+    return execute
+
+
+@pytest.mark.parametrize("chunk_3", ["missing", "confirmed", "receipt_expired"])
+def test_upload_file_resumes_from_checkpoint(mock_client, contents_file, tmp_path, chunk_3):
+    """Test that an interrupted upload continues after the chunks the file holds."""
+    checkpoint_path = tmp_path / "upload.checkpoint"
+    uploaded = []
+    submitted = {}
+
+    with (
+        patch.object(
+            Transaction,
+            "execute",
+            autospec=True,
+            side_effect=_fake_network(uploaded, fail_on=CONTENTS[1536:2048], submitted=submitted),
+        ),
+        pytest.raises(RuntimeError, match="link dropped"),
+    ):
+        upload_file(mock_client, contents_file, chunk_size=512, pipeline_window=1, checkpoint_path=checkpoint_path)
+
+    checkpoint = UploadCheckpoint.load(checkpoint_path)
+    assert checkpoint.file_id == FileId(0, 0, 777)
+    assert checkpoint.next_chunk == 3
+    assert all(tx_id is not None for tx_id in checkpoint.transaction_ids)
+
+    if chunk_3 != "missing":
+        # Chunk 3 reached consensus, only its confirmation was lost with the link.
+        uploaded.append(CONTENTS[1536:2048])
+    if chunk_3 == "confirmed":
+        submitted[str(checkpoint.transaction_ids[3])] = MagicMock(status=ResponseCode.SUCCESS)
+
+    resumed = []
+    with (
+        patch.object(Transaction, "execute", autospec=True, side_effect=_fake_network(resumed, submitted=submitted)),
+        patch.object(TransactionGetReceiptQuery, "execute", autospec=True, side_effect=_receipt_lookup(submitted)),
+        patch.object(FileInfoQuery, "execute", autospec=True, side_effect=_file_info(uploaded, resumed)),
+    ):
+        file_id = upload_file(
+            mock_client, contents_file, chunk_size=512, pipeline_window=1, checkpoint_path=checkpoint_path
+        )
+
+    assert file_id == FileId(0, 0, 777)
+    assert resumed == ([CONTENTS[1536:2048]] if chunk_3 == "missing" else []) + [CONTENTS[2048:]]
+    assert b"".join(uploaded + resumed) == CONTENTS
+    assert not checkpoint_path.exists()
+
+
+def test_upload_file_rejects_checkpoint_for_other_contents(mock_client, contents_file, tmp_path):
+    """Test that a checkpoint is only resumed for the same contents and chunk size."""
+    checkpoint_path = tmp_path / "upload.checkpoint"
+    UploadCheckpoint(content_hash="00" * 32, total_size=len(CONTENTS), chunk_size=512).save(checkpoint_path)
+
+    with pytest.raises(ValueError, match="different contents"):
+        upload_file(mock_client, contents_file, chunk_size=512, checkpoint_path=checkpoint_path)
+
+
+def _saved_checkpoint(checkpoint_path, next_chunk: int) -> list[TransactionId]:
+    transaction_ids = [TransactionId.generate(AccountId(0, 0, 1234)) for _ in range(5)]
+    UploadCheckpoint(
+        content_hash=hashlib.sha256(CONTENTS).hexdigest(),
+        total_size=len(CONTENTS),
+        chunk_size=512,
+        file_id=FileId(0, 0, 777),
+        next_chunk=next_chunk,
+        transaction_ids=transaction_ids,
+    ).save(checkpoint_path)
+    return transaction_ids
+
+
+def test_upload_file_refuses_to_resume_out_of_order_chunks(mock_client, contents_file, tmp_path):
+    """Test that a later chunk confirmed before an earlier one blocks the resume."""
+    checkpoint_path = tmp_path / "upload.checkpoint"
+    transaction_ids = _saved_checkpoint(checkpoint_path, next_chunk=2)
+    submitted = {str(transaction_ids[3]): MagicMock(status=ResponseCode.SUCCESS)}
+    # The file holds chunks 0, 1 and the bytes of chunk 3.
+    uploaded = [CONTENTS[:1024], CONTENTS[1536:2048]]
+
+    with (
+        patch.object(TransactionGetReceiptQuery, "execute", autospec=True, side_effect=_receipt_lookup(submitted)),
+        patch.object(FileInfoQuery, "execute", autospec=True, side_effect=_file_info(uploaded)),
+        pytest.raises(RuntimeError, match="Chunk 3 reached consensus"),
+    ):
+        upload_file(mock_client, contents_file, chunk_size=512, pipeline_window=4, checkpoint_path=checkpoint_path)
+
+
+@pytest.mark.parametrize("size", [512, 1700, 4096])
+def test_upload_file_refuses_to_resume_when_file_size_disagrees(mock_client, contents_file, tmp_path, size):
+    """Test that a file smaller than the confirmed chunks, or not made of whole chunks, blocks the resume."""
+    checkpoint_path = tmp_path / "upload.checkpoint"
+    _saved_checkpoint(checkpoint_path, next_chunk=2)
+
+    with (
+        patch.object(TransactionGetReceiptQuery, "execute", autospec=True, side_effect=_receipt_lookup({})),
+        patch.object(FileInfoQuery, "execute", autospec=True, return_value=MagicMock(size=size)),
+        pytest.raises(RuntimeError, match=f"holds {size} bytes"),
+    ):
+        upload_file(mock_client, contents_file, chunk_size=512, checkpoint_path=checkpoint_path)
+
+
+def test_upload_file_resume_propagates_unexpected_receipt_errors(mock_client, contents_file, tmp_path):
+    """Test that only a missing receipt is treated as unknown; other errors are raised."""
+    checkpoint_path = tmp_path / "upload.checkpoint"
+    _saved_checkpoint(checkpoint_path, next_chunk=2)
+
+    with (
+        patch.object(
+            TransactionGetReceiptQuery,
+            "execute",
+            autospec=True,
+            side_effect=PrecheckError(ResponseCode.INVALID_SIGNATURE),
+        ),
+        patch.object(FileInfoQuery, "execute", autospec=True, return_value=MagicMock(size=1024)),
+        pytest.raises(PrecheckError),
+    ):
+        upload_file(mock_client, contents_file, chunk_size=512, pipeline_window=2, checkpoint_path=checkpoint_path)
@@ -826,3 +826,43 @@ def test_protobuf_roundtrip(key):
     assert loaded.is_ed25519() == pub_key.is_ed25519()
     assert loaded.is_ecdsa() == pub_key.is_ecdsa()
     assert loaded.to_bytes_raw() == pub_key.to_bytes_raw()
+
+
+@pytest.mark.parametrize("key", [PrivateKey.generate_ed25519(), PrivateKey.generate_ecdsa()])
+def test_encodings_are_cached(key):
+    """Derived encodings are computed once and returned unchanged afterwards."""
+    pub_key = PublicKey(key._private_key.public_key())
+
+    assert pub_key.to_bytes_raw() is pub_key.to_bytes_raw()
+    assert pub_key.to_bytes_der() is pub_key.to_bytes_der()
+    assert pub_key.to_string_der() is pub_key.to_string_der()
+    assert pub_key.to_bytes_der() == key._private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.DER, format=serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    assert hash(pub_key) == hash(pub_key)
+
+
+def test_ecdsa_encodings_and_evm_address_are_cached():
+    """ECDSA point encodings and the EVM address are cached; EvmAddress objects are not shared."""
+    pub_key = PrivateKey.generate_ecdsa().public_key()
+
+    assert pub_key.to_bytes_ecdsa(compressed=False) is pub_key.to_bytes_ecdsa(compressed=False)
+    assert pub_key.to_bytes_ecdsa() is pub_key.to_bytes_raw()
+    assert pub_key.to_bytes_der_ecdsa_compressed() is pub_key.to_bytes_der_ecdsa_compressed()
+
+    first, second = pub_key.to_evm_address(), pub_key.to_evm_address()
+    assert first == second
+    assert first is not second
+    assert first.address_bytes == keccak256(pub_key.to_bytes_ecdsa(compressed=False)[1:])[-20:]
+
+
+def test_equal_keys_from_different_sources_hash_alike():
+    """Keys are compared and hashed by their cached raw bytes."""
+    private_key = PrivateKey.generate_ecdsa()
+    pub_key = private_key.public_key()
+    reloaded = PublicKey.from_bytes_ecdsa(pub_key.to_bytes_ecdsa(compressed=False))
+
+    assert private_key.public_key() is pub_key
+    assert reloaded == pub_key
+    assert {pub_key: "operator"}[reloaded] == "operator"
+    assert reloaded != PrivateKey.generate_ed25519().public_key()
@@ -0,0 +1,209 @@
+"""Tests for the mirror gRPC channel pool."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import grpc
+import pytest
+
+from hiero_sdk_python.client.client import Client
+from hiero_sdk_python.client.mirror_channel_pool import MirrorChannelPool
+from hiero_sdk_python.client.network import Network
+from hiero_sdk_python.hapi.mirror import consensus_service_pb2 as mirror_proto
+from hiero_sdk_python.query.topic_message_query import TopicMessageQuery
+from tests.unit.mock_server import RealRpcError
+
+
+pytestmark = pytest.mark.unit
+
+
+def _new_channel(*_args, **_kwargs):
+    return MagicMock()
+
+
+@pytest.fixture
+def channels():
+    with (
+        patch("grpc.insecure_channel", side_effect=_new_channel) as insecure,
+        patch("grpc.secure_channel", side_effect=_new_channel) as secure,
+    ):
+        yield insecure, secure
+
+
+def test_channels_get_keepalive_window_and_own_connection_options(channels):
+    """Test that tuning options are passed to every pooled channel."""
+    insecure, _ = channels
+    pool = MirrorChannelPool(
+        "localhost:5600",
+        channels_per_endpoint=3,
+        keepalive_time=20,
+        keepalive_timeout=5,
+        initial_window_size=1 << 20,
+        channel_options=[("grpc.primary_user_agent", "test")],
+    )
+
+    pool.acquire()
+
+    assert insecure.call_count == 3
+    options = dict(insecure.call_args.kwargs["options"])
+    assert options["grpc.use_local_subchannel_pool"] == 1
+    assert options["grpc.keepalive_time_ms"] == 20_000
+    assert options["grpc.keepalive_timeout_ms"] == 5_000
+    assert options["grpc.http2.lookahead_bytes"] == 1 << 20
+    assert options["grpc.http2.bdp_probe"] == 0
+    assert options["grpc.primary_user_agent"] == "test"
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "transport_security", "expect_tls"),
+    [
+        ("mainnet.mirrornode.hedera.com:443", None, True),
+        ("hiero.mirror:50212", None, True),
+        ("localhost:5600", None, False),
+        ("localhost:5600", True, True),
+        ("mirror.example.com:443", False, False),
+    ],
+)
+def test_transport_security(channels, endpoint, transport_security, expect_tls):
+    insecure, secure = channels
+
+    MirrorChannelPool(endpoint, channels_per_endpoint=1, transport_security=transport_security).acquire()
+
+    assert secure.called is expect_tls
+    assert insecure.called is not expect_tls
+
+
+def test_acquire_places_subscriptions_on_least_loaded_channel(channels):
+    """Test that subscriptions are spread evenly and released channels are reused first."""
+    pool = MirrorChannelPool(["a.mirror:5600", "b.mirror:5600"], channels_per_endpoint=2)
+
+    placed = [pool.acquire() for _ in range(4)]
+
+    assert len({id(channel) for channel in placed}) == 4
+    assert [channel.endpoint for channel in placed] == ["a.mirror:5600"] * 2 + ["b.mirror:5600"] * 2
+
+    pool.release(placed[2])
+    assert pool.acquire() is placed[2]
+    assert all(channel.active_streams == 1 for channel in placed)
+
+
+def test_mark_failed_fails_over_to_other_endpoints(channels):
+    """Test that a failed endpoint is skipped until its backoff expires."""
+    pool = MirrorChannelPool(["a.mirror:5600", "b.mirror:5600"], channels_per_endpoint=1, failover_backoff=60)
+
+    first = pool.acquire()
+    pool.release(first)
+    pool.mark_failed(first)
+
+    assert all(pool.acquire().endpoint == "b.mirror:5600" for _ in range(3))
+
+    with patch("hiero_sdk_python.client.mirror_channel_pool.time.monotonic", return_value=1e12):
+        assert pool.acquire().endpoint == "a.mirror:5600"
+
+
+def test_close_closes_channels_and_rejects_acquire(channels):
+    pool = MirrorChannelPool("localhost:5600", channels_per_endpoint=2)
+    placed = pool.acquire()
+
+    pool.close()
+
+    placed.channel.close.assert_called_once()
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.acquire()
+
+
+def test_acquire_aio_opens_channels_per_event_loop():
+    """Test that asyncio channels are opened with the pool options, once per event loop."""
+    pool = MirrorChannelPool("localhost:5600", channels_per_endpoint=2, keepalive_time=20)
+
+    async def acquire_twice():
+        return pool.acquire_aio(), pool.acquire_aio()
+
+    with patch("grpc.aio.insecure_channel", side_effect=_new_channel) as insecure:
+        first = asyncio.run(acquire_twice())
+        second = asyncio.run(acquire_twice())
+
+    assert insecure.call_count == 4
+    assert dict(insecure.call_args.kwargs["options"])["grpc.keepalive_time_ms"] == 20_000
+    assert first[0] is not first[1]
+    assert not {id(c) for c in first} & {id(c) for c in second}
+
+
+def test_acquire_aio_shares_endpoint_health(channels):
+    pool = MirrorChannelPool(["a.mirror:5600", "b.mirror:5600"], channels_per_endpoint=1, failover_backoff=60)
+    pool.mark_failed(pool.acquire())
+
+    async def acquire():
+        return pool.acquire_aio()
+
+    with patch("grpc.aio.insecure_channel", side_effect=_new_channel):
+        assert asyncio.run(acquire()).endpoint == "b.mirror:5600"
+
+
+def test_close_closes_aio_channels_on_their_loop():
+    pool = MirrorChannelPool("localhost:5600", channels_per_endpoint=1)
+    aio_channel = MagicMock()
+    aio_channel.close = AsyncMock()
+
+    async def acquire_and_close():
+        pool.acquire_aio()
+        pool.close()
+        await asyncio.sleep(0)
+
+    with patch("grpc.aio.insecure_channel", return_value=aio_channel):
+        asyncio.run(acquire_and_close())
+
+    aio_channel.close.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error"),
+    [
+        ({"endpoints": []}, "At least one mirror endpoint"),
+        ({"endpoints": "no-port"}, "expected host:port"),
+        ({"endpoints": "localhost:5600", "channels_per_endpoint": 0}, "channels_per_endpoint"),
+        ({"endpoints": "localhost:5600", "keepalive_time": 0}, "keepalive_time"),
+        ({"endpoints": "localhost:5600", "initial_window_size": 0}, "initial_window_size"),
+    ],
+)
+def test_invalid_pool_arguments(kwargs, error):
+    with pytest.raises(ValueError, match=error):
+        MirrorChannelPool(**kwargs)
+
+
+def test_network_replaces_and_closes_pool(channels):
+    network = Network("testnet")
+    first = MirrorChannelPool("localhost:5600")
+    first.acquire()
+
+    network.set_mirror_channel_pool(first)
+    network.set_mirror_channel_pool(MirrorChannelPool("localhost:5601"))
+
+    with pytest.raises(RuntimeError, match="closed"):
+        first.acquire()
+    with pytest.raises(TypeError, match="MirrorChannelPool"):
+        network.set_mirror_channel_pool("localhost:5600")
+
+
+def test_subscription_fails_over_to_next_endpoint():
+    """Test that a subscription retry moves to another endpoint after UNAVAILABLE."""
+    pool = MagicMock(spec=MirrorChannelPool)
+    failing, healthy = MagicMock(endpoint="a"), MagicMock(endpoint="b")
+    failing.stub.subscribeTopic.side_effect = RealRpcError(grpc.StatusCode.UNAVAILABLE, "down")
+    healthy.stub.subscribeTopic.return_value = iter([mirror_proto.ConsensusTopicResponse(message=b"hi")])
+    pool.acquire.side_effect = [failing, healthy]
+
+    client = MagicMock(spec=Client)
+    client.mirror_channel_pool = pool
+    received = []
+
+    query = TopicMessageQuery(topic_id="0.0.123").set_max_backoff(0.5)
+    with patch("hiero_sdk_python.query.topic_message_query.time.sleep"):
+        handle = query.subscribe(client, on_message=received.append)
+        handle.join(timeout=1.0)
+
+    assert [m.contents for m in received] == [b"hi"]
+    pool.mark_failed.assert_called_once_with(failing)
+    assert [c.args[0] for c in pool.release.call_args_list] == [failing, healthy]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from unittest.mock import Mock, patch
 
@@ -565,6 +566,30 @@ def test_get_mirror_stub_initializes_insecure_channel():
     mock_insecure.assert_called_once_with("localhost:5600")
 
 
+@pytest.mark.parametrize(
+    ("address", "secure"),
+    [("hiero.mirror:443", True), ("hiero.mirror:50212", True), ("localhost:5600", False), ("localhost:1443", False)],
+)
+def test_sync_and_aio_mirror_channels_share_transport_security(address, secure):
+    """Test that the sync and asyncio mirror channels pick TLS the same way."""
+    network = Network("testnet", mirror_address=address)
+
+    async def get_aio_stub():
+        return network.get_mirror_aio_stub()
+
+    with (
+        patch("grpc.secure_channel") as mock_secure,
+        patch("grpc.insecure_channel") as mock_insecure,
+        patch("grpc.aio.secure_channel") as mock_aio_secure,
+        patch("grpc.aio.insecure_channel") as mock_aio_insecure,
+    ):
+        network.get_mirror_stub()
+        asyncio.run(get_aio_stub())
+
+    assert mock_secure.call_count == mock_aio_secure.call_count == int(secure)
+    assert mock_insecure.call_count == mock_aio_insecure.call_count == int(not secure)
+
+
 def test_close_mirror_connection_is_safe_when_none():
     """Test close_mirror_connection if no connection exists."""
     network = Network("testnet")
@@ -593,3 +618,24 @@ def test_mirror_address_setter_validation_value_error(address):
 
     with pytest.raises(ValueError, match="mirror_address cannot be empty"):
         network.mirror_address = address
+
+
+def test_get_mirror_aio_stub_shares_channel_per_event_loop():
+    """Test that the asyncio mirror channel is reused on one loop and replaced on another."""
+    network = Network("testnet", mirror_address="localhost:5600")
+
+    async def get_stubs():
+        return network.get_mirror_aio_stub(), network.get_mirror_aio_stub()
+
+    with patch("grpc.aio.insecure_channel") as mock_insecure:
+        first, again = asyncio.run(get_stubs())
+        assert first is again
+        mock_insecure.assert_called_once_with("localhost:5600")
+
+        second, _ = asyncio.run(get_stubs())
+
+    assert second is not first
+    assert mock_insecure.call_count == 2
+
+    with pytest.raises(RuntimeError):
+        network.get_mirror_aio_stub()
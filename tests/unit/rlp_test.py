@@ -0,0 +1,95 @@
+"""
+Unit tests for the RLP encoder and decoder.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from hiero_sdk_python.utils import rlp
+
+
+pytestmark = pytest.mark.unit
+
+ITEMS = [
+    b"",
+    b"\x00",
+    b"\x7f",
+    b"\x80",
+    b"a" * 55,
+    b"a" * 56,
+    b"a" * 70_000,
+    0,
+    127,
+    128,
+    2**256 - 1,
+    [],
+    [[], [[]], [[], [[]]]],
+    [b"dog", [b"cat", b"x" * 60], 1024, [b"y" * 70] * 3],
+]
+
+
+@pytest.mark.parametrize("item", ITEMS)
+def test_encode_matches_reference_implementation(item):
+    reference = pytest.importorskip("rlp")
+    assert rlp.encode(item) == reference.encode(item)
+
+
+@pytest.mark.parametrize(
+    ("item", "expected"),
+    [
+        (b"dog", bytes.fromhex("83646f67")),
+        ([b"cat", b"dog"], bytes.fromhex("c88363617483646f67")),
+        (0, b"\x80"),
+        (1024, bytes.fromhex("820400")),
+        ([[], [[]], [[], [[]]]], bytes.fromhex("c7c0c1c0c3c0c1c0")),
+    ],
+)
+def test_encode_known_vectors(item, expected):
+    assert rlp.encode(item) == expected
+
+
+def test_encode_with_prefix():
+    assert rlp.encode([1, 2], prefix=b"\x02") == b"\x02\xc2\x01\x02"
+
+
+def test_encode_rejects_invalid_items():
+    with pytest.raises(ValueError):
+        rlp.encode(-1)
+    with pytest.raises(TypeError):
+        rlp.encode("text")
+
+
+@pytest.mark.parametrize("item", ITEMS)
+def test_decode_round_trip(item):
+    def normalize(value):
+        if isinstance(value, int):
+            return value.to_bytes((value.bit_length() + 7) // 8, "big")
+        if isinstance(value, list):
+            return [normalize(child) for child in value]
+        return value
+
+    assert rlp.decode(rlp.encode(item)) == normalize(item)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\x81\x05",  # single byte below 0x80 must not be prefixed
+        b"\xb8\x05hello",  # long form for a short string
+        b"\x83do",  # truncated
+        b"\x80\x80",  # trailing bytes
+        b"\xc3\x80",  # list exceeds data
+    ],
+)
+def test_decode_rejects_non_canonical_data(data):
+    with pytest.raises(ValueError):
+        rlp.decode(data)
+
+
+def test_to_int_rejects_leading_zeros():
+    assert rlp.to_int(b"") == 0
+    assert rlp.to_int(b"\x04\x00") == 1024
+    with pytest.raises(ValueError):
+        rlp.to_int(b"\x00\x01")
@@ -87,3 +87,16 @@ def test_token_id_repr():
     # Test with different values
     token_id2 = TokenId(1, 2, 456)
     assert repr(token_id2) == "TokenId(shard=1, realm=2, num=456)"
+
+
+def test_token_id_slots_hash_and_cached_proto():
+    """TokenId is slotted, hashes like its (shard, realm, num) and hands out copies of its cached proto."""
+    token_id = TokenId(1, 2, 3)
+
+    assert not hasattr(token_id, "__dict__")
+    assert hash(token_id) == hash((1, 2, 3))
+    proto = token_id._to_proto()
+    proto.tokenNum = 99
+    assert token_id._to_proto() is not proto
+    assert token_id._to_proto().tokenNum == 3
+    assert TokenId._from_proto(token_id._to_proto()) == token_id
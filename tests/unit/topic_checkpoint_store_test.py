@@ -0,0 +1,119 @@
+"""Tests for the topic subscription checkpoint stores."""
+
+from __future__ import annotations
+
+import pytest
+
+from hiero_sdk_python.consensus.topic_checkpoint_store import (
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+    TopicCheckpoint,
+)
+from hiero_sdk_python.consensus.topic_id import TopicId
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def open_store(request, tmp_path):
+    stores = []
+
+    def open_store():
+        if request.param == "file":
+            store = FileCheckpointStore(tmp_path / "checkpoints.json")
+        else:
+            store = SQLiteCheckpointStore(tmp_path / "checkpoints.db")
+        stores.append(store)
+        return store
+
+    yield open_store
+
+    for store in stores:
+        store.close()
+
+
+def test_checkpoints_are_kept_per_topic_and_survive_reopening(open_store):
+    """Test that saved checkpoints are replaced per topic and persisted."""
+    store = open_store()
+    first, second = TopicId(0, 0, 1001), TopicId(0, 0, 1002)
+
+    assert store.load(first) is None
+
+    store.save(first, TopicCheckpoint(1_700_000_000_000_000_001, 10))
+    store.save(second, TopicCheckpoint(1_700_000_000_000_000_002, 3))
+    store.save(first, TopicCheckpoint(1_700_000_000_000_000_009, 12))
+
+    reopened = open_store()
+    assert reopened.load(first) == TopicCheckpoint(1_700_000_000_000_000_009, 12)
+    assert reopened.load(second) == TopicCheckpoint(1_700_000_000_000_000_002, 3)
+
+
+def test_file_store_leaves_no_temporary_file(tmp_path):
+    store = FileCheckpointStore(tmp_path / "checkpoints.json")
+
+    store.save(TopicId(0, 0, 5), TopicCheckpoint(1, 1))
+
+    assert [p.name for p in tmp_path.iterdir()] == ["checkpoints.json"]
+
+
+def test_sqlite_store_rejects_invalid_table_name(tmp_path):
+    with pytest.raises(ValueError, match="Invalid table name"):
+        SQLiteCheckpointStore(tmp_path / "checkpoints.db", table="drop table; --")
+
+
+def test_file_store_appends_only_the_changed_topic(tmp_path):
+    """Test that a save appends one line instead of rewriting every topic."""
+    path = tmp_path / "checkpoints.json"
+    store = FileCheckpointStore(path)
+    store.save(TopicId(0, 0, 1), TopicCheckpoint(1, 1))
+    store.save(TopicId(0, 0, 2), TopicCheckpoint(2, 2))
+    before = path.read_text(encoding="utf-8")
+
+    store.save(TopicId(0, 0, 1), TopicCheckpoint(3, 3))
+    store.close()
+
+    after = path.read_text(encoding="utf-8")
+    assert after.startswith(before)
+    assert after[len(before) :].count("\n") == 1
+    assert FileCheckpointStore(path).load(TopicId(0, 0, 1)) == TopicCheckpoint(3, 3)
+
+
+def test_file_store_compacts_superseded_lines(tmp_path):
+    """Test that the file is rewritten with one line per topic once enough lines are superseded."""
+    path = tmp_path / "checkpoints.json"
+    store = FileCheckpointStore(path, compact_after=3)
+
+    for i in range(1, 11):
+        store.save(TopicId(0, 0, 1), TopicCheckpoint(i, i))
+    store.save(TopicId(0, 0, 2), TopicCheckpoint(100, 100))
+    store.close()
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) <= 4
+    reopened = FileCheckpointStore(path)
+    assert reopened.load(TopicId(0, 0, 1)) == TopicCheckpoint(10, 10)
+    assert reopened.load(TopicId(0, 0, 2)) == TopicCheckpoint(100, 100)
+
+
+def test_file_store_ignores_a_torn_last_line(tmp_path):
+    """Test that a line cut short by a crash is skipped and rewritten away on the next save."""
+    path = tmp_path / "checkpoints.json"
+    store = FileCheckpointStore(path)
+    store.save(TopicId(0, 0, 1), TopicCheckpoint(1, 1))
+    store.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"topic_id": "0.0.1", "consensus_')
+
+    store = FileCheckpointStore(path)
+    assert store.load(TopicId(0, 0, 1)) == TopicCheckpoint(1, 1)
+
+    store.save(TopicId(0, 0, 2), TopicCheckpoint(2, 2))
+    store.close()
+    reopened = FileCheckpointStore(path)
+    assert reopened.load(TopicId(0, 0, 1)) == TopicCheckpoint(1, 1)
+    assert reopened.load(TopicId(0, 0, 2)) == TopicCheckpoint(2, 2)
+
+
+def test_file_store_rejects_non_positive_compact_after(tmp_path):
+    with pytest.raises(ValueError, match="compact_after must be positive"):
+        FileCheckpointStore(tmp_path / "checkpoints.json", compact_after=0)
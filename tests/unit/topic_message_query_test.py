@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
@@ -9,7 +11,10 @@ import pytest
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.client.client import Client
+from hiero_sdk_python.client.mirror_channel_pool import MirrorChannelPool
+from hiero_sdk_python.consensus.topic_checkpoint_store import TopicCheckpoint, TopicCheckpointStore
 from hiero_sdk_python.consensus.topic_id import TopicId
+from hiero_sdk_python.consensus.topic_message_batch import TopicMessageBatch
 from hiero_sdk_python.hapi.mirror import consensus_service_pb2 as mirror_proto
 from hiero_sdk_python.hapi.services import timestamp_pb2 as hapi_timestamp_pb2
 from hiero_sdk_python.hapi.services.consensus_submit_message_pb2 import ConsensusMessageChunkInfo
@@ -27,6 +32,7 @@ def mock_client():
     client = MagicMock(spec=Client)
     client.operator_account_id = AccountId(0, 0, 12345)
     client.mirror_stub = MagicMock()
+    client.mirror_channel_pool = None
 
     return client
 
@@ -306,6 +312,139 @@ def test_chunk_message_handling(mock_client):
     assert b"chunk-2" in received_messages[0].contents
 
 
+def _chunk(tx_id, number, total, message, seconds=100):
+    return mirror_proto.ConsensusTopicResponse(
+        consensusTimestamp=hapi_timestamp_pb2.Timestamp(seconds=seconds),
+        message=message,
+        sequenceNumber=number,
+        chunkInfo=ConsensusMessageChunkInfo(initialTransactionID=tx_id._to_proto(), total=total, number=number),
+    )
+
+
+def test_chunks_reassembled_by_number_when_out_of_order(mock_client):
+    """Test that chunks arriving out of order are placed by their chunk number."""
+    query = TopicMessageQuery(topic_id="0.0.123", chunking_enabled=True)
+    state = SubscriptionState()
+    tx_id = TransactionId.generate(mock_client.operator_account_id)
+    received = []
+
+    for number in (3, 1, 1, 2):
+        query._handle_response(_chunk(tx_id, number, 3, f"part{number}-".encode()), state, received.append)
+
+    assert len(received) == 1
+    assert received[0].contents == b"part1-part2-part3-"
+    assert received[0].transaction_id == tx_id
+    assert [chunk.sequence_number for chunk in received[0].chunks] == [1, 2, 3]
+    assert state.pending_messages == {}
+    assert state.pending_bytes == 0
+
+
+def test_huge_chunk_total_does_not_preallocate(mock_client):
+    """Test that an advertised chunk total is not used to size any allocation."""
+    query = TopicMessageQuery(topic_id="0.0.123", chunking_enabled=True)
+    state = SubscriptionState()
+    tx_id = TransactionId.generate(mock_client.operator_account_id)
+    received = []
+
+    for number in (1, 0, 2_000_000_001):
+        query._handle_response(_chunk(tx_id, number, 2_000_000_000, b"part"), state, received.append)
+
+    pending = state.pending_messages[tx_id]
+    assert received == []
+    assert pending.total == 2_000_000_000
+    assert list(pending.chunks) == [1]
+    assert state.pending_bytes == 4
+
+
+def test_pending_message_limit_evicts_oldest(mock_client):
+    """Test that starting a message beyond the pending limit evicts the oldest one."""
+    evicted = []
+    query = (
+        TopicMessageQuery(topic_id="0.0.123", chunking_enabled=True)
+        .set_max_pending_messages(2)
+        .set_eviction_handler(lambda tx_id, reason: evicted.append((tx_id, reason)))
+    )
+    state = SubscriptionState()
+    tx_ids = [TransactionId.generate(AccountId(0, 0, 1000 + i)) for i in range(3)]
+
+    for tx_id in tx_ids:
+        query._handle_response(_chunk(tx_id, 1, 2, b"abc"), state, MagicMock())
+
+    assert evicted == [(tx_ids[0], "max_pending_messages")]
+    assert list(state.pending_messages) == tx_ids[1:]
+    assert state.pending_bytes == 6
+
+
+def test_pending_bytes_limit_evicts_until_within_limit(mock_client):
+    """Test that buffered chunk bytes are bounded across all incomplete messages."""
+    evicted = []
+    query = (
+        TopicMessageQuery(topic_id="0.0.123", chunking_enabled=True)
+        .set_max_pending_bytes(10)
+        .set_eviction_handler(lambda tx_id, reason: evicted.append((tx_id, reason)))
+    )
+    state = SubscriptionState()
+    first = TransactionId.generate(AccountId(0, 0, 1001))
+    second = TransactionId.generate(AccountId(0, 0, 1002))
+
+    query._handle_response(_chunk(first, 1, 3, b"123456"), state, MagicMock())
+    query._handle_response(_chunk(second, 1, 3, b"123456"), state, MagicMock())
+
+    assert evicted == [(first, "max_pending_bytes")]
+    assert list(state.pending_messages) == [second]
+    assert state.pending_bytes == 6
+
+
+def test_pending_age_is_measured_in_consensus_time(mock_client):
+    """Test that incomplete messages expire based on chunk consensus timestamps."""
+    evicted = []
+    received = []
+    query = (
+        TopicMessageQuery(topic_id="0.0.123", chunking_enabled=True)
+        .set_max_pending_age(60)
+        .set_eviction_handler(lambda tx_id, reason: evicted.append((tx_id, reason)))
+    )
+    state = SubscriptionState()
+    stale = TransactionId.generate(AccountId(0, 0, 1001))
+    fresh = TransactionId.generate(AccountId(0, 0, 1002))
+
+    query._handle_response(_chunk(stale, 1, 2, b"old", seconds=100), state, received.append)
+    query._handle_response(_chunk(fresh, 1, 2, b"new-", seconds=150), state, received.append)
+    assert evicted == []
+
+    query._handle_response(_chunk(fresh, 2, 2, b"message", seconds=170), state, received.append)
+
+    assert evicted == [(stale, "max_pending_age")]
+    assert [m.contents for m in received] == [b"new-message"]
+    assert state.pending_messages == {}
+    assert state.pending_bytes == 0
+
+
+def test_pending_limits_are_off_by_default(mock_client):
+    """Test that without limits no incomplete message is evicted, however many are buffered."""
+    evicted = []
+    query = TopicMessageQuery(topic_id="0.0.123", chunking_enabled=True).set_eviction_handler(
+        lambda tx_id, reason: evicted.append((tx_id, reason))
+    )
+    state = SubscriptionState()
+
+    for i in range(1500):
+        query._handle_response(_chunk(TransactionId.generate(AccountId(0, 0, 1000 + i)), 1, 2, b"abc"), state, None)
+
+    assert evicted == []
+    assert len(state.pending_messages) == 1500
+
+
+@pytest.mark.parametrize("setter", ["set_max_pending_messages", "set_max_pending_bytes", "set_max_pending_age"])
+def test_pending_limits_reject_non_positive_values(setter):
+    query = TopicMessageQuery()
+
+    with pytest.raises(ValueError, match="must be greater than 0"):
+        getattr(query, setter)(0)
+
+    assert getattr(query, setter)(None) is query
+
+
 def test_chunk_message_handling_when_chunking_is_disabled(mock_client):
     """Test that when chunking is disabled only single chunk is released as a single message."""
     query = TopicMessageQuery(topic_id="0.0.123", chunking_enabled=False)
@@ -406,3 +545,383 @@ def test_subscription_cancellation(mock_client):
 
     assert not handle._thread.is_alive()
     mock_call.cancel.assert_called()
+
+
+class _FakeAioCall:
+    """Async-iterable stand-in for a grpc.aio server-streaming call."""
+
+    def __init__(self, responses, error=None):
+        self._responses = list(responses)
+        self._error = error
+        self.cancelled = False
+        self.read = 0
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for response in self._responses:
+            self.read += 1
+            yield response
+        if self._error is not None:
+            raise self._error
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def _message(seconds, text=b"msg"):
+    return mirror_proto.ConsensusTopicResponse(
+        consensusTimestamp=hapi_timestamp_pb2.Timestamp(seconds=seconds), message=text, sequenceNumber=seconds
+    )
+
+
+async def _no_sleep(_delay):
+    return None
+
+
+async def _collect(query, client, **kwargs):
+    return [message async for message in query.stream(client, **kwargs)]
+
+
+def test_stream_yields_messages_and_resumes_after_retryable_error(mock_client):
+    """Test that stream() reconnects from the last received message."""
+    query = TopicMessageQuery(topic_id="0.0.123", limit=3).set_max_backoff(0.5)
+    first = _FakeAioCall([_message(1), _message(2)], error=RealRpcError(grpc.StatusCode.UNAVAILABLE, "down"))
+    second = _FakeAioCall([_message(3)])
+    mock_client.mirror_aio_stub.subscribeTopic.side_effect = [first, second]
+
+    with patch("hiero_sdk_python.query.topic_message_query.asyncio.sleep", new=_no_sleep):
+        messages = asyncio.run(_collect(query, mock_client))
+
+    assert [m.sequence_number for m in messages] == [1, 2, 3]
+    resumed_request = mock_client.mirror_aio_stub.subscribeTopic.call_args_list[1].args[0]
+    assert resumed_request.consensusStartTime.seconds == 2
+    assert resumed_request.consensusStartTime.nanos == 1
+    assert resumed_request.limit == 1
+
+
+def test_stream_fails_over_between_pooled_channels(mock_client):
+    """Test that stream() places attempts on pooled asyncio channels and fails over after UNAVAILABLE."""
+    pool = MagicMock(spec=MirrorChannelPool)
+    failing, healthy = MagicMock(endpoint="a"), MagicMock(endpoint="b")
+    failing.stub.subscribeTopic.return_value = _FakeAioCall(
+        [_message(1)], error=RealRpcError(grpc.StatusCode.UNAVAILABLE, "down")
+    )
+    healthy.stub.subscribeTopic.return_value = _FakeAioCall([_message(2)])
+    pool.acquire_aio.side_effect = [failing, healthy]
+    mock_client.mirror_channel_pool = pool
+    query = TopicMessageQuery(topic_id="0.0.123")
+
+    with patch("hiero_sdk_python.query.topic_message_query.asyncio.sleep", new=_no_sleep):
+        messages = asyncio.run(_collect(query, mock_client))
+
+    assert [m.sequence_number for m in messages] == [1, 2]
+    pool.mark_failed.assert_called_once_with(failing)
+    assert [c.args[0] for c in pool.release.call_args_list] == [failing, healthy]
+    mock_client.mirror_aio_stub.subscribeTopic.assert_not_called()
+
+
+def test_stream_raises_non_retryable_error(mock_client):
+    """Test that a non-retryable error ends the stream and reaches the consumer."""
+    error_handler = MagicMock()
+    query = TopicMessageQuery(topic_id="0.0.123").set_error_handler(error_handler)
+    error = RealRpcError(grpc.StatusCode.PERMISSION_DENIED, "denied")
+    mock_client.mirror_aio_stub.subscribeTopic.return_value = _FakeAioCall([_message(1)], error=error)
+
+    received = []
+
+    async def consume():
+        async for message in query.stream(mock_client):
+            received.append(message)
+
+    with pytest.raises(grpc.RpcError):
+        asyncio.run(consume())
+
+    assert len(received) == 1
+    error_handler.assert_called_once_with(error)
+
+
+def test_stream_queue_bounds_read_ahead_and_break_cancels_call(mock_client):
+    """Test that a slow consumer limits how far the stream reads ahead."""
+    query = TopicMessageQuery(topic_id="0.0.123")
+    call = _FakeAioCall([_message(i) for i in range(1, 101)])
+    mock_client.mirror_aio_stub.subscribeTopic.return_value = call
+
+    async def consume():
+        async for message in query.stream(mock_client, max_queue_size=2):
+            await asyncio.sleep(0.01)
+            if message.sequence_number == 3:
+                break
+
+    asyncio.run(consume())
+
+    # Three consumed, two queued and one waiting to be queued at most.
+    assert call.read <= 6
+    assert call.cancelled
+
+
+def test_stream_multiplexes_topics_on_one_event_loop(mock_client):
+    """Test that many streams run concurrently on a single loop."""
+    mock_client.mirror_aio_stub.subscribeTopic.side_effect = lambda request: _FakeAioCall(
+        [_message(request.topicID.topicNum)]
+    )
+
+    async def run_all():
+        queries = [TopicMessageQuery(topic_id=f"0.0.{i}") for i in range(1, 201)]
+        return await asyncio.gather(*(_collect(query, mock_client) for query in queries))
+
+    results = asyncio.run(run_all())
+
+    assert [messages[0].sequence_number for messages in results] == list(range(1, 201))
+
+
+def test_stream_rejects_invalid_arguments(mock_client):
+    with pytest.raises(ValueError, match="Topic ID must be set"):
+        asyncio.run(_collect(TopicMessageQuery(), mock_client))
+
+    with pytest.raises(ValueError, match="max_queue_size"):
+        asyncio.run(_collect(TopicMessageQuery(topic_id="0.0.1"), mock_client, max_queue_size=0))
+
+
+def test_subscribe_batches_flushes_on_size_and_at_end(mock_client):
+    """Test that full batches are delivered and the remainder is flushed on completion."""
+    query = TopicMessageQuery(topic_id="0.0.123")
+    mock_client.mirror_stub.subscribeTopic.return_value = iter([_message(i) for i in range(1, 8)])
+    batches = []
+
+    handle = query.subscribe_batches(mock_client, batches.append, max_batch_size=3, max_batch_latency=10)
+    handle.join(timeout=2.0)
+
+    assert [[m.sequence_number for m in batch] for batch in batches] == [[1, 2, 3], [4, 5, 6], [7]]
+
+
+def test_subscribe_batches_flushes_on_latency(mock_client):
+    """Test that a partial batch is delivered once its first message waited max_batch_latency."""
+    query = TopicMessageQuery(topic_id="0.0.123")
+    release = threading.Event()
+
+    def slow_stream():
+        yield _message(1)
+        yield _message(2)
+        release.wait(timeout=2.0)
+
+    mock_client.mirror_stub.subscribeTopic.return_value = slow_stream()
+    batches = []
+
+    handle = query.subscribe_batches(
+        mock_client, batches.append, max_batch_size=100, max_batch_latency=0.05, mode="raw"
+    )
+    deadline = time.monotonic() + 2.0
+    while not batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    handle.join(timeout=2.0)
+
+    assert len(batches) == 1
+    assert [response.sequenceNumber for response in batches[0]] == [1, 2]
+    assert isinstance(batches[0][0], mirror_proto.ConsensusTopicResponse)
+
+
+def test_subscribe_batches_columnar_mode(mock_client):
+    """Test that columnar batches expose timestamps, sequence numbers and payload views."""
+    query = TopicMessageQuery(topic_id="0.0.123")
+    mock_client.mirror_stub.subscribeTopic.return_value = iter(
+        [_message(1, b"ab"), _message(2, b""), _message(3, b"cde")]
+    )
+    batches = []
+
+    handle = query.subscribe_batches(mock_client, batches.append, max_batch_size=10, mode="columnar")
+    handle.join(timeout=2.0)
+
+    (batch,) = batches
+    assert isinstance(batch, TopicMessageBatch)
+    assert len(batch) == 3
+    assert list(batch.consensus_timestamps) == [1_000_000_000, 2_000_000_000, 3_000_000_000]
+    assert list(batch.sequence_numbers) == [1, 2, 3]
+    assert bytes(batch.contents(0)) == b"ab"
+    assert bytes(batch.contents(-1)) == b"cde"
+    assert [bytes(contents) for _, _, contents in batch] == [b"ab", b"", b"cde"]
+    with pytest.raises(IndexError):
+        batch.contents(3)
+
+
+def test_subscribe_batches_cancels_when_on_batch_raises(mock_client):
+    """Test that a failing batch sink reports the error and stops the subscription."""
+    query = TopicMessageQuery(topic_id="0.0.123").set_error_handler(MagicMock())
+    mock_call = MagicMock()
+    mock_call.__iter__.return_value = iter([_message(i) for i in range(1, 5)])
+    mock_client.mirror_stub.subscribeTopic.return_value = mock_call
+    on_error = MagicMock()
+    failure = RuntimeError("database down")
+
+    handle = query.subscribe_batches(
+        mock_client, MagicMock(side_effect=failure), on_error=on_error, max_batch_size=2, max_batch_latency=10
+    )
+    handle.join(timeout=2.0)
+
+    on_error.assert_called_once_with(failure)
+    assert handle.is_cancelled()
+    mock_call.cancel.assert_called()
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "error"),
+    [
+        ({"max_batch_size": 0}, "max_batch_size"),
+        ({"max_batch_latency": 0}, "max_batch_latency"),
+        ({"mode": "bogus"}, "Unknown batch mode"),
+    ],
+)
+def test_subscribe_batches_rejects_invalid_arguments(mock_client, kwargs, error):
+    with pytest.raises(ValueError, match=error):
+        TopicMessageQuery(topic_id="0.0.123").subscribe_batches(mock_client, MagicMock(), **kwargs)
+
+
+def test_subscribe_batches_raw_mode_requires_chunking_disabled(mock_client):
+    query = TopicMessageQuery(topic_id="0.0.123", chunking_enabled=True)
+
+    with pytest.raises(ValueError, match="cannot be used with chunking"):
+        query.subscribe_batches(mock_client, MagicMock(), mode="columnar")
+
+
+class _MemoryCheckpointStore(TopicCheckpointStore):
+    def __init__(self, checkpoint=None):
+        self.saved = [] if checkpoint is None else [checkpoint]
+
+    def load(self, topic_id):
+        assert topic_id == TopicId(0, 0, 123)
+        return self.saved[-1] if self.saved else None
+
+    def save(self, topic_id, checkpoint):
+        assert topic_id == TopicId(0, 0, 123)
+        self.saved.append(checkpoint)
+
+
+def test_subscription_resumes_from_checkpoint_and_drops_duplicates(mock_client):
+    """Test that a stored checkpoint sets the start point and filters replayed messages."""
+    store = _MemoryCheckpointStore(TopicCheckpoint(2_000_000_000, 2))
+    query = TopicMessageQuery(topic_id="0.0.123", start_time=datetime(2023, 1, 1, tzinfo=timezone.utc))
+    query.set_checkpoint_store(store, save_every=2)
+    mock_client.mirror_stub.subscribeTopic.return_value = iter([_message(i) for i in range(2, 6)])
+    received = []
+
+    handle = query.subscribe(mock_client, on_message=received.append)
+    handle.join(timeout=1.0)
+
+    request = mock_client.mirror_stub.subscribeTopic.call_args.args[0]
+    assert (request.consensusStartTime.seconds, request.consensusStartTime.nanos) == (2, 1)
+    assert [m.sequence_number for m in received] == [3, 4, 5]
+    # Saved after every second message, and once more when the stream ended.
+    assert store.saved[1:] == [TopicCheckpoint(4_000_000_000, 4), TopicCheckpoint(5_000_000_000, 5)]
+
+
+def test_checkpoint_stops_before_incomplete_chunked_message(mock_client):
+    """Test that a checkpoint never skips chunks of a message that is still being assembled."""
+    store = _MemoryCheckpointStore()
+    query = TopicMessageQuery(topic_id="0.0.123", chunking_enabled=True).set_checkpoint_store(store, save_every=1)
+    tx_id = TransactionId.generate(mock_client.operator_account_id)
+    mock_client.mirror_stub.subscribeTopic.return_value = iter([_chunk(tx_id, 1, 2, b"a", seconds=10), _message(11)])
+    received = []
+
+    handle = query.subscribe(mock_client, on_message=received.append)
+    handle.join(timeout=1.0)
+
+    assert [m.sequence_number for m in received] == [11]
+    assert store.saved == [TopicCheckpoint(10_000_000_000 - 1, 11)]
+
+
+def test_stream_checkpoints_messages_the_consumer_handled(mock_client):
+    """Test that stream() only checkpoints messages the consumer has moved past."""
+    store = _MemoryCheckpointStore()
+    query = TopicMessageQuery(topic_id="0.0.123").set_checkpoint_store(store, save_every=None, save_interval=None)
+    mock_client.mirror_aio_stub.subscribeTopic.return_value = _FakeAioCall([_message(i) for i in range(1, 6)])
+
+    async def consume():
+        async for message in query.stream(mock_client):
+            if message.sequence_number == 3:
+                break
+
+    asyncio.run(consume())
+
+    assert store.saved == [TopicCheckpoint(2_000_000_000, 2)]
+
+
+def test_stream_saves_checkpoints_off_the_event_loop(mock_client):
+    """Test that stream() runs checkpoint store writes on a worker thread."""
+    store = _MemoryCheckpointStore()
+    save_threads = []
+    store_save = store.save
+
+    def save(topic_id, checkpoint):
+        save_threads.append(threading.get_ident())
+        store_save(topic_id, checkpoint)
+
+    store.save = save
+    query = TopicMessageQuery(topic_id="0.0.123").set_checkpoint_store(store, save_every=2)
+    mock_client.mirror_aio_stub.subscribeTopic.return_value = _FakeAioCall([_message(i) for i in range(1, 6)])
+
+    async def consume():
+        loop_thread = threading.get_ident()
+        messages = [message async for message in query.stream(mock_client)]
+        return loop_thread, messages
+
+    loop_thread, messages = asyncio.run(consume())
+
+    assert len(messages) == 5
+    assert [cp.sequence_number for cp in store.saved] == [2, 4, 5]
+    assert save_threads
+    assert loop_thread not in save_threads
+
+
+def test_stream_loads_checkpoints_off_the_event_loop(mock_client):
+    """Test that stream() reads the stored checkpoint on a worker thread."""
+    store = _MemoryCheckpointStore(TopicCheckpoint(2_000_000_000, 2))
+    load_threads = []
+    store_load = store.load
+
+    def load(topic_id):
+        load_threads.append(threading.get_ident())
+        return store_load(topic_id)
+
+    store.load = load
+    query = TopicMessageQuery(topic_id="0.0.123").set_checkpoint_store(store, save_every=None, save_interval=None)
+    mock_client.mirror_aio_stub.subscribeTopic.return_value = _FakeAioCall([_message(i) for i in range(1, 6)])
+
+    async def consume():
+        loop_thread = threading.get_ident()
+        messages = [message async for message in query.stream(mock_client)]
+        return loop_thread, messages
+
+    loop_thread, messages = asyncio.run(consume())
+
+    assert [m.sequence_number for m in messages] == [3, 4, 5]
+    assert load_threads
+    assert loop_thread not in load_threads
+
+
+def test_subscribe_batches_checkpoints_after_each_batch(mock_client):
+    """Test that batches are checkpointed once on_batch returns."""
+    store = _MemoryCheckpointStore()
+    query = TopicMessageQuery(topic_id="0.0.123").set_checkpoint_store(store, save_every=1)
+    mock_client.mirror_stub.subscribeTopic.return_value = iter([_message(i) for i in range(1, 6)])
+    batches = []
+
+    handle = query.subscribe_batches(mock_client, batches.append, max_batch_size=2, max_batch_latency=10, mode="raw")
+    handle.join(timeout=2.0)
+
+    assert len(batches) == 3
+    assert [cp.sequence_number for cp in store.saved] == [2, 4, 5]
+
+
+def test_set_checkpoint_store_validates_arguments():
+    query = TopicMessageQuery()
+
+    with pytest.raises(TypeError, match="TopicCheckpointStore"):
+        query.set_checkpoint_store(object())
+    with pytest.raises(ValueError, match="save_every"):
+        query.set_checkpoint_store(_MemoryCheckpointStore(), save_every=0)
+    with pytest.raises(ValueError, match="save_interval"):
+        query.set_checkpoint_store(_MemoryCheckpointStore(), save_interval=0)
+
+    assert query.set_checkpoint_store(None) is query
@@ -145,6 +145,34 @@ def test_method_chaining(topic_id, message, custom_fee_limit):
     assert tx.max_chunks == max_chunks
 
 
+def test_str_message_is_encoded_once(topic_id):
+    """Test that a str message is encoded once and re-encoded only after it changes."""
+    tx = TopicMessageSubmitTransaction(topic_id=topic_id, message="héllo wörld", chunk_size=4)
+
+    encoded = tx._message_as_bytes()
+
+    assert encoded == "héllo wörld".encode()
+    assert tx._message_as_bytes() is encoded
+    assert tx.get_required_chunks() == 4
+
+    tx.set_message("new")
+    assert tx._message_as_bytes() == b"new"
+    assert tx.get_required_chunks() == 1
+
+
+def test_build_proto_body_uses_chunk_offsets(topic_id):
+    """Test that every chunk body carries its slice of the encoded message."""
+    tx = TopicMessageSubmitTransaction(topic_id=topic_id, message="abcdefghij", chunk_size=4)
+    tx._initial_transaction_id = TransactionId.generate(AccountId(0, 0, 1234))
+
+    chunks = []
+    for index in range(tx.get_required_chunks()):
+        tx._current_chunk_index = index
+        chunks.append(tx._build_proto_body().message)
+
+    assert chunks == [b"abcd", b"efgh", b"ij"]
+
+
 def test_get_method():
     """Test retrieving the gRPC method for the transaction."""
     tx = TopicMessageSubmitTransaction()
@@ -685,3 +685,52 @@ def test_map_response_raises_if_proto_request_is_not_transaction():
             node_id=mock_node_id,
             proto_request=invalid_proto_request,
         )
+
+
+def _frozen_transfer(amount: int) -> TransferTransaction:
+    operator_id = AccountId.from_string("0.0.1234")
+    transaction = (
+        TransferTransaction()
+        .add_hbar_transfer(operator_id, -amount)
+        .add_hbar_transfer(AccountId.from_string("0.0.5678"), amount)
+    )
+    transaction.transaction_id = TransactionId.generate(operator_id)
+    transaction.node_account_id = AccountId.from_string("0.0.3")
+    return transaction.freeze()
+
+
+def test_get_transaction_class_is_cached():
+    """Test that transaction class resolution is memoized per body field."""
+    from hiero_sdk_python.transaction.transaction import _TRANSACTION_CLASS_CACHE, Transaction
+
+    first = Transaction._get_transaction_class("cryptoTransfer")
+
+    assert first is TransferTransaction
+    assert _TRANSACTION_CLASS_CACHE["cryptoTransfer"] is TransferTransaction
+    assert Transaction._get_transaction_class("cryptoTransfer") is first
+
+
+def test_from_bytes_many_round_trip():
+    """Test that from_bytes_many restores every transaction in order."""
+    from hiero_sdk_python.transaction.transaction import Transaction
+
+    transactions = [_frozen_transfer(amount) for amount in (1, 2, 3)]
+    all_bytes = [transaction.to_bytes() for transaction in transactions]
+
+    restored = Transaction.from_bytes_many(iter(all_bytes))
+
+    assert [type(tx) for tx in restored] == [TransferTransaction] * 3
+    assert [tx.hbar_transfers[1].amount for tx in restored] == [1, 2, 3]
+    assert [tx.to_bytes() for tx in restored] == all_bytes
+
+
+def test_from_bytes_many_reports_failing_index():
+    """Test that from_bytes_many reports the index of an invalid entry."""
+    from hiero_sdk_python.transaction.transaction import Transaction
+
+    valid = _frozen_transfer(1).to_bytes()
+
+    with pytest.raises(ValueError, match="index 1"):
+        Transaction.from_bytes_many([valid, b""])
+
+    assert Transaction.from_bytes_many([]) == []
@@ -507,3 +507,27 @@ def test_transaction_record_query_execute_without_children(transaction_id):
         assert result.transaction_memo == "primary"
         assert hasattr(result, "children")
         assert result.children == []
+
+
+def test_set_lazy_decoding():
+    """set_lazy_decoding() stores the flag and rejects non-boolean values."""
+    query = TransactionRecordQuery()
+    assert query.lazy_decoding is False
+    assert query.set_lazy_decoding(True) is query
+    assert query.lazy_decoding is True
+
+    with pytest.raises(TypeError, match="lazy_decoding must be a boolean"):
+        query.set_lazy_decoding("yes")
+
+
+def test_map_record_list_lazy_decoding(transaction_id):
+    """_map_record_list returns lazily decoded records when lazy_decoding is set."""
+    receipt = transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS)
+    proto_record = transaction_record_pb2.TransactionRecord(receipt=receipt, memo="child")
+
+    query = TransactionRecordQuery(transaction_id=transaction_id, lazy_decoding=True)
+    (record,) = query._map_record_list([proto_record])
+
+    assert "transaction_memo" not in vars(record)
+    assert record.transaction_memo == "child"
+    assert record._to_proto() == TransactionRecord._from_proto(proto_record, transaction_id=transaction_id)._to_proto()
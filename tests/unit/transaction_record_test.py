@@ -914,3 +914,61 @@ def test_high_volume_multiplier_in_repr():
     output = repr(record)
 
     assert "1250" in output
+
+
+def test_from_proto_lazy_matches_eager(transaction_id):
+    """A lazily decoded record compares equal to the eagerly decoded one."""
+    proto = transaction_record_pb2.TransactionRecord(
+        memo="lazy", transactionFee=5, receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS)
+    )
+    transfer = proto.transferList.accountAmounts.add()
+    transfer.accountID.CopyFrom(AccountId(0, 0, 200)._to_proto())
+    transfer.amount = 1000
+    token_list = proto.tokenTransferLists.add()
+    token_list.token.CopyFrom(TokenId(0, 0, 300)._to_proto())
+    token_transfer = token_list.transfers.add()
+    token_transfer.accountID.CopyFrom(AccountId(0, 0, 200)._to_proto())
+    token_transfer.amount = 500
+
+    eager = TransactionRecord._from_proto(proto, transaction_id)
+    lazy = TransactionRecord._from_proto(proto, transaction_id, lazy=True)
+
+    assert isinstance(lazy, TransactionRecord)
+    assert lazy._to_proto() == eager._to_proto()
+    assert lazy.transfers == eager.transfers
+    assert lazy.token_transfers == eager.token_transfers
+    assert repr(lazy) == repr(eager)
+
+
+def test_from_proto_lazy_decodes_on_first_access(transaction_id):
+    """Lazy records decode each field only once it is read, then cache it."""
+    proto = transaction_record_pb2.TransactionRecord(
+        receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS)
+    )
+    transfer = proto.transferList.accountAmounts.add()
+    transfer.accountID.CopyFrom(AccountId(0, 0, 200)._to_proto())
+    transfer.amount = 1000
+
+    record = TransactionRecord._from_proto(proto, transaction_id, lazy=True)
+
+    assert "transfers" not in vars(record)
+    assert record.receipt.status == ResponseCode.SUCCESS
+    assert "transfers" not in vars(record)
+    assert record.transfers[AccountId(0, 0, 200)] == 1000
+    assert record.transfers is record.transfers
+
+
+def test_from_proto_lazy_fields_are_assignable(transaction_id, proto_transaction_record):
+    """Assigning a field of a lazy record overrides the decoded value."""
+    record = TransactionRecord._from_proto(proto_transaction_record, transaction_id, lazy=True)
+
+    record.transaction_memo = "updated"
+
+    assert record.transaction_memo == "updated"
+    assert record._to_proto().memo == "updated"
+
+
+def test_from_proto_lazy_requires_transaction_id():
+    """Lazy decoding still validates the transaction ID eagerly."""
+    with pytest.raises(ValueError, match="transaction_id is required"):
+        TransactionRecord._from_proto(transaction_record_pb2.TransactionRecord(), lazy=True)
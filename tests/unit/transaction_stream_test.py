@@ -0,0 +1,185 @@
+"""Tests for length-delimited transaction streams."""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+from unittest.mock import patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.hapi.services import response_header_pb2, response_pb2, transaction_get_receipt_pb2
+from hiero_sdk_python.hapi.services.transaction_receipt_pb2 import TransactionReceipt as TransactionReceiptProto
+from hiero_sdk_python.hapi.services.transaction_response_pb2 import TransactionResponse as TransactionResponseProto
+from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.transaction import transaction_stream
+from hiero_sdk_python.transaction.transaction_id import TransactionId
+from hiero_sdk_python.transaction.transaction_stream import (
+    iter_transaction_bytes,
+    read_transactions,
+    write_transactions,
+)
+from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+
+def _frozen_transfer(amount: int, memo: str = "") -> TransferTransaction:
+    operator_id = AccountId(0, 0, 1234)
+    transaction = (
+        TransferTransaction()
+        .add_hbar_transfer(operator_id, -amount)
+        .add_hbar_transfer(AccountId(0, 0, 5678), amount)
+        .set_transaction_memo(memo)
+    )
+    transaction.transaction_id = TransactionId.generate(operator_id)
+    transaction.node_account_id = AccountId(0, 0, 3)
+    return transaction.freeze()
+
+
+def test_write_and_read_round_trip():
+    """Test that transactions written to a stream are read back in order."""
+    transactions = [_frozen_transfer(amount) for amount in (1, 2, 3)]
+    buffer = io.BytesIO()
+
+    count = write_transactions(iter(transactions), buffer)
+    buffer.seek(0)
+    restored = list(read_transactions(buffer))
+
+    assert count == 3
+    assert [tx.to_bytes() for tx in restored] == [tx.to_bytes() for tx in transactions]
+    assert all(isinstance(tx, TransferTransaction) for tx in restored)
+
+
+def test_write_accepts_raw_bytes_and_rejects_other_types():
+    """Test that serialized bytes can be written and other items are rejected."""
+    payload = _frozen_transfer(1).to_bytes()
+    buffer = io.BytesIO()
+
+    write_transactions([payload], buffer)
+
+    assert list(iter_transaction_bytes(buffer.getvalue())) == [payload]
+    with pytest.raises(TypeError, match="Transaction or bytes"):
+        write_transactions(["not a transaction"], io.BytesIO())
+
+
+def test_read_from_file_with_small_chunks(monkeypatch):
+    """Test that records spanning several reads are reassembled."""
+    monkeypatch.setattr(transaction_stream, "_READ_CHUNK_SIZE", 7)
+    transactions = [_frozen_transfer(amount, memo="x" * 300) for amount in (1, 2)]
+    buffer = io.BytesIO()
+    write_transactions(transactions, buffer)
+    buffer.seek(0)
+
+    restored = list(read_transactions(buffer))
+
+    assert [tx.to_bytes() for tx in restored] == [tx.to_bytes() for tx in transactions]
+
+
+def test_read_memory_mapped_file(tmp_path):
+    """Test reading a regular file through mmap, including an empty file."""
+    transactions = [_frozen_transfer(amount) for amount in (1, 2)]
+    path = tmp_path / "signed.txs"
+    with open(path, "wb") as f:
+        write_transactions(transactions, f)
+
+    with open(path, "rb") as f:
+        restored = list(read_transactions(f, use_mmap=True))
+
+    assert [tx.to_bytes() for tx in restored] == [tx.to_bytes() for tx in transactions]
+
+    empty = tmp_path / "empty.txs"
+    empty.write_bytes(b"")
+    with open(empty, "rb") as f:
+        assert list(read_transactions(f, use_mmap=True)) == []
+
+
+def test_read_memory_mapped_pipe_falls_back_to_streamed_reads():
+    """Test that use_mmap reads a pipe, which cannot be mapped, in chunks."""
+    transactions = [_frozen_transfer(amount) for amount in (1, 2)]
+    buffer = io.BytesIO()
+    write_transactions(transactions, buffer)
+
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(write_fd, "wb") as writer:
+        writer.write(buffer.getvalue())
+    with os.fdopen(read_fd, "rb") as reader:
+        restored = list(read_transactions(reader, use_mmap=True))
+
+    assert [tx.to_bytes() for tx in restored] == [tx.to_bytes() for tx in transactions]
+
+
+def test_read_falls_back_when_mmap_fails(tmp_path, monkeypatch):
+    """Test that an mmap error on a regular file falls back to streamed reads."""
+    transactions = [_frozen_transfer(amount) for amount in (1, 2)]
+    path = tmp_path / "signed.txs"
+    with open(path, "wb") as f:
+        write_transactions(transactions, f)
+
+    class FailingMmap(mmap.mmap):
+        def __new__(cls, *_args, **_kwargs):
+            raise OSError("mmap not supported")
+
+    monkeypatch.setattr(transaction_stream.mmap, "mmap", FailingMmap)
+    with open(path, "rb") as f:
+        restored = list(read_transactions(f, use_mmap=True))
+
+    assert [tx.to_bytes() for tx in restored] == [tx.to_bytes() for tx in transactions]
+
+
+@pytest.mark.parametrize("data", [b"\x05abc", b"\x80", b"\xff" * 11])
+def test_read_malformed_stream_raises(data):
+    """Test that truncated records and bad length prefixes are reported."""
+    with pytest.raises(ValueError):
+        list(iter_transaction_bytes(data))
+    with pytest.raises(ValueError):
+        list(iter_transaction_bytes(io.BytesIO(data)))
+
+
+def test_read_reports_index_of_invalid_record():
+    """Test that an undecodable record reports its index."""
+    buffer = io.BytesIO()
+    write_transactions([_frozen_transfer(1), b"\xff\xff"], buffer)
+
+    with pytest.raises(ValueError, match="index 1"):
+        list(read_transactions(buffer.getvalue()))
+
+
+def test_client_submit_transactions_from_stream():
+    """Test that the client submits every transaction of a stream."""
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+    receipt_response = response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
+            receipt=TransactionReceiptProto(status=ResponseCode.SUCCESS),
+        )
+    )
+    buffer = io.BytesIO()
+    write_transactions([_frozen_transfer(1), _frozen_transfer(2)], buffer)
+    buffer.seek(0)
+
+    with mock_hedera_servers([[ok_response, receipt_response, ok_response, receipt_response]]) as client:
+        receipts = client.submit_transactions(buffer)
+
+    assert isinstance(receipts, list)
+    assert [receipt.status for receipt in receipts] == [ResponseCode.SUCCESS, ResponseCode.SUCCESS]
+
+
+def test_client_iter_submit_transactions_is_lazy(mock_client):
+    """Test that iter_submit_transactions submits nothing until it is iterated."""
+    buffer = io.BytesIO()
+    write_transactions([_frozen_transfer(1), _frozen_transfer(2)], buffer)
+    buffer.seek(0)
+
+    with patch.object(TransferTransaction, "execute", autospec=True, return_value="receipt") as execute:
+        results = mock_client.iter_submit_transactions(buffer)
+        execute.assert_not_called()
+
+        assert next(results) == "receipt"
+        assert execute.call_count == 1
+        assert list(results) == ["receipt"]
+        assert execute.call_count == 2